@@ -221,6 +221,7 @@ def _convert_batch_type_to_numpy(
         from ray.air.util.transform_pyarrow import (
             _is_column_extension_type,
             _concatenate_extension_column,
+            _to_numpy_tensor_column,
         )
 
         if data.column_names == [TENSOR_COLUMN_NAME] and (
@@ -228,16 +229,16 @@ def _convert_batch_type_to_numpy(
         ):
             # If representing a tensor dataset, return as a single numpy array.
             # Example: ray.data.from_numpy(np.arange(12).reshape((3, 2, 2)))
-            # Arrow’s incorrect concatenation of extension arrays:
-            # https://issues.apache.org/jira/browse/ARROW-16503
-            return _concatenate_extension_column(data[TENSOR_COLUMN_NAME]).to_numpy(
-                zero_copy_only=False
-            )
+            ndarray, _ = _to_numpy_tensor_column(data[TENSOR_COLUMN_NAME])
+            return ndarray
         else:
             output_dict = {}
             for col_name in data.column_names:
                 col = data[col_name]
-                if col.num_chunks == 0:
+                if isinstance(col.type, ArrowTensorType):
+                    output_dict[col_name], _ = _to_numpy_tensor_column(col)
+                    continue
+                elif col.num_chunks == 0:
                     col = pyarrow.array([], type=col.type)
                 elif _is_column_extension_type(col):
                     # Arrow’s incorrect concatenation of extension arrays:
@@ -1,3 +1,7 @@
+from typing import Tuple
+
+import numpy as np
+
 try:
     import pyarrow
 except ImportError:
@@ -36,3 +40,60 @@ def _concatenate_extension_column(ca: "pyarrow.ChunkedArray") -> "pyarrow.Array"
         storage = pyarrow.concat_arrays([c.storage for c in ca.chunks])
 
     return ca.type.__arrow_ext_class__().from_storage(ca.type, storage)
+
+
+def _to_numpy_tensor_column(ca: "pyarrow.ChunkedArray") -> Tuple[np.ndarray, int]:
+    """Convert a fixed-shape tensor column into a single ndarray.
+
+    The ndarray is a zero-copy view of the column if it has a single chunk, or if its
+    chunks are adjacent slices of the same buffer, e.g. consecutive slices of a
+    block. Otherwise, the chunks are copied into a single preallocated ndarray.
+
+    Returns:
+        The ndarray, and the number of bytes that were copied to create it.
+    """
+    from ray.air.util.tensor_extensions.arrow import (
+        ArrowTensorType,
+        _get_buffer_address,
+        _pairwise,
+    )
+
+    if not isinstance(ca.type, ArrowTensorType):
+        raise ValueError(f"Chunked array isn't a fixed-shape tensor array: {ca}")
+
+    chunks = [chunk for chunk in ca.chunks if len(chunk) > 0]
+    if not chunks:
+        return _concatenate_extension_column(ca).to_numpy(), 0
+    arrays = [chunk.to_numpy() for chunk in chunks]
+    num_bytes_copied = 0
+    if pyarrow.types.is_boolean(ca.type.storage_type.value_type):
+        # Arrow bit-packs booleans, so they're unpacked into copies.
+        num_bytes_copied += sum(array.nbytes for array in arrays)
+    elif len(arrays) > 1:
+        buffers = [chunk.buffers()[3] for chunk in chunks]
+        if all(
+            buffer.address == buffers[0].address and buffer.size == buffers[0].size
+            for buffer in buffers
+        ) and all(
+            _get_buffer_address(curr) - _get_buffer_address(prev) == prev.nbytes
+            for prev, curr in _pairwise(arrays)
+        ):
+            # The chunks are adjacent in the same buffer, so view them all at once.
+            return (
+                np.ndarray(
+                    (sum(len(array) for array in arrays),) + arrays[0].shape[1:],
+                    dtype=arrays[0].dtype,
+                    buffer=buffers[0],
+                    offset=_get_buffer_address(arrays[0]) - buffers[0].address,
+                ),
+                num_bytes_copied,
+            )
+    if len(arrays) == 1:
+        return arrays[0], num_bytes_copied
+
+    out = np.empty(
+        (sum(len(array) for array in arrays),) + arrays[0].shape[1:],
+        dtype=arrays[0].dtype,
+    )
+    np.concatenate(arrays, out=out)
+    return out, num_bytes_copied + out.nbytes
@@ -13,6 +13,7 @@ from ray.data.context import DataContext, DatasetContext
 from ray.data.dataset import Dataset, Schema
 from ray.data.dataset_pipeline import DatasetPipeline
 from ray.data.datasource import Datasource, ReadTask
+from ray.data.expressions import col, lit
 from ray.data.iterator import DataIterator, DatasetIterator
 from ray.data.preprocessor import Preprocessor
 from ray.data.read_api import (  # noqa: F401
@@ -67,6 +68,7 @@ __all__ = [
     "NodeIdStr",
     "ReadTask",
     "Schema",
+    "col",
     "from_dask",
     "from_items",
     "from_arrow",
@@ -81,6 +83,7 @@ __all__ = [
     "from_tf",
     "from_torch",
     "from_huggingface",
+    "lit",
     "range",
     "range_table",
     "range_tensor",
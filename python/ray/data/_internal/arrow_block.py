@@ -25,14 +25,7 @@ from ray.data._internal.numpy_support import (
 )
 from ray.data._internal.table_block import TableBlockAccessor, TableBlockBuilder
 from ray.data._internal.util import _truncated_repr, find_partitions
-from ray.data.block import (
-    Block,
-    BlockAccessor,
-    BlockExecStats,
-    BlockMetadata,
-    KeyType,
-    U,
-)
+from ray.data.block import Block, BlockAccessor, BlockExecStats, BlockMetadata, U
 from ray.data.context import DataContext
 from ray.data.row import TableRow
 
@@ -51,6 +44,10 @@ if TYPE_CHECKING:
 
 T = TypeVar("T")
 
+# The size in bytes of the rows that a sort merge sorts at a time. See
+# `transform_pyarrow.merge_sorted()`.
+SORT_MERGE_WINDOW_SIZE_BYTES = 64 * 1024 * 1024
+
 
 # We offload some transformations to polars for performance.
 def get_sort_transform(context: DataContext) -> Callable:
@@ -143,6 +140,9 @@ class ArrowBlockAccessor(TableBlockAccessor):
         if pyarrow is None:
             raise ImportError("Run `pip install pyarrow` for Arrow support")
         super().__init__(table)
+        # The number of bytes copied to concatenate the chunks of tensor columns when
+        # converting this block to numpy.
+        self.num_bytes_copied = 0
 
     def column_names(self) -> List[str]:
         return self._table.column_names
@@ -234,9 +234,11 @@ class ArrowBlockAccessor(TableBlockAccessor):
     def to_numpy(
         self, columns: Optional[Union[str, List[str]]] = None
     ) -> Union[np.ndarray, Dict[str, np.ndarray]]:
+        from ray.air.util.tensor_extensions.arrow import ArrowTensorType
         from ray.air.util.transform_pyarrow import (
             _concatenate_extension_column,
             _is_column_extension_type,
+            _to_numpy_tensor_column,
         )
 
         if columns is None:
@@ -258,7 +260,13 @@ class ArrowBlockAccessor(TableBlockAccessor):
         arrays = []
         for column in columns:
             array = self._table[column]
-            if _is_column_extension_type(array):
+            if isinstance(array.type, ArrowTensorType):
+                # Avoid copying the tensors if their chunks are contiguous.
+                ndarray, num_bytes_copied = _to_numpy_tensor_column(array)
+                self.num_bytes_copied += num_bytes_copied
+                arrays.append(ndarray)
+                continue
+            elif _is_column_extension_type(array):
                 array = _concatenate_extension_column(array)
             elif array.num_chunks == 0:
                 array = pyarrow.array([], type=array.type)
@@ -449,35 +457,8 @@ class ArrowBlockAccessor(TableBlockAccessor):
                 f"got: {type(key)}."
             )
 
-        def iter_groups() -> Iterator[Tuple[KeyType, Block]]:
-            """Creates an iterator over zero-copy group views."""
-            if key is None:
-                # Global aggregation consists of a single "group", so we short-circuit.
-                yield None, self.to_block()
-                return
-
-            start = end = 0
-            iter = self.iter_rows(public_row_format=False)
-            next_row = None
-            while True:
-                try:
-                    if next_row is None:
-                        next_row = next(iter)
-                    next_key = next_row[key]
-                    while next_row[key] == next_key:
-                        end += 1
-                        try:
-                            next_row = next(iter)
-                        except StopIteration:
-                            next_row = None
-                            break
-                    yield next_key, self.slice(start, end)
-                    start = end
-                except StopIteration:
-                    break
-
         builder = ArrowBlockBuilder()
-        for group_key, group_view in iter_groups():
+        for group_key, group_view in self._iter_groups_sorted(key):
             # Aggregate.
             accumulators = [agg.init(group_key) for agg in aggs]
             for i in range(len(aggs)):
@@ -511,11 +492,19 @@ class ArrowBlockAccessor(TableBlockAccessor):
     ) -> Tuple[Block, BlockMetadata]:
         stats = BlockExecStats.builder()
         blocks = [b for b in blocks if b.num_rows > 0]
+        context = DataContext.get_current()
         if len(blocks) == 0:
             ret = ArrowBlockAccessor._empty_table()
-        else:
-            concat_and_sort = get_concat_and_sort_transform(DataContext.get_current())
+        elif context.use_polars:
+            concat_and_sort = get_concat_and_sort_transform(context)
             ret = concat_and_sort(blocks, sort_key)
+        else:
+            ret = transform_pyarrow.merge_sorted(
+                blocks,
+                sort_key,
+                window_size_bytes=SORT_MERGE_WINDOW_SIZE_BYTES,
+                spill_threshold_bytes=context.sort_spill_threshold_bytes,
+            )
         return ret, ArrowBlockAccessor(ret).get_metadata(None, exec_stats=stats.build())
 
     @staticmethod
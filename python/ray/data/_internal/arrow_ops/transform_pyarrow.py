@@ -1,4 +1,6 @@
-from typing import TYPE_CHECKING, List, Union
+import os
+import tempfile
+from typing import TYPE_CHECKING, Any, List, Optional, Tuple, Union
 
 try:
     import pyarrow
@@ -265,6 +267,157 @@ def concat_and_sort(
     return take_table(ret, indices)
 
 
+def merge_sorted(
+    blocks: List["pyarrow.Table"],
+    sort_key: "SortKey",
+    window_size_bytes: int,
+    spill_threshold_bytes: Optional[int] = None,
+) -> "pyarrow.Table":
+    """Merge tables that are each sorted by `sort_key` into one sorted table.
+
+    This is a k-way merge that only sorts a bounded window of rows at a time,
+    instead of concatenating and sorting all the rows at once. In each step, a window
+    of about `window_size_bytes` in total is taken from the front of the tables, and
+    the rows of the windows up to the smallest last key of a window are merged.
+
+    If the tables are larger than `spill_threshold_bytes` in total, the merged rows
+    are written to a temporary file on local disk as they are produced, and the
+    result is memory-mapped from that file. This bounds the heap memory of the merge
+    to a few windows, however large the tables are.
+    """
+    blocks = [b for b in blocks if b.num_rows > 0]
+    if len(blocks) == 0:
+        return pyarrow.table({})
+    if len(blocks) == 1:
+        return blocks[0]
+    if not _can_merge_sorted(blocks, sort_key):
+        return concat_and_sort(blocks, sort_key)
+
+    from ray.data._internal.util import find_partition_range
+
+    columns = sort_key.get_columns()
+    # The key that comes first in the sort order.
+    first_key = max if sort_key.get_descending() else min
+
+    total_rows = sum(b.num_rows for b in blocks)
+    total_bytes = sum(b.nbytes for b in blocks)
+    window_rows = max(
+        1, window_size_bytes * total_rows // (max(total_bytes, 1) * len(blocks))
+    )
+
+    spill = (
+        spill_threshold_bytes is not None
+        and total_bytes > spill_threshold_bytes
+        # Spilled files are deleted while they are memory-mapped.
+        and os.name != "nt"
+        and all(b.schema.equals(blocks[0].schema) for b in blocks)
+    )
+    output = _SpilledTable(blocks[0].schema) if spill else _InMemoryTable()
+    try:
+        offsets = [0] * len(blocks)
+        while True:
+            windows = []
+            # The last keys of the windows of tables that have rows after the
+            # window. No row after such a key can be merged before reading more rows
+            # of its table.
+            limits = []
+            for block, offset in zip(blocks, offsets):
+                window = block.slice(offset, window_rows)
+                windows.append(window)
+                if offset + window.num_rows < block.num_rows:
+                    limits.append(_key_at(window, window.num_rows - 1, columns))
+            if all(window.num_rows == 0 for window in windows):
+                break
+
+            limit = first_key(limits) if limits else None
+            runs = []
+            for i, window in enumerate(windows):
+                if limit is None:
+                    num_rows = window.num_rows
+                else:
+                    _, num_rows = find_partition_range(window, limit, sort_key)
+                if num_rows > 0:
+                    runs.append(window.slice(0, num_rows))
+                    offsets[i] += num_rows
+            if len(runs) == 1:
+                output.append(runs[0])
+            else:
+                output.append(concat_and_sort(runs, sort_key))
+        return output.finish()
+    except BaseException:
+        output.close()
+        raise
+
+
+def _can_merge_sorted(blocks: List["pyarrow.Table"], sort_key: "SortKey") -> bool:
+    """Whether the key columns can be merged by comparing key values, i.e. they don't
+    contain nulls or NaNs, whose sort order isn't consistent with NumPy.
+    """
+    import pyarrow.compute as pac
+
+    for block in blocks:
+        for column in sort_key.get_columns():
+            col = block.column(column)
+            if col.null_count > 0:
+                return False
+            if pyarrow.types.is_floating(col.type) and pac.any(pac.is_nan(col)).as_py():
+                return False
+    return True
+
+
+def _key_at(table: "pyarrow.Table", index: int, columns: List[str]) -> Tuple[Any]:
+    return tuple(table.column(c).slice(index, 1).to_numpy()[0] for c in columns)
+
+
+class _InMemoryTable:
+    """Collects the merged rows in memory."""
+
+    def __init__(self):
+        self._tables = []
+
+    def append(self, table: "pyarrow.Table"):
+        self._tables.append(table)
+
+    def finish(self) -> "pyarrow.Table":
+        return concat(self._tables)
+
+    def close(self):
+        self._tables = []
+
+
+class _SpilledTable:
+    """Writes the merged rows to a temporary file on local disk."""
+
+    def __init__(self, schema: "pyarrow.Schema"):
+        import pyarrow.ipc
+
+        fd, self._path = tempfile.mkstemp(prefix="ray-data-sort-", suffix=".arrow")
+        os.close(fd)
+        self._sink = pyarrow.OSFile(self._path, "wb")
+        self._writer = pyarrow.ipc.new_stream(self._sink, schema)
+
+    def append(self, table: "pyarrow.Table"):
+        self._writer.write_table(table)
+
+    def finish(self) -> "pyarrow.Table":
+        import pyarrow.ipc
+
+        self._writer.close()
+        self._sink.close()
+        try:
+            source = pyarrow.memory_map(self._path)
+            return pyarrow.ipc.open_stream(source).read_all()
+        finally:
+            # The memory-mapped data stays readable after the file is removed.
+            os.remove(self._path)
+
+    def close(self):
+        if not self._sink.closed:
+            self._sink.close()
+        if os.path.exists(self._path):
+            os.remove(self._path)
+
+
 def combine_chunks(table: "pyarrow.Table") -> "pyarrow.Table":
     """This is pyarrow.Table.combine_chunks()
     with support for extension types.
@@ -1,4 +1,6 @@
-from typing import Optional
+from typing import Dict, List, Optional
+
+import numpy as np
 
 from ray.data._internal.arrow_block import ArrowBlockAccessor
 from ray.data._internal.arrow_ops import transform_pyarrow
@@ -13,11 +15,10 @@ from ray.data.block import Block, BlockAccessor
 # https://github.com/apache/arrow/issues/35126 is resolved.
 MIN_NUM_CHUNKS_TO_TRIGGER_COMBINE_CHUNKS = 2
 
-# Delay compaction until the shuffle buffer has reached this ratio over the min
-# shuffle buffer size. Setting this to 1 minimizes memory usage, at the cost of
-# frequent compactions. Setting this to higher values increases memory usage but
-# reduces compaction frequency.
-SHUFFLE_BUFFER_COMPACTION_RATIO = 1.5
+# The shuffling batcher copies the unyielded rows of a buffered block into a new
+# block once less than this fraction of its rows are left, so that the yielded rows
+# are released. This bounds the rows kept in memory to twice the rows in the buffer.
+MIN_UNYIELDED_FRACTION_TO_KEEP_BLOCK = 0.5
 
 
 class BatcherInterface:
@@ -169,20 +170,16 @@ class ShufflingBatcher(BatcherInterface):
 
     # Implementation Note:
     #
-    # This shuffling batcher lazily builds a shuffle buffer from added blocks, and once
-    # a batch is requested via .next_batch(), it concatenates the blocks into a concrete
-    # shuffle buffer and randomly shuffles the entire buffer.
-    #
-    # Adding of more blocks can be intermixed with retrieving batches, but it should be
-    # noted that we can end up performing two expensive operations on each retrieval:
-    #  1. Build added blocks into a concrete shuffle buffer.
-    #  2. Shuffling the entire buffer.
-    # To amortize the overhead of this process, we only shuffle the blocks after a
-    # delay designated by SHUFFLE_BUFFER_COMPACTION_RATIO.
+    # This shuffling batcher keeps the added blocks as they are, along with the
+    # (block, row) indices of their rows that haven't been yielded yet. Each batch is
+    # a uniform random sample of these rows, drawn without replacement, which is
+    # gathered from the blocks with a take() per block, and then put back into the
+    # sampled order so that it isn't grouped by block.
     #
-    # Similarly, adding blocks is very cheap. Each added block will be appended to a
-    # list, with concatenation of the underlying data delayed until the next batch
-    # compaction.
+    # A block is released once all of its rows are yielded. Since that can take a
+    # long time for large buffers, a block whose unyielded rows fall below
+    # MIN_UNYIELDED_FRACTION_TO_KEEP_BLOCK of its rows is compacted, i.e. replaced
+    # by a copy of its unyielded rows.
 
     def __init__(
         self,
@@ -206,19 +203,21 @@ class ShufflingBatcher(BatcherInterface):
         if batch_size is None:
             raise ValueError("Must specify a batch_size if using a local shuffle.")
         self._batch_size = batch_size
-        self._shuffle_seed = shuffle_seed
         if shuffle_buffer_min_size < batch_size:
             # Round it up internally to `batch_size` since our algorithm requires it.
             # This is harmless since it only offers extra randomization.
             shuffle_buffer_min_size = batch_size
-        self._buffer_capacity = max(
-            2 * shuffle_buffer_min_size,
-            shuffle_buffer_min_size + batch_size,
-        )
         self._buffer_min_size = shuffle_buffer_min_size
-        self._builder = DelegatingBlockBuilder()
-        self._shuffle_buffer: Block = None
-        self._batch_head = 0
+        self._rng = np.random.default_rng(shuffle_seed)
+        # The buffered blocks, and their numbers of unyielded rows, by block ID.
+        self._blocks: Dict[int, Block] = {}
+        self._num_rows_left: Dict[int, int] = {}
+        self._next_block_id = 0
+        # The block IDs and row indices of the unyielded rows, in the first
+        # `_num_rows` entries of these arrays.
+        self._block_ids = np.empty(0, dtype=np.int64)
+        self._row_ids = np.empty(0, dtype=np.int64)
+        self._num_rows = 0
         self._done_adding = False
 
     def add(self, block: Block):
@@ -229,8 +228,30 @@ class ShufflingBatcher(BatcherInterface):
         Args:
             block: Block to add to the shuffle buffer.
         """
-        if BlockAccessor.for_block(block).num_rows() > 0:
-            self._builder.add_block(block)
+        accessor = BlockAccessor.for_block(block)
+        num_rows = accessor.num_rows()
+        if num_rows == 0:
+            return
+        if (
+            isinstance(accessor, ArrowBlockAccessor)
+            and block.num_columns > 0
+            and block.column(0).num_chunks >= MIN_NUM_CHUNKS_TO_TRIGGER_COMBINE_CHUNKS
+        ):
+            # Combine the chunks once here, instead of on every take().
+            block = transform_pyarrow.combine_chunks(block)
+        block_id = self._next_block_id
+        self._next_block_id += 1
+        self._blocks[block_id] = block
+        self._num_rows_left[block_id] = num_rows
+
+        end = self._num_rows + num_rows
+        if end > len(self._block_ids):
+            capacity = max(end, 2 * len(self._block_ids))
+            self._block_ids = _resize(self._block_ids, self._num_rows, capacity)
+            self._row_ids = _resize(self._row_ids, self._num_rows, capacity)
+        self._block_ids[self._num_rows : end] = block_id
+        self._row_ids[self._num_rows : end] = np.arange(num_rows)
+        self._num_rows = end
 
     def done_adding(self) -> bool:
         """Indicate to the batcher that no more blocks will be added to the batcher.
@@ -241,39 +262,15 @@ class ShufflingBatcher(BatcherInterface):
 
     def has_any(self) -> bool:
         """Whether this batcher has any data."""
-        return self._buffer_size() > 0
+        return self._num_rows > 0
 
     def has_batch(self) -> bool:
         """Whether this batcher has any batches."""
-        buffer_size = self._buffer_size()
-
         if not self._done_adding:
-            # Delay pulling of batches until the buffer is large enough in order to
-            # amortize compaction overhead.
-            return self._materialized_buffer_size() >= self._buffer_min_size or (
-                buffer_size - self._batch_size
-                >= self._buffer_min_size * SHUFFLE_BUFFER_COMPACTION_RATIO
-            )
+            # Keep at least the min number of rows in the buffer after the batch.
+            return self._num_rows - self._batch_size >= self._buffer_min_size
         else:
-            return buffer_size >= self._batch_size
-
-    def _buffer_size(self) -> int:
-        """Return shuffle buffer size."""
-        buffer_size = self._builder.num_rows()
-        buffer_size += self._materialized_buffer_size()
-        return buffer_size
-
-    def _materialized_buffer_size(self) -> int:
-        """Return materialized (compacted portion of) shuffle buffer size."""
-        if self._shuffle_buffer is None:
-            return 0
-        # The size of the concrete (materialized) shuffle buffer, adjusting
-        # for the batch head position, which also serves as a counter of the number
-        # of already-yielded rows from the current concrete shuffle buffer.
-        return max(
-            0,
-            BlockAccessor.for_block(self._shuffle_buffer).num_rows() - self._batch_head,
-        )
+            return self._num_rows >= self._batch_size
 
     def next_batch(self) -> Block:
         """Get the next shuffled batch from the shuffle buffer.
@@ -282,51 +279,84 @@ class ShufflingBatcher(BatcherInterface):
             A batch represented as a Block.
         """
         assert self.has_batch() or (self._done_adding and self.has_any())
-        # Add rows in the builder to the shuffle buffer. Note that we delay compaction
-        # as much as possible to amortize the concatenation overhead. Compaction is
-        # only necessary when the materialized buffer size falls below the min size.
-        if self._builder.num_rows() > 0 and (
-            self._done_adding
-            or self._materialized_buffer_size() <= self._buffer_min_size
+        # Truncate the batch to the buffer size, if necessary.
+        batch_size = min(self._batch_size, self._num_rows)
+        positions = self._rng.choice(self._num_rows, batch_size, replace=False)
+        block_ids = self._block_ids[positions]
+        row_ids = self._row_ids[positions]
+        self._remove(positions)
+
+        # Gather the rows of each block at once.
+        order = np.argsort(block_ids, kind="stable")
+        block_ids = block_ids[order]
+        row_ids = row_ids[order]
+        unique_block_ids, starts, counts = np.unique(
+            block_ids, return_index=True, return_counts=True
+        )
+        output = DelegatingBlockBuilder()
+        to_compact = []
+        for block_id, start, count in zip(
+            unique_block_ids.tolist(), starts.tolist(), counts.tolist()
         ):
-            if self._shuffle_buffer is not None:
-                if self._batch_head > 0:
-                    # Compact the materialized shuffle buffer.
-                    block = BlockAccessor.for_block(self._shuffle_buffer)
-                    self._shuffle_buffer = block.slice(
-                        self._batch_head, block.num_rows()
-                    )
-                # Add the unyielded rows from the existing shuffle buffer.
-                self._builder.add_block(self._shuffle_buffer)
-            # Build the new shuffle buffer.
-            self._shuffle_buffer = self._builder.build()
-            self._shuffle_buffer = BlockAccessor.for_block(
-                self._shuffle_buffer
-            ).random_shuffle(self._shuffle_seed)
-            if self._shuffle_seed is not None:
-                self._shuffle_seed += 1
-            if (
-                isinstance(
-                    BlockAccessor.for_block(self._shuffle_buffer), ArrowBlockAccessor
-                )
-                and self._shuffle_buffer.num_columns > 0
-                and self._shuffle_buffer.column(0).num_chunks
-                >= MIN_NUM_CHUNKS_TO_TRIGGER_COMBINE_CHUNKS
+            accessor = BlockAccessor.for_block(self._blocks[block_id])
+            output.add_block(accessor.take(row_ids[start : start + count]))
+            self._num_rows_left[block_id] -= count
+            num_rows_left = self._num_rows_left[block_id]
+            if num_rows_left == 0:
+                del self._blocks[block_id]
+                del self._num_rows_left[block_id]
+            elif (
+                num_rows_left
+                < MIN_UNYIELDED_FRACTION_TO_KEEP_BLOCK * accessor.num_rows()
             ):
-                self._shuffle_buffer = transform_pyarrow.combine_chunks(
-                    self._shuffle_buffer
-                )
-            # Reset the builder.
-            self._builder = DelegatingBlockBuilder()
-            self._batch_head = 0
-
-        assert self._shuffle_buffer is not None
-        buffer_size = BlockAccessor.for_block(self._shuffle_buffer).num_rows()
-        # Truncate the batch to the buffer size, if necessary.
-        batch_size = min(self._batch_size, buffer_size)
-        slice_start = self._batch_head
-        self._batch_head += batch_size
-        # Yield the shuffled batch.
-        return BlockAccessor.for_block(self._shuffle_buffer).slice(
-            slice_start, self._batch_head
+                to_compact.append(block_id)
+        if to_compact:
+            self._compact(to_compact)
+
+        batch = output.build()
+        if len(unique_block_ids) > 1:
+            # Undo the grouping by block, restoring the random order of the sample.
+            batch = BlockAccessor.for_block(batch).take(np.argsort(order))
+        return batch
+
+    def _compact(self, block_ids: List[int]) -> None:
+        """Replace the given blocks by copies of their unyielded rows, so that their
+        yielded rows are released."""
+        positions = np.flatnonzero(
+            np.isin(self._block_ids[: self._num_rows], block_ids)
+        )
+        # Sort the positions by block, and by row within each block.
+        positions = positions[
+            np.lexsort((self._row_ids[positions], self._block_ids[positions]))
+        ]
+        _, starts, counts = np.unique(
+            self._block_ids[positions], return_index=True, return_counts=True
         )
+        for start, count in zip(starts.tolist(), counts.tolist()):
+            block_positions = positions[start : start + count]
+            block_id = int(self._block_ids[block_positions[0]])
+            accessor = BlockAccessor.for_block(self._blocks[block_id])
+            self._blocks[block_id] = accessor.take(self._row_ids[block_positions])
+            self._row_ids[block_positions] = np.arange(count)
+
+    def _remove(self, positions: np.ndarray) -> None:
+        """Remove the rows at the given positions from the buffer, by moving rows from
+        the end of the buffer into their places."""
+        tail_start = self._num_rows - len(positions)
+        in_tail = positions >= tail_start
+        # The rows at the end of the buffer that aren't removed.
+        is_kept = np.ones(len(positions), dtype=bool)
+        is_kept[positions[in_tail] - tail_start] = False
+        holes = positions[~in_tail]
+        kept = tail_start + np.flatnonzero(is_kept)
+        self._block_ids[holes] = self._block_ids[kept]
+        self._row_ids[holes] = self._row_ids[kept]
+        self._num_rows = tail_start
+
+
+def _resize(array: np.ndarray, size: int, capacity: int) -> np.ndarray:
+    """Return a copy of the first `size` entries of the array, with the given
+    capacity."""
+    resized = np.empty(capacity, dtype=array.dtype)
+    resized[:size] = array[:size]
+    return resized
@@ -0,0 +1,240 @@
+"""Overlapping the host-to-device copies of batches with their collation and use.
+
+Collated batches are copied into reusable host staging buffers (page-locked for
+GPUs) in the batch prefetching thread. The consumer then starts asynchronous
+copies of these buffers to the device ahead of the batch it's using, on a separate
+copy stream, so that collation, the copies and the training step overlap.
+"""
+import abc
+import collections
+import threading
+from typing import TYPE_CHECKING, Any, Callable, Deque, Iterator, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    import torch
+
+# The max number of free staging buffers to keep for reuse.
+DEFAULT_MAX_FREE_STAGING_BUFFERS = 16
+
+
+class BatchDevice(metaclass=abc.ABCMeta):
+    """A device that batches of tensors are copied to.
+
+    Copies are asynchronous: `copy` starts a copy and returns a handle to it, and
+    `wait` orders the consumer's later work on the device after the copy.
+    """
+
+    @abc.abstractmethod
+    def allocate_staging_buffer(
+        self, shape: Tuple[int, ...], dtype: "torch.dtype"
+    ) -> "torch.Tensor":
+        """Allocate a host buffer to stage tensors in before copying them."""
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def copy(self, tensor: "torch.Tensor") -> Tuple["torch.Tensor", Any]:
+        """Start copying a host tensor to the device.
+
+        Returns:
+            The tensor on the device, and a handle to the copy.
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def wait(self, tensor: "torch.Tensor", handle: Any) -> None:
+        """Make the consumer's later work on the device wait for the copy of the
+        given device tensor."""
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def synchronize(self, handle: Any) -> None:
+        """Block until the copy finishes, so that its source can be reused."""
+        raise NotImplementedError
+
+
+class CUDABatchDevice(BatchDevice):
+    """Copies batches from page-locked memory to a GPU on a separate stream."""
+
+    def __init__(self, device: "torch.device"):
+        import torch
+
+        self._device = device
+        self._stream = torch.cuda.Stream(device=device)
+
+    def allocate_staging_buffer(
+        self, shape: Tuple[int, ...], dtype: "torch.dtype"
+    ) -> "torch.Tensor":
+        import torch
+
+        return torch.empty(shape, dtype=dtype, pin_memory=True)
+
+    def copy(self, tensor: "torch.Tensor") -> Tuple["torch.Tensor", Any]:
+        import torch
+
+        with torch.cuda.stream(self._stream):
+            device_tensor = tensor.to(device=self._device, non_blocking=True)
+            event = torch.cuda.Event()
+            event.record(self._stream)
+        return device_tensor, event
+
+    def wait(self, tensor: "torch.Tensor", handle: Any) -> None:
+        import torch
+
+        stream = torch.cuda.current_stream(self._device)
+        stream.wait_event(handle)
+        # The tensor was allocated on the copy stream, so tell the caching
+        # allocator it's used on the consumer's stream.
+        tensor.record_stream(stream)
+
+    def synchronize(self, handle: Any) -> None:
+        handle.synchronize()
+
+
+class HostBatchDevice(BatchDevice):
+    """Copies batches synchronously, from pageable memory.
+
+    This is used for devices that don't support asynchronous copies, e.g. CPUs,
+    which lets the copy pipeline run and be tested without GPUs.
+    """
+
+    def __init__(self, device: "torch.device"):
+        self._device = device
+
+    def allocate_staging_buffer(
+        self, shape: Tuple[int, ...], dtype: "torch.dtype"
+    ) -> "torch.Tensor":
+        import torch
+
+        return torch.empty(shape, dtype=dtype)
+
+    def copy(self, tensor: "torch.Tensor") -> Tuple["torch.Tensor", Any]:
+        return tensor.to(device=self._device, copy=True), None
+
+    def wait(self, tensor: "torch.Tensor", handle: Any) -> None:
+        pass
+
+    def synchronize(self, handle: Any) -> None:
+        pass
+
+
+def get_batch_device(device: Any) -> BatchDevice:
+    """Return the batch device to copy batches to the given Torch device with."""
+    import torch
+
+    device = torch.device(device)
+    if device.type == "cuda":
+        return CUDABatchDevice(device)
+    return HostBatchDevice(device)
+
+
+class StagingBufferPool:
+    """A pool of reusable host buffers to stage batches in before copying them to
+    a device.
+
+    Buffers are reused for tensors of the same shape and dtype once the copies from
+    them have finished. This class is thread-safe, so that batches can be staged and
+    released by different threads.
+
+    Args:
+        device: The device that the staged batches are copied to.
+        max_free_buffers: The max number of free buffers to keep for reuse.
+    """
+
+    def __init__(
+        self,
+        device: BatchDevice,
+        max_free_buffers: int = DEFAULT_MAX_FREE_STAGING_BUFFERS,
+    ):
+        self._device = device
+        self._max_free_buffers = max_free_buffers
+        self._lock = threading.Lock()
+        # Free buffers, with the handles of the last copies from them, in the order
+        # they were released.
+        self._free_buffers: Deque[Tuple["torch.Tensor", Any]] = collections.deque()
+        self.num_allocated = 0
+
+    def stage(self, batch: Any) -> Any:
+        """Copy the tensors of a batch into staging buffers."""
+        return _map_tensors(batch, self._stage_tensor)
+
+    def release(self, buffer: "torch.Tensor", handle: Any) -> None:
+        """Return a buffer to the pool, once the copy with the given handle from it
+        has been started."""
+        with self._lock:
+            self._free_buffers.append((buffer, handle))
+            if len(self._free_buffers) > self._max_free_buffers:
+                self._free_buffers.popleft()
+
+    def _stage_tensor(self, tensor: "torch.Tensor") -> "torch.Tensor":
+        buffer = None
+        with self._lock:
+            for i, (free_buffer, handle) in enumerate(self._free_buffers):
+                if (
+                    free_buffer.shape == tensor.shape
+                    and free_buffer.dtype == tensor.dtype
+                ):
+                    buffer = free_buffer
+                    del self._free_buffers[i]
+                    break
+        if buffer is None:
+            buffer = self._device.allocate_staging_buffer(
+                tuple(tensor.shape), tensor.dtype
+            )
+            self.num_allocated += 1
+        elif handle is not None:
+            self._device.synchronize(handle)
+        buffer.copy_(tensor)
+        return buffer
+
+
+def prefetch_to_device(
+    batch_iter: Iterator[Any],
+    device: BatchDevice,
+    num_batches: int,
+    staging_buffer_pool: Optional[StagingBufferPool] = None,
+) -> Iterator[Any]:
+    """Copy batches of host tensors to a device, starting the copies of up to
+    `num_batches` batches ahead of the batch being consumed.
+
+    Args:
+        batch_iter: An iterator over batches of tensors, or dicts of tensors.
+        device: The device to copy the batches to.
+        num_batches: The number of batches to start copying ahead of the batch being
+            consumed. If 0, each batch is copied when it's consumed.
+        staging_buffer_pool: The pool that the tensors of the batches were staged in,
+            if any. The buffers are returned to it after they're copied.
+
+    Returns:
+        An iterator over the batches on the device.
+    """
+    in_flight: Deque[Tuple[Any, List[Tuple[Any, ...]]]] = collections.deque()
+
+    def start_copy(batch: Any) -> Tuple[Any, List[Tuple[Any, ...]]]:
+        copies = []
+
+        def copy(tensor: "torch.Tensor") -> "torch.Tensor":
+            device_tensor, handle = device.copy(tensor)
+            copies.append((tensor, device_tensor, handle))
+            return device_tensor
+
+        return _map_tensors(batch, copy), copies
+
+    def finish_copy(batch: Any, copies: List[Tuple[Any, ...]]) -> Any:
+        for tensor, device_tensor, handle in copies:
+            device.wait(device_tensor, handle)
+            if staging_buffer_pool is not None:
+                staging_buffer_pool.release(tensor, handle)
+        return batch
+
+    for batch in batch_iter:
+        in_flight.append(start_copy(batch))
+        if len(in_flight) > num_batches:
+            yield finish_copy(*in_flight.popleft())
+    while in_flight:
+        yield finish_copy(*in_flight.popleft())
+
+
+def _map_tensors(batch: Any, fn: Callable[["torch.Tensor"], "torch.Tensor"]) -> Any:
+    if isinstance(batch, dict):
+        return {name: fn(tensor) for name, tensor in batch.items()}
+    return fn(batch)
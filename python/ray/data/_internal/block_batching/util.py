@@ -6,6 +6,7 @@ from typing import Any, Callable, Iterator, List, Optional, Tuple, TypeVar, Unio
 
 import ray
 from ray.actor import ActorHandle
+from ray.data._internal.arrow_block import ArrowBlockAccessor
 from ray.data._internal.batcher import Batcher, ShufflingBatcher
 from ray.data._internal.block_batching.interfaces import (
     Batch,
@@ -150,16 +151,17 @@ def format_batches(
     Args:
         block_iter: An iterator over blocks.
         batch_format: The batch format to use.
-        stats: An optional stats object to record formatting times.
+        stats: An optional stats object to record formatting times and copies.
 
     Returns:
         An iterator over batch index and the formatted batch.
     """
     for batch in block_iter:
+        accessor = BlockAccessor.for_block(batch.data)
         with stats.iter_format_batch_s.timer() if stats else nullcontext():
-            formatted_batch = BlockAccessor.for_block(batch.data).to_batch_format(
-                batch_format
-            )
+            formatted_batch = accessor.to_batch_format(batch_format)
+        if stats and isinstance(accessor, ArrowBlockAccessor):
+            stats.iter_format_batch_bytes_copied.add(accessor.num_bytes_copied)
         yield Batch(batch.batch_idx, formatted_batch)
 
 
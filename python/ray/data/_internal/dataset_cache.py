@@ -0,0 +1,134 @@
+"""Persistent caching of Dataset results, keyed by the fingerprint of their plan.
+
+The blocks of a cached Dataset are stored as Arrow IPC stream files under
+``{location}/{fingerprint}/``. A manifest listing the files in block order is
+written last, so a cache entry is only visible once all of its files are written.
+"""
+import json
+import posixpath
+import uuid
+from typing import TYPE_CHECKING, List, Optional, Tuple
+
+import ray
+from ray.data._internal.arrow_block import ArrowBlockBuilder
+from ray.data._internal.remote_fn import cached_remote_fn
+from ray.data._internal.util import _is_local_scheme
+from ray.data.block import Block, BlockAccessor
+from ray.data.datasource.file_based_datasource import (
+    FileBasedDatasource,
+    _resolve_paths_and_filesystem,
+    _unwrap_s3_serialization_workaround,
+    _wrap_s3_serialization_workaround,
+)
+from ray.util.scheduling_strategies import NodeAffinitySchedulingStrategy
+
+if TYPE_CHECKING:
+    import pyarrow
+
+    from ray.data.dataset import Dataset
+
+_MANIFEST_FILE_NAME = "_manifest.json"
+
+
+class _ArrowIPCDatasource(FileBasedDatasource):
+    """Datasource for reading the Arrow IPC stream files of a cached Dataset."""
+
+    _FILE_EXTENSION = "arrow"
+
+    def _read_file(self, f: "pyarrow.NativeFile", path: str, **reader_args):
+        import pyarrow as pa
+
+        return pa.ipc.open_stream(f).read_all()
+
+
+def resolve_cache_dir(
+    location: str, fingerprint: str, filesystem: Optional["pyarrow.fs.FileSystem"]
+) -> Tuple[str, "pyarrow.fs.FileSystem"]:
+    """Return the directory of the cache entry of a fingerprint, and its filesystem."""
+    paths, filesystem = _resolve_paths_and_filesystem(location, filesystem)
+    return posixpath.join(paths[0], fingerprint), filesystem
+
+
+def read_cache(
+    cache_dir: str, filesystem: "pyarrow.fs.FileSystem"
+) -> Optional["Dataset"]:
+    """Return a Dataset reading the cache entry in `cache_dir`, or None if there's
+    no complete cache entry.
+    """
+    import pyarrow.fs
+
+    manifest_path = posixpath.join(cache_dir, _MANIFEST_FILE_NAME)
+    if filesystem.get_file_info(manifest_path).type == pyarrow.fs.FileType.NotFound:
+        return None
+    with filesystem.open_input_stream(manifest_path) as f:
+        manifest = json.loads(f.readall().decode())
+    paths = [posixpath.join(cache_dir, name) for name in manifest["files"]]
+    return ray.data.read_datasource(
+        _ArrowIPCDatasource(),
+        paths=paths,
+        filesystem=filesystem,
+        parallelism=len(paths),
+    )
+
+
+def write_cache(
+    ds: "Dataset",
+    cache_dir: str,
+    filesystem: "pyarrow.fs.FileSystem",
+    location: str,
+) -> None:
+    """Write the blocks of a materialized Dataset to the cache entry in `cache_dir`.
+
+    Files of failed or concurrent writes of the same entry don't conflict, since
+    each write uses its own file name prefix, and only the files listed in the
+    manifest are read.
+    """
+    filesystem.create_dir(cache_dir, recursive=True)
+    remote_args = {}
+    if _is_local_scheme(location):
+        remote_args["scheduling_strategy"] = NodeAffinitySchedulingStrategy(
+            ray.get_runtime_context().get_node_id(), soft=False
+        )
+    write_block = cached_remote_fn(_write_block).options(**remote_args)
+
+    blocks = ds.get_internal_block_refs()
+    if len(blocks) == 0:
+        # Write an empty block, so that reading the cache entry yields a Dataset.
+        blocks = [ray.put(ArrowBlockBuilder._empty_table())]
+    write_uuid = uuid.uuid4().hex
+    wrapped_filesystem = _wrap_s3_serialization_workaround(filesystem)
+    file_names = [
+        f"{write_uuid}_{i:06}.{_ArrowIPCDatasource._FILE_EXTENSION}"
+        for i in range(len(blocks))
+    ]
+    ray.get(
+        [
+            write_block.remote(
+                block, posixpath.join(cache_dir, name), wrapped_filesystem
+            )
+            for block, name in zip(blocks, file_names)
+        ]
+    )
+    _write_manifest(cache_dir, filesystem, file_names)
+
+
+def _write_block(block: Block, path: str, filesystem: "pyarrow.fs.FileSystem"):
+    import pyarrow as pa
+
+    filesystem = _unwrap_s3_serialization_workaround(filesystem)
+    table = BlockAccessor.for_block(block).to_arrow()
+    with filesystem.open_output_stream(path) as f:
+        with pa.ipc.new_stream(f, table.schema) as writer:
+            writer.write_table(table)
+
+
+def _write_manifest(
+    cache_dir: str, filesystem: "pyarrow.fs.FileSystem", file_names: List[str]
+) -> None:
+    manifest = json.dumps({"files": file_names}).encode()
+    # Write the manifest to a temporary file first, so that readers never see a
+    # partially written manifest.
+    tmp_path = posixpath.join(cache_dir, f".{uuid.uuid4().hex}{_MANIFEST_FILE_NAME}")
+    with filesystem.open_output_stream(tmp_path) as f:
+        f.write(manifest)
+    filesystem.move(tmp_path, posixpath.join(cache_dir, _MANIFEST_FILE_NAME))
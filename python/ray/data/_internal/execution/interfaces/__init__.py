@@ -4,13 +4,14 @@ from .executor import Executor, OutputIterator
 from .physical_operator import PhysicalOperator
 from .ref_bundle import RefBundle
 from .task_context import TaskContext
-from .transform_fn import AllToAllTransformFn
+from .transform_fn import AllToAllTransformFn, JoinTransformFn
 
 __all__ = [
     "AllToAllTransformFn",
     "ExecutionOptions",
     "ExecutionResources",
     "Executor",
+    "JoinTransformFn",
     "NodeIdStr",
     "OutputIterator",
     "PhysicalOperator",
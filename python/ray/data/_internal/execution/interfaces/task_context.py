@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, Dict, Optional
 
 from ray.data._internal.progress_bar import ProgressBar
@@ -20,6 +20,11 @@ class TaskContext:
     # TODO(chengsu): clean it up from TaskContext with new optimizer framework.
     sub_progress_bar_dict: Optional[Dict[str, ProgressBar]] = None
 
+    # The extra metrics reported by a blocking transformation, e.g. skew statistics
+    # of an aggregation. They're shown with the operator stats. Note this is only
+    # used on driver side.
+    extra_metrics: Dict[str, Any] = field(default_factory=dict)
+
     # NOTE(hchen): `upstream_map_transformer` and `upstream_map_ray_remote_args`
     # are only used for `RandomShuffle`. DO NOT use them for other operators.
     # Ideally, they should be handled by the optimizer, and should be transparent
@@ -8,3 +8,9 @@ from ray.data._internal.stats import StatsDict
 AllToAllTransformFn = Callable[
     [List[RefBundle], TaskContext], Tuple[List[RefBundle], StatsDict]
 ]
+
+# Block transform function applied in JoinOperator. The inputs are the list of
+# input ref bundles of the left and right side respectively.
+JoinTransformFn = Callable[
+    [List[RefBundle], List[RefBundle], TaskContext], Tuple[List[RefBundle], StatsDict]
+]
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 from ray.data._internal.execution.interfaces import (
     AllToAllTransformFn,
@@ -66,6 +66,7 @@ class AllToAllOperator(PhysicalOperator):
         self._input_buffer: List[RefBundle] = []
         self._output_buffer: List[RefBundle] = []
         self._stats: StatsDict = {}
+        self._metrics: Dict[str, Any] = {}
         super().__init__(name, [input_op])
 
     def num_outputs_total(self) -> Optional[int]:
@@ -86,6 +87,7 @@ class AllToAllOperator(PhysicalOperator):
             sub_progress_bar_dict=self._sub_progress_bar_dict,
         )
         self._output_buffer, self._stats = self._bulk_fn(self._input_buffer, ctx)
+        self._metrics = ctx.extra_metrics
         self._next_task_index += 1
         self._input_buffer.clear()
         super().all_inputs_done()
@@ -99,6 +101,9 @@ class AllToAllOperator(PhysicalOperator):
     def get_stats(self) -> StatsDict:
         return self._stats
 
+    def get_metrics(self) -> Dict[str, Any]:
+        return self._metrics
+
     def get_transformation_fn(self) -> AllToAllTransformFn:
         return self._bulk_fn
 
@@ -0,0 +1,84 @@
+from typing import List, Optional, Tuple
+
+from ray.data._internal.execution.interfaces import (
+    JoinTransformFn,
+    PhysicalOperator,
+    RefBundle,
+    TaskContext,
+)
+from ray.data._internal.execution.operators.base_physical_operator import (
+    AllToAllOperator,
+)
+from ray.data._internal.planner.exchange.interfaces import ExchangeTaskSpec
+from ray.data._internal.stats import StatsDict
+
+
+class JoinOperator(AllToAllOperator):
+    """An operator that joins its two inputs on key columns.
+
+    Like other all-to-all operators, this is a blocking operator that executes once
+    the inputs of both sides are complete.
+    """
+
+    def __init__(
+        self,
+        join_fn: JoinTransformFn,
+        left_input_op: PhysicalOperator,
+        right_input_op: PhysicalOperator,
+        num_outputs: Optional[int] = None,
+    ):
+        """Create a JoinOperator.
+
+        Args:
+            join_fn: The blocking join function to run. The inputs are the lists of
+                input ref bundles of the left and right side, and the outputs are
+                the output ref bundles and a stats dict.
+            left_input_op: The input operator at left hand side.
+            right_input_op: The input operator at right hand side.
+            num_outputs: The number of expected output bundles for progress bar.
+        """
+        self._join_fn = join_fn
+        self._right_input_buffer: List[RefBundle] = []
+        super().__init__(
+            self._join,
+            left_input_op,
+            num_outputs=num_outputs,
+            sub_progress_bar_names=[
+                ExchangeTaskSpec.MAP_SUB_PROGRESS_BAR_NAME,
+                ExchangeTaskSpec.REDUCE_SUB_PROGRESS_BAR_NAME,
+            ],
+            name="Join",
+        )
+        # AllToAllOperator only registers a single input dependency, so register
+        # the right hand side here.
+        self._input_dependencies.append(right_input_op)
+        right_input_op._output_dependencies.append(self)
+
+    def num_outputs_total(self) -> Optional[int]:
+        if self._num_outputs:
+            return self._num_outputs
+        left_num_outputs = self.input_dependencies[0].num_outputs_total()
+        right_num_outputs = self.input_dependencies[1].num_outputs_total()
+        if left_num_outputs is not None and right_num_outputs is not None:
+            return max(left_num_outputs, right_num_outputs)
+        elif left_num_outputs is not None:
+            return left_num_outputs
+        else:
+            return right_num_outputs
+
+    def add_input(self, refs: RefBundle, input_index: int) -> None:
+        assert not self.completed()
+        assert input_index == 0 or input_index == 1, input_index
+        if input_index == 0:
+            self._input_buffer.append(refs)
+        else:
+            self._right_input_buffer.append(refs)
+
+    def all_inputs_done(self) -> None:
+        super().all_inputs_done()
+        self._right_input_buffer.clear()
+
+    def _join(
+        self, left_input: List[RefBundle], ctx: TaskContext
+    ) -> Tuple[List[RefBundle], StatsDict]:
+        return self._join_fn(left_input, self._right_input_buffer, ctx)
@@ -1,4 +1,5 @@
 import math
+import threading
 from collections import deque
 from typing import Dict, List, Optional
 
@@ -28,6 +29,14 @@ class OutputSplitter(PhysicalOperator):
     has a minimum size calculated to enable a good locality hit rate, as well as ensure
     we can satisfy the `equal` requirement.
 
+    If `max_outstanding_bundles` is set, the consumers of the output splits must call
+    `on_output_consumed()` for each bundle they take. Each output split is then only
+    assigned up to `max_outstanding_bundles` bundles that haven't been consumed yet,
+    and the remaining bundles stay in the buffer until its consumer catches up. This
+    bounds the object store memory held for slow consumers, and backpressures the
+    upstream operators instead. If `equal` is not set, bundles are assigned to the
+    other output splits in the meantime, so faster consumers get more of the data.
+
     OutputSplitter does not provide any ordering guarantees.
     """
 
@@ -37,6 +46,7 @@ class OutputSplitter(PhysicalOperator):
         n: int,
         equal: bool,
         locality_hints: Optional[List[NodeIdStr]] = None,
+        max_outstanding_bundles: Optional[int] = None,
     ):
         super().__init__(f"split({n}, equal={equal})", [input_op])
         self._equal = equal
@@ -47,6 +57,24 @@ class OutputSplitter(PhysicalOperator):
         # The number of rows output to each output split so far.
         self._num_output: List[int] = [0 for _ in range(n)]
 
+        if max_outstanding_bundles is not None and max_outstanding_bundles < 1:
+            raise ValueError(
+                "max_outstanding_bundles must be at least 1, got "
+                f"{max_outstanding_bundles}"
+            )
+        self._max_outstanding_bundles = max_outstanding_bundles
+        # The number of bundles output to each output split that haven't been
+        # consumed yet, and the max of that so far. Guarded by self._lock, since
+        # bundles are consumed from other threads.
+        self._num_outstanding: List[int] = [0 for _ in range(n)]
+        self._max_num_outstanding: List[int] = [0 for _ in range(n)]
+        self._lock = threading.Lock()
+        # Whether the buffer is waiting for consumers to catch up.
+        self._waiting_for_consumers = False
+        # The number of bundles assigned to other output splits than the one with the
+        # least data, because its consumer was behind.
+        self._num_rebalanced = 0
+
         if locality_hints is not None:
             if n != len(locality_hints):
                 raise ValueError(
@@ -81,9 +109,27 @@ class OutputSplitter(PhysicalOperator):
         """
         return True
 
+    def should_add_input(self) -> bool:
+        # Stop taking inputs once the buffer holds a couple bundles per output split
+        # and is waiting for consumers to catch up. Otherwise the buffer would grow
+        # without bounds while consumers are behind.
+        return not self._waiting_for_consumers or len(self._buffer) < max(
+            self._min_buffer_size, 2 * len(self._num_output)
+        )
+
     def has_next(self) -> bool:
+        if self._buffer and self._waiting_for_consumers:
+            # Dispatch the bundles that were waiting for consumers to catch up.
+            self._dispatch_bundles(
+                dispatch_all=self._inputs_complete and not self._equal
+            )
         return len(self._output_queue) > 0
 
+    def completed(self) -> bool:
+        # Bundles may still be waiting for consumers to catch up after all inputs
+        # are done.
+        return super().completed() and not self._buffer
+
     def get_next(self) -> RefBundle:
         return self._output_queue.popleft()
 
@@ -94,8 +140,23 @@ class OutputSplitter(PhysicalOperator):
         stats = {}
         for i, num in enumerate(self._num_output):
             stats[f"num_output_{i}"] = num
+        if self._max_outstanding_bundles is not None:
+            with self._lock:
+                for i, num in enumerate(self._num_outstanding):
+                    stats[f"num_outstanding_{i}"] = num
+                for i, num in enumerate(self._max_num_outstanding):
+                    stats[f"max_outstanding_{i}"] = num
+            stats["num_rebalanced"] = self._num_rebalanced
         return stats
 
+    def on_output_consumed(self, output_split_idx: int) -> None:
+        """Notify this operator that a bundle of an output split was consumed.
+
+        This is thread-safe, so that consumers can call it from their own threads.
+        """
+        with self._lock:
+            self._num_outstanding[output_split_idx] -= 1
+
     def add_input(self, bundle, input_index) -> None:
         if bundle.num_rows() is None:
             raise ValueError("OutputSplitter requires bundles with known row count")
@@ -106,7 +167,9 @@ class OutputSplitter(PhysicalOperator):
         super().all_inputs_done()
         if not self._equal:
             self._dispatch_bundles(dispatch_all=True)
-            assert not self._buffer, "Should have dispatched all bundles."
+            assert (
+                not self._buffer or self._waiting_for_consumers
+            ), "Should have dispatched all bundles."
             return
 
         # Otherwise:
@@ -130,7 +193,9 @@ class OutputSplitter(PhysicalOperator):
             for b in bundles:
                 b.output_split_idx = i
                 self._output_queue.append(b)
+                self._add_outstanding(i)
         self._buffer = []
+        self._waiting_for_consumers = False
 
     def internal_queue_size(self) -> int:
         return len(self._buffer)
@@ -149,16 +214,22 @@ class OutputSplitter(PhysicalOperator):
 
     def _dispatch_bundles(self, dispatch_all: bool = False) -> None:
         # Dispatch all dispatchable bundles from the internal buffer.
-        # This may not dispatch all bundles when equal=True.
+        # This may not dispatch all bundles when equal=True, or when consumers are
+        # behind.
+        self._waiting_for_consumers = False
         while self._buffer and (
             dispatch_all or len(self._buffer) >= self._min_buffer_size
         ):
             target_index = self._select_output_index()
+            if target_index is None:
+                self._waiting_for_consumers = True
+                break
             target_bundle = self._pop_bundle_to_dispatch(target_index)
             if self._can_safely_dispatch(target_index, target_bundle.num_rows()):
                 target_bundle.output_split_idx = target_index
                 self._num_output[target_index] += target_bundle.num_rows()
                 self._output_queue.append(target_bundle)
+                self._add_outstanding(target_index)
                 if self._locality_hints:
                     preferred_loc = self._locality_hints[target_index]
                     if self._get_location(target_bundle) == preferred_loc:
@@ -170,10 +241,43 @@ class OutputSplitter(PhysicalOperator):
                 self._buffer.insert(0, target_bundle)
                 break
 
-    def _select_output_index(self) -> int:
+    def _select_output_index(self) -> Optional[int]:
         # Greedily dispatch to the consumer with the least data so far.
         i, _ = min(enumerate(self._num_output), key=lambda t: t[1])
-        return i
+        if self._has_capacity(i):
+            return i
+        if self._equal:
+            # Wait for the consumer to catch up, since dispatching to the other
+            # consumers would only grow the buffer needed to equalize the splits.
+            return None
+        # Rebalance to the consumer with the least data among the ones that aren't
+        # behind.
+        candidates = [
+            (j, num) for j, num in enumerate(self._num_output) if self._has_capacity(j)
+        ]
+        if not candidates:
+            return None
+        self._num_rebalanced += 1
+        j, _ = min(candidates, key=lambda t: t[1])
+        return j
+
+    def _has_capacity(self, output_split_idx: int) -> bool:
+        """Return whether more bundles can be output to the given output split."""
+        if self._max_outstanding_bundles is None:
+            return True
+        with self._lock:
+            num_outstanding = self._num_outstanding[output_split_idx]
+        return num_outstanding < self._max_outstanding_bundles
+
+    def _add_outstanding(self, output_split_idx: int) -> None:
+        if self._max_outstanding_bundles is None:
+            return
+        with self._lock:
+            self._num_outstanding[output_split_idx] += 1
+            self._max_num_outstanding[output_split_idx] = max(
+                self._max_num_outstanding[output_split_idx],
+                self._num_outstanding[output_split_idx],
+            )
 
     def _pop_bundle_to_dispatch(self, target_index: int) -> RefBundle:
         if self._locality_hints:
@@ -4,6 +4,7 @@ This is split out from streaming_executor.py to facilitate better unit testing.
 """
 
 import math
+import os
 import time
 from collections import deque
 from dataclasses import dataclass
@@ -41,6 +42,26 @@ DEFAULT_OBJECT_STORE_MEMORY_LIMIT_FRACTION = 0.25
 # Min number of seconds between two autoscaling requests.
 MIN_GAP_BETWEEN_AUTOSCALING_REQUESTS = 20
 
+# Whether to backpressure operators that produce outputs faster than their
+# downstream operator consumes them. See `_throughput_allowed()`.
+THROUGHPUT_BACKPRESSURE_ENABLED = bool(
+    int(os.environ.get("RAY_DATA_THROUGHPUT_BACKPRESSURE", "1"))
+)
+
+# The number of seconds of work to keep queued for an operator. Upstream operators
+# are backpressured once more outputs than that are queued for their downstream
+# operator, at the rate the downstream operator consumes them.
+THROUGHPUT_BACKPRESSURE_HORIZON_S = 10
+
+# Operators are never backpressured on throughput with fewer outputs queued.
+THROUGHPUT_BACKPRESSURE_MIN_QUEUED = 4
+
+# The window over which operator input and output rates are measured.
+THROUGHPUT_WINDOW_S = 30
+
+# The min number of seconds of measurements needed to estimate a rate.
+MIN_THROUGHPUT_MEASUREMENT_S = 5
+
 
 @dataclass
 class AutoscalingState:
@@ -86,6 +107,42 @@ class TopologyResourceUsage:
         return TopologyResourceUsage(cur_usage, downstream_usage)
 
 
+class RollingRate:
+    """Rate of events (e.g. bundles consumed by an operator) over a rolling window.
+
+    Note: the events are recorded by the scheduling thread only.
+    """
+
+    def __init__(self, window_s: float = THROUGHPUT_WINDOW_S):
+        self._window_s = window_s
+        self._events: Deque[float] = deque()
+        self._start_ts: Optional[float] = None
+
+    def record(self, now: Optional[float] = None) -> None:
+        """Record an event at the given time, or now."""
+        now = time.time() if now is None else now
+        if self._start_ts is None:
+            self._start_ts = now
+        self._events.append(now)
+        self._evict(now)
+
+    def rate(self, now: Optional[float] = None) -> Optional[float]:
+        """Return the number of events per second in the window, or None if the
+        events don't span long enough to estimate a rate yet."""
+        now = time.time() if now is None else now
+        if self._start_ts is None:
+            return None
+        elapsed = min(now - self._start_ts, self._window_s)
+        if elapsed < MIN_THROUGHPUT_MEASUREMENT_S:
+            return None
+        self._evict(now)
+        return len(self._events) / elapsed
+
+    def _evict(self, now: float) -> None:
+        while self._events and self._events[0] < now - self._window_s:
+            self._events.popleft()
+
+
 @dataclass
 class DownstreamMemoryInfo:
     """Mem stats of an operator and its downstream operators in a topology."""
@@ -126,6 +183,10 @@ class OpState:
         # Tracks whether `input_done` is called for each input op.
         self.input_done_called = [False] * len(op.input_dependencies)
         self.dependents_completed_called = False
+        # The rates at which the operator consumes input bundles and produces
+        # output bundles, for throughput-based backpressure.
+        self.input_rate = RollingRate()
+        self.output_rate = RollingRate()
 
     def initialize_progress_bars(self, index: int, verbose_progress: bool) -> int:
         """Create progress bars at the given index (line offset in console).
@@ -168,6 +229,7 @@ class OpState:
     def add_output(self, ref: RefBundle) -> None:
         """Move a bundle produced by the operator to its outqueue."""
         self.outqueue.append(ref)
+        self.output_rate.record()
         self.num_completed_tasks += 1
         if self.progress_bar:
             self.progress_bar.update(1)
@@ -196,6 +258,7 @@ class OpState:
         for i, inqueue in enumerate(self.inqueues):
             if inqueue:
                 self.op.add_input(inqueue.popleft(), input_index=i)
+                self.input_rate.record()
                 return
         assert False, "Nothing to dispatch"
 
@@ -388,7 +451,11 @@ def select_operator_to_run(
 
     This is currently implemented by applying backpressure on operators that are
     producing outputs faster than they are consuming them `len(outqueue)`, as well as
-    operators with a large number of running tasks `num_processing()`.
+    operators with a large number of running tasks `num_processing()`. Operators are
+    also backpressured once their outputs queued for a downstream operator would
+    keep it busy for a while, at the rate it was measured to consume them (see
+    `_throughput_allowed()`). This keeps the slowest operator saturated, while its
+    upstream operators leave their resources and object store memory to it.
 
     Note that memory limits also apply to the outqueue of the output operator. This
     provides backpressure if the consumer is slow. However, once a bundle is returned
@@ -406,6 +473,7 @@ def select_operator_to_run(
             and op.should_add_input()
             and under_resource_limits
             and not op.completed()
+            and _throughput_allowed(op, topology)
         ):
             ops.append(op)
         # Update the op in all cases to enable internal autoscaling, etc.
@@ -496,6 +564,37 @@ def _try_to_scale_up_cluster(topology: Topology, execution_id: str):
     actor.request_resources.remote(resource_request, execution_id)
 
 
+def _throughput_allowed(op: PhysicalOperator, topology: Topology) -> bool:
+    """Return whether an operator is allowed to execute given the throughput of its
+    downstream operators.
+
+    An operator is throttled if any of its downstream operators has more of its
+    outputs queued than it can consume in `THROUGHPUT_BACKPRESSURE_HORIZON_S`
+    seconds, at its rate of consuming inputs. Since a downstream operator with
+    queued inputs consumes them as fast as it can, this rate is its throughput.
+    Operators with no measured rate yet are never throttled.
+
+    Args:
+        op: The operator to check.
+        topology: The execution state of the topology.
+
+    Returns:
+        Whether the op is allowed to run.
+    """
+    if not THROUGHPUT_BACKPRESSURE_ENABLED or op.throttling_disabled():
+        return True
+
+    num_queued = len(topology[op].outqueue)
+    if num_queued < THROUGHPUT_BACKPRESSURE_MIN_QUEUED:
+        return True
+    now = time.time()
+    for dep in op.output_dependencies:
+        rate = topology[dep].input_rate.rate(now)
+        if rate is not None and num_queued > rate * THROUGHPUT_BACKPRESSURE_HORIZON_S:
+            return False
+    return True
+
+
 def _execution_allowed(
     op: PhysicalOperator,
     global_usage: TopologyResourceUsage,
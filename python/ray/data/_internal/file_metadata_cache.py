@@ -0,0 +1,356 @@
+"""An on-disk cache of file listings and Parquet footers, shared across drivers.
+
+Listing the files under large prefixes and reading the footers of every Parquet
+file can take minutes on cloud storage. This cache stores them under a directory
+set by `DataContext.file_metadata_cache_dir`, so that later reads of the same
+files, possibly by other drivers, only refresh what changed:
+
+- A directory listing is reused if the modification times of the directory and
+  all of its subdirectories are unchanged, i.e. no files were added, removed or
+  renamed. Filesystems that don't report modification times for directories
+  (e.g. S3) are listed again, unless `DataContext.file_metadata_cache_listing_ttl_s`
+  is set, in which case their listings are reused for that many seconds, even if
+  files were added or removed since. Note that the file sizes of a reused listing
+  are stale for files overwritten in place; they're only used as size estimates.
+- A Parquet footer is reused if the size and modification time of its file, as
+  reported by a fresh listing of the parent directory, are unchanged. Cached
+  footers are decoded in the tasks that fetch the footers of the other files.
+
+Listings and footers are dropped from the cache once they're older than a week,
+so that the entries of files that are no longer read don't build up.
+
+Entries are written to temporary files that are then moved into place, so
+concurrent writers can only lose each other's updates, not corrupt the cache.
+
+Entries are stored as JSON, and Parquet footers in the Parquet metadata format,
+so reading the cache never runs code from it. Anyone who can write to the cache
+directory can still make reads list the wrong files or report the wrong row counts
+and schemas, so the cache directory should only be writable by trusted users.
+"""
+import base64
+import hashlib
+import json
+import logging
+import posixpath
+import time
+import uuid
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    import pyarrow
+    import pyarrow.parquet
+
+logger = logging.getLogger(__name__)
+
+# A file path, size and modification time in nanoseconds.
+FileEntry = Tuple[str, int, Optional[int]]
+# The size and modification time of a Parquet file, its footer, and the time in
+# seconds when the footer was cached.
+ParquetCacheEntry = Tuple[int, int, str, float]
+
+_LISTINGS_DIR = "listings"
+_PARQUET_DIR = "parquet"
+# The number of hex digits of the path digest that select a Parquet footer shard.
+_PARQUET_SHARD_DIGITS = 2
+# The age in seconds after which cache entries are dropped.
+_MAX_ENTRY_AGE_S = 7 * 24 * 60 * 60
+
+
+class FileMetadataCache:
+    """On-disk cache of file listings and Parquet footers.
+
+    Args:
+        cache_dir: The directory to store the cache in, on local disk or shared
+            storage, e.g. ``"s3://bucket/metadata_cache"``.
+        listing_ttl_s: How long to reuse the listings of directories whose
+            modification times the filesystem doesn't report. If None, these
+            directories are always listed again.
+    """
+
+    def __init__(self, cache_dir: str, listing_ttl_s: Optional[float] = None):
+        from ray.data.datasource.file_based_datasource import (
+            _resolve_paths_and_filesystem,
+        )
+
+        paths, self._filesystem = _resolve_paths_and_filesystem(cache_dir)
+        self._cache_dir = paths[0]
+        self._listing_ttl_s = listing_ttl_s
+
+    def list_directory(
+        self,
+        path: str,
+        filesystem: "pyarrow.fs.FileSystem",
+        recursive: bool = True,
+        ignore_missing_path: bool = False,
+    ) -> List[FileEntry]:
+        """Return the files in the given directory, sorted by path.
+
+        Args:
+            path: The directory to list.
+            filesystem: The filesystem of the directory.
+            recursive: Whether to also list the files in subdirectories.
+            ignore_missing_path: If True, returns no files if the directory doesn't
+                exist, instead of raising an error.
+        """
+        key = f"{filesystem.type_name}://{path}?recursive={recursive}"
+        entry_path = posixpath.join(self._cache_dir, _LISTINGS_DIR, _digest(key))
+        entry = self._read_entry(entry_path)
+        if entry is not None and self._listing_unchanged(entry, filesystem):
+            return [tuple(file_entry) for file_entry in entry["files"]]
+
+        listed_at = time.time()
+        files, mtimes = _list_directory(
+            path, filesystem, recursive, ignore_missing_path
+        )
+        if (
+            all(mtime is not None for mtime in mtimes.values())
+            or self._listing_ttl_s is not None
+        ):
+            self._write_entry(
+                entry_path, {"listed_at": listed_at, "mtimes": mtimes, "files": files}
+            )
+            self._prune()
+        return files
+
+    def _listing_unchanged(
+        self, entry: Dict[str, Any], filesystem: "pyarrow.fs.FileSystem"
+    ) -> bool:
+        if all(mtime is not None for mtime in entry["mtimes"].values()):
+            return _directories_unchanged(entry["mtimes"], filesystem)
+        return (
+            self._listing_ttl_s is not None
+            and time.time() - entry["listed_at"] < self._listing_ttl_s
+        )
+
+    def _prune(self) -> None:
+        """Delete the cache files, including the temporary files of failed writes,
+        that weren't written in the last `_MAX_ENTRY_AGE_S`."""
+        from pyarrow.fs import FileSelector
+
+        min_mtime_ns = (time.time() - _MAX_ENTRY_AGE_S) * 1e9
+        for subdir in [_LISTINGS_DIR, _PARQUET_DIR]:
+            selector = FileSelector(
+                posixpath.join(self._cache_dir, subdir), allow_not_found=True
+            )
+            for info in self._filesystem.get_file_info(selector):
+                if (
+                    info.is_file
+                    and info.mtime_ns is not None
+                    and info.mtime_ns < min_mtime_ns
+                ):
+                    try:
+                        self._filesystem.delete_file(info.path)
+                    except FileNotFoundError:
+                        # Another driver deleted it first.
+                        pass
+
+    def get_file_entries(
+        self, paths: List[str], filesystem: "pyarrow.fs.FileSystem"
+    ) -> Dict[str, FileEntry]:
+        """Return the current entries of the given files that exist, by listing
+        their parent directories.
+        """
+        paths_by_parent: Dict[str, List[str]] = {}
+        for path in paths:
+            paths_by_parent.setdefault(posixpath.dirname(path), []).append(path)
+        entries = {}
+        for parent, parent_paths in paths_by_parent.items():
+            # Don't reuse cached listings, since their files may have been
+            # overwritten in place since.
+            files, _ = _list_directory(
+                parent, filesystem, recursive=False, ignore_missing_path=True
+            )
+            listing = {entry[0]: entry for entry in files}
+            for path in parent_paths:
+                if path in listing:
+                    entries[path] = listing[path]
+        return entries
+
+    def get_parquet_metadata(
+        self,
+        pieces: List["pyarrow.dataset.ParquetFileFragment"],
+        fetch: Callable[
+            [List["pyarrow.dataset.ParquetFileFragment"], List[Optional[str]]],
+            Optional[List["pyarrow.parquet.FileMetaData"]],
+        ],
+    ) -> Optional[List["pyarrow.parquet.FileMetaData"]]:
+        """Return the footers of the given Parquet files, reusing the cached footers
+        of unmodified files.
+
+        Args:
+            pieces: The Parquet files.
+            fetch: Called with the pieces and the cached footer of each piece, or
+                None if it must be read from the file. Returns the footer of each
+                piece, decoding the cached ones with `_decode_footer`.
+
+        Returns:
+            The footer of each piece, in the order of `pieces`, or None if `fetch`
+            didn't return the footers of all pieces.
+        """
+        if not pieces:
+            return fetch(pieces, [])
+        entries = self.get_file_entries(
+            [piece.path for piece in pieces], pieces[0].filesystem
+        )
+        shards: Dict[str, Dict[str, ParquetCacheEntry]] = {}
+        footers: List[Optional[str]] = []
+        for piece in pieces:
+            shard = self._get_parquet_shard(shards, piece.path)
+            entry = entries.get(piece.path)
+            cached = shard.get(piece.path)
+            if entry is not None and cached is not None and cached[:2] == entry[1:]:
+                footers.append(cached[2])
+            else:
+                footers.append(None)
+
+        metadata = fetch(pieces, footers)
+        if metadata is None or len(metadata) != len(pieces):
+            return None
+        cached_at = time.time()
+        dirty_shards = set()
+        for piece, footer, piece_metadata in zip(pieces, footers, metadata):
+            entry = entries.get(piece.path)
+            if footer is not None or entry is None or entry[2] is None:
+                continue
+            footer = _encode_footer(piece_metadata)
+            if footer is not None:
+                shard_name = _parquet_shard_name(piece.path)
+                shards[shard_name][piece.path] = (entry[1], entry[2], footer, cached_at)
+                dirty_shards.add(shard_name)
+        for shard_name in dirty_shards:
+            self._write_parquet_shard(shard_name, shards[shard_name])
+        if dirty_shards:
+            self._prune()
+        logger.debug(
+            f"Reused {len(pieces) - footers.count(None)} of {len(pieces)} Parquet "
+            f"footers from the file metadata cache."
+        )
+        return metadata
+
+    def _get_parquet_shard(
+        self, shards: Dict[str, Dict[str, ParquetCacheEntry]], path: str
+    ) -> Dict[str, ParquetCacheEntry]:
+        shard_name = _parquet_shard_name(path)
+        if shard_name not in shards:
+            entry_path = posixpath.join(self._cache_dir, _PARQUET_DIR, shard_name)
+            shard = self._read_entry(entry_path) or {}
+            shards[shard_name] = {path: tuple(entry) for path, entry in shard.items()}
+        return shards[shard_name]
+
+    def _write_parquet_shard(
+        self, shard_name: str, shard: Dict[str, ParquetCacheEntry]
+    ) -> None:
+        entry_path = posixpath.join(self._cache_dir, _PARQUET_DIR, shard_name)
+        # Merge the footers other drivers wrote in the meantime.
+        current = self._read_entry(entry_path) or {}
+        current.update(shard)
+        # Drop the old footers, most of which belong to files that were deleted
+        # or are no longer read.
+        min_cached_at = time.time() - _MAX_ENTRY_AGE_S
+        current = {
+            path: entry for path, entry in current.items() if entry[3] >= min_cached_at
+        }
+        self._write_entry(entry_path, current)
+
+    def _read_entry(self, entry_path: str) -> Optional[Any]:
+        from pyarrow.fs import FileType
+
+        if self._filesystem.get_file_info(entry_path).type != FileType.File:
+            return None
+        try:
+            with self._filesystem.open_input_stream(entry_path) as f:
+                return json.loads(f.readall().decode())
+        except Exception:
+            logger.warning(
+                f"Ignoring the unreadable file metadata cache entry {entry_path}.",
+                exc_info=True,
+            )
+            return None
+
+    def _write_entry(self, entry_path: str, value: Any) -> None:
+        data = json.dumps(value).encode()
+        self._filesystem.create_dir(posixpath.dirname(entry_path), recursive=True)
+        tmp_path = f"{entry_path}.{uuid.uuid4().hex}.tmp"
+        with self._filesystem.open_output_stream(tmp_path) as f:
+            f.write(data)
+        self._filesystem.move(tmp_path, entry_path)
+
+
+def get_file_metadata_cache() -> Optional[FileMetadataCache]:
+    """Return the file metadata cache configured in the current DataContext, if any."""
+    from ray.data.context import DataContext
+
+    ctx = DataContext.get_current()
+    if ctx.file_metadata_cache_dir is None:
+        return None
+    return FileMetadataCache(
+        ctx.file_metadata_cache_dir, ctx.file_metadata_cache_listing_ttl_s
+    )
+
+
+def _list_directory(
+    path: str,
+    filesystem: "pyarrow.fs.FileSystem",
+    recursive: bool,
+    ignore_missing_path: bool,
+) -> Tuple[List[FileEntry], Dict[str, Optional[int]]]:
+    """Return the files in the given directory sorted by path, and the modification
+    times of the directory and its subdirectories."""
+    from pyarrow.fs import FileSelector, FileType
+
+    selector = FileSelector(
+        path, recursive=recursive, allow_not_found=ignore_missing_path
+    )
+    infos = filesystem.get_file_info(selector)
+    files = sorted(
+        (info.path, info.size, info.mtime_ns) for info in infos if info.is_file
+    )
+    mtimes = {path: filesystem.get_file_info(path).mtime_ns}
+    mtimes.update(
+        (info.path, info.mtime_ns) for info in infos if info.type == FileType.Directory
+    )
+    return files, mtimes
+
+
+def _directories_unchanged(
+    mtimes: Dict[str, int], filesystem: "pyarrow.fs.FileSystem"
+) -> bool:
+    from pyarrow.fs import FileType
+
+    infos = filesystem.get_file_info(list(mtimes))
+    return all(
+        info.type == FileType.Directory and info.mtime_ns == mtime
+        for info, mtime in zip(infos, mtimes.values())
+    )
+
+
+def _encode_footer(metadata: "pyarrow.parquet.FileMetaData") -> Optional[str]:
+    """Serialize a Parquet footer in the Parquet metadata format, base64 encoded."""
+    import pyarrow as pa
+
+    try:
+        sink = pa.BufferOutputStream()
+        metadata.write_metadata_file(sink)
+    except Exception:
+        logger.debug("Failed to serialize a Parquet footer.", exc_info=True)
+        return None
+    return base64.b64encode(sink.getvalue().to_pybytes()).decode()
+
+
+def _decode_footer(footer: str) -> Optional["pyarrow.parquet.FileMetaData"]:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    try:
+        return pq.read_metadata(pa.BufferReader(base64.b64decode(footer)))
+    except Exception:
+        logger.warning("Ignoring an unreadable cached Parquet footer.", exc_info=True)
+        return None
+
+
+def _parquet_shard_name(path: str) -> str:
+    return _digest(path)[:_PARQUET_SHARD_DIGITS]
+
+
+def _digest(key: str) -> str:
+    return hashlib.sha256(key.encode()).hexdigest()
@@ -138,6 +138,7 @@ class SplitCoordinator:
         self._locality_hints = locality_hints
         self._lock = threading.RLock()
         self._executor = None
+        self._output_splitter = None
 
         # Guarded by self._lock.
         self._next_bundle: Dict[int, RefBundle] = {}
@@ -152,7 +153,16 @@ class SplitCoordinator:
                 self._executor = executor
 
                 def add_split_op(dag):
-                    return OutputSplitter(dag, n, equal, locality_hints)
+                    self._output_splitter = OutputSplitter(
+                        dag,
+                        n,
+                        equal,
+                        locality_hints,
+                        max_outstanding_bundles=(
+                            dataset.context.streaming_split_max_outstanding_bundles
+                        ),
+                    )
+                    return self._output_splitter
 
                 output_iterator = execute_to_legacy_bundle_iterator(
                     executor,
@@ -208,6 +218,8 @@ class SplitCoordinator:
             while next_bundle is None or not next_bundle.blocks:
                 # This is a BLOCKING call, so do it outside the lock.
                 next_bundle = self._output_iterator.get_next(output_split_idx)
+                # Let the splitter output more bundles to this split.
+                self._output_splitter.on_output_consumed(output_split_idx)
 
             block = next_bundle.blocks[-1]
             next_bundle = replace(next_bundle, blocks=next_bundle.blocks[:-1])
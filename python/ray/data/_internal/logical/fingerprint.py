@@ -0,0 +1,272 @@
+"""Fingerprints of logical plans, used to reuse the results of identical plans.
+
+A fingerprint is a hex digest over the operators of a plan, the arguments and UDFs
+of each operator, and the inputs of the plan (e.g. the paths, sizes and
+modification times of the files read). Plans with the same fingerprint are
+expected to produce the same data.
+
+UDFs are fingerprinted by their bytecode, constants, defaults, closure values and
+the values of the globals they reference. Other functions and classes a UDF
+references are only fingerprinted by name, so changing their implementation
+doesn't change the fingerprint. Plans with UDFs that reference other values that
+can't be fingerprinted, e.g. locks, can't be fingerprinted at all.
+
+Arrow data is fingerprinted by a hash of its contents, and Python objects by their
+`__dict__`, if that holds all of their state.
+"""
+import functools
+import hashlib
+import pickle
+import types
+from typing import TYPE_CHECKING, Any, List, Optional, Set
+
+import numpy as np
+
+from ray.data._internal.logical.interfaces import LogicalOperator, LogicalPlan
+from ray.data._internal.logical.operators.from_operators import AbstractFrom
+from ray.data._internal.logical.operators.input_data_operator import InputData
+from ray.data._internal.logical.operators.read_operator import Read
+
+if TYPE_CHECKING:
+    import pyarrow
+
+# The operator attributes that don't affect the output data.
+_IGNORED_OPERATOR_ATTRIBUTES = {
+    "_input_dependencies",
+    "_output_dependencies",
+    "_ray_remote_args",
+    "_compute",
+}
+
+
+# The instance size of Python classes without slots, whose instances keep all of
+# their state in their `__dict__`. Instances of classes with C-level state, e.g.
+# subclasses of builtins or extension types, are larger.
+_PYTHON_OBJECT_BASICSIZE = type("_PythonObject", (), {}).__basicsize__
+
+
+class _NotFingerprintableError(Exception):
+    pass
+
+
+def fingerprint_plan(plan: LogicalPlan) -> Optional[str]:
+    """Return the fingerprint of a logical plan, or None if any of its operators
+    or inputs can't be fingerprinted.
+    """
+    try:
+        return _digest(_fingerprint_operator(plan.dag))
+    except _NotFingerprintableError:
+        return None
+
+
+def fingerprint_value(value: Any) -> Optional[str]:
+    """Return the fingerprint of an argument of an operator or a reader, or None if
+    it can't be fingerprinted.
+    """
+    try:
+        return _digest(_fingerprint(value, set()))
+    except _NotFingerprintableError:
+        return None
+
+
+def fingerprint_files(
+    paths: List[str], filesystem: "pyarrow.fs.FileSystem"
+) -> Optional[List[Any]]:
+    """Return the path, size and modification time of each file, or None if the
+    filesystem doesn't report modification times.
+    """
+    files = []
+    for info in filesystem.get_file_info(paths):
+        if info.mtime_ns is None:
+            return None
+        files.append((info.path, info.size, info.mtime_ns))
+    return files
+
+
+def _digest(fingerprint: str) -> str:
+    return hashlib.sha256(fingerprint.encode()).hexdigest()
+
+
+def _fingerprint_operator(op: LogicalOperator) -> str:
+    if isinstance(op, Read):
+        reader_fingerprint = op._reader.get_fingerprint()
+        if reader_fingerprint is None:
+            raise _NotFingerprintableError
+        args = [
+            type(op._datasource),
+            reader_fingerprint,
+            op._parallelism,
+            op._additional_split_factor,
+        ]
+    elif isinstance(op, (InputData, AbstractFrom)):
+        if op.input_data is None:
+            raise _NotFingerprintableError
+        # The blocks are immutable, so the same block refs hold the same data.
+        args = [block.hex() for bundle in op.input_data for block, _ in bundle.blocks]
+    else:
+        args = {
+            name: value
+            for name, value in vars(op).items()
+            if name not in _IGNORED_OPERATOR_ATTRIBUTES
+        }
+    inputs = [_fingerprint_operator(input_op) for input_op in op.input_dependencies]
+    return f"{_qualified_name(type(op))}({_fingerprint(args, set())}, {inputs})"
+
+
+def _fingerprint(value: Any, seen: set) -> str:
+    if value is None or isinstance(value, (bool, int, float, str, bytes)):
+        return f"{type(value).__name__}:{value!r}"
+    if isinstance(value, np.generic):
+        return f"{type(value).__name__}:{value!r}"
+
+    # Guard against reference cycles, e.g. between recursive functions and their
+    # closures.
+    if id(value) in seen:
+        return f"cycle:{_qualified_name(type(value))}"
+    seen = seen | {id(value)}
+
+    if isinstance(value, (list, tuple)):
+        items = ", ".join(_fingerprint(item, seen) for item in value)
+        return f"{type(value).__name__}[{items}]"
+    if isinstance(value, dict):
+        items = sorted(
+            f"{_fingerprint(k, seen)}: {_fingerprint(v, seen)}"
+            for k, v in value.items()
+        )
+        return f"dict{{{', '.join(items)}}}"
+    if isinstance(value, (set, frozenset)):
+        items = sorted(_fingerprint(item, seen) for item in value)
+        return f"{type(value).__name__}{{{', '.join(items)}}}"
+    if isinstance(value, np.ndarray):
+        if value.dtype == object:
+            return f"ndarray[{_fingerprint(value.tolist(), seen)}]"
+        digest = hashlib.sha256(np.ascontiguousarray(value).tobytes()).hexdigest()
+        return f"ndarray({value.dtype}, {value.shape}, {digest})"
+    if isinstance(value, types.FunctionType):
+        return _fingerprint_function(value, seen)
+    if isinstance(value, types.MethodType):
+        func = _fingerprint(value.__func__, seen)
+        return f"method({func}, {_fingerprint(value.__self__, seen)})"
+    if isinstance(value, functools.partial):
+        args = _fingerprint([value.func, value.args, value.keywords], seen)
+        return f"partial({args})"
+    if isinstance(value, (types.BuiltinFunctionType, types.ModuleType)):
+        return f"{type(value).__name__}:{_qualified_name(value)}"
+    if isinstance(value, type):
+        # Fingerprint the methods of callable class UDFs.
+        methods = {
+            name: attr
+            for name, attr in vars(value).items()
+            if isinstance(attr, types.FunctionType)
+        }
+        return f"class:{_qualified_name(value)}({_fingerprint(methods, seen)})"
+
+    module = type(value).__module__ or ""
+    if module.startswith("pyarrow"):
+        return f"{_qualified_name(type(value))}:{_fingerprint_arrow(value)}"
+    if module.startswith("ray") and hasattr(value, "hex"):
+        # Object refs.
+        return f"{_qualified_name(type(value))}:{value.hex()}"
+    if _has_only_instance_dict_state(type(value)):
+        cls = _fingerprint(type(value), seen)
+        return f"object:{cls}({_fingerprint(vars(value), seen)})"
+    raise _NotFingerprintableError
+
+
+def _fingerprint_arrow(value: Any) -> str:
+    import pyarrow as pa
+    import pyarrow.dataset
+    import pyarrow.fs
+
+    if isinstance(value, (pa.Table, pa.RecordBatch, pa.Array, pa.ChunkedArray)):
+        # The repr of data leaves out rows, so hash all of the data instead.
+        if isinstance(value, (pa.Array, pa.ChunkedArray)):
+            value = pa.table([value], names=["value"])
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, value.schema) as writer:
+            writer.write(value)
+        return hashlib.sha256(sink.getvalue().to_pybytes()).hexdigest()
+    if isinstance(value, pa.Schema):
+        # Unlike the repr, the serialized schema includes all of the metadata.
+        return hashlib.sha256(value.serialize().to_pybytes()).hexdigest()
+    if isinstance(value, (pa.DataType, pa.Field)):
+        metadata = value.metadata if isinstance(value, pa.Field) else None
+        return f"{value}, {metadata}"
+    if isinstance(value, pa.Scalar):
+        return f"{value.type}, {value.as_py()!r}"
+    if isinstance(value, (pyarrow.dataset.Expression, pyarrow.fs.FileSystem)):
+        # Expressions are serialized with all of their literals, and filesystems
+        # with all of their options, e.g. the region and credentials of S3.
+        try:
+            return hashlib.sha256(pickle.dumps(value)).hexdigest()
+        except Exception:
+            raise _NotFingerprintableError from None
+    raise _NotFingerprintableError
+
+
+def _has_only_instance_dict_state(cls: type) -> bool:
+    """Return whether all of the state of the instances of a class is in their
+    `__dict__`, i.e. the class and its bases are Python classes without slots.
+    """
+    return (
+        cls.__basicsize__ == _PYTHON_OBJECT_BASICSIZE
+        and cls.__itemsize__ == 0
+        and not any("__slots__" in vars(base) for base in cls.__mro__)
+    )
+
+
+def _fingerprint_function(fn: types.FunctionType, seen: set) -> str:
+    closure = []
+    for cell in fn.__closure__ or []:
+        try:
+            closure.append(cell.cell_contents)
+        except ValueError:
+            # The cell is empty.
+            closure.append(None)
+    global_values = {
+        name: _fingerprint_global(fn.__globals__[name], seen)
+        for name in _referenced_names(fn.__code__)
+        if name in fn.__globals__
+    }
+    parts = [
+        _qualified_name(fn),
+        _fingerprint_code(fn.__code__),
+        _fingerprint([fn.__defaults__, fn.__kwdefaults__, closure], seen),
+        str(sorted(global_values.items())),
+    ]
+    return f"function({', '.join(parts)})"
+
+
+def _referenced_names(code: types.CodeType) -> Set[str]:
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            names |= _referenced_names(const)
+    return names
+
+
+def _fingerprint_global(value: Any, seen: set) -> str:
+    # Global functions, classes and modules are only fingerprinted by name, to
+    # avoid fingerprinting whole libraries.
+    if isinstance(
+        value,
+        (types.FunctionType, types.BuiltinFunctionType, types.ModuleType, type),
+    ):
+        return f"{type(value).__name__}:{_qualified_name(value)}"
+    return _fingerprint(value, seen)
+
+
+def _fingerprint_code(code: types.CodeType) -> str:
+    consts = [
+        _fingerprint_code(const)
+        if isinstance(const, types.CodeType)
+        else _fingerprint(const, set())
+        for const in code.co_consts
+    ]
+    return f"code({code.co_code.hex()}, {consts}, {code.co_names})"
+
+
+def _qualified_name(value: Any) -> str:
+    module = getattr(value, "__module__", None)
+    name = getattr(value, "__qualname__", None) or getattr(value, "__name__", "")
+    return f"{module}.{name}" if module else name
@@ -1,12 +1,16 @@
 import inspect
-from typing import Any, Dict, Iterable, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Union
 
 from ray.data._internal.compute import ComputeStrategy, TaskPoolStrategy
 from ray.data._internal.dataset_logger import DatasetLogger
 from ray.data._internal.logical.interfaces import LogicalOperator
 from ray.data._internal.logical.operators.one_to_one_operator import AbstractOneToOne
-from ray.data.block import UserDefinedFunction
+from ray.data.block import BlockAccessor, DataBatch, UserDefinedFunction
 from ray.data.context import DEFAULT_BATCH_SIZE
+from ray.data.expressions import Expr
+
+if TYPE_CHECKING:
+    import pyarrow
 
 logger = DatasetLogger(__name__)
 
@@ -139,6 +143,89 @@ class MapBatches(AbstractUDFMap):
         return False
 
 
+def _generate_select_columns_fn(cols: List[str]) -> UserDefinedFunction:
+    """Generate the batch UDF selecting the given columns of a batch."""
+
+    def select_columns(batch: DataBatch) -> DataBatch:
+        return BlockAccessor.for_block(batch).select(columns=cols)
+
+    return select_columns
+
+
+def _generate_filter_by_expression_fn(
+    filter_expr: Union[Expr, "pyarrow.dataset.Expression"],
+) -> UserDefinedFunction:
+    """Generate the batch UDF keeping the rows of an Arrow batch that satisfy
+    the filter expression.
+    """
+
+    def filter_by_expression(batch: "pyarrow.Table") -> "pyarrow.Table":
+        if isinstance(filter_expr, Expr):
+            return batch.filter(filter_expr.evaluate(batch))
+
+        import pyarrow.dataset as pds
+
+        return pds.dataset(batch).to_table(filter=filter_expr)
+
+    return filter_by_expression
+
+
+class Project(MapBatches):
+    """Logical operator for select_columns.
+
+    The selected columns are kept on the operator, so that the optimizer can push
+    the projection down into the read.
+    """
+
+    def __init__(
+        self,
+        input_op: LogicalOperator,
+        cols: List[str],
+        compute: Optional[Union[str, ComputeStrategy]] = None,
+        ray_remote_args: Optional[Dict[str, Any]] = None,
+    ):
+        super().__init__(
+            input_op,
+            _generate_select_columns_fn(cols),
+            batch_size=None,
+            batch_format="pandas",
+            zero_copy_batch=True,
+            compute=compute,
+            ray_remote_args=ray_remote_args,
+        )
+        self._cols = cols
+
+
+class FilterByExpression(MapBatches):
+    """Logical operator for filter with an expression.
+
+    The expression is kept on the operator, so that the optimizer can push the
+    filter down into the read.
+    """
+
+    def __init__(
+        self,
+        input_op: LogicalOperator,
+        filter_expr: Union[Expr, "pyarrow.dataset.Expression"],
+        compute: Optional[Union[str, ComputeStrategy]] = None,
+        ray_remote_args: Optional[Dict[str, Any]] = None,
+    ):
+        super().__init__(
+            input_op,
+            _generate_filter_by_expression_fn(filter_expr),
+            batch_size=None,
+            batch_format="pyarrow",
+            zero_copy_batch=True,
+            compute=compute,
+            ray_remote_args=ray_remote_args,
+        )
+        self._filter_expr = filter_expr
+
+    @property
+    def can_modify_num_rows(self) -> bool:
+        return True
+
+
 class MapRows(AbstractUDFMap):
     """Logical operator for map."""
 
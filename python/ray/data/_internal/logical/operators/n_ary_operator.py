@@ -1,3 +1,5 @@
+from typing import List, Optional, Tuple
+
 from ray.data._internal.logical.interfaces import LogicalOperator
 
 
@@ -39,3 +41,40 @@ class Union(NAry):
         *input_ops: LogicalOperator,
     ):
         super().__init__(*input_ops)
+
+
+class Join(NAry):
+    """Logical operator for join."""
+
+    def __init__(
+        self,
+        left_input_op: LogicalOperator,
+        right_input_op: LogicalOperator,
+        left_keys: List[str],
+        right_keys: List[str],
+        how: str,
+        suffixes: Tuple[str, str],
+        num_outputs: Optional[int] = None,
+        strategy: Optional[str] = None,
+    ):
+        """
+        Args:
+            left_input_op: The input operator at left hand side.
+            right_input_op: The input operator at right hand side.
+            left_keys: The key columns of the left hand side to join on.
+            right_keys: The key columns of the right hand side to join on.
+            how: The type of join, one of "inner", "left", "right" or "outer".
+            suffixes: The suffixes to disambiguate duplicate non-key column names
+                of the left and right hand side.
+            num_outputs: The number of output blocks. If not set, the larger
+                number of input blocks of both sides is used.
+            strategy: The join strategy, either "hash" or "broadcast". If not set,
+                it's chosen based on the size of the right hand side.
+        """
+        super().__init__(left_input_op, right_input_op)
+        self._left_keys = left_keys
+        self._right_keys = right_keys
+        self._how = how
+        self._suffixes = suffixes
+        self._num_outputs = num_outputs
+        self._strategy = strategy
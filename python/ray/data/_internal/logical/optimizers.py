@@ -12,6 +12,7 @@ from ray.data._internal.logical.rules._user_provided_optimizer_rules import (
 )
 from ray.data._internal.logical.rules.operator_fusion import OperatorFusionRule
 from ray.data._internal.logical.rules.randomize_blocks import ReorderRandomizeBlocksRule
+from ray.data._internal.logical.rules.read_pushdown import ReadPushdownRule
 from ray.data._internal.logical.rules.zero_copy_map_fusion import (
     EliminateBuildOutputBlocks,
 )
@@ -19,6 +20,7 @@ from ray.data._internal.planner.planner import Planner
 
 DEFAULT_LOGICAL_RULES = [
     ReorderRandomizeBlocksRule,
+    ReadPushdownRule,
 ]
 
 DEFAULT_PHYSICAL_RULES = [
@@ -0,0 +1,58 @@
+import copy
+
+from ray.data._internal.logical.interfaces import LogicalOperator, LogicalPlan, Rule
+from ray.data._internal.logical.operators.map_operator import (
+    FilterByExpression,
+    Project,
+)
+from ray.data._internal.logical.operators.read_operator import Read
+from ray.data.expressions import Expr
+
+
+class ReadPushdownRule(Rule):
+    """Rule for pushing down column projections and filters into Read operators.
+
+    A Project or FilterByExpression operator that directly follows a Read operator
+    is removed from the DAG, if the reader of the Read operator can apply it while
+    reading (see `Reader.push_down_projection()` and `Reader.push_down_filter()`).
+    Consecutive projections and filters are pushed down one after another, e.g.
+    `Read -> FilterByExpression -> Project` becomes a single `Read`.
+    """
+
+    def apply(self, plan: LogicalPlan) -> LogicalPlan:
+        optimized_dag: LogicalOperator = self._apply(plan.dag)
+        return LogicalPlan(dag=optimized_dag)
+
+    def _apply(self, op: LogicalOperator) -> LogicalOperator:
+        input_ops = [self._apply(input_op) for input_op in op.input_dependencies]
+        new_input_ops = [
+            new_op
+            for new_op, old_op in zip(input_ops, op.input_dependencies)
+            if new_op is not old_op
+        ]
+        if new_input_ops:
+            # We need to make a copy of the operator.
+            # Because the operator instance may be shared by multiple
+            # Datasets. We shouldn't modify it in place.
+            op = copy.copy(op)
+            op._input_dependencies = input_ops
+            for input_op in new_input_ops:
+                input_op._output_dependencies = [op]
+
+        if isinstance(op, (Project, FilterByExpression)) and isinstance(
+            op.input_dependency, Read
+        ):
+            read_op = op.input_dependency
+            if isinstance(op, Project):
+                reader = read_op._reader.push_down_projection(op._cols)
+            else:
+                filter_expr = op._filter_expr
+                if isinstance(filter_expr, Expr):
+                    filter_expr = filter_expr.to_pyarrow()
+                reader = read_op._reader.push_down_filter(filter_expr)
+            if reader is not None:
+                new_read_op = copy.copy(read_op)
+                new_read_op._reader = reader
+                new_read_op._output_dependencies = []
+                return new_read_op
+        return op
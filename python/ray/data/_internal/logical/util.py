@@ -55,6 +55,7 @@ _op_name_white_list = [
     # N-ary
     "Zip",
     "Union",
+    "Join",
 ]
 
 
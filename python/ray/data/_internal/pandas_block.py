@@ -18,14 +18,7 @@ import numpy as np
 from ray.air.constants import TENSOR_COLUMN_NAME
 from ray.data._internal.table_block import TableBlockAccessor, TableBlockBuilder
 from ray.data._internal.util import find_partitions
-from ray.data.block import (
-    Block,
-    BlockAccessor,
-    BlockExecStats,
-    BlockMetadata,
-    KeyType,
-    U,
-)
+from ray.data.block import Block, BlockAccessor, BlockExecStats, BlockMetadata, U
 from ray.data.context import DataContext
 from ray.data.row import TableRow
 
@@ -380,35 +373,8 @@ class PandasBlockAccessor(TableBlockAccessor):
                 f"got: {type(key)}."
             )
 
-        def iter_groups() -> Iterator[Tuple[KeyType, Block]]:
-            """Creates an iterator over zero-copy group views."""
-            if key is None:
-                # Global aggregation consists of a single "group", so we short-circuit.
-                yield None, self.to_block()
-                return
-
-            start = end = 0
-            iter = self.iter_rows(public_row_format=False)
-            next_row = None
-            while True:
-                try:
-                    if next_row is None:
-                        next_row = next(iter)
-                    next_key = next_row[key]
-                    while next_row[key] == next_key:
-                        end += 1
-                        try:
-                            next_row = next(iter)
-                        except StopIteration:
-                            next_row = None
-                            break
-                    yield next_key, self.slice(start, end, copy=False)
-                    start = end
-                except StopIteration:
-                    break
-
         builder = PandasBlockBuilder()
-        for group_key, group_view in iter_groups():
+        for group_key, group_view in self._iter_groups_sorted(key):
             # Aggregate.
             accumulators = [agg.init(group_key) for agg in aggs]
             for i in range(len(aggs)):
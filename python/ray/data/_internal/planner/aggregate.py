@@ -1,4 +1,6 @@
-from typing import List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
 
 from ray.data._internal.execution.interfaces import (
     AllToAllTransformFn,
@@ -15,7 +17,7 @@ from ray.data._internal.planner.exchange.push_based_shuffle_task_scheduler impor
     PushBasedShuffleTaskScheduler,
 )
 from ray.data._internal.planner.exchange.sort_task_spec import SortTaskSpec
-from ray.data._internal.sort import SortKey
+from ray.data._internal.sort import SortKey, compute_boundaries, find_heavy_hitters
 from ray.data._internal.stats import StatsDict
 from ray.data._internal.util import unify_block_metadata_schema
 from ray.data.aggregate import AggregateFn
@@ -50,23 +52,31 @@ def generate_aggregate_fn(
 
         num_mappers = len(blocks)
 
+        heavy_hitters = []
         if key is None:
             num_outputs = 1
             boundaries = []
         else:
             # Use same number of output partitions.
             num_outputs = num_mappers
-            # Sample boundaries for aggregate key.
-            boundaries = SortTaskSpec.sample_boundaries(
+            # Sample boundaries and heavy hitters for aggregate key.
+            sorted_samples = SortTaskSpec.sample_keys(
                 blocks,
                 SortKey(key),
                 num_outputs,
             )
+            if sorted_samples is None:
+                boundaries = [None] * (num_outputs - 1)
+            else:
+                boundaries = compute_boundaries(sorted_samples, num_outputs)
+                heavy_hitters = find_heavy_hitters(sorted_samples, num_outputs)
+        ctx.extra_metrics.update(_get_skew_metrics(heavy_hitters))
 
         agg_spec = SortAggregateTaskSpec(
             boundaries=boundaries,
             key=key,
             aggs=aggs,
+            heavy_hitters=[heavy_key for (heavy_key,), _ in heavy_hitters],
         )
         if DataContext.get_current().use_push_based_shuffle:
             scheduler = PushBasedShuffleTaskScheduler(agg_spec)
@@ -76,3 +86,21 @@ def generate_aggregate_fn(
         return scheduler.execute(refs, num_outputs, ctx)
 
     return fn
+
+
+def _get_skew_metrics(heavy_hitters: List[Tuple[Any, float]]) -> Dict[str, Any]:
+    """Return the skew metrics to report in the dataset stats, given the heavy
+    hitter keys and their estimated fraction of the rows.
+    """
+    return {
+        "num_heavy_hitter_keys": len(heavy_hitters),
+        "heavy_hitter_key_fractions": {
+            _to_python(heavy_key): round(fraction, 4)
+            for (heavy_key,), fraction in heavy_hitters
+        },
+    }
+
+
+def _to_python(value: Any) -> Any:
+    # Convert numpy scalars, so that the metrics print like Python values.
+    return value.item() if isinstance(value, np.generic) else value
@@ -1,4 +1,9 @@
-from typing import List, Optional, Tuple, Union
+import bisect
+import collections
+import heapq
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
 
 from ray.data._internal.planner.exchange.interfaces import ExchangeTaskSpec
 from ray.data._internal.sort import SortKey
@@ -22,6 +27,11 @@ class SortAggregateTaskSpec(ExchangeTaskSpec):
     Final aggregate (`reduce`): each task would receive a block from every worker that
     consists of items in a certain range. It then merges the sorted blocks and
     aggregates on-the-fly.
+
+    Heavy hitter keys, i.e. keys that make up a large fraction of the rows, are
+    split out of each block before sorting and are combined directly, so that the
+    hot rows are never sorted, and each reducer only receives one partially
+    combined row per block for them.
     """
 
     def __init__(
@@ -29,9 +39,10 @@ class SortAggregateTaskSpec(ExchangeTaskSpec):
         boundaries: List[KeyType],
         key: Optional[str],
         aggs: List[AggregateFn],
+        heavy_hitters: Optional[List[KeyType]] = None,
     ):
         super().__init__(
-            map_args=[boundaries, key, aggs],
+            map_args=[boundaries, key, aggs, heavy_hitters or []],
             reduce_args=[key, aggs],
         )
 
@@ -43,18 +54,25 @@ class SortAggregateTaskSpec(ExchangeTaskSpec):
         boundaries: List[KeyType],
         key: Optional[str],
         aggs: List[AggregateFn],
+        heavy_hitters: List[KeyType],
     ) -> List[Union[BlockMetadata, Block]]:
         stats = BlockExecStats.builder()
 
         block = SortAggregateTaskSpec._prune_unused_columns(block, key, aggs)
+        heavy_parts = {}
         if key is None:
             partitions = [block]
         else:
-            partitions = BlockAccessor.for_block(block).sort_and_partition(
+            rest, heavy_parts = SortAggregateTaskSpec._combine_heavy_hitters(
+                block, boundaries, key, aggs, heavy_hitters
+            )
+            partitions = BlockAccessor.for_block(rest).sort_and_partition(
                 boundaries,
                 SortKey(key),
             )
         parts = [BlockAccessor.for_block(p).combine(key, aggs) for p in partitions]
+        for i, combined in heavy_parts.items():
+            parts[i] = _merge_combined_blocks([parts[i]] + combined, key)
         meta = BlockAccessor.for_block(block).get_metadata(
             input_files=None, exec_stats=stats.build()
         )
@@ -71,6 +89,42 @@ class SortAggregateTaskSpec(ExchangeTaskSpec):
             list(mapper_outputs), key, aggs, finalize=not partial_reduce
         )
 
+    @staticmethod
+    def _combine_heavy_hitters(
+        block: Block,
+        boundaries: List[KeyType],
+        key: str,
+        aggs: List[AggregateFn],
+        heavy_hitters: List[KeyType],
+    ) -> Tuple[Block, Dict[int, List[Block]]]:
+        """Split the rows of the heavy hitter keys out of the block, and combine
+        them without sorting.
+
+        Returns the remaining rows of the block, and the combined rows of the heavy
+        hitter keys by the index of the partition they belong to.
+        """
+        block_accessor = BlockAccessor.for_block(block)
+        if len(heavy_hitters) == 0 or block_accessor.num_rows() == 0:
+            return block, {}
+
+        keys = block_accessor.to_numpy(key)
+        is_heavy = np.zeros(len(keys), dtype=bool)
+        heavy_parts = collections.defaultdict(list)
+        for heavy_key in heavy_hitters:
+            mask = np.asarray(keys == heavy_key)
+            if mask.shape != is_heavy.shape or not mask.any():
+                continue
+            is_heavy |= mask
+            heavy_rows = block_accessor.take(np.flatnonzero(mask))
+            # Partition i holds the keys in [boundaries[i - 1], boundaries[i]).
+            partition = bisect.bisect_right(boundaries, (heavy_key,))
+            heavy_parts[partition].append(
+                BlockAccessor.for_block(heavy_rows).combine(key, aggs)
+            )
+        if not is_heavy.any():
+            return block, {}
+        return block_accessor.take(np.flatnonzero(~is_heavy)), heavy_parts
+
     @staticmethod
     def _prune_unused_columns(
         block: Block,
@@ -102,3 +156,19 @@ class SortAggregateTaskSpec(ExchangeTaskSpec):
             return block_accessor.select(list(columns))
         else:
             return block
+
+
+def _merge_combined_blocks(blocks: List[Block], key: str) -> Block:
+    """Merge partially combined blocks, which are sorted by distinct keys, into one
+    sorted block.
+    """
+    builder = BlockAccessor.for_block(blocks[0]).builder()
+    for row in heapq.merge(
+        *[
+            BlockAccessor.for_block(block).iter_rows(public_row_format=False)
+            for block in blocks
+        ],
+        key=lambda row: row[key],
+    ):
+        builder.add(row)
+    return builder.build()
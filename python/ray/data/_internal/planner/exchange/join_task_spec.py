@@ -0,0 +1,219 @@
+from typing import TYPE_CHECKING, List, Tuple, Union
+
+import numpy as np
+
+from ray.data._internal.arrow_ops import transform_pyarrow
+from ray.data._internal.planner.exchange.interfaces import ExchangeTaskSpec
+from ray.data.block import Block, BlockAccessor, BlockExecStats, BlockMetadata
+
+if TYPE_CHECKING:
+    import pyarrow
+
+# Mapping from the join types exposed by `Dataset.join()` to the join types of
+# `pyarrow.Table.join()`.
+# The multiplier that combines the hashes of multiple key columns.
+_HASH_MULTIPLIER = np.uint64(1099511628211)
+
+_ARROW_JOIN_TYPES = {
+    "inner": "inner",
+    "left": "left outer",
+    "right": "right outer",
+    "outer": "full outer",
+}
+
+
+class HashJoinTaskSpec(ExchangeTaskSpec):
+    """
+    The implementation for distributed hash join tasks.
+
+    Join is done in 2 steps: hash partitioning the blocks of both sides, and
+    joining co-partitioned blocks.
+
+    Hash partitioning (`map`): each block is partitioned into smaller blocks by the
+    hash of its key columns, so rows with equal keys from both sides end up in the
+    same output partition. The first `num_left_blocks` input blocks belong to the
+    left side, and the remaining ones to the right side.
+
+    Joining (`reduce`): each task would receive one block per input block of both
+    sides. It concatenates the blocks of each side and joins them with Arrow.
+    """
+
+    JOIN_TYPES = tuple(_ARROW_JOIN_TYPES.keys())
+
+    def __init__(
+        self,
+        num_left_blocks: int,
+        left_keys: List[str],
+        right_keys: List[str],
+        how: str,
+        suffixes: Tuple[str, str],
+    ):
+        super().__init__(
+            map_args=[num_left_blocks, left_keys, right_keys],
+            reduce_args=[num_left_blocks, left_keys, right_keys, how, suffixes],
+        )
+
+    @staticmethod
+    def map(
+        idx: int,
+        block: Block,
+        output_num_blocks: int,
+        num_left_blocks: int,
+        left_keys: List[str],
+        right_keys: List[str],
+    ) -> List[Union[BlockMetadata, Block]]:
+        stats = BlockExecStats.builder()
+        keys = left_keys if idx < num_left_blocks else right_keys
+        table = BlockAccessor.for_block(block).to_arrow()
+        partitions = _hash_partition(table, keys, output_num_blocks)
+        meta = BlockAccessor.for_block(block).get_metadata(
+            input_files=None, exec_stats=stats.build()
+        )
+        return partitions + [meta]
+
+    @staticmethod
+    def reduce(
+        num_left_blocks: int,
+        left_keys: List[str],
+        right_keys: List[str],
+        how: str,
+        suffixes: Tuple[str, str],
+        *mapper_outputs: List[Block],
+        partial_reduce: bool = False,
+    ) -> Tuple[Block, BlockMetadata]:
+        stats = BlockExecStats.builder()
+        left = transform_pyarrow.concat(
+            [
+                BlockAccessor.for_block(b).to_arrow()
+                for b in mapper_outputs[:num_left_blocks]
+            ]
+        )
+        right = transform_pyarrow.concat(
+            [
+                BlockAccessor.for_block(b).to_arrow()
+                for b in mapper_outputs[num_left_blocks:]
+            ]
+        )
+        result = _join_tables(left, right, left_keys, right_keys, how, suffixes)
+        meta = BlockAccessor.for_block(result).get_metadata(
+            input_files=None, exec_stats=stats.build()
+        )
+        return result, meta
+
+
+def _hash_partition(
+    table: "pyarrow.Table",
+    keys: List[str],
+    num_partitions: int,
+) -> List["pyarrow.Table"]:
+    """Partition the rows of `table` into `num_partitions` tables by the hash of
+    the `keys` columns.
+    """
+    if table.num_rows == 0:
+        return [table] * num_partitions
+
+    hashes = _hash_column(table.column(keys[0]))
+    for key in keys[1:]:
+        hashes = hashes * _HASH_MULTIPLIER ^ _hash_column(table.column(key))
+    partition_ids = hashes % np.uint64(num_partitions)
+    # Group rows of the same partition together with a single take, and then
+    # slice out the partitions with zero-copy.
+    indices = np.argsort(partition_ids, kind="stable")
+    counts = np.bincount(partition_ids.astype(np.int64), minlength=num_partitions)
+    offsets = np.concatenate([[0], np.cumsum(counts)])
+    table = transform_pyarrow.take_table(table, indices)
+    return [table.slice(offsets[i], counts[i]) for i in range(num_partitions)]
+
+
+def _hash_column(column: "pyarrow.ChunkedArray") -> np.ndarray:
+    """Return a uint64 hash of each value of a key column.
+
+    The hashes only depend on the Arrow type and values of the column, and not on
+    whether it has nulls. E.g. converting an int64 column with nulls to pandas would
+    make it a float64 column, which hashes differently than the int64 column without
+    nulls on the other side of the join.
+
+    NOTE: `hash_array` uses a fixed hash key, so the hashes are stable across
+    processes. This guarantees that equal keys on both sides of the join are
+    assigned to the same partition, as long as the key types match.
+    """
+    import pandas as pd
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    column = column.combine_chunks()
+    is_null = column.is_null().to_numpy(zero_copy_only=False)
+    if pa.types.is_integer(column.type) or pa.types.is_boolean(column.type):
+        values = pc.fill_null(column.cast(pa.int64(), safe=False), 0).to_numpy()
+        hashes = pd.util.hash_array(values)
+    elif pa.types.is_floating(column.type):
+        values = pc.fill_null(column.cast(pa.float64()), 0).to_numpy()
+        hashes = pd.util.hash_array(values)
+    else:
+        # Other types, e.g. strings and timestamps, convert to the same pandas
+        # dtype with or without nulls.
+        hashes = pd.util.hash_pandas_object(column.to_pandas(), index=False).to_numpy()
+    # Nulls never match, but hash them the same way on both sides anyway.
+    return np.where(is_null, np.uint64(0), hashes)
+
+
+def _join_tables(
+    left: "pyarrow.Table",
+    right: "pyarrow.Table",
+    left_keys: List[str],
+    right_keys: List[str],
+    how: str,
+    suffixes: Tuple[str, str],
+) -> "pyarrow.Table":
+    """Join two Arrow tables on the given key columns.
+
+    Uses `pyarrow.Table.join()` when available (Arrow 7.0.0+), and falls back to
+    `pandas.merge()` otherwise. Key columns are coalesced into the left key
+    columns in both cases.
+    """
+    import pyarrow as pa
+
+    if hasattr(pa.Table, "join"):
+        left_suffix, right_suffix = suffixes
+        joined = left.join(
+            right,
+            keys=left_keys,
+            right_keys=right_keys,
+            join_type=_ARROW_JOIN_TYPES[how],
+            left_suffix=left_suffix or None,
+            right_suffix=right_suffix or None,
+        )
+        if how == "right" and left_keys != right_keys:
+            # Right outer joins output the right key columns, so rename them to
+            # the left key columns.
+            renames = dict(zip(right_keys, left_keys))
+            joined = joined.rename_columns(
+                [renames.get(name, name) for name in joined.column_names]
+            )
+        return joined
+
+    import pandas as pd
+
+    left_df = left.to_pandas()
+    right_df = right.to_pandas()
+    joined = pd.merge(
+        left_df,
+        right_df,
+        how=how,
+        left_on=left_keys,
+        right_on=right_keys,
+        suffixes=suffixes,
+    )
+    if left_keys != right_keys:
+        # Coalesce the right key columns into the left ones, so that the output
+        # schema matches the Arrow join.
+        drop_columns = []
+        for left_key, right_key in zip(left_keys, right_keys):
+            if left_key == right_key:
+                continue
+            if right_key not in joined.columns and right_key in left_df.columns:
+                right_key = right_key + suffixes[1]
+            joined[left_key] = joined[left_key].fillna(joined[right_key])
+            drop_columns.append(right_key)
+        joined = joined.drop(columns=drop_columns)
+    return pa.Table.from_pandas(joined, preserve_index=False)
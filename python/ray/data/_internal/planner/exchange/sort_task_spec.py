@@ -1,4 +1,4 @@
-from typing import List, Tuple, TypeVar, Union
+from typing import List, Optional, Tuple, TypeVar, Union
 
 import numpy as np
 
@@ -6,7 +6,7 @@ from ray.data._internal.delegating_block_builder import DelegatingBlockBuilder
 from ray.data._internal.planner.exchange.interfaces import ExchangeTaskSpec
 from ray.data._internal.progress_bar import ProgressBar
 from ray.data._internal.remote_fn import cached_remote_fn
-from ray.data._internal.sort import SortKey
+from ray.data._internal.sort import SortKey, compute_boundaries
 from ray.data.block import Block, BlockAccessor, BlockExecStats, BlockMetadata
 from ray.types import ObjectRef
 
@@ -81,6 +81,20 @@ class SortTaskSpec(ExchangeTaskSpec):
         partition the domain into ranges with approximately equally many elements.
         Each boundary item is a tuple of a form (col1_value, col2_value, ...).
         """
+        sorted_samples = SortTaskSpec.sample_keys(blocks, sort_key, num_reducers)
+        # The dataset is empty
+        if sorted_samples is None:
+            return [None] * (num_reducers - 1)
+        return compute_boundaries(sorted_samples, num_reducers)
+
+    @staticmethod
+    def sample_keys(
+        blocks: List[ObjectRef[Block]], sort_key: SortKey, num_reducers: int
+    ) -> Optional[List[np.ndarray]]:
+        """
+        Return the sorted values of each key column, sampled from the blocks, or
+        None if the blocks are empty.
+        """
         columns = sort_key.get_columns()
         n_samples = int(num_reducers * 10 / len(blocks))
 
@@ -96,9 +110,8 @@ class SortTaskSpec(ExchangeTaskSpec):
         sample_bar.close()
         del sample_results
         samples = [s for s in samples if len(s) > 0]
-        # The dataset is empty
         if len(samples) == 0:
-            return [None] * (num_reducers - 1)
+            return None
         builder = DelegatingBlockBuilder()
         for sample in samples:
             builder.add_block(sample)
@@ -108,20 +121,7 @@ class SortTaskSpec(ExchangeTaskSpec):
         # Compute sorted indices of the samples. In np.lexsort last key is the
         # primary key hence have to reverse the order.
         indices = np.lexsort(list(reversed(list(sample_dict.values()))))
-        # Sort each column by indices, and calculate q-ths quantile items.
-        # Ignore the 1st item as it's not required for the boundary
-        for k, v in sample_dict.items():
-            sorted_v = v[indices]
-            sample_dict[k] = [
-                np.quantile(sorted_v, q, interpolation="nearest")
-                for q in np.linspace(0, 1, num_reducers)
-            ][1:]
-        # Return the list of boundaries as tuples
-        # of a form (col1_value, col2_value, ...)
-        return [
-            tuple(sample_dict[k][i] for k in sample_dict)
-            for i in range(num_reducers - 1)
-        ]
+        return [v[indices] for v in sample_dict.values()]
 
 
 def _sample_block(block: Block, n_samples: int, sort_key: SortKey) -> Block:
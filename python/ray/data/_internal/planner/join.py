@@ -0,0 +1,203 @@
+from typing import List, Optional, Tuple
+
+import ray
+from ray.data._internal.arrow_ops import transform_pyarrow
+from ray.data._internal.execution.interfaces import (
+    JoinTransformFn,
+    RefBundle,
+    TaskContext,
+)
+from ray.data._internal.planner.exchange.interfaces import ExchangeTaskSpec
+from ray.data._internal.planner.exchange.join_task_spec import (
+    HashJoinTaskSpec,
+    _join_tables,
+)
+from ray.data._internal.planner.exchange.pull_based_shuffle_task_scheduler import (
+    PullBasedShuffleTaskScheduler,
+)
+from ray.data._internal.remote_fn import cached_remote_fn
+from ray.data._internal.stats import StatsDict
+from ray.data._internal.util import unify_block_metadata_schema
+from ray.data.block import Block, BlockAccessor, BlockExecStats, BlockMetadata
+from ray.data.context import DataContext
+from ray.types import ObjectRef
+
+# The join types that can be executed by broadcasting the right hand side. The
+# other join types also need the right hand side rows without any match, which
+# can't be known by a single join task.
+BROADCAST_JOIN_TYPES = ("inner", "left")
+
+
+def generate_join_fn(
+    left_keys: List[str],
+    right_keys: List[str],
+    how: str,
+    suffixes: Tuple[str, str],
+    num_outputs: Optional[int] = None,
+    strategy: Optional[str] = None,
+) -> JoinTransformFn:
+    """Generate function to join blocks of two sides by the key columns.
+
+    If `strategy` is "hash", both sides are hash partitioned and co-partitioned
+    blocks are joined. If it's "broadcast", the right hand side is broadcast to a
+    join task per left hand side block. If it's None, broadcast is chosen when the
+    right hand side is smaller than `DataContext.broadcast_join_threshold_bytes`.
+    """
+
+    def fn(
+        left_refs: List[RefBundle],
+        right_refs: List[RefBundle],
+        ctx: TaskContext,
+    ) -> Tuple[List[RefBundle], StatsDict]:
+        left_blocks, left_metadata = _get_blocks_and_metadata(left_refs)
+        right_blocks, right_metadata = _get_blocks_and_metadata(right_refs)
+
+        # Without any block on one side, there is no schema to join against, so
+        # only keep the rows the join type requires from the other side.
+        if len(left_blocks) == 0 or len(right_blocks) == 0:
+            if how in ("left", "outer") and len(left_blocks) > 0:
+                return left_refs, {}
+            if how in ("right", "outer") and len(right_blocks) > 0:
+                return right_refs, {}
+            return [], {}
+
+        _validate_keys(left_keys, unify_block_metadata_schema(left_metadata))
+        _validate_keys(right_keys, unify_block_metadata_schema(right_metadata))
+
+        if strategy == "broadcast" or (
+            strategy is None and _should_broadcast(how, right_metadata)
+        ):
+            return _execute_broadcast_join(
+                left_refs,
+                right_blocks,
+                left_keys,
+                right_keys,
+                how,
+                suffixes,
+                ctx,
+            )
+
+        if num_outputs is None:
+            # Use same number of output partitions as the larger side.
+            output_num_blocks = max(len(left_blocks), len(right_blocks))
+        else:
+            output_num_blocks = num_outputs
+
+        join_spec = HashJoinTaskSpec(
+            num_left_blocks=len(left_blocks),
+            left_keys=left_keys,
+            right_keys=right_keys,
+            how=how,
+            suffixes=suffixes,
+        )
+        # NOTE: push-based shuffle merges map outputs of different map tasks
+        # together, which would lose track of which side each block belongs to.
+        # So always use pull-based shuffle for joins.
+        scheduler = PullBasedShuffleTaskScheduler(join_spec)
+        return scheduler.execute(left_refs + right_refs, output_num_blocks, ctx)
+
+    return fn
+
+
+def _should_broadcast(how: str, right_metadata: List[BlockMetadata]) -> bool:
+    """Whether the right hand side is small enough to be broadcast."""
+    if how not in BROADCAST_JOIN_TYPES:
+        return False
+    if any(meta.size_bytes is None for meta in right_metadata):
+        return False
+    right_size_bytes = sum(meta.size_bytes for meta in right_metadata)
+    threshold = DataContext.get_current().broadcast_join_threshold_bytes
+    return right_size_bytes <= threshold
+
+
+def _execute_broadcast_join(
+    left_refs: List[RefBundle],
+    right_blocks: List[ObjectRef[Block]],
+    left_keys: List[str],
+    right_keys: List[str],
+    how: str,
+    suffixes: Tuple[str, str],
+    ctx: TaskContext,
+) -> Tuple[List[RefBundle], StatsDict]:
+    """Join every left hand side block with the whole right hand side.
+
+    The right hand side blocks are concatenated into a single table that is stored
+    in the object store once, so join tasks on the same node share a zero-copy
+    view of it. This avoids shuffling the left hand side, and preserves its block
+    order.
+    """
+    build_broadcast_table = cached_remote_fn(_build_broadcast_table)
+    join_one_block = cached_remote_fn(_broadcast_join_one_block, num_returns=2)
+
+    right_table = build_broadcast_table.remote(*right_blocks)
+    output_blocks = []
+    output_metadata = []
+    for ref_bundle in left_refs:
+        for block, _ in ref_bundle.blocks:
+            res, meta = join_one_block.remote(
+                block, right_table, left_keys, right_keys, how, suffixes
+            )
+            output_blocks.append(res)
+            output_metadata.append(meta)
+    del right_table
+
+    bar_name = ExchangeTaskSpec.MAP_SUB_PROGRESS_BAR_NAME
+    sub_progress_bar_dict = ctx.sub_progress_bar_dict
+    if sub_progress_bar_dict is not None and bar_name in sub_progress_bar_dict:
+        output_metadata = sub_progress_bar_dict[bar_name].fetch_until_complete(
+            output_metadata
+        )
+    else:
+        output_metadata = ray.get(output_metadata)
+
+    input_owned = all(b.owns_blocks for b in left_refs)
+    output = [
+        RefBundle([(block, meta)], owns_blocks=input_owned)
+        for block, meta in zip(output_blocks, output_metadata)
+    ]
+    return output, {"broadcast_join": output_metadata}
+
+
+def _build_broadcast_table(*blocks: Block) -> Block:
+    return transform_pyarrow.concat(
+        [BlockAccessor.for_block(b).to_arrow() for b in blocks]
+    )
+
+
+def _broadcast_join_one_block(
+    block: Block,
+    right_table: Block,
+    left_keys: List[str],
+    right_keys: List[str],
+    how: str,
+    suffixes: Tuple[str, str],
+) -> Tuple[Block, BlockMetadata]:
+    stats = BlockExecStats.builder()
+    left_table = BlockAccessor.for_block(block).to_arrow()
+    result = _join_tables(left_table, right_table, left_keys, right_keys, how, suffixes)
+    meta = BlockAccessor.for_block(result).get_metadata(
+        input_files=None, exec_stats=stats.build()
+    )
+    return result, meta
+
+
+def _get_blocks_and_metadata(refs: List[RefBundle]) -> Tuple[List, List]:
+    blocks = []
+    metadata = []
+    for ref_bundle in refs:
+        for block, block_metadata in ref_bundle.blocks:
+            blocks.append(block)
+            metadata.append(block_metadata)
+    return blocks, metadata
+
+
+def _validate_keys(keys: List[str], schema) -> None:
+    """Check that the join keys exist in the schema, if the schema is known."""
+    if schema is None or not hasattr(schema, "names"):
+        return
+    for key in keys:
+        if key not in schema.names:
+            raise ValueError(
+                f"The join key column '{key}' does not exist in the schema "
+                f"'{schema}'."
+            )
@@ -1,6 +1,7 @@
 from typing import Dict
 
 from ray.data._internal.execution.interfaces import PhysicalOperator
+from ray.data._internal.execution.operators.join_operator import JoinOperator
 from ray.data._internal.execution.operators.union_operator import UnionOperator
 from ray.data._internal.execution.operators.zip_operator import ZipOperator
 from ray.data._internal.logical.interfaces import (
@@ -12,10 +13,11 @@ from ray.data._internal.logical.operators.all_to_all_operator import AbstractAll
 from ray.data._internal.logical.operators.from_operators import AbstractFrom
 from ray.data._internal.logical.operators.input_data_operator import InputData
 from ray.data._internal.logical.operators.map_operator import AbstractUDFMap
-from ray.data._internal.logical.operators.n_ary_operator import Union, Zip
+from ray.data._internal.logical.operators.n_ary_operator import Join, Union, Zip
 from ray.data._internal.logical.operators.one_to_one_operator import Limit
 from ray.data._internal.logical.operators.read_operator import Read
 from ray.data._internal.logical.operators.write_operator import Write
+from ray.data._internal.planner.join import generate_join_fn
 from ray.data._internal.planner.plan_all_to_all_op import plan_all_to_all_op
 from ray.data._internal.planner.plan_from_op import plan_from_op
 from ray.data._internal.planner.plan_input_data_op import plan_input_data_op
@@ -67,6 +69,22 @@ class Planner:
         elif isinstance(logical_op, Zip):
             assert len(physical_children) == 2
             physical_op = ZipOperator(physical_children[0], physical_children[1])
+        elif isinstance(logical_op, Join):
+            assert len(physical_children) == 2
+            join_fn = generate_join_fn(
+                logical_op._left_keys,
+                logical_op._right_keys,
+                logical_op._how,
+                logical_op._suffixes,
+                logical_op._num_outputs,
+                logical_op._strategy,
+            )
+            physical_op = JoinOperator(
+                join_fn,
+                physical_children[0],
+                physical_children[1],
+                num_outputs=logical_op._num_outputs,
+            )
         elif isinstance(logical_op, Union):
             assert len(physical_children) >= 2
             physical_op = UnionOperator(*physical_children)
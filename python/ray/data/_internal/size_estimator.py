@@ -1,49 +1,131 @@
-from typing import Any, List
+import datetime
+import decimal
+from typing import Any, Dict, List, Optional
+
+import numpy as np
 
 import ray
 from ray import cloudpickle
 
 _ray_initialized = False
 
+# The size in bytes of an offset into the data of a variable-size Arrow value, e.g.
+# a string or a list.
+_OFFSET_SIZE_BYTES = 4
+# The size in bytes of fixed-size scalars, e.g. ints, floats and timestamps.
+_SCALAR_SIZE_BYTES = 8
+# The max number of elements of a sequence to estimate the size of. The sizes of
+# longer sequences are extrapolated from evenly spaced elements.
+_MAX_SEQUENCE_SAMPLES = 100
+
 
 class SizeEstimator:
-    """Efficiently estimates the Ray serialized size of a stream of items.
+    """Efficiently estimates the in-memory size of a stream of items once they're
+    built into a block.
+
+    The size of an item is the sum of the sizes of its values, which are modelled on
+    their Arrow representation: numpy arrays and Arrow arrays count their buffer
+    sizes, strings and bytes their length plus an offset, and other scalars 8 bytes.
+    Values of other types are sized by Ray serialization, for only a sample of the
+    values of each type.
 
-    For efficiency, this only samples a fraction of the added items for real
-    Ray-serialization.
+    For efficiency, this only sizes a fraction of the added items: the first 10,
+    every 10th of the first 100, and every 100th after that.
     """
 
     def __init__(self):
         self._running_mean = RunningMean()
         self._count = 0
+        # The mean serialized size of values of types that aren't modelled, by type.
+        self._serialized_sizes: Dict[type, RunningMean] = {}
+        self._serialized_counts: Dict[type, int] = {}
 
     def add(self, item: Any) -> None:
         self._count += 1
         if self._count <= 10:
-            self._running_mean.add(self._real_size(item), weight=1)
+            self._running_mean.add(self._estimate_item_size(item), weight=1)
         elif self._count <= 100:
             if self._count % 10 == 0:
-                self._running_mean.add(self._real_size(item), weight=10)
+                self._running_mean.add(self._estimate_item_size(item), weight=10)
         elif self._count % 100 == 0:
-            self._running_mean.add(self._real_size(item), weight=100)
+            self._running_mean.add(self._estimate_item_size(item), weight=100)
 
     def add_block(self, block: List[Any]) -> None:
         if self._count < 10:
             for i in range(min(10 - self._count, len(block))):
-                self._running_mean.add(self._real_size(block[i]), weight=1)
+                self._running_mean.add(self._estimate_item_size(block[i]), weight=1)
         if self._count < 100:
             for i in range(
                 10 - (self._count % 10), min(100 - self._count, len(block)), 10
             ):
-                self._running_mean.add(self._real_size(block[i]), weight=10)
+                self._running_mean.add(self._estimate_item_size(block[i]), weight=10)
         if (len(block) + (self._count % 100)) // 100 > 1:
             for i in range(100 - (self._count % 100), len(block), 100):
-                self._running_mean.add(self._real_size(block[i]), weight=100)
+                self._running_mean.add(self._estimate_item_size(block[i]), weight=100)
         self._count += len(block)
 
     def size_bytes(self) -> int:
         return int(self._running_mean.mean * self._count)
 
+    def _estimate_item_size(self, item: Any) -> float:
+        if isinstance(item, dict):
+            # The keys are column names, which aren't stored per row.
+            return sum(self._estimate_size(value) for value in item.values())
+        return self._estimate_size(item)
+
+    def _estimate_size(self, value: Any) -> float:
+        if value is None or isinstance(value, (bool, np.bool_)):
+            return 1
+        if isinstance(value, (str, bytes, bytearray)):
+            if isinstance(value, str) and not value.isascii():
+                return len(value.encode()) + _OFFSET_SIZE_BYTES
+            return len(value) + _OFFSET_SIZE_BYTES
+        if isinstance(value, np.ndarray):
+            if value.dtype == object:
+                return value.nbytes + self._estimate_sequence_size(value.ravel())
+            return value.nbytes
+        if isinstance(value, np.generic):
+            return value.nbytes
+        if isinstance(
+            value,
+            (
+                int,
+                float,
+                datetime.date,
+                datetime.time,
+                datetime.timedelta,
+            ),
+        ):
+            return _SCALAR_SIZE_BYTES
+        if isinstance(value, decimal.Decimal):
+            return 2 * _SCALAR_SIZE_BYTES
+        if isinstance(value, (list, tuple)):
+            return _OFFSET_SIZE_BYTES + self._estimate_sequence_size(value)
+        if isinstance(value, dict):
+            return self._estimate_sequence_size(list(value.values()))
+        arrow_size = _arrow_size_bytes(value)
+        if arrow_size is not None:
+            return arrow_size
+        return self._serialized_size(value)
+
+    def _estimate_sequence_size(self, values: Any) -> float:
+        if len(values) <= _MAX_SEQUENCE_SAMPLES:
+            return sum(self._estimate_size(value) for value in values)
+        step = len(values) // _MAX_SEQUENCE_SAMPLES
+        samples = values[::step][:_MAX_SEQUENCE_SAMPLES]
+        sample_size = sum(self._estimate_size(value) for value in samples)
+        return sample_size * len(values) / len(samples)
+
+    def _serialized_size(self, value: Any) -> float:
+        # Serialize the first 10 values of each type, then every 100th value.
+        value_type = type(value)
+        count = self._serialized_counts.get(value_type, 0) + 1
+        self._serialized_counts[value_type] = count
+        mean = self._serialized_sizes.setdefault(value_type, RunningMean())
+        if count <= 10 or count % 100 == 0:
+            mean.add(self._real_size(value), weight=1)
+        return mean.mean
+
     def _real_size(self, item: Any) -> int:
         is_client = ray.util.client.ray.is_connected()
         # In client mode, fallback to using Ray cloudpickle instead of the
@@ -64,6 +146,17 @@ class SizeEstimator:
         )
 
 
+def _arrow_size_bytes(value: Any) -> Optional[int]:
+    """Return the buffer size of an Arrow array, or None if the value isn't one."""
+    if not type(value).__module__.startswith("pyarrow"):
+        return None
+    if hasattr(value, "get_total_buffer_size"):
+        return value.get_total_buffer_size()
+    if hasattr(value, "nbytes"):
+        return value.nbytes
+    return None
+
+
 # Adapted from the RLlib MeanStdFilter.
 class RunningMean:
     def __init__(self):
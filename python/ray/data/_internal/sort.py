@@ -16,7 +16,7 @@ Merging: a merge task would receive a block from every worker that consists
 of items in a certain range. It then merges the sorted blocks into one sorted
 block and becomes part of the new, sorted dataset.
 """
-from typing import TYPE_CHECKING, List, Optional, Tuple, TypeVar, Union
+from typing import TYPE_CHECKING, Any, List, Optional, Tuple, TypeVar, Union
 
 import numpy as np
 
@@ -141,6 +141,23 @@ def sample_boundaries(
     partition the domain into ranges with approximately equally many elements.
     Each boundary item is a tuple of a form (col1_value, col2_value, ...).
     """
+    sorted_samples = sample_keys(blocks, sort_key, num_reducers, ctx)
+    # The dataset is empty
+    if sorted_samples is None:
+        return [None] * (num_reducers - 1)
+    return compute_boundaries(sorted_samples, num_reducers)
+
+
+def sample_keys(
+    blocks: List[ObjectRef[Block]],
+    sort_key: SortKey,
+    num_reducers: int,
+    ctx: Optional[TaskContext] = None,
+) -> Optional[List[np.ndarray]]:
+    """
+    Return the sorted values of each key column, sampled from the blocks, or None if
+    the blocks are empty.
+    """
     columns = sort_key.get_columns()
 
     n_samples = int(num_reducers * 10 / len(blocks))
@@ -166,9 +183,8 @@ def sample_boundaries(
         sample_bar.close()
     del sample_results
     samples = [s for s in samples if len(s) > 0]
-    # The dataset is empty
     if len(samples) == 0:
-        return [None] * (num_reducers - 1)
+        return None
     builder = DelegatingBlockBuilder()
     for sample in samples:
         builder.add_block(sample)
@@ -177,19 +193,94 @@ def sample_boundaries(
     # Compute sorted indices of the samples. In np.lexsort last key is the
     # primary key hence have to reverse the order.
     indices = np.lexsort(list(reversed(list(sample_dict.values()))))
-    # Sort each column by indices, and calculate q-ths quantile items.
-    # Ignore the 1st item as it's not required for the boundary
-    for k, v in sample_dict.items():
-        sorted_v = v[indices]
-        sample_dict[k] = [
-            np.quantile(sorted_v, q, interpolation="nearest")
-            for q in np.linspace(0, 1, num_reducers)
-        ][1:]
-    # Return the list of boundaries as tuples
-    # of a form (col1_value, col2_value, ...)
-    return [
-        tuple(sample_dict[k][i] for k in sample_dict) for i in range(num_reducers - 1)
-    ]
+    return [v[indices] for v in sample_dict.values()]
+
+
+def compute_boundaries(sorted_samples: List[np.ndarray], num_reducers: int) -> List[T]:
+    """
+    Return (num_reducers - 1) boundaries in ascending order that partition the sorted
+    samples into ranges with approximately equally many samples. Each boundary item
+    is a tuple of a form (col1_value, col2_value, ...), and `sorted_samples` holds
+    the sorted sample values of each column.
+
+    Samples with the same key always fall into the same range, so that all rows of a
+    key go to the same reducer. A key making up more than a range's share of the
+    samples (i.e., a skewed key) gets a range of its own, and the remaining samples
+    are re-split evenly across the remaining ranges, instead of leaving ranges empty
+    and sending their rows to the reducer of the skewed key.
+    """
+    num_samples = len(sorted_samples[0])
+    run_starts, run_ends = _find_runs(sorted_samples)
+
+    boundaries = []
+    num_assigned_samples = 0
+    range_size = 0
+    for start, end in zip(run_starts, run_ends):
+        if len(boundaries) == num_reducers - 1:
+            break
+        run_size = end - start
+        # The share of each remaining range, including the current one.
+        target_range_size = (num_samples - num_assigned_samples) / (
+            num_reducers - len(boundaries)
+        )
+        # Start a new range at this key, if adding the key would overfill the current
+        # range by more than it would underfill it.
+        if range_size > 0 and range_size + run_size / 2 > target_range_size:
+            boundaries.append(tuple(values[start] for values in sorted_samples))
+            num_assigned_samples += range_size
+            range_size = 0
+        range_size += run_size
+
+    # There are fewer distinct keys than reducers, so leave the last ranges empty.
+    last_key = tuple(values[-1] for values in sorted_samples)
+    while len(boundaries) < num_reducers - 1:
+        boundaries.append(boundaries[-1] if boundaries else last_key)
+    return boundaries
+
+
+def find_heavy_hitters(
+    sorted_samples: List[np.ndarray], num_reducers: int
+) -> List[Tuple[T, float]]:
+    """
+    Return the keys that make up more than a reducer's share (1 / num_reducers) of
+    the sorted samples, together with their fraction of the samples, in ascending
+    order. Each key is a tuple of a form (col1_value, col2_value, ...), and
+    `sorted_samples` holds the sorted sample values of each column.
+
+    If any sampled key is null or NaN, no key is reported, since null keys can't be
+    ordered consistently with the other keys.
+    """
+    num_samples = len(sorted_samples[0])
+    if num_samples == 0:
+        return []
+    if any(_is_null(value) for values in sorted_samples for value in values):
+        return []
+    run_starts, run_ends = _find_runs(sorted_samples)
+
+    heavy_hitters = []
+    for start, end in zip(run_starts, run_ends):
+        fraction = float(end - start) / num_samples
+        if fraction > 1 / num_reducers:
+            key = tuple(values[start] for values in sorted_samples)
+            heavy_hitters.append((key, fraction))
+    return heavy_hitters
+
+
+def _find_runs(sorted_samples: List[np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+    """Return the start and end indices of the runs of samples with the same key."""
+    num_samples = len(sorted_samples[0])
+    key_changed = np.zeros(num_samples - 1, dtype=bool)
+    for values in sorted_samples:
+        key_changed |= values[1:] != values[:-1]
+    run_starts = np.concatenate([[0], np.flatnonzero(key_changed) + 1])
+    run_ends = np.append(run_starts[1:], num_samples)
+    return run_starts, run_ends
+
+
+def _is_null(value: Any) -> bool:
+    return value is None or (
+        isinstance(value, (float, np.floating)) and bool(np.isnan(value))
+    )
 
 
 # Note: currently the map_groups() API relies on this implementation
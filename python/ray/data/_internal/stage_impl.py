@@ -7,6 +7,8 @@ from ray.data._internal.delegating_block_builder import DelegatingBlockBuilder
 from ray.data._internal.execution.interfaces import TaskContext
 from ray.data._internal.fast_repartition import fast_repartition
 from ray.data._internal.plan import AllToAllStage
+from ray.data._internal.planner.exchange.interfaces import ExchangeTaskSpec
+from ray.data._internal.planner.join import generate_join_fn
 from ray.data._internal.remote_fn import cached_remote_fn
 from ray.data._internal.shuffle_and_partition import (
     PushBasedShufflePartitionOp,
@@ -261,6 +263,55 @@ class ZipStage(AllToAllStage):
         super().__init__("Zip", None, do_zip_all)
 
 
+class JoinStage(AllToAllStage):
+    """Implementation of `Dataset.join()`."""
+
+    def __init__(
+        self,
+        other: "Dataset",
+        left_keys: List[str],
+        right_keys: List[str],
+        how: str,
+        suffixes: Tuple[str, str],
+        num_outputs: Optional[int],
+        strategy: Optional[str],
+    ):
+        join_fn = generate_join_fn(
+            left_keys, right_keys, how, suffixes, num_outputs, strategy
+        )
+
+        def do_join(
+            block_list: BlockList,
+            ctx: TaskContext,
+            clear_input_blocks: bool,
+            *_,
+        ):
+            from ray.data._internal.execution.legacy_compat import (
+                _block_list_to_bundles,
+                _bundles_to_block_list,
+            )
+
+            other_block_list = other._plan.execute()
+            left_refs = _block_list_to_bundles(
+                block_list, owns_blocks=clear_input_blocks
+            )
+            right_refs = _block_list_to_bundles(other_block_list, owns_blocks=False)
+            if clear_input_blocks:
+                block_list.clear()
+            output, stats = join_fn(left_refs, right_refs, ctx)
+            return _bundles_to_block_list(output), stats
+
+        super().__init__(
+            "Join",
+            num_outputs,
+            do_join,
+            sub_stage_names=[
+                ExchangeTaskSpec.MAP_SUB_PROGRESS_BAR_NAME,
+                ExchangeTaskSpec.REDUCE_SUB_PROGRESS_BAR_NAME,
+            ],
+        )
+
+
 def _calculate_blocks_rows_and_bytes(
     blocks_with_metadata: BlockPartition,
 ) -> Tuple[List[int], List[int]]:
@@ -253,6 +253,9 @@ class DatasetStats:
         self.iter_total_blocked_s: Timer = Timer()
         self.iter_user_s: Timer = Timer()
         self.iter_total_s: Timer = Timer()
+        # The number of bytes copied to format each batch, e.g. to concatenate the
+        # chunks of tensor columns.
+        self.iter_format_batch_bytes_copied: Timer = Timer()
         self.extra_metrics = {}
 
         # Block fetch stats during iteration.
@@ -323,6 +326,7 @@ class DatasetStats:
             self.iter_blocks_local,
             self.iter_blocks_remote,
             self.iter_unknown_location,
+            self.iter_format_batch_bytes_copied,
         )
         stats_summary_parents = []
         if self.parents is not None:
@@ -747,6 +751,8 @@ class IterStatsSummary:
     iter_blocks_remote: int
     # Num of blocks with unknown locations
     iter_unknown_location: int
+    # Bytes copied in `_format_batch_()`
+    format_bytes_copied: Timer
 
     def __str__(self) -> str:
         if self.legacy_iter_batches:
@@ -811,6 +817,17 @@ class IterStatsSummary:
                     fmt(self.format_time.avg()),
                     fmt(self.format_time.get()),
                 )
+            if self.format_bytes_copied.get():
+                format_str = (
+                    "    * Bytes copied in batch formatting: {} min, {} max, "
+                    "{} avg, {} total\n"
+                )
+                out += format_str.format(
+                    int(self.format_bytes_copied.min()),
+                    int(self.format_bytes_copied.max()),
+                    int(self.format_bytes_copied.avg()),
+                    int(self.format_bytes_copied.get()),
+                )
             if self.collate_time.get():
                 out += "    * In collate_fn: {} min, {} max, {} avg, {} total\n".format(
                     fmt(self.collate_time.min()),
@@ -894,6 +911,7 @@ class DatasetPipelineStats:
             "iter_get_s": Timer(),
             "iter_next_batch_s": Timer(),
             "iter_format_batch_s": Timer(),
+            "iter_format_batch_bytes_copied": Timer(),
             "iter_collate_batch_s": Timer(),
             "iter_finalize_batch_s": Timer(),
             "iter_user_s": Timer(),
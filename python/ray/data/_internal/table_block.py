@@ -1,5 +1,16 @@
 import collections
-from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Mapping, TypeVar, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 import numpy as np
 
@@ -7,7 +18,7 @@ from ray.air.constants import TENSOR_COLUMN_NAME
 from ray.data._internal.block_builder import BlockBuilder
 from ray.data._internal.numpy_support import convert_udf_returns_to_numpy, is_array_like
 from ray.data._internal.size_estimator import SizeEstimator
-from ray.data.block import Block, BlockAccessor
+from ray.data.block import Block, BlockAccessor, KeyType
 from ray.data.row import TableRow
 
 if TYPE_CHECKING:
@@ -73,8 +84,8 @@ class TableBlockBuilder(BlockBuilder):
                 value = np.array(value)
             self._columns[key].append(value)
         self._num_rows += 1
-        self._compact_if_needed()
         self._uncompacted_size.add(item)
+        self._compact_if_needed()
 
     def add_block(self, block: Any) -> None:
         if not isinstance(block, self._block_type):
@@ -200,6 +211,34 @@ class TableBlockAccessor(BlockAccessor):
 
         return Iter()
 
+    def _iter_groups_sorted(
+        self, key: Optional[str]
+    ) -> Iterator[Tuple[KeyType, Block]]:
+        """Creates an iterator over zero-copy group views of the rows with the same
+        key, assuming the block is sorted by the key.
+
+        The group boundaries are found with a vectorized comparison of the key
+        column, so only a single row per group is materialized in Python.
+        """
+        if key is None:
+            # Global aggregation consists of a single "group", so we short-circuit.
+            yield None, self.to_block()
+            return
+        if self.num_rows() == 0:
+            return
+
+        import pandas as pd
+
+        keys = self.to_numpy(key)
+        is_null = pd.isnull(keys)
+        # Null keys are grouped together, like equal keys.
+        key_changed = (keys[1:] != keys[:-1]) & ~(is_null[1:] & is_null[:-1])
+        starts = np.concatenate([[0], np.flatnonzero(key_changed) + 1])
+        ends = np.append(starts[1:], self.num_rows())
+        for start, end in zip(starts, ends):
+            group_key = self._get_row(start)[key]
+            yield group_key, self.slice(start, end, copy=False)
+
     def _zip(self, acc: BlockAccessor) -> "Block":
         raise NotImplementedError
 
@@ -5,7 +5,7 @@ import pathlib
 import sys
 import urllib.parse
 from types import ModuleType
-from typing import TYPE_CHECKING, Any, Iterable, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Iterable, List, Optional, Tuple, Union
 
 import numpy as np
 
@@ -537,13 +537,27 @@ def find_partition_index(
     desired: List[Any],
     sort_key: "SortKey",
 ) -> int:
+    left, right = find_partition_range(table, desired, sort_key)
+    return right if sort_key.get_descending() is True else left
+
+
+def find_partition_range(
+    table: Union["pyarrow.Table", "pandas.DataFrame"],
+    desired: List[Any],
+    sort_key: "SortKey",
+) -> Tuple[int, int]:
+    """Return the range of rows of the sorted `table` whose key equals `desired`.
+
+    If there is no such row, the range is empty and starts where `desired` would be
+    inserted to keep the table sorted.
+    """
     columns = sort_key.get_columns()
     descending = sort_key.get_descending()
 
     left, right = 0, len(table)
     for i in range(len(desired)):
         if left == right:
-            return right
+            return left, right
         col_name = columns[i]
         col_vals = table[col_name].to_numpy()[left:right]
         desired_val = desired[i]
@@ -571,7 +585,7 @@ def find_partition_index(
         else:
             left = prevleft + np.searchsorted(col_vals, desired_val, side="left")
             right = prevleft + np.searchsorted(col_vals, desired_val, side="right")
-    return right if descending is True else left
+    return left, right
 
 
 def find_partitions(table, boundaries, sort_key):
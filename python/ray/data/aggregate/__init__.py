@@ -1,6 +1,9 @@
 from ray.data.aggregate._aggregate import (
     AbsMax,
     AggregateFn,
+    ApproxCountDistinct,
+    ApproxQuantile,
+    ApproxTopK,
     Count,
     Max,
     Mean,
@@ -13,6 +16,9 @@ from ray.data.aggregate._aggregate import (
 __all__ = [
     "AbsMax",
     "AggregateFn",
+    "ApproxCountDistinct",
+    "ApproxQuantile",
+    "ApproxTopK",
     "Count",
     "Max",
     "Mean",
@@ -1,5 +1,8 @@
 import math
-from typing import TYPE_CHECKING, Callable, List, Optional, Union
+import pickle
+from typing import TYPE_CHECKING, Any, Callable, List, Optional, Union
+
+import numpy as np
 
 from ray.data._internal.null_aggregate import (
     _null_wrap_accumulate_block,
@@ -8,6 +11,13 @@ from ray.data._internal.null_aggregate import (
     _null_wrap_init,
     _null_wrap_merge,
 )
+from ray.data._internal.sketches import (
+    DEFAULT_HLL_PRECISION,
+    DEFAULT_KLL_K,
+    FrequentItems,
+    HyperLogLog,
+    KLLSketch,
+)
 from ray.data._internal.sort import SortKey
 from ray.data.block import AggType, Block, BlockAccessor, KeyType, T, U
 from ray.util.annotations import PublicAPI
@@ -429,3 +439,195 @@ class Quantile(_AggregateOnKeyBase):
             finalize=_null_wrap_finalize(percentile),
             name=(self._rs_name),
         )
+
+
+class _NullCount(_AggregateOnKeyBase):
+    """Defines null count aggregation."""
+
+    def __init__(self, on: str, alias_name: Optional[str] = None):
+        self._set_key_fn(on)
+        if alias_name:
+            self._rs_name = alias_name
+        else:
+            self._rs_name = f"null_count({str(on)})"
+
+        def accumulate_block(a: int, block: Block) -> int:
+            block_acc = BlockAccessor.for_block(block)
+            num_rows = block_acc.num_rows()
+            if num_rows == 0:
+                return a
+            return a + num_rows - block_acc.count(on)
+
+        super().__init__(
+            init=lambda k: 0,
+            merge=lambda a1, a2: a1 + a2,
+            accumulate_block=accumulate_block,
+            name=(self._rs_name),
+        )
+
+
+class _SketchAggregateBase(_AggregateOnKeyBase):
+    """Base class of the aggregations that summarize the non-null values of a
+    column with a mergeable sketch.
+
+    The accumulators are pickled sketches, so that they can be stored in blocks
+    between the partial and final aggregations.
+    """
+
+    def __init__(
+        self,
+        on: str,
+        create_sketch: Callable[[], Any],
+        finalize: Callable[[Any], U],
+        name: str,
+    ):
+        self._set_key_fn(on)
+
+        def accumulate_block(a: bytes, block: Block) -> bytes:
+            values = _get_non_null_values(block, on)
+            if len(values) == 0:
+                return a
+            sketch = pickle.loads(a)
+            sketch.add(values)
+            return pickle.dumps(sketch)
+
+        def merge(a1: bytes, a2: bytes) -> bytes:
+            sketch = pickle.loads(a1)
+            sketch.merge(pickle.loads(a2))
+            return pickle.dumps(sketch)
+
+        super().__init__(
+            init=lambda k: pickle.dumps(create_sketch()),
+            merge=merge,
+            accumulate_block=accumulate_block,
+            finalize=lambda a: finalize(pickle.loads(a)),
+            name=name,
+        )
+
+
+def _get_non_null_values(block: Block, on: str) -> np.ndarray:
+    import pandas as pd
+
+    block_acc = BlockAccessor.for_block(block)
+    if block_acc.num_rows() == 0:
+        return np.empty(0)
+    values = block_acc.to_numpy(on)
+    if values.dtype.kind in "fmMO":
+        values = values[~pd.isnull(values)]
+    return values
+
+
+@PublicAPI(stability="alpha")
+class ApproxCountDistinct(_SketchAggregateBase):
+    """Defines approximate distinct count aggregation.
+
+    The distinct non-null values are counted with a HyperLogLog sketch, in
+    ``2**precision`` bytes of memory per group. The relative standard error of the
+    count is about ``1.04 / sqrt(2**precision)``, e.g. 0.8% for the default
+    precision.
+
+    Args:
+        on: The column to count the distinct values of.
+        precision: The number of hash bits used to index the sketch, between 4
+            and 18.
+        alias_name: The name of the aggregation result.
+    """
+
+    def __init__(
+        self,
+        on: str,
+        precision: int = DEFAULT_HLL_PRECISION,
+        alias_name: Optional[str] = None,
+    ):
+        # Validate the precision eagerly.
+        HyperLogLog(precision)
+        super().__init__(
+            on,
+            create_sketch=lambda: HyperLogLog(precision),
+            finalize=lambda sketch: sketch.count(),
+            name=alias_name or f"approx_count_distinct({str(on)})",
+        )
+
+
+@PublicAPI(stability="alpha")
+class ApproxQuantile(_SketchAggregateBase):
+    """Defines approximate quantile aggregation.
+
+    Unlike :class:`Quantile`, this doesn't collect all of the values: the non-null
+    values are summarized with a KLL sketch of ``O(k)`` values per group. The rank
+    error of the quantiles shrinks roughly in proportion to ``1 / k``. For the
+    default ``k`` of 200, it's at most about 1.65% with 99% confidence, and usually
+    0.5-1.5%. The min and max are exact.
+
+    Args:
+        on: The numeric column to compute the quantiles of.
+        q: The quantile, or list of quantiles, to compute, between 0 and 1.
+        k: The size parameter of the sketch, which trades off memory for accuracy.
+        alias_name: The name of the aggregation result.
+
+    Returns:
+        The quantile, or a list of the quantiles if ``q`` is a list.
+    """
+
+    def __init__(
+        self,
+        on: str,
+        q: Union[float, List[float]] = 0.5,
+        k: int = DEFAULT_KLL_K,
+        alias_name: Optional[str] = None,
+    ):
+        qs = q if isinstance(q, list) else [q]
+        if any(not 0 <= q_ <= 1 for q_ in qs):
+            raise ValueError(f"Quantiles must be between 0 and 1, got {q}.")
+        KLLSketch(k)
+
+        def finalize(sketch: KLLSketch) -> Union[float, List[float]]:
+            quantiles = sketch.quantiles(qs)
+            return quantiles if isinstance(q, list) else quantiles[0]
+
+        super().__init__(
+            on,
+            create_sketch=lambda: KLLSketch(k),
+            finalize=finalize,
+            name=alias_name or f"approx_quantile({str(on)})",
+        )
+
+
+@PublicAPI(stability="alpha")
+class ApproxTopK(_SketchAggregateBase):
+    """Defines approximate most frequent values aggregation.
+
+    The non-null values are counted with a mergeable frequent items summary of at
+    most ``capacity`` counters per group. Any value that occurs in more than
+    ``1 / (capacity + 1)`` of the rows is found, and its count is underestimated by
+    at most ``num_rows / (capacity + 1)``.
+
+    Args:
+        on: The column to find the most frequent values of.
+        k: The number of values to return.
+        capacity: The number of counters to keep. Defaults to ``max(10 * k, 100)``.
+        alias_name: The name of the aggregation result.
+
+    Returns:
+        A list of up to ``k`` ``{"value": value, "count": count}`` dicts, by
+        descending count.
+    """
+
+    def __init__(
+        self,
+        on: str,
+        k: int = 10,
+        capacity: Optional[int] = None,
+        alias_name: Optional[str] = None,
+    ):
+        if k < 1:
+            raise ValueError(f"k must be positive, got {k}.")
+        if capacity is None:
+            capacity = max(10 * k, 100)
+        FrequentItems(capacity)
+        super().__init__(
+            on,
+            create_sketch=lambda: FrequentItems(capacity),
+            finalize=lambda sketch: sketch.top(k),
+            name=alias_name or f"approx_top_k({str(on)})",
+        )
@@ -73,6 +73,37 @@ DEFAULT_SCHEDULING_STRATEGY_LARGE_ARGS = "DEFAULT"
 # task scheduling (i.e., low tens of ms).
 DEFAULT_LARGE_ARGS_THRESHOLD = 50 * 1024 * 1024
 
+# Size in bytes under which the right hand side of a join is broadcast to all join
+# tasks, instead of hash partitioning both sides. This avoids a full shuffle when
+# joining a large dataset with a small one.
+DEFAULT_BROADCAST_JOIN_THRESHOLD_BYTES = 256 * 1024 * 1024
+
+# Size in bytes of the sorted blocks merged by a sort reduce task, above which the
+# merged block is written to local disk as it's produced and then memory-mapped,
+# rather than being built up in the worker's heap.
+DEFAULT_SORT_SPILL_THRESHOLD_BYTES = 2 * DEFAULT_TARGET_MAX_BLOCK_SIZE
+
+# The max number of bundles output by `Dataset.streaming_split()` to each split that
+# haven't been consumed yet. Once a split reaches it, no more bundles are assigned
+# to it until its consumer catches up, which bounds the object store memory held
+# for slow consumers.
+DEFAULT_STREAMING_SPLIT_MAX_OUTSTANDING_BUNDLES = 4
+
+# The directory to cache file listings and Parquet footers in, so that reads of the
+# same files don't list and fetch them again. Not set by default. The directory must
+# only be writable by trusted users, since its entries are trusted by reads.
+DEFAULT_FILE_METADATA_CACHE_DIR = os.environ.get("RAY_DATA_FILE_METADATA_CACHE_DIR")
+
+# How long in seconds the file metadata cache reuses the listings of directories
+# whose modification times the filesystem doesn't report, e.g. on S3. Listings reused
+# this way don't include the files added since. Not set by default, i.e. these
+# directories are always listed again.
+DEFAULT_FILE_METADATA_CACHE_LISTING_TTL_S = (
+    float(os.environ["RAY_DATA_FILE_METADATA_CACHE_LISTING_TTL_S"])
+    if "RAY_DATA_FILE_METADATA_CACHE_LISTING_TTL_S" in os.environ
+    else None
+)
+
 # Whether to use Polars for tabular dataset sorts, groupbys, and aggregations.
 DEFAULT_USE_POLARS = False
 
@@ -158,6 +189,11 @@ class DataContext:
         scheduling_strategy: SchedulingStrategyT,
         scheduling_strategy_large_args: SchedulingStrategyT,
         large_args_threshold: int,
+        broadcast_join_threshold_bytes: int,
+        sort_spill_threshold_bytes: int,
+        streaming_split_max_outstanding_bundles: int,
+        file_metadata_cache_dir: Optional[str],
+        file_metadata_cache_listing_ttl_s: Optional[float],
         use_polars: bool,
         new_execution_backend: bool,
         use_streaming_executor: bool,
@@ -191,6 +227,13 @@ class DataContext:
         self.scheduling_strategy = scheduling_strategy
         self.scheduling_strategy_large_args = scheduling_strategy_large_args
         self.large_args_threshold = large_args_threshold
+        self.broadcast_join_threshold_bytes = broadcast_join_threshold_bytes
+        self.sort_spill_threshold_bytes = sort_spill_threshold_bytes
+        self.streaming_split_max_outstanding_bundles = (
+            streaming_split_max_outstanding_bundles
+        )
+        self.file_metadata_cache_dir = file_metadata_cache_dir
+        self.file_metadata_cache_listing_ttl_s = file_metadata_cache_listing_ttl_s
         self.use_polars = use_polars
         self.new_execution_backend = new_execution_backend
         self.use_streaming_executor = use_streaming_executor
@@ -240,6 +283,17 @@ class DataContext:
                         DEFAULT_SCHEDULING_STRATEGY_LARGE_ARGS
                     ),
                     large_args_threshold=DEFAULT_LARGE_ARGS_THRESHOLD,
+                    broadcast_join_threshold_bytes=(
+                        DEFAULT_BROADCAST_JOIN_THRESHOLD_BYTES
+                    ),
+                    sort_spill_threshold_bytes=DEFAULT_SORT_SPILL_THRESHOLD_BYTES,
+                    streaming_split_max_outstanding_bundles=(
+                        DEFAULT_STREAMING_SPLIT_MAX_OUTSTANDING_BUNDLES
+                    ),
+                    file_metadata_cache_dir=DEFAULT_FILE_METADATA_CACHE_DIR,
+                    file_metadata_cache_listing_ttl_s=(
+                        DEFAULT_FILE_METADATA_CACHE_LISTING_TTL_S
+                    ),
                     use_polars=DEFAULT_USE_POLARS,
                     new_execution_backend=DEFAULT_NEW_EXECUTION_BACKEND,
                     use_streaming_executor=DEFAULT_USE_STREAMING_EXECUTOR,
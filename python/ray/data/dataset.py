@@ -31,6 +31,7 @@ from ray._private.thirdparty.tabulate.tabulate import tabulate
 from ray._private.usage import usage_lib
 from ray.air.util.data_batch_conversion import BlockFormat
 from ray.air.util.tensor_extensions.utils import _create_possibly_ragged_ndarray
+from ray.data._internal import dataset_cache
 from ray.data._internal.block_list import BlockList
 from ray.data._internal.compute import (
     ActorPoolStrategy,
@@ -45,6 +46,7 @@ from ray.data._internal.execution.legacy_compat import _block_list_to_bundles
 from ray.data._internal.iterator.iterator_impl import DataIteratorImpl
 from ray.data._internal.iterator.stream_split_iterator import StreamSplitDataIterator
 from ray.data._internal.lazy_block_list import LazyBlockList
+from ray.data._internal.logical.fingerprint import fingerprint_plan
 from ray.data._internal.logical.operators.all_to_all_operator import (
     RandomizeBlocks,
     RandomShuffle,
@@ -54,10 +56,15 @@ from ray.data._internal.logical.operators.all_to_all_operator import (
 from ray.data._internal.logical.operators.input_data_operator import InputData
 from ray.data._internal.logical.operators.map_operator import (
     Filter,
+    FilterByExpression,
     FlatMap,
     MapBatches,
     MapRows,
+    Project,
+    _generate_filter_by_expression_fn,
+    _generate_select_columns_fn,
 )
+from ray.data._internal.logical.operators.n_ary_operator import Join
 from ray.data._internal.logical.operators.n_ary_operator import (
     Union as UnionLogicalOperator,
 )
@@ -67,6 +74,8 @@ from ray.data._internal.logical.operators.write_operator import Write
 from ray.data._internal.logical.optimizers import LogicalPlan
 from ray.data._internal.pandas_block import PandasBlockSchema
 from ray.data._internal.plan import ExecutionPlan, OneToOneStage
+from ray.data._internal.planner.exchange.join_task_spec import HashJoinTaskSpec
+from ray.data._internal.planner.join import BROADCAST_JOIN_TYPES
 from ray.data._internal.planner.plan_udf_map_op import (
     generate_filter_fn,
     generate_flat_map_fn,
@@ -79,6 +88,7 @@ from ray.data._internal.remote_fn import cached_remote_fn
 from ray.data._internal.sort import SortKey
 from ray.data._internal.split import _get_num_rows, _split_at_indices
 from ray.data._internal.stage_impl import (
+    JoinStage,
     LimitStage,
     RandomizeBlocksStage,
     RandomShuffleStage,
@@ -132,6 +142,7 @@ from ray.data.datasource.file_based_datasource import (
     _unwrap_arrow_serialization_workaround,
     _wrap_arrow_serialization_workaround,
 )
+from ray.data.expressions import Expr
 from ray.data.iterator import DataIterator
 from ray.data.random_access_dataset import RandomAccessDataset
 from ray.types import ObjectRef
@@ -630,15 +641,17 @@ class Dataset:
     def add_column(
         self,
         col: str,
-        fn: Callable[["pandas.DataFrame"], "pandas.Series"],
+        fn: Union[Callable[["pandas.DataFrame"], "pandas.Series"], Expr],
         *,
         compute: Optional[str] = None,
         **ray_remote_args,
     ) -> "Dataset":
         """Add the given column to the dataset.
 
-        A function generating the new column values given the batch in pandas
-        format must be specified.
+        Either a function generating the new column values given the batch in pandas
+        format, or an :class:`~ray.data.expressions.Expr` computing the new column
+        must be specified. Expressions are evaluated on Arrow batches with
+        vectorized ``pyarrow.compute`` kernels.
 
         Examples:
 
@@ -663,13 +676,19 @@ class Dataset:
             >>> ds.add_column("id", lambda df: 0).take(3)
             [{'id': 0}, {'id': 0}, {'id': 0}]
 
+            Add a new column with an expression.
+
+            >>> from ray.data import col
+            >>> ds.add_column("new_id", col("id") + 1).take(2)
+            [{'id': 0, 'new_id': 1}, {'id': 1, 'new_id': 2}]
+
         Time complexity: O(dataset size / parallelism)
 
         Args:
             col: Name of the column to add. If the name already exists, the
                 column is overwritten.
             fn: Map function generating the column values given a batch of
-                records in pandas format.
+                records in pandas format, or an expression of the column values.
             compute: The compute strategy, either "tasks" (default) to use Ray
                 tasks, ``ray.data.ActorPoolStrategy(size=n)`` to use a fixed-size actor
                 pool, or ``ray.data.ActorPoolStrategy(min_size=m, max_size=n)`` for an
@@ -677,6 +696,8 @@ class Dataset:
             ray_remote_args: Additional resource requirements to request from
                 ray (e.g., num_gpus=1 to request GPUs for the map tasks).
         """
+        if isinstance(fn, Expr):
+            return self._add_column_by_expression(col, fn, compute, ray_remote_args)
 
         def process_batch(batch: "pandas.DataFrame") -> "pandas.DataFrame":
             batch.loc[:, col] = fn(batch)
@@ -693,6 +714,28 @@ class Dataset:
             **ray_remote_args,
         )
 
+    def _add_column_by_expression(
+        self,
+        col: str,
+        expr: Expr,
+        compute: Optional[str],
+        ray_remote_args: Dict[str, Any],
+    ) -> "Dataset":
+        def add_column(batch: "pyarrow.Table") -> "pyarrow.Table":
+            values = expr.evaluate(batch)
+            index = batch.schema.get_field_index(col)
+            if index == -1:
+                return batch.append_column(col, values)
+            return batch.set_column(index, col, values)
+
+        return self.map_batches(
+            add_column,
+            batch_format="pyarrow",
+            compute=compute,
+            zero_copy_batch=True,
+            **ray_remote_args,
+        )
+
     def drop_columns(
         self,
         cols: List[str],
@@ -752,7 +795,9 @@ class Dataset:
     ) -> "Dataset":
         """Select one or more columns from the dataset.
 
-        Specified columns must be in the dataset schema.
+        Specified columns must be in the dataset schema. If the selection directly
+        follows a read that supports column pruning (e.g., Parquet), only the
+        selected columns are read.
 
         Examples:
 
@@ -784,14 +829,33 @@ class Dataset:
             ray_remote_args: Additional resource requirements to request from
                 ray (e.g., num_gpus=1 to request GPUs for the map tasks).
         """  # noqa: E501
-        return self.map_batches(
-            lambda batch: BlockAccessor.for_block(batch).select(columns=cols),
+        transform_fn = generate_map_batches_fn(
+            batch_size=None,
             batch_format="pandas",
             zero_copy_batch=True,
-            compute=compute,
-            **ray_remote_args,
+        )
+        plan = self._plan.with_stage(
+            OneToOneStage(
+                "MapBatches(select_columns)",
+                transform_fn,
+                compute,
+                ray_remote_args,
+                fn=_generate_select_columns_fn(cols),
+            )
         )
 
+        logical_plan = self._logical_plan
+        if logical_plan is not None:
+            op = Project(
+                logical_plan.dag,
+                cols,
+                compute=compute,
+                ray_remote_args=ray_remote_args,
+            )
+            logical_plan = LogicalPlan(op)
+
+        return Dataset(plan, self._epoch, self._lazy, logical_plan)
+
     def flat_map(
         self,
         fn: UserDefinedFunction[Dict[str, Any], List[Dict[str, Any]]],
@@ -895,13 +959,19 @@ class Dataset:
 
     def filter(
         self,
-        fn: UserDefinedFunction[Dict[str, Any], bool],
+        fn: Optional[UserDefinedFunction[Dict[str, Any], bool]] = None,
         *,
+        expr: Optional[Union[Expr, "pyarrow.dataset.Expression"]] = None,
         compute: Union[str, ComputeStrategy] = None,
         **ray_remote_args,
     ) -> "Dataset":
         """Filter out rows that don't satisfy the given predicate.
 
+        The predicate is either a function applied to each row, or an expression
+        evaluated on batches of rows. Expression filters that directly
+        follow a read supporting predicate pushdown (e.g., Parquet) are applied
+        while reading, which skips row groups that can't match.
+
         .. tip::
             If you can represent your predicate with NumPy or pandas operations,
             :meth:`Dataset.map_batches` might be faster. You can implement filter by
@@ -914,12 +984,19 @@ class Dataset:
             >>> ds.filter(lambda row: row["id"] % 2 == 0).take_all()
             [{'id': 0}, {'id': 2}, {'id': 4}, ...]
 
+            >>> from ray.data import col
+            >>> ds.filter(expr=(col("id") < 3) | (col("id") == 99)).take_all()
+            [{'id': 0}, {'id': 1}, {'id': 2}, {'id': 99}]
+
         Time complexity: O(dataset size / parallelism)
 
         Args:
             fn: The predicate to apply to each row, or a class type
                 that can be instantiated to create such a callable. Callable classes are
                 only supported for the actor compute strategy.
+            expr: An :class:`~ray.data.expressions.Expr` or a
+                ``pyarrow.dataset.Expression`` that rows must satisfy. Exactly one of
+                ``fn`` and ``expr`` must be specified.
             compute: The compute strategy, either "tasks" (default) to use Ray
                 tasks, ``ray.data.ActorPoolStrategy(size=n)`` to use a fixed-size actor
                 pool, or ``ray.data.ActorPoolStrategy(min_size=m, max_size=n)`` for an
@@ -927,6 +1004,12 @@ class Dataset:
             ray_remote_args: Additional resource requirements to request from
                 ray (e.g., num_gpus=1 to request GPUs for the map tasks).
         """
+        if (fn is None) == (expr is None):
+            raise ValueError("Exactly one of `fn` and `expr` must be specified.")
+
+        if expr is not None:
+            return self._filter_by_expression(expr, compute, ray_remote_args)
+
         validate_compute(fn, compute)
 
         transform_fn = generate_filter_fn()
@@ -947,6 +1030,39 @@ class Dataset:
 
         return Dataset(plan, self._epoch, self._lazy, logical_plan)
 
+    def _filter_by_expression(
+        self,
+        expr: Union[Expr, "pyarrow.dataset.Expression"],
+        compute: Union[str, ComputeStrategy],
+        ray_remote_args: Dict[str, Any],
+    ) -> "Dataset":
+        transform_fn = generate_map_batches_fn(
+            batch_size=None,
+            batch_format="pyarrow",
+            zero_copy_batch=True,
+        )
+        plan = self._plan.with_stage(
+            OneToOneStage(
+                "MapBatches(filter_by_expression)",
+                transform_fn,
+                compute,
+                ray_remote_args,
+                fn=_generate_filter_by_expression_fn(expr),
+            )
+        )
+
+        logical_plan = self._logical_plan
+        if logical_plan is not None:
+            op = FilterByExpression(
+                logical_plan.dag,
+                expr,
+                compute=compute,
+                ray_remote_args=ray_remote_args,
+            )
+            logical_plan = LogicalPlan(op)
+
+        return Dataset(plan, self._epoch, self._lazy, logical_plan)
+
     def repartition(self, num_blocks: int, *, shuffle: bool = False) -> "Dataset":
         """Repartition the :class:`Dataset` into exactly this number of :ref:`blocks <dataset_concept>`.
 
@@ -2173,6 +2289,97 @@ class Dataset:
         ret = self._aggregate_on(Std, on, ignore_nulls, ddof=ddof)
         return self._aggregate_result(ret)
 
+    @ConsumptionAPI
+    def summary(self) -> "pandas.DataFrame":
+        """Compute summary statistics of the columns of the dataset.
+
+        The statistics of all of the columns are computed in a single pass over the
+        dataset. The distinct counts, quantiles, and most frequent values are
+        approximated with mergeable sketches, so that the memory usage is bounded
+        regardless of the size of the dataset. See
+        :class:`~ray.data.aggregate.ApproxCountDistinct`,
+        :class:`~ray.data.aggregate.ApproxQuantile`, and
+        :class:`~ray.data.aggregate.ApproxTopK`.
+
+        Examples:
+            >>> import ray
+            >>> ds = ray.data.range(100)
+            >>> ds.summary()  # doctest: +SKIP
+                type  count  null_count  approx_count_distinct  min  max  mean ...
+            id  int64   100           0                    100    0   99  49.5 ...
+
+        Time complexity: O(dataset size / parallelism)
+
+        Returns:
+            A pandas DataFrame with a row for each column of the dataset. The
+            ``count``, ``null_count``, and ``approx_count_distinct`` statistics are
+            computed for all columns with scalar values. The ``min``, ``max``,
+            ``mean``, ``std``, ``approx_25%``, ``approx_50%``, and ``approx_75%``
+            statistics are computed for numeric columns, and the ``approx_top_k``
+            most frequent values for the other columns. The statistics that don't
+            apply to a column are null.
+        """
+        import pandas as pd
+        import pyarrow as pa
+
+        from ray.data.aggregate import (
+            ApproxCountDistinct,
+            ApproxQuantile,
+            ApproxTopK,
+            Count,
+        )
+        from ray.data.aggregate._aggregate import _NullCount
+
+        schema = self.schema(fetch_if_missing=True)
+        if schema is None:
+            return pd.DataFrame()
+
+        quantiles = [0.25, 0.5, 0.75]
+        column_aggs = {}
+        for name, type_ in zip(schema.names, schema.types):
+            aggs = {"null_count": _NullCount(name)}
+            is_scalar = isinstance(type_, pa.DataType) and not (
+                pa.types.is_nested(type_) or isinstance(type_, pa.ExtensionType)
+            )
+            if is_scalar:
+                aggs["approx_count_distinct"] = ApproxCountDistinct(name)
+                if pa.types.is_integer(type_) or pa.types.is_floating(type_):
+                    aggs["min"] = Min(name)
+                    aggs["max"] = Max(name)
+                    aggs["mean"] = Mean(name)
+                    aggs["std"] = Std(name)
+                    aggs["approx_quantiles"] = ApproxQuantile(name, q=quantiles)
+                else:
+                    aggs["approx_top_k"] = ApproxTopK(name, k=5)
+            column_aggs[name] = aggs
+
+        all_aggs = [Count()] + [
+            agg for aggs in column_aggs.values() for agg in aggs.values()
+        ]
+        result = self.aggregate(*all_aggs) or {}
+        num_rows = result.get("count()", 0)
+
+        rows = []
+        for name, type_ in zip(schema.names, schema.types):
+            row = {"type": str(type_)}
+            for stat, agg in column_aggs[name].items():
+                value = result.get(agg.name)
+                if stat == "null_count":
+                    value = value or 0
+                    row["count"] = num_rows - value
+                if stat == "approx_quantiles":
+                    values = value or [None] * len(quantiles)
+                    for q, value in zip(quantiles, values):
+                        row[f"approx_{q:.0%}"] = value
+                else:
+                    row[stat] = value
+            rows.append(row)
+
+        columns = ["type", "count", "null_count", "approx_count_distinct"]
+        columns += ["min", "max", "mean", "std"]
+        columns += [f"approx_{q:.0%}" for q in quantiles] + ["approx_top_k"]
+        return pd.DataFrame(rows, index=schema.names, columns=columns)
+
     def sort(
         self,
         key: Union[str, List[str], None] = None,
@@ -2256,6 +2463,112 @@ class Dataset:
             logical_plan = LogicalPlan(op)
         return Dataset(plan, self._epoch, self._lazy, logical_plan)
 
+    def join(
+        self,
+        other: "Dataset",
+        on: Union[str, List[str]],
+        *,
+        right_on: Optional[Union[str, List[str]]] = None,
+        how: str = "inner",
+        suffixes: Tuple[str, str] = ("", "_1"),
+        num_outputs: Optional[int] = None,
+        strategy: Optional[str] = None,
+    ) -> "Dataset":
+        """Join this dataset with another dataset on key columns.
+
+        With the ``"hash"`` strategy, both datasets are hash partitioned by their
+        key columns, so rows with equal keys end up in the same partition, and each
+        pair of co-partitioned blocks is joined with Arrow in parallel. This scales
+        to datasets that don't fit in the memory of a single node.
+
+        With the ``"broadcast"`` strategy, ``other`` is stored in the object store
+        once and joined with every block of this dataset, without shuffling this
+        dataset. This is much faster when ``other`` is small, e.g., when joining a
+        fact table with a dimension table. By default, the broadcast strategy is
+        chosen for ``"inner"`` and ``"left"`` joins when ``other`` is smaller than
+        ``DataContext.broadcast_join_threshold_bytes``.
+
+        .. note::
+            The key columns must have the same types on both sides, otherwise
+            equal keys might be assigned to different partitions.
+
+        Examples:
+            >>> import ray
+            >>> ds1 = ray.data.from_items([{"id": 0, "a": 1}, {"id": 1, "a": 2}])
+            >>> ds2 = ray.data.from_items([{"id": 1, "b": 3}, {"id": 2, "b": 4}])
+            >>> ds1.join(ds2, on="id").take_all()
+            [{'id': 1, 'a': 2, 'b': 3}]
+
+        Time complexity: O(dataset size / parallelism)
+
+        Args:
+            other: The dataset to join with on the right hand side.
+            on: The key column or list of key columns of this dataset to join on.
+                These are also used as the key columns of ``other``, unless
+                ``right_on`` is specified.
+            right_on: The key column or list of key columns of ``other`` to join on.
+            how: The type of join. One of ``"inner"``, ``"left"``, ``"right"``
+                or ``"outer"``.
+            suffixes: The suffixes to append to duplicate non-key column names of
+                this dataset and ``other`` respectively.
+            num_outputs: The number of output blocks of the hash join. If not
+                specified, the larger number of blocks of both datasets is used.
+                The broadcast join outputs one block per block of this dataset.
+            strategy: The join strategy, either ``"hash"`` or ``"broadcast"``. If
+                not specified, it's chosen based on the size of ``other``.
+
+        Returns:
+            A :class:`Dataset` containing the joined rows. The key columns of
+            ``other`` are coalesced into the key columns of this dataset.
+        """
+        if how not in HashJoinTaskSpec.JOIN_TYPES:
+            raise ValueError(
+                f"Invalid join type '{how}', expected one of "
+                f"{list(HashJoinTaskSpec.JOIN_TYPES)}."
+            )
+        if strategy not in (None, "hash", "broadcast"):
+            raise ValueError(
+                f"Invalid join strategy '{strategy}', expected 'hash' or 'broadcast'."
+            )
+        if strategy == "broadcast" and how not in BROADCAST_JOIN_TYPES:
+            raise ValueError(
+                f"The broadcast join strategy only supports {BROADCAST_JOIN_TYPES} "
+                f"joins, but got '{how}'."
+            )
+        left_keys = [on] if isinstance(on, str) else list(on)
+        if right_on is None:
+            right_keys = left_keys
+        else:
+            right_keys = [right_on] if isinstance(right_on, str) else list(right_on)
+        if len(left_keys) == 0 or len(left_keys) != len(right_keys):
+            raise ValueError(
+                "The join key columns must be non-empty and have the same length on "
+                f"both sides, but got {left_keys} and {right_keys}."
+            )
+        suffixes = tuple(suffixes)
+
+        plan = self._plan.with_stage(
+            JoinStage(
+                other, left_keys, right_keys, how, suffixes, num_outputs, strategy
+            )
+        )
+
+        logical_plan = self._logical_plan
+        other_logical_plan = other._logical_plan
+        if logical_plan is not None and other_logical_plan is not None:
+            op = Join(
+                logical_plan.dag,
+                other_logical_plan.dag,
+                left_keys=left_keys,
+                right_keys=right_keys,
+                how=how,
+                suffixes=suffixes,
+                num_outputs=num_outputs,
+                strategy=strategy,
+            )
+            logical_plan = LogicalPlan(op)
+        return Dataset(plan, self._epoch, self._lazy, logical_plan)
+
     @ConsumptionAPI
     def limit(self, limit: int) -> "Dataset":
         """Truncate the dataset to the first ``limit`` rows.
@@ -2651,14 +2964,18 @@ class Dataset:
         try_create_dir: bool = True,
         arrow_open_stream_args: Optional[Dict[str, Any]] = None,
         block_path_provider: BlockWritePathProvider = DefaultBlockWritePathProvider(),
+        partition_cols: Optional[List[str]] = None,
+        max_rows_per_file: Optional[int] = None,
+        target_file_size_bytes: Optional[int] = None,
         arrow_parquet_args_fn: Callable[[], Dict[str, Any]] = lambda: {},
         ray_remote_args: Dict[str, Any] = None,
         **arrow_parquet_args,
     ) -> None:
         """Writes the :class:`~ray.data.Dataset` to parquet files under the provided ``path``.
 
-        The number of files is determined by the number of blocks in the dataset.
-        To control the number of number of blocks, call
+        The number of files is determined by the number of blocks in the dataset,
+        unless ``max_rows_per_file``, ``target_file_size_bytes`` or
+        ``partition_cols`` is set. To control the number of number of blocks, call
         :meth:`~ray.data.Dataset.repartition`.
 
         If pyarrow can't represent your data, this method errors.
@@ -2710,6 +3027,17 @@ class Dataset:
                 instead of ``arrow_parquet_args`` if any of your write arguments
                 can't pickled, or if you'd like to lazily resolve the write
                 arguments for each dataset block.
+            partition_cols: The columns to partition the output by, in a Hive-style
+                directory layout, e.g. ``{path}/year=2023/month=1/``. The partition
+                columns aren't written to the files. Each write task writes the rows
+                of each partition to separate files, so this doesn't require a
+                shuffle.
+            max_rows_per_file: The max number of rows to write to each file. The
+                blocks of each write task are streamed into files of up to this
+                many rows.
+            target_file_size_bytes: The approximate size of each file. The blocks of
+                each write task are streamed into a file until it reaches this size,
+                then into a new file.
             ray_remote_args: Kwargs passed to :meth:`~ray.remote` in the write tasks.
             arrow_parquet_args: Options to pass to
                 `pyarrow.parquet.write_table() <https://arrow.apache.org/docs/python\
@@ -2726,6 +3054,9 @@ class Dataset:
             try_create_dir=try_create_dir,
             open_stream_args=arrow_open_stream_args,
             block_path_provider=block_path_provider,
+            partition_cols=partition_cols,
+            max_rows_per_file=max_rows_per_file,
+            target_file_size_bytes=target_file_size_bytes,
             write_args_fn=arrow_parquet_args_fn,
             **arrow_parquet_args,
         )
@@ -2739,14 +3070,18 @@ class Dataset:
         try_create_dir: bool = True,
         arrow_open_stream_args: Optional[Dict[str, Any]] = None,
         block_path_provider: BlockWritePathProvider = DefaultBlockWritePathProvider(),
+        partition_cols: Optional[List[str]] = None,
+        max_rows_per_file: Optional[int] = None,
+        target_file_size_bytes: Optional[int] = None,
         pandas_json_args_fn: Callable[[], Dict[str, Any]] = lambda: {},
         ray_remote_args: Dict[str, Any] = None,
         **pandas_json_args,
     ) -> None:
         """Writes the :class:`~ray.data.Dataset` to JSON and JSONL files.
 
-        The number of files is determined by the number of blocks in the dataset.
-        To control the number of number of blocks, call
+        The number of files is determined by the number of blocks in the dataset,
+        unless ``max_rows_per_file``, ``target_file_size_bytes`` or
+        ``partition_cols`` is set. To control the number of number of blocks, call
         :meth:`~ray.data.Dataset.repartition`.
 
         This method is only supported for datasets with records that are convertible to
@@ -2807,6 +3142,17 @@ class Dataset:
                 instead of ``pandas_json_args`` if any of your write arguments
                 can't be pickled, or if you'd like to lazily resolve the write
                 arguments for each dataset block.
+            partition_cols: The columns to partition the output by, in a Hive-style
+                directory layout, e.g. ``{path}/year=2023/month=1/``. The partition
+                columns aren't written to the files. Each write task writes the rows
+                of each partition to separate files, so this doesn't require a
+                shuffle.
+            max_rows_per_file: The max number of rows to write to each file. The
+                blocks of each write task are streamed into files of up to this
+                many rows.
+            target_file_size_bytes: The approximate size of each file. The blocks of
+                each write task are streamed into a file until it reaches this size,
+                then into a new file.
             ray_remote_args: kwargs passed to :meth:`~ray.remote` in the write tasks.
             pandas_json_args: These args are passed to
                 `pandas.DataFrame.to_json() <https://pandas.pydata.org/docs/reference/\
@@ -2824,6 +3170,9 @@ class Dataset:
             try_create_dir=try_create_dir,
             open_stream_args=arrow_open_stream_args,
             block_path_provider=block_path_provider,
+            partition_cols=partition_cols,
+            max_rows_per_file=max_rows_per_file,
+            target_file_size_bytes=target_file_size_bytes,
             write_args_fn=pandas_json_args_fn,
             **pandas_json_args,
         )
@@ -2896,14 +3245,18 @@ class Dataset:
         try_create_dir: bool = True,
         arrow_open_stream_args: Optional[Dict[str, Any]] = None,
         block_path_provider: BlockWritePathProvider = DefaultBlockWritePathProvider(),
+        partition_cols: Optional[List[str]] = None,
+        max_rows_per_file: Optional[int] = None,
+        target_file_size_bytes: Optional[int] = None,
         arrow_csv_args_fn: Callable[[], Dict[str, Any]] = lambda: {},
         ray_remote_args: Dict[str, Any] = None,
         **arrow_csv_args,
     ) -> None:
         """Writes the :class:`~ray.data.Dataset` to CSV files.
 
-        The number of files is determined by the number of blocks in the dataset.
-        To control the number of number of blocks, call
+        The number of files is determined by the number of blocks in the dataset,
+        unless ``max_rows_per_file``, ``target_file_size_bytes`` or
+        ``partition_cols`` is set. To control the number of number of blocks, call
         :meth:`~ray.data.Dataset.repartition`.
 
         This method is only supported for datasets with records that are convertible to
@@ -2963,6 +3316,17 @@ class Dataset:
                 Use this argument instead of ``arrow_csv_args`` if any of your write
                 arguments cannot be pickled, or if you'd like to lazily resolve the
                 write arguments for each dataset block.
+            partition_cols: The columns to partition the output by, in a Hive-style
+                directory layout, e.g. ``{path}/year=2023/month=1/``. The partition
+                columns aren't written to the files. Each write task writes the rows
+                of each partition to separate files, so this doesn't require a
+                shuffle.
+            max_rows_per_file: The max number of rows to write to each file. The
+                blocks of each write task are streamed into files of up to this
+                many rows.
+            target_file_size_bytes: The approximate size of each file. The blocks of
+                each write task are streamed into a file until it reaches this size,
+                then into a new file.
             ray_remote_args: kwargs passed to :meth:`~ray.remote` in the write tasks.
             arrow_csv_args: Options to pass to `pyarrow.write.write_csv <https://\
                 arrow.apache.org/docs/python/generated/pyarrow.csv.write_csv.html\
@@ -2978,6 +3342,9 @@ class Dataset:
             try_create_dir=try_create_dir,
             open_stream_args=arrow_open_stream_args,
             block_path_provider=block_path_provider,
+            partition_cols=partition_cols,
+            max_rows_per_file=max_rows_per_file,
+            target_file_size_bytes=target_file_size_bytes,
             write_args_fn=arrow_csv_args_fn,
             **arrow_csv_args,
         )
@@ -2992,6 +3359,9 @@ class Dataset:
         try_create_dir: bool = True,
         arrow_open_stream_args: Optional[Dict[str, Any]] = None,
         block_path_provider: BlockWritePathProvider = DefaultBlockWritePathProvider(),
+        partition_cols: Optional[List[str]] = None,
+        max_rows_per_file: Optional[int] = None,
+        target_file_size_bytes: Optional[int] = None,
         ray_remote_args: Dict[str, Any] = None,
     ) -> None:
         """Write the :class:`~ray.data.Dataset` to TFRecord files.
@@ -3007,8 +3377,9 @@ class Dataset:
             so this function only supports datasets with these data types,
             and will error if the dataset contains unsupported types.
 
-        The number of files is determined by the number of blocks in the dataset.
-        To control the number of number of blocks, call
+        The number of files is determined by the number of blocks in the dataset,
+        unless ``max_rows_per_file``, ``target_file_size_bytes`` or
+        ``partition_cols`` is set. To control the number of number of blocks, call
         :meth:`~ray.data.Dataset.repartition`.
 
         This method is only supported for datasets with records that are convertible to
@@ -3052,6 +3423,17 @@ class Dataset:
                 parquet file. By default, the format of the output files is
                 ``{uuid}_{block_idx}.tfrecords``, where ``uuid`` is a unique id for the
                 dataset.
+            partition_cols: The columns to partition the output by, in a Hive-style
+                directory layout, e.g. ``{path}/year=2023/month=1/``. The partition
+                columns aren't written to the files. Each write task writes the rows
+                of each partition to separate files, so this doesn't require a
+                shuffle.
+            max_rows_per_file: The max number of rows to write to each file. The
+                blocks of each write task are streamed into files of up to this
+                many rows.
+            target_file_size_bytes: The approximate size of each file. The blocks of
+                each write task are streamed into a file until it reaches this size,
+                then into a new file.
             ray_remote_args: kwargs passed to :meth:`~ray.remote` in the write tasks.
 
         """
@@ -3065,6 +3447,9 @@ class Dataset:
             try_create_dir=try_create_dir,
             open_stream_args=arrow_open_stream_args,
             block_path_provider=block_path_provider,
+            partition_cols=partition_cols,
+            max_rows_per_file=max_rows_per_file,
+            target_file_size_bytes=target_file_size_bytes,
             tf_schema=tf_schema,
         )
 
@@ -3582,6 +3967,8 @@ class Dataset:
         drop_last: bool = False,
         local_shuffle_buffer_size: Optional[int] = None,
         local_shuffle_seed: Optional[int] = None,
+        pin_memory: bool = False,
+        device_prefetch_batches: int = 0,
         # Deprecated
         prefetch_blocks: int = 0,
     ) -> Iterator[TorchBatchType]:
@@ -3659,6 +4046,14 @@ class Dataset:
                 the buffer, the remaining rows in the buffer are drained.
                 ``batch_size`` must also be specified when using local shuffling.
             local_shuffle_seed: The seed to use for the local random shuffle.
+            pin_memory: Whether to copy the batches into reusable page-locked host
+                buffers before copying them to the device, which makes the copies to
+                GPUs asynchronous. You can't use this parameter with ``collate_fn``.
+            device_prefetch_batches: The number of batches to start copying to the
+                device ahead of the current batch. If greater than 0, the copies to
+                GPUs are made on a separate CUDA stream, overlapping with the use of
+                the current batch. Defaults to 0, which copies each batch when it's
+                fetched. You can't use this parameter with ``collate_fn``.
 
         Returns:
             An iterator over Torch Tensor batches.
@@ -3677,6 +4072,8 @@ class Dataset:
             drop_last=drop_last,
             local_shuffle_buffer_size=local_shuffle_buffer_size,
             local_shuffle_seed=local_shuffle_seed,
+            pin_memory=pin_memory,
+            device_prefetch_batches=device_prefetch_batches,
         )
 
     @ConsumptionAPI
@@ -4369,6 +4766,10 @@ class Dataset:
         number of worker actors are created, each of which has zero-copy access to the
         underlying sorted data blocks of the dataset.
 
+        Each worker indexes the sorted keys of its blocks, so that ``multiget()``
+        finds many keys with a single request per worker, and ``range()`` scans the
+        records with keys in a range.
+
         Note that the key must be unique in the dataset. If there are duplicate keys,
         an arbitrary value is returned.
 
@@ -4741,6 +5142,73 @@ class Dataset:
         output._plan._in_stats.dataset_uuid = self._get_uuid()
         return output
 
+    @PublicAPI(stability="alpha")
+    @ConsumptionAPI(pattern="Args:")
+    def cache(
+        self,
+        location: str,
+        *,
+        filesystem: Optional["pyarrow.fs.FileSystem"] = None,
+    ) -> "MaterializedDataset":
+        """Cache the results of this dataset in persistent storage, and reuse them
+        in later jobs.
+
+        The cache entry is keyed by a fingerprint of the logical plan of this
+        dataset: its operators, the arguments and UDFs of each operator, and the
+        paths, sizes and modification times of the input files. If an entry with
+        the same fingerprint exists under ``location``, it's read into memory
+        instead of executing this dataset. Otherwise this dataset is materialized,
+        and its blocks are written to the cache as Arrow IPC files. Either way, a
+        :class:`MaterializedDataset` is returned.
+
+        Examples:
+            >>> import ray
+            >>> ds = ray.data.range(100).map(lambda row: {"id": row["id"] * 2})
+            >>> ds = ds.cache("/tmp/ray_data_cache")
+            >>> ds.take(2)
+            [{'id': 0}, {'id': 2}]
+
+        .. note::
+            Functions and classes called by a UDF are only fingerprinted by name,
+            so changing their implementation doesn't invalidate the cache. Clear
+            ``location`` in that case. UDFs that reference global values which
+            can't be fingerprinted, like locks or open files, can't be cached.
+
+        Args:
+            location: The directory to store cache entries in, on local disk or
+                shared storage, e.g. ``"s3://bucket/cache"``.
+            filesystem: The pyarrow filesystem implementation to use for
+                ``location``. If not specified, it's inferred from ``location``.
+
+        Returns:
+            A :class:`MaterializedDataset` holding the results of this dataset.
+
+        Raises:
+            ValueError: if the dataset can't be fingerprinted, e.g. because it's
+                created from in-memory data or reads from a datasource that doesn't
+                implement :meth:`~ray.data.datasource.Reader.get_fingerprint`.
+        """
+        fingerprint = None
+        if self._logical_plan is not None:
+            fingerprint = fingerprint_plan(self._logical_plan)
+        if fingerprint is None:
+            raise ValueError(
+                "This dataset can't be cached, because its inputs or operators can't "
+                "be fingerprinted. Only datasets read from files or created with "
+                "`ray.data.range()`, and transformed with Python functions or "
+                "classes, can be cached."
+            )
+        cache_dir, filesystem = dataset_cache.resolve_cache_dir(
+            location, fingerprint, filesystem
+        )
+        cached_ds = dataset_cache.read_cache(cache_dir, filesystem)
+        if cached_ds is not None:
+            logger.info(f"Reading the cached dataset from {cache_dir}.")
+            return cached_ds.materialize()
+        materialized_ds = self.materialize()
+        dataset_cache.write_cache(materialized_ds, cache_dir, filesystem, location)
+        return materialized_ds
+
     @ConsumptionAPI(pattern="timing information.", insert_after=True)
     def stats(self) -> str:
         """Returns a string containing execution timing information.
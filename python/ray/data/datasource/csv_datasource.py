@@ -3,6 +3,7 @@ from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator
 from ray.data.block import Block, BlockAccessor
 from ray.data.datasource.file_based_datasource import (
     FileBasedDatasource,
+    _FileBlockWriter,
     _resolve_kwargs,
 )
 from ray.util.annotations import PublicAPI
@@ -74,3 +75,37 @@ class CSVDatasource(FileBasedDatasource):
         writer_args = _resolve_kwargs(writer_args_fn, **writer_args)
         write_options = writer_args.pop("write_options", None)
         csv.write_csv(block.to_arrow(), f, write_options, **writer_args)
+
+    def _open_block_writer(
+        self,
+        f: "pyarrow.NativeFile",
+        writer_args_fn: Callable[[], Dict[str, Any]] = lambda: {},
+        **writer_args,
+    ) -> _FileBlockWriter:
+        writer_args = _resolve_kwargs(writer_args_fn, **writer_args)
+        return _CSVBlockWriter(f, **writer_args)
+
+
+class _CSVBlockWriter(_FileBlockWriter):
+    """Writes blocks to a CSV file, with a single header."""
+
+    def __init__(self, f: "pyarrow.NativeFile", **writer_args):
+        super().__init__(f)
+        self._writer_args = writer_args
+        self._writer = None
+        self._schema = None
+
+    def write(self, block: BlockAccessor) -> None:
+        from pyarrow import csv
+
+        table = block.to_arrow()
+        if self._writer is None:
+            self._schema = table.schema
+            self._writer = csv.CSVWriter(self._file, self._schema, **self._writer_args)
+        elif not table.schema.equals(self._schema):
+            table = table.cast(self._schema)
+        self._writer.write_table(table)
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
@@ -1,6 +1,6 @@
 import builtins
 from copy import copy
-from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 import numpy as np
 
@@ -12,6 +12,9 @@ from ray.data.context import DataContext
 from ray.types import ObjectRef
 from ray.util.annotations import Deprecated, DeveloperAPI, PublicAPI
 
+if TYPE_CHECKING:
+    import pyarrow
+
 WriteResult = Any
 
 
@@ -172,6 +175,46 @@ class Reader:
         """
         raise NotImplementedError
 
+    @DeveloperAPI
+    def push_down_projection(self, columns: List[str]) -> Optional["Reader"]:
+        """Return a new reader that only reads the given columns.
+
+        This is called by the optimizer when a column selection directly follows
+        the read. Return None (the default) if the projection can't be pushed
+        down into this reader.
+
+        Args:
+            columns: The names of the columns to read.
+        """
+        return None
+
+    @DeveloperAPI
+    def push_down_filter(
+        self, filter_expr: "pyarrow.dataset.Expression"
+    ) -> Optional["Reader"]:
+        """Return a new reader that only reads the rows satisfying the filter.
+
+        This is called by the optimizer when an expression-based filter directly
+        follows the read. Return None (the default) if the filter can't be pushed
+        down into this reader.
+
+        Args:
+            filter_expr: The filter expression to apply while reading.
+        """
+        return None
+
+    @DeveloperAPI
+    def get_fingerprint(self) -> Optional[str]:
+        """Return a fingerprint of the data this reader reads, or None (the
+        default) if it's unknown.
+
+        Readers with the same fingerprint must read the same data, e.g. because
+        they read the same unmodified files with the same arguments. This is used
+        by :meth:`Dataset.cache() <ray.data.Dataset.cache>` to reuse the results of
+        a previous execution.
+        """
+        return None
+
 
 class _LegacyDatasourceReader(Reader):
     def __init__(self, datasource: Datasource, **read_args):
@@ -260,6 +303,13 @@ class _RangeDatasourceReader(Reader):
         self._tensor_shape = tensor_shape
         self._column_name = column_name
 
+    def get_fingerprint(self) -> Optional[str]:
+        from ray.data._internal.logical.fingerprint import fingerprint_value
+
+        return fingerprint_value(
+            [self._n, self._block_format, self._tensor_shape, self._column_name]
+        )
+
     def estimate_inmemory_data_size(self) -> Optional[int]:
         if self._block_format == "tensor":
             element_size = np.product(self._tensor_shape)
@@ -1,4 +1,6 @@
+import functools
 import itertools
+import math
 import os
 import pathlib
 import posixpath
@@ -68,6 +70,9 @@ OPEN_FILE_RETRY_MAX_BACKOFF_SECONDS = 32
 # The max number of attempts for opening file.
 OPEN_FILE_MAX_ATTEMPTS = 10
 
+# The Hive partition directory name of null partition column values.
+HIVE_DEFAULT_PARTITION = "__HIVE_DEFAULT_PARTITION__"
+
 
 @DeveloperAPI
 class BlockWritePathProvider:
@@ -311,10 +316,46 @@ class FileBasedDatasource(Datasource):
         block_path_provider: Optional[BlockWritePathProvider] = None,
         write_args_fn: Callable[[], Dict[str, Any]] = lambda: {},
         file_format: Optional[str] = None,
+        partition_cols: Optional[List[str]] = None,
+        max_rows_per_file: Optional[int] = None,
+        target_file_size_bytes: Optional[int] = None,
         _block_udf: Optional[Callable[[Block], Block]] = None,
         **write_args,
     ) -> WriteResult:
-        """Write blocks for a file-based datasource."""
+        """Write blocks for a file-based datasource.
+
+        By default, each block is written to its own file. If any of
+        ``partition_cols``, ``max_rows_per_file`` or ``target_file_size_bytes`` is
+        set, the blocks of each write task are instead streamed into as few files as
+        the options allow, with the ``block_index`` of the path provider numbering
+        the files of each directory.
+
+        Args:
+            partition_cols: The columns to partition the output by, in a Hive-style
+                directory layout, e.g. ``{path}/year=2023/month=1/``. The partition
+                columns aren't written to the files. Each write task writes the rows
+                of each partition it has to separate files, without a shuffle.
+            max_rows_per_file: The max number of rows to write to each file.
+            target_file_size_bytes: The size to roll over to a new file at. Files
+                are split at row boundaries, based on the size of the rows written
+                so far, so their sizes are approximate.
+        """
+        for name, value in [
+            ("max_rows_per_file", max_rows_per_file),
+            ("target_file_size_bytes", target_file_size_bytes),
+        ]:
+            if value is not None and value <= 0:
+                raise ValueError(f"`{name}` must be positive, but got {value}.")
+        rolling = (
+            bool(partition_cols)
+            or max_rows_per_file is not None
+            or target_file_size_bytes is not None
+        )
+        if rolling and self._WRITE_FILE_PER_ROW:
+            raise ValueError(
+                f"{type(self).__name__} writes a file per row, so it doesn't support "
+                "`partition_cols`, `max_rows_per_file` or `target_file_size_bytes`."
+            )
         # `FileBasedDatasource` subclasses expose a `_FILE_EXTENSION` attribute. It
         # represents a list of supported file extensions. If the user doesn't specify
         # a file format, we default to the first extension in the list.
@@ -334,63 +375,83 @@ class FileBasedDatasource(Datasource):
         if not block_path_provider:
             block_path_provider = DefaultBlockWritePathProvider()
 
-        num_rows_written = 0
-        block_idx = 0
-        for block in blocks:
-            if _block_udf is not None:
-                block = _block_udf(block)
-
-            block = BlockAccessor.for_block(block)
-            if block.num_rows() == 0:
-                continue
-
-            fs = _unwrap_s3_serialization_workaround(filesystem)
-
-            if self._WRITE_FILE_PER_ROW:
-                for row_index, row in enumerate(
-                    block.iter_rows(public_row_format=False)
-                ):
-                    # TODO: Refactor `BlockWritePathProvider` to support rows.
-                    filename = (
-                        f"{dataset_uuid}_{ctx.task_idx:06}_{block_idx:06}_"
-                        f"{row_index:06}.{file_format}"
+        if rolling:
+            num_rows_written = self._write_rolling(
+                blocks,
+                ctx,
+                path,
+                dataset_uuid,
+                filesystem,
+                open_stream_args,
+                block_path_provider,
+                file_format,
+                partition_cols,
+                max_rows_per_file,
+                target_file_size_bytes,
+                _block_udf,
+                writer_args_fn=write_args_fn,
+                **write_args,
+            )
+        else:
+            num_rows_written = 0
+            block_idx = 0
+            for block in blocks:
+                if _block_udf is not None:
+                    block = _block_udf(block)
+
+                block = BlockAccessor.for_block(block)
+                if block.num_rows() == 0:
+                    continue
+
+                fs = _unwrap_s3_serialization_workaround(filesystem)
+
+                if self._WRITE_FILE_PER_ROW:
+                    for row_index, row in enumerate(
+                        block.iter_rows(public_row_format=False)
+                    ):
+                        # TODO: Refactor `BlockWritePathProvider` to support rows.
+                        filename = (
+                            f"{dataset_uuid}_{ctx.task_idx:06}_{block_idx:06}_"
+                            f"{row_index:06}.{file_format}"
+                        )
+                        write_path = os.path.join(path, filename)
+                        logger.get_logger().debug(f"Writing {write_path} file.")
+                        with _open_file_with_retry(
+                            write_path,
+                            lambda: fs.open_output_stream(
+                                write_path, **open_stream_args
+                            ),
+                        ) as f:
+                            _write_row_to_file(
+                                f,
+                                row,
+                                writer_args_fn=write_args_fn,
+                                file_format=file_format,
+                                **write_args,
+                            )
+                else:
+                    write_path = block_path_provider(
+                        path,
+                        filesystem=filesystem,
+                        dataset_uuid=dataset_uuid,
+                        task_index=ctx.task_idx,
+                        block_index=block_idx,
+                        file_format=file_format,
                     )
-                    write_path = os.path.join(path, filename)
                     logger.get_logger().debug(f"Writing {write_path} file.")
                     with _open_file_with_retry(
                         write_path,
                         lambda: fs.open_output_stream(write_path, **open_stream_args),
                     ) as f:
-                        _write_row_to_file(
+                        _write_block_to_file(
                             f,
-                            row,
+                            block,
                             writer_args_fn=write_args_fn,
-                            file_format=file_format,
                             **write_args,
                         )
-            else:
-                write_path = block_path_provider(
-                    path,
-                    filesystem=filesystem,
-                    dataset_uuid=dataset_uuid,
-                    task_index=ctx.task_idx,
-                    block_index=block_idx,
-                    file_format=file_format,
-                )
-                logger.get_logger().debug(f"Writing {write_path} file.")
-                with _open_file_with_retry(
-                    write_path,
-                    lambda: fs.open_output_stream(write_path, **open_stream_args),
-                ) as f:
-                    _write_block_to_file(
-                        f,
-                        block,
-                        writer_args_fn=write_args_fn,
-                        **write_args,
-                    )
 
-            num_rows_written += block.num_rows()
-            block_idx += 1
+                num_rows_written += block.num_rows()
+                block_idx += 1
 
         if num_rows_written == 0:
             logger.get_logger().warning(
@@ -402,6 +463,75 @@ class FileBasedDatasource(Datasource):
         # succeeds.
         return "ok"
 
+    def _write_rolling(
+        self,
+        blocks: Iterable[Block],
+        ctx: TaskContext,
+        path: str,
+        dataset_uuid: str,
+        filesystem: "pyarrow.fs.FileSystem",
+        open_stream_args: Dict[str, Any],
+        block_path_provider: BlockWritePathProvider,
+        file_format: str,
+        partition_cols: Optional[List[str]],
+        max_rows_per_file: Optional[int],
+        target_file_size_bytes: Optional[int],
+        block_udf: Optional[Callable[[Block], Block]],
+        writer_args_fn: Callable[[], Dict[str, Any]],
+        **writer_args,
+    ) -> int:
+        """Stream blocks into files that are rolled over by size and row count, in
+        a directory per partition. Returns the number of rows written."""
+        fs = _unwrap_s3_serialization_workaround(filesystem)
+
+        def open_file(dir_path: str, file_index: int) -> "pyarrow.NativeFile":
+            if file_index == 0 and dir_path != path:
+                fs.create_dir(dir_path, recursive=True)
+            write_path = block_path_provider(
+                dir_path,
+                filesystem=filesystem,
+                dataset_uuid=dataset_uuid,
+                task_index=ctx.task_idx,
+                block_index=file_index,
+                file_format=file_format,
+            )
+            logger.get_logger().debug(f"Writing {write_path} file.")
+            return _open_file_with_retry(
+                write_path,
+                lambda: fs.open_output_stream(write_path, **open_stream_args),
+            )
+
+        def open_writer(f: "pyarrow.NativeFile") -> _FileBlockWriter:
+            return self._open_block_writer(
+                f, writer_args_fn=writer_args_fn, **writer_args
+            )
+
+        writers: Dict[str, _RollingFileWriter] = {}
+        num_rows_written = 0
+        try:
+            for block in blocks:
+                if block_udf is not None:
+                    block = block_udf(block)
+                block = BlockAccessor.for_block(block)
+                if block.num_rows() == 0:
+                    continue
+                for dir_path, partition in _partition_block(
+                    block, path, partition_cols
+                ):
+                    if dir_path not in writers:
+                        writers[dir_path] = _RollingFileWriter(
+                            functools.partial(open_file, dir_path),
+                            open_writer,
+                            max_rows_per_file,
+                            target_file_size_bytes,
+                        )
+                    writers[dir_path].write(partition)
+                num_rows_written += block.num_rows()
+        finally:
+            for writer in writers.values():
+                writer.close()
+        return num_rows_written
+
     def on_write_complete(
         self,
         write_results: List[WriteResult],
@@ -434,6 +564,26 @@ class FileBasedDatasource(Datasource):
             "Subclasses of FileBasedDatasource must implement _write_files()."
         )
 
+    def _open_block_writer(
+        self,
+        f: "pyarrow.NativeFile",
+        writer_args_fn: Callable[[], Dict[str, Any]] = lambda: {},
+        **writer_args,
+    ) -> "_FileBlockWriter":
+        """Returns a writer that writes blocks to a single file one at a time,
+        passing all kwargs to the writer.
+
+        By default, the blocks are concatenated and written with `_write_block()`
+        once the file is complete. Subclasses whose format can be appended to should
+        override this to write each block as it's added.
+        """
+        return _BufferedFileBlockWriter(
+            f,
+            lambda f, block: self._write_block(
+                f, block, writer_args_fn=writer_args_fn, **writer_args
+            ),
+        )
+
     def _write_row(
         self,
         f: "pyarrow.NativeFile",
@@ -455,6 +605,266 @@ class FileBasedDatasource(Datasource):
         return FileExtensionFilter(cls._FILE_EXTENSION)
 
 
+class _IncompatibleBlockError(Exception):
+    """Raised by a `_FileBlockWriter` for a block that can't be written to the same
+    file as the blocks before it, e.g. because its schema can't be cast to theirs."""
+
+    pass
+
+
+class _FileBlockWriter:
+    """Writes blocks to a single file, one at a time."""
+
+    def __init__(self, f: "pyarrow.NativeFile"):
+        self._file = f
+
+    def write(self, block: BlockAccessor) -> None:
+        """Write a block to the file.
+
+        Raises:
+            _IncompatibleBlockError: If the block can't be written to this file. The
+                file is unchanged, and the block must be written to a new file.
+        """
+        raise NotImplementedError
+
+    def num_bytes(self) -> int:
+        """Return the size of the file so far, including any buffered blocks."""
+        return self._file.tell()
+
+    def close(self) -> None:
+        """Finish writing the file. This doesn't close the file itself."""
+        pass
+
+
+class _AppendingFileBlockWriter(_FileBlockWriter):
+    """Writes each block to the file as it's added, for formats whose files can
+    simply be concatenated, e.g. record-based formats."""
+
+    def __init__(
+        self,
+        f: "pyarrow.NativeFile",
+        write_block: Callable[["pyarrow.NativeFile", BlockAccessor], None],
+    ):
+        super().__init__(f)
+        self._write_block = write_block
+
+    def write(self, block: BlockAccessor) -> None:
+        self._write_block(self._file, block)
+
+
+class _BufferedFileBlockWriter(_FileBlockWriter):
+    """Concatenates the blocks and writes them once the file is complete, for
+    formats that can't be appended to."""
+
+    def __init__(
+        self,
+        f: "pyarrow.NativeFile",
+        write_block: Callable[["pyarrow.NativeFile", BlockAccessor], None],
+    ):
+        from ray.data._internal.delegating_block_builder import DelegatingBlockBuilder
+
+        super().__init__(f)
+        self._write_block = write_block
+        self._builder = DelegatingBlockBuilder()
+        self._num_bytes = 0
+
+    def write(self, block: BlockAccessor) -> None:
+        self._builder.add_block(block.to_block())
+        self._num_bytes += block.size_bytes()
+
+    def num_bytes(self) -> int:
+        return self._num_bytes
+
+    def close(self) -> None:
+        if self._builder.num_rows() > 0:
+            self._write_block(
+                self._file, BlockAccessor.for_block(self._builder.build())
+            )
+        self._builder = None
+
+
+class _RollingFileWriter:
+    """Writes blocks to a sequence of files, rolling over to a new file once the
+    current one reaches the max number of rows or the target size.
+
+    Args:
+        open_file: Opens the file with the given index in the sequence.
+        open_writer: Returns a block writer for an opened file.
+        max_rows_per_file: The max number of rows to write to each file.
+        target_file_size_bytes: The size to roll over to a new file at.
+    """
+
+    def __init__(
+        self,
+        open_file: Callable[[int], "pyarrow.NativeFile"],
+        open_writer: Callable[["pyarrow.NativeFile"], _FileBlockWriter],
+        max_rows_per_file: Optional[int] = None,
+        target_file_size_bytes: Optional[int] = None,
+    ):
+        self._open_file = open_file
+        self._open_writer = open_writer
+        self._max_rows_per_file = max_rows_per_file
+        self._target_file_size_bytes = target_file_size_bytes
+        self._num_files = 0
+        self._file: Optional["pyarrow.NativeFile"] = None
+        self._writer: Optional[_FileBlockWriter] = None
+        # The number of rows written to the current file.
+        self._num_rows = 0
+        # The size of the closed files, and the in-memory size of the blocks written
+        # to all files.
+        self._num_closed_file_bytes = 0
+        self._num_block_bytes = 0
+
+    def write(self, block: BlockAccessor) -> None:
+        """Write a block, splitting it across files if needed."""
+        while block.num_rows() > 0:
+            if self._writer is None:
+                self._file = self._open_file(self._num_files)
+                self._writer = self._open_writer(self._file)
+                self._num_files += 1
+                self._num_rows = 0
+
+            num_rows = block.num_rows()
+            if self._max_rows_per_file is not None:
+                num_rows = min(num_rows, self._max_rows_per_file - self._num_rows)
+            # Whether the rows are expected to fill the file up to the target size.
+            fills_file = False
+            if self._target_file_size_bytes is not None:
+                num_rows_to_target = self._estimate_num_rows_to_target(block)
+                if num_rows_to_target < num_rows:
+                    num_rows = num_rows_to_target
+                    # Only roll over before reaching the target size once the rows
+                    # written so far give a reliable estimate of the row sizes.
+                    fills_file = self._num_block_bytes > 0
+
+            if num_rows < block.num_rows():
+                piece = BlockAccessor.for_block(block.slice(0, num_rows, copy=False))
+                rest = BlockAccessor.for_block(
+                    block.slice(num_rows, block.num_rows(), copy=False)
+                )
+            else:
+                piece = block
+                rest = BlockAccessor.for_block(block.slice(0, 0, copy=False))
+            try:
+                self._writer.write(piece)
+            except _IncompatibleBlockError:
+                if self._num_rows == 0:
+                    raise
+                # Write the block to a new file instead.
+                self.close()
+                continue
+            block = rest
+            self._num_rows += num_rows
+            self._num_block_bytes += piece.size_bytes()
+
+            if (
+                fills_file
+                or (
+                    self._max_rows_per_file is not None
+                    and self._num_rows >= self._max_rows_per_file
+                )
+                or (
+                    self._target_file_size_bytes is not None
+                    and self._writer.num_bytes() >= self._target_file_size_bytes
+                )
+            ):
+                self.close()
+
+    def close(self) -> None:
+        """Finish writing the current file, if any."""
+        if self._writer is not None:
+            self._writer.close()
+            self._num_closed_file_bytes += self._file.tell()
+            self._file.close()
+            self._writer = None
+            self._file = None
+
+    def _estimate_num_rows_to_target(self, block: BlockAccessor) -> int:
+        """Estimate the number of rows of the block that fill the current file up to
+        the target size."""
+        num_bytes = self._writer.num_bytes()
+        # Scale the in-memory size of the rows by the ratio of the file sizes to the
+        # in-memory size of the rows written so far, e.g. due to compression.
+        ratio = 1
+        num_file_bytes = self._num_closed_file_bytes + num_bytes
+        if num_file_bytes > 0 and self._num_block_bytes > 0:
+            ratio = num_file_bytes / self._num_block_bytes
+        row_bytes = ratio * block.size_bytes() / block.num_rows()
+        if row_bytes <= 0:
+            return block.num_rows()
+        return max(1, math.ceil((self._target_file_size_bytes - num_bytes) / row_bytes))
+
+
+def _partition_block(
+    block: BlockAccessor, path: str, partition_cols: Optional[List[str]]
+) -> Iterator[Tuple[str, BlockAccessor]]:
+    """Split a block by the values of the partition columns.
+
+    Returns:
+        The Hive-style directory of each partition under the given path, and the
+        rows of the partition without the partition columns.
+    """
+    if not partition_cols:
+        yield path, block
+        return
+    column_names = block.column_names()
+    missing = [col for col in partition_cols if col not in column_names]
+    if missing:
+        raise ValueError(
+            f"Partition columns {missing} not found in the columns {column_names}."
+        )
+    data_cols = [col for col in column_names if col not in partition_cols]
+    if not data_cols:
+        raise ValueError(
+            "Can't partition by all columns, since there would be no columns left "
+            f"to write: {partition_cols}."
+        )
+    import pyarrow.compute as pc
+
+    # Group the rows in Arrow rather than pandas, so that the partition values keep
+    # their types, e.g. integer columns with nulls aren't converted to floats.
+    keys = BlockAccessor.for_block(block.select(partition_cols)).to_arrow()
+    dictionaries, codes = [], []
+    for col in partition_cols:
+        encoded = pc.dictionary_encode(
+            keys.column(col).combine_chunks(), null_encoding="encode"
+        )
+        dictionaries.append(encoded.dictionary)
+        codes.append(encoded.indices.to_numpy())
+    unique_codes, partition_ids = np.unique(
+        np.stack(codes, axis=1), axis=0, return_inverse=True
+    )
+    partition_ids = partition_ids.reshape(-1)
+    data = BlockAccessor.for_block(block.select(data_cols))
+    # The row indices of each partition, in the order of `unique_codes`.
+    order = np.argsort(partition_ids, kind="stable")
+    partition_indices = np.split(order, np.cumsum(np.bincount(partition_ids))[:-1])
+    for key_codes, indices in zip(unique_codes.tolist(), partition_indices):
+        dir_path = posixpath.join(
+            path,
+            *[
+                f"{col}={_to_hive_path_value(dictionary[code])}"
+                for col, dictionary, code in zip(
+                    partition_cols, dictionaries, key_codes
+                )
+            ],
+        )
+        if len(unique_codes) == 1:
+            yield dir_path, data
+        else:
+            yield dir_path, BlockAccessor.for_block(data.take(indices))
+
+
+def _to_hive_path_value(value: "pyarrow.Scalar") -> str:
+    value = value.as_py()
+    if value is None or (isinstance(value, float) and math.isnan(value)):
+        return HIVE_DEFAULT_PARTITION
+    if isinstance(value, bool):
+        # Like Hive, Spark and Arrow.
+        return "true" if value else "false"
+    return urllib.parse.quote(str(value), safe="")
+
+
 class _FileBasedDatasourceReader(Reader):
     def __init__(
         self,
@@ -512,6 +922,27 @@ class _FileBasedDatasourceReader(Reader):
         shuffler_class = get_attribute_from_class_name(ctx.file_metadata_shuffler)
         self._file_metadata_shuffler = shuffler_class(self._reader_args)
 
+    def get_fingerprint(self) -> Optional[str]:
+        from ray.data._internal.logical.fingerprint import (
+            fingerprint_files,
+            fingerprint_value,
+        )
+
+        files = fingerprint_files(self._paths, self._filesystem)
+        if files is None:
+            return None
+        return fingerprint_value(
+            [
+                self._delegate,
+                files,
+                self._filesystem,
+                self._schema,
+                self._open_stream_args,
+                self._partitioning,
+                self._reader_args,
+            ]
+        )
+
     def estimate_inmemory_data_size(self) -> Optional[int]:
         total_size = 0
         for sz in self._file_sizes:
@@ -311,6 +311,27 @@ class DefaultParquetMetadataProvider(ParquetMetadataProvider):
         pieces: List["pyarrow.dataset.ParquetFileFragment"],
         **ray_remote_args,
     ) -> Optional[List["pyarrow.parquet.FileMetaData"]]:
+        from ray.data._internal.file_metadata_cache import get_file_metadata_cache
+
+        cache = get_file_metadata_cache()
+        if cache is not None:
+            # Only read the footers of new or modified files.
+            return cache.get_parquet_metadata(
+                pieces,
+                lambda pieces, footers: self._fetch_file_metadata(
+                    pieces, footers, **ray_remote_args
+                ),
+            )
+        return self._fetch_file_metadata(pieces, **ray_remote_args)
+
+    def _fetch_file_metadata(
+        self,
+        pieces: List["pyarrow.dataset.ParquetFileFragment"],
+        footers: Optional[List[Optional[str]]] = None,
+        **ray_remote_args,
+    ) -> Optional[List["pyarrow.parquet.FileMetaData"]]:
+        """Fetch the footers of the given pieces, decoding those that are given
+        in `footers` from the file metadata cache instead of reading them."""
         from ray.data.datasource.file_based_datasource import _fetch_metadata_parallel
         from ray.data.datasource.parquet_datasource import (
             PARALLELIZE_META_FETCH_THRESHOLD,
@@ -320,9 +341,14 @@ class DefaultParquetMetadataProvider(ParquetMetadataProvider):
             _SerializedPiece,
         )
 
+        if footers is None:
+            footers = [None] * len(pieces)
         if len(pieces) > PARALLELIZE_META_FETCH_THRESHOLD:
             # Wrap Parquet fragments in serialization workaround.
-            pieces = [_SerializedPiece(piece) for piece in pieces]
+            pieces = [
+                _SerializedPiece(piece, footer)
+                for piece, footer in zip(pieces, footers)
+            ]
             # Fetch Parquet metadata in parallel using Ray tasks.
             return list(
                 _fetch_metadata_parallel(
@@ -333,7 +359,7 @@ class DefaultParquetMetadataProvider(ParquetMetadataProvider):
                 )
             )
         else:
-            return _fetch_metadata(pieces)
+            return _fetch_metadata(pieces, footers)
 
 
 def _handle_read_os_error(error: OSError, paths: Union[str, List[str]]) -> str:
@@ -533,19 +559,31 @@ def _expand_directory(
 
     from pyarrow.fs import FileSelector
 
+    from ray.data._internal.file_metadata_cache import get_file_metadata_cache
+
     selector = FileSelector(path, recursive=True, allow_not_found=ignore_missing_path)
-    files = filesystem.get_file_info(selector)
+    cache = get_file_metadata_cache()
+    if cache is not None:
+        files = [
+            (file_path, file_size)
+            for file_path, file_size, _ in cache.list_directory(
+                path, filesystem, ignore_missing_path=ignore_missing_path
+            )
+        ]
+    else:
+        files = [
+            (file_.path, file_.size)
+            for file_ in filesystem.get_file_info(selector)
+            if file_.is_file
+        ]
     base_path = selector.base_dir
     out = []
-    for file_ in files:
-        if not file_.is_file:
-            continue
-        file_path = file_.path
+    for file_path, file_size in files:
         if not file_path.startswith(base_path):
             continue
         relative = file_path[len(base_path) :]
         if any(relative.startswith(prefix) for prefix in exclude_prefixes):
             continue
-        out.append((file_path, file_.size))
+        out.append((file_path, file_size))
     # We sort the paths to guarantee a stable order.
     return sorted(out)
@@ -4,6 +4,8 @@ from typing import TYPE_CHECKING, Any, Callable, Dict
 from ray.data.block import BlockAccessor
 from ray.data.datasource.file_based_datasource import (
     FileBasedDatasource,
+    _FileBlockWriter,
+    _IncompatibleBlockError,
     _resolve_kwargs,
 )
 from ray.util.annotations import PublicAPI
@@ -54,3 +56,49 @@ class ParquetBaseDatasource(FileBasedDatasource):
 
         writer_args = _resolve_kwargs(writer_args_fn, **writer_args)
         pq.write_table(block.to_arrow(), f, **writer_args)
+
+    def _open_block_writer(
+        self,
+        f: "pyarrow.NativeFile",
+        writer_args_fn: Callable[[], Dict[str, Any]] = lambda: {},
+        **writer_args,
+    ) -> _FileBlockWriter:
+        writer_args = _resolve_kwargs(writer_args_fn, **writer_args)
+        return _ParquetBlockWriter(f, **writer_args)
+
+
+class _ParquetBlockWriter(_FileBlockWriter):
+    """Writes each block to a Parquet file as one or more row groups."""
+
+    def __init__(self, f: "pyarrow.NativeFile", **writer_args):
+        super().__init__(f)
+        # `pyarrow.parquet.write_table()` passes this to `ParquetWriter.write()`,
+        # and all other args to the `ParquetWriter`.
+        self._row_group_size = writer_args.pop("row_group_size", None)
+        self._writer_args = writer_args
+        self._writer = None
+
+    def write(self, block: BlockAccessor) -> None:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        table = block.to_arrow()
+        if self._writer is None:
+            self._writer = pq.ParquetWriter(
+                self._file, table.schema, **self._writer_args
+            )
+        elif not table.schema.equals(self._writer.schema):
+            # E.g. a column that was all nulls in the first block has the null type
+            # in the file, and the values of later blocks can't be cast to it.
+            try:
+                table = table.cast(self._writer.schema)
+            except (ValueError, pa.ArrowException) as e:
+                raise _IncompatibleBlockError(
+                    f"Can't write a block with schema {table.schema} to a Parquet "
+                    f"file with schema {self._writer.schema}: {e}"
+                ) from e
+        self._writer.write_table(table, row_group_size=self._row_group_size)
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
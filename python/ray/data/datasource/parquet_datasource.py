@@ -1,9 +1,11 @@
+import copy
 import logging
 from typing import TYPE_CHECKING, Callable, Iterator, List, Optional, Union
 
 import numpy as np
 
 import ray.cloudpickle as cloudpickle
+from ray.data._internal.file_metadata_cache import _decode_footer
 from ray.data._internal.progress_bar import ProgressBar
 from ray.data._internal.remote_fn import cached_remote_fn
 from ray.data._internal.util import _check_pyarrow_version
@@ -13,7 +15,11 @@ from ray.data.datasource._default_metadata_providers import (
     get_generic_metadata_provider,
 )
 from ray.data.datasource.datasource import Reader, ReadTask
-from ray.data.datasource.file_based_datasource import _resolve_paths_and_filesystem
+from ray.data.datasource.file_based_datasource import (
+    _resolve_paths_and_filesystem,
+    _unwrap_s3_serialization_workaround,
+    _wrap_s3_serialization_workaround,
+)
 from ray.data.datasource.file_meta_provider import (
     DefaultParquetMetadataProvider,
     ParquetMetadataProvider,
@@ -70,10 +76,12 @@ PARQUET_ENCODING_RATIO_ESTIMATE_NUM_ROWS = 1024
 # TODO(ekl) this is a workaround for a pyarrow serialization bug, where serializing a
 # raw pyarrow file fragment causes S3 network calls.
 class _SerializedPiece:
-    def __init__(self, frag: "ParquetFileFragment"):
+    def __init__(self, frag: "ParquetFileFragment", footer: Optional[str] = None):
         self._data = cloudpickle.dumps(
             (frag.format, frag.path, frag.filesystem, frag.partition_expression)
         )
+        # The footer of the file from the file metadata cache, if it's cached.
+        self.footer = footer
 
     def deserialize(self) -> "ParquetFileFragment":
         # Implicitly trigger S3 subsystem initialization by importing
@@ -185,7 +193,6 @@ class _ParquetDatasourceReader(Reader):
         **reader_args,
     ):
         _check_pyarrow_version()
-        import pyarrow as pa
         import pyarrow.parquet as pq
 
         self._local_scheduling = None
@@ -229,10 +236,9 @@ class _ParquetDatasourceReader(Reader):
             _handle_read_os_error(e, paths)
         if schema is None:
             schema = pq_ds.schema
+        dataset_schema = schema
         if columns:
-            schema = pa.schema(
-                [schema.field(column) for column in columns], schema.metadata
-            )
+            schema = _project_schema(schema, columns)
 
         if _block_udf is not None:
             # Try to infer dataset schema by passing dummy table through UDF.
@@ -268,12 +274,14 @@ class _ParquetDatasourceReader(Reader):
         # `_SerializedPiece()` implementation for more details.
         self._pq_pieces = [_SerializedPiece(p) for p in pq_ds.pieces]
         self._pq_paths = [p.path for p in pq_ds.pieces]
+        self._filesystem = _wrap_s3_serialization_workaround(filesystem)
         self._meta_provider = meta_provider
         self._inferred_schema = inferred_schema
         self._block_udf = _block_udf
         self._reader_args = reader_args
         self._columns = columns
         self._schema = schema
+        self._dataset_schema = dataset_schema
         self._encoding_ratio = self._estimate_files_encoding_ratio()
 
     def estimate_inmemory_data_size(self) -> Optional[int]:
@@ -284,6 +292,64 @@ class _ParquetDatasourceReader(Reader):
                 total_size += row_group_metadata.total_byte_size
         return total_size * self._encoding_ratio
 
+    def get_fingerprint(self) -> Optional[str]:
+        from ray.data._internal.logical.fingerprint import (
+            fingerprint_files,
+            fingerprint_value,
+        )
+
+        filesystem = _unwrap_s3_serialization_workaround(self._filesystem)
+        files = fingerprint_files(self._pq_paths, filesystem)
+        if files is None:
+            return None
+        return fingerprint_value(
+            [
+                files,
+                filesystem,
+                self._columns,
+                self._schema,
+                self._block_udf,
+                self._reader_args,
+            ]
+        )
+
+    def push_down_projection(
+        self, columns: List[str]
+    ) -> Optional["_ParquetDatasourceReader"]:
+        # The block UDF may depend on any of the read columns, and columns missing
+        # from the schema or selected multiple times are handled by the projection
+        # itself.
+        if self._block_udf is not None or len(set(columns)) != len(columns):
+            return None
+        readable_columns = self._columns or self._dataset_schema.names
+        if any(column not in readable_columns for column in columns):
+            return None
+        reader = copy.copy(self)
+        reader._columns = columns
+        reader._schema = _project_schema(self._dataset_schema, columns)
+        reader._inferred_schema = reader._schema
+        return reader
+
+    def push_down_filter(
+        self, filter_expr: "pyarrow.dataset.Expression"
+    ) -> Optional["_ParquetDatasourceReader"]:
+        if self._block_udf is not None:
+            return None
+        if self._columns and not _filter_applies_to_schema(filter_expr, self._schema):
+            # The filter references columns that aren't read, e.g. because they
+            # were dropped by a projection before the filter. The read reads with
+            # the schema of the whole dataset, so it would silently accept the
+            # filter, rather than raise the error of the filter that isn't
+            # pushed down.
+            return None
+        reader = copy.copy(self)
+        reader._reader_args = dict(self._reader_args)
+        existing_filter = reader._reader_args.get("filter")
+        if existing_filter is not None:
+            filter_expr = existing_filter & filter_expr
+        reader._reader_args["filter"] = filter_expr
+        return reader
+
     def get_read_tasks(self, parallelism: int) -> List[ReadTask]:
         # NOTE: We override the base class FileBasedDatasource.get_read_tasks()
         # method in order to leverage pyarrow's ParquetDataset abstraction,
@@ -330,11 +396,12 @@ class _ParquetDatasourceReader(Reader):
                 )
             else:
                 default_read_batch_size = PARQUET_READER_ROW_BATCH_SIZE
-            block_udf, reader_args, columns, schema = (
+            block_udf, reader_args, columns, schema, dataset_schema = (
                 self._block_udf,
                 self._reader_args,
                 self._columns,
                 self._schema,
+                self._dataset_schema,
             )
             read_tasks.append(
                 ReadTask(
@@ -344,6 +411,7 @@ class _ParquetDatasourceReader(Reader):
                         default_read_batch_size,
                         columns,
                         schema,
+                        dataset_schema,
                         p,
                     ),
                     meta,
@@ -392,7 +460,7 @@ class _ParquetDatasourceReader(Reader):
                 sample_piece.options(scheduling_strategy=scheduling).remote(
                     self._reader_args,
                     self._columns,
-                    self._schema,
+                    self._dataset_schema,
                     sample,
                 )
             )
@@ -410,6 +478,7 @@ def _read_pieces(
     default_read_batch_size,
     columns,
     schema,
+    dataset_schema,
     serialized_pieces: List[_SerializedPiece],
 ) -> Iterator["pyarrow.Table"]:
     # This import is necessary to load the tensor extension type.
@@ -431,10 +500,12 @@ def _read_pieces(
     batch_size = reader_args.pop("batch_size", default_read_batch_size)
     for piece in pieces:
         part = _get_partition_keys(piece.partition_expression)
+        # NOTE: Read with the schema of the whole dataset, so that a filter can
+        # reference columns that are not read.
         batches = piece.to_batches(
             use_threads=use_threads,
             columns=columns,
-            schema=schema,
+            schema=dataset_schema,
             batch_size=batch_size,
             **reader_args,
         )
@@ -442,8 +513,12 @@ def _read_pieces(
             table = pa.Table.from_batches([batch], schema=schema)
             if part:
                 for col, value in part.items():
+                    field_index = table.schema.get_field_index(col)
+                    if field_index == -1:
+                        # The partition column isn't read.
+                        continue
                     table = table.set_column(
-                        table.schema.get_field_index(col),
+                        field_index,
                         col,
                         pa.array([value] * len(table)),
                     )
@@ -455,25 +530,56 @@ def _read_pieces(
                     yield table
 
 
+def _project_schema(
+    schema: "pyarrow.lib.Schema", columns: List[str]
+) -> "pyarrow.lib.Schema":
+    import pyarrow as pa
+
+    return pa.schema([schema.field(column) for column in columns], schema.metadata)
+
+
+def _filter_applies_to_schema(
+    filter_expr: "pyarrow.dataset.Expression", schema: "pyarrow.lib.Schema"
+) -> bool:
+    """Return whether the filter only references columns of the schema, with
+    compatible types."""
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+
+    try:
+        ds.dataset(schema.empty_table()).to_table(filter=filter_expr)
+    except pa.ArrowException:
+        return False
+    return True
+
+
 def _fetch_metadata_serialization_wrapper(
-    pieces: _SerializedPiece,
+    pieces: List[_SerializedPiece],
 ) -> List["pyarrow.parquet.FileMetaData"]:
+    footers = [p.footer for p in pieces]
     pieces: List[
         "pyarrow._dataset.ParquetFileFragment"
     ] = _deserialize_pieces_with_retry(pieces)
 
-    return _fetch_metadata(pieces)
+    return _fetch_metadata(pieces, footers)
 
 
 def _fetch_metadata(
     pieces: List["pyarrow.dataset.ParquetFileFragment"],
+    footers: Optional[List[Optional[str]]] = None,
 ) -> List["pyarrow.parquet.FileMetaData"]:
+    if footers is None:
+        footers = [None] * len(pieces)
     piece_metadata = []
-    for p in pieces:
-        try:
-            piece_metadata.append(p.metadata)
-        except AttributeError:
-            break
+    for p, footer in zip(pieces, footers):
+        # Decode the cached footer if there is one, and otherwise read it.
+        metadata = _decode_footer(footer) if footer is not None else None
+        if metadata is None:
+            try:
+                metadata = p.metadata
+            except AttributeError:
+                break
+        piece_metadata.append(metadata)
     return piece_metadata
 
 
@@ -6,50 +6,81 @@ from typing import (
     Dict,
     Iterable,
     Iterator,
+    List,
     Optional,
-    Union,
+    Tuple,
 )
 
 import numpy as np
 
 from ray.data._internal.util import _check_import
 from ray.data.block import Block, BlockAccessor
-from ray.data.datasource.file_based_datasource import FileBasedDatasource
+from ray.data.datasource.file_based_datasource import (
+    FileBasedDatasource,
+    _AppendingFileBlockWriter,
+    _FileBlockWriter,
+)
 from ray.util.annotations import PublicAPI
 
 if TYPE_CHECKING:
     import pyarrow
-    import tensorflow as tf
     from tensorflow_metadata.proto.v0 import schema_pb2
 
+# The maximum number of records, and the maximum total size of the records in
+# bytes, that are decoded into a single block.
+_READ_BATCH_MAX_RECORDS = 1024
+_READ_BATCH_MAX_BYTES = 16 * 1024 * 1024
+
+# The types of the values of a `tf.train.Feature`, by the field number of the
+# value list in the `tf.train.Feature` message.
+_FEATURE_TYPES = {1: "bytes", 2: "float", 3: "int"}
+_FEATURE_FIELD_NUMBERS = {
+    feature_type: field_number for field_number, feature_type in _FEATURE_TYPES.items()
+}
+
+# A decoded `tf.train.Feature`: the type of its values, or None if no value list
+# is set, and its values. Float and int values are kept in their packed wire
+# encoding, i.e. as little-endian floats and concatenated varints.
+_Feature = Tuple[Optional[str], Any]
+
 
 @PublicAPI(stability="alpha")
 class TFRecordDatasource(FileBasedDatasource):
-    """TFRecord datasource, for reading and writing TFRecord files."""
+    """TFRecord datasource, for reading and writing TFRecord files.
+
+    `tf.train.Example` messages are decoded and encoded directly from and to Arrow
+    columns, so TensorFlow doesn't need to be installed.
+    """
 
     _FILE_EXTENSION = "tfrecords"
 
     def _read_stream(
         self, f: "pyarrow.NativeFile", path: str, **reader_args
     ) -> Iterator[Block]:
-        import pyarrow as pa
-        import tensorflow as tf
-        from google.protobuf.message import DecodeError
-
         tf_schema: Optional["schema_pb2.Schema"] = reader_args.get("tf_schema", None)
+        schema_dict = _get_schema_dict(tf_schema)
 
+        examples = []
+        num_bytes = 0
         for record in _read_records(f, path):
-            example = tf.train.Example()
             try:
-                example.ParseFromString(record)
-            except DecodeError as e:
+                examples.append(_parse_example(bytes(record)))
+            except ValueError as e:
                 raise ValueError(
                     "`TFRecordDatasource` failed to parse `tf.train.Example` "
                     f"record in '{path}'. This error can occur if your TFRecord "
                     f"file contains a message type other than `tf.train.Example`: {e}"
                 )
-
-            yield pa.Table.from_pydict(_convert_example_to_dict(example, tf_schema))
+            num_bytes += len(record)
+            if (
+                len(examples) >= _READ_BATCH_MAX_RECORDS
+                or num_bytes >= _READ_BATCH_MAX_BYTES
+            ):
+                yield _convert_examples_to_table(examples, tf_schema, schema_dict)
+                examples = []
+                num_bytes = 0
+        if examples:
+            yield _convert_examples_to_table(examples, tf_schema, schema_dict)
 
     def _write_block(
         self,
@@ -65,8 +96,8 @@ class TFRecordDatasource(FileBasedDatasource):
 
         # It seems like TFRecords are typically row-based,
         # https://www.tensorflow.org/tutorials/load_data/tfrecord#writing_a_tfrecord_file_2
-        # so we must iterate through the rows of the block,
-        # serialize to tf.train.Example proto, and write to file.
+        # so we must serialize each row of the block to a tf.train.Example proto,
+        # and write it to file.
 
         examples = _convert_arrow_table_to_examples(arrow_table, tf_schema)
 
@@ -74,160 +105,378 @@ class TFRecordDatasource(FileBasedDatasource):
         for example in examples:
             _write_record(f, example)
 
+    def _open_block_writer(
+        self,
+        f: "pyarrow.NativeFile",
+        writer_args_fn: Callable[[], Dict[str, Any]] = lambda: {},
+        **writer_args,
+    ) -> _FileBlockWriter:
+        # TFRecord files are sequences of records, so blocks can be appended.
+        return _AppendingFileBlockWriter(
+            f,
+            lambda f, block: self._write_block(
+                f, block, writer_args_fn=writer_args_fn, **writer_args
+            ),
+        )
+
 
-def _convert_example_to_dict(
-    example: "tf.train.Example",
+def _get_schema_dict(
     tf_schema: Optional["schema_pb2.Schema"],
-) -> Dict[str, "pyarrow.Array"]:
-    record = {}
-    schema_dict = {}
-    # Convert user-specified schema into dict for convenient mapping
-    if tf_schema is not None:
-        for schema_feature in tf_schema.feature:
-            schema_dict[schema_feature.name] = schema_feature.type
-
-    for feature_name, feature in example.features.feature.items():
-        if tf_schema is not None and feature_name not in schema_dict:
-            raise ValueError(
-                f"Found extra unexpected feature {feature_name} "
-                f"not in specified schema: {tf_schema}"
-            )
-        schema_feature_type = schema_dict.get(feature_name)
-        record[feature_name] = _get_feature_value(feature, schema_feature_type)
-    return record
-
+) -> Dict[str, Optional[str]]:
+    """Convert a user-specified schema into a dict from feature names to their
+    types, i.e. `"bytes"`, `"float"`, `"int"`, or None for other types."""
+    if tf_schema is None:
+        return {}
+    try:
+        from tensorflow_metadata.proto.v0 import schema_pb2
+    except ModuleNotFoundError:
+        raise ModuleNotFoundError(
+            "To use TensorFlow schemas, please install "
+            "the tensorflow-metadata package."
+        )
+    feature_types = {
+        schema_pb2.FeatureType.BYTES: "bytes",
+        schema_pb2.FeatureType.FLOAT: "float",
+        schema_pb2.FeatureType.INT: "int",
+    }
+    return {
+        schema_feature.name: feature_types.get(schema_feature.type)
+        for schema_feature in tf_schema.feature
+    }
 
-def _convert_arrow_table_to_examples(
-    arrow_table: "pyarrow.Table",
-    tf_schema: Optional["schema_pb2.Schema"] = None,
-) -> Iterable["tf.train.Example"]:
-    import tensorflow as tf
 
-    schema_dict = {}
-    # Convert user-specified schema into dict for convenient mapping
-    if tf_schema is not None:
-        for schema_feature in tf_schema.feature:
-            schema_dict[schema_feature.name] = schema_feature.type
+def _convert_examples_to_table(
+    examples: List[Dict[str, _Feature]],
+    tf_schema: Optional["schema_pb2.Schema"],
+    schema_dict: Dict[str, Optional[str]],
+) -> "pyarrow.Table":
+    import pyarrow as pa
 
-    # Serialize each row[i] of the block to a tf.train.Example and yield it.
-    for i in range(arrow_table.num_rows):
-        # First, convert row[i] to a dictionary.
-        features: Dict[str, "tf.train.Feature"] = {}
-        for name in arrow_table.column_names:
+    names = {}
+    for example in examples:
+        for name in example:
             if tf_schema is not None and name not in schema_dict:
                 raise ValueError(
                     f"Found extra unexpected feature {name} "
                     f"not in specified schema: {tf_schema}"
                 )
-            schema_feature_type = schema_dict.get(name)
-            features[name] = _value_to_feature(
-                arrow_table[name][i],
-                schema_feature_type,
-            )
-
-        # Convert the dictionary to an Example proto.
-        proto = tf.train.Example(features=tf.train.Features(feature=features))
-
-        yield proto
+            names[name] = None
 
-
-def _get_single_true_type(dct) -> str:
-    """Utility function for getting the single key which has a `True` value in
-    a dict. Used to filter a dict of `{field_type: is_valid}` to get
-    the field type from a schema or data source."""
-    filtered_types = iter([_type for _type in dct if dct[_type]])
-    # In the case where there are no keys with a `True` value, return `None`
-    return next(filtered_types, None)
+    columns = {}
+    for name in names:
+        features = [example.get(name) for example in examples]
+        if tf_schema is not None:
+            columns[name] = _features_to_column(features, schema_dict[name], True)
+        else:
+            columns[name] = _features_to_column(features, None, False)
+    return pa.Table.from_pydict(columns)
 
 
-def _get_feature_value(
-    feature: "tf.train.Feature",
-    schema_feature_type: Optional["schema_pb2.FeatureType"] = None,
+def _features_to_column(
+    features: List[Optional[_Feature]],
+    schema_feature_type: Optional[str],
+    has_schema: bool,
 ) -> "pyarrow.Array":
+    """Build the column of a feature from its values in a batch of examples.
+
+    Without a schema, the column holds the values themselves if every example
+    contains at most one value, and at least one example contains exactly one.
+    Otherwise, and always with a schema, the column holds lists of values.
+    Examples that don't contain the feature have null values.
+    """
     import pyarrow as pa
 
-    underlying_feature_type = {
-        "bytes": feature.HasField("bytes_list"),
-        "float": feature.HasField("float_list"),
-        "int": feature.HasField("int64_list"),
+    underlying_types = {
+        feature[0]
+        for feature in features
+        if feature is not None and feature[0] is not None
     }
-    # At most one of `bytes_list`, `float_list`, and `int64_list`
-    # should contain values. If none contain data, this indicates
-    # an empty feature value.
-    assert sum(bool(value) for value in underlying_feature_type.values()) <= 1
-
-    if schema_feature_type is not None:
-        try:
-            from tensorflow_metadata.proto.v0 import schema_pb2
-        except ModuleNotFoundError:
-            raise ModuleNotFoundError(
-                "To use TensorFlow schemas, please install "
-                "the tensorflow-metadata package."
-            )
-        # If a schema is specified, compare to the underlying type
-        specified_feature_type = {
-            "bytes": schema_feature_type == schema_pb2.FeatureType.BYTES,
-            "float": schema_feature_type == schema_pb2.FeatureType.FLOAT,
-            "int": schema_feature_type == schema_pb2.FeatureType.INT,
-        }
-        und_type = _get_single_true_type(underlying_feature_type)
-        spec_type = _get_single_true_type(specified_feature_type)
-        if und_type is not None and und_type != spec_type:
+    if has_schema:
+        for underlying_type in underlying_types:
+            if underlying_type != schema_feature_type:
+                raise ValueError(
+                    "Schema field type mismatch during read: specified type is "
+                    f"{schema_feature_type}, but underlying type is {underlying_type}",
+                )
+        feature_type = schema_feature_type
+    else:
+        if len(underlying_types) > 1:
             raise ValueError(
-                "Schema field type mismatch during read: specified type is "
-                f"{spec_type}, but underlying type is {und_type}",
+                f"Found values of multiple types {sorted(underlying_types)} for "
+                "the same feature. Specify a schema to read this feature."
             )
-        # Override the underlying value type with the type in the user-specified schema.
-        underlying_feature_type = specified_feature_type
-
-    if underlying_feature_type["bytes"]:
-        value = feature.bytes_list.value
-        type_ = pa.binary()
-    elif underlying_feature_type["float"]:
-        value = feature.float_list.value
-        type_ = pa.float32()
-    elif underlying_feature_type["int"]:
-        value = feature.int64_list.value
-        type_ = pa.int64()
+        feature_type = next(iter(underlying_types), None)
+
+    missing = np.array([feature is None for feature in features])
+    if feature_type is None:
+        # There are no values to infer the type from.
+        return pa.array(
+            [None if feature is None else [] for feature in features],
+            type=pa.list_(pa.null()),
+        )
+
+    # Concatenate the values of all examples, and count the values of each.
+    if feature_type == "bytes":
+        value_lists = [
+            feature[1] if feature is not None and feature[0] is not None else []
+            for feature in features
+        ]
+        counts = np.array([len(value_list) for value_list in value_lists])
+        values = pa.array(
+            [value for value_list in value_lists for value in value_list],
+            type=pa.binary(),
+        )
     else:
-        value = []
-        type_ = pa.null()
-    value = list(value)
-    if len(value) == 1 and schema_feature_type is None:
-        # Use the value itself if the features contains a single value.
+        payloads = [
+            feature[1] if feature is not None and feature[0] is not None else b""
+            for feature in features
+        ]
+        if feature_type == "float":
+            sizes = np.array([len(payload) for payload in payloads])
+            if np.any(sizes % 4):
+                raise ValueError("Truncated float value.")
+            counts = sizes // 4
+            values = pa.array(np.frombuffer(b"".join(payloads), dtype="<f4"))
+        else:
+            values, counts = _decode_varints(payloads)
+            values = pa.array(values, type=pa.int64())
+
+    if not has_schema and np.any(counts == 1) and np.all(counts <= 1):
+        # Use the value itself if each example contains at most a single value.
         # This is to give better user experience when writing preprocessing UDF on
         # these single-value lists.
-        value = value[0]
-    else:
-        # If the feature value is empty and no type is specified in the user-provided
-        # schema, set the type to null for now to allow pyarrow to construct a valid
-        # Array; later, infer the type from other records which have non-empty values
-        # for the feature.
-        if len(value) == 0:
-            type_ = pa.null()
-        type_ = pa.list_(type_)
-    return pa.array([value], type=type_)
-
-
-def _value_to_feature(
-    value: Union["pyarrow.Scalar", "pyarrow.Array"],
-    schema_feature_type: Optional["schema_pb2.FeatureType"] = None,
-) -> "tf.train.Feature":
+        has_value = counts == 1
+        indices = np.cumsum(has_value) - 1
+        indices[~has_value] = 0
+        return values.take(pa.array(indices, mask=~has_value))
+
+    offsets = np.concatenate([[0], np.cumsum(counts)])
+    offsets = pa.array(
+        offsets, type=pa.int32(), mask=np.concatenate([missing, [False]])
+    )
+    return pa.ListArray.from_arrays(offsets, values)
+
+
+def _decode_varints(payloads: List[bytes]) -> Tuple[np.ndarray, np.ndarray]:
+    """Decode the concatenated varints of each payload as int64 values.
+
+    Returns:
+        The values of all payloads, and the number of values of each payload.
+    """
+    data = np.frombuffer(b"".join(payloads), dtype=np.uint8)
+    sizes = np.array([len(payload) for payload in payloads], dtype=np.int64)
+    # The last byte of each varint has the most significant bit unset.
+    is_last = data < 0x80
+    if sizes.sum() and not is_last[np.cumsum(sizes)[sizes > 0] - 1].all():
+        raise ValueError("Truncated varint.")
+    num_values = np.concatenate([[0], np.cumsum(is_last)])
+    counts = np.diff(num_values[np.concatenate([[0], np.cumsum(sizes)])])
+    if len(data) == 0:
+        return np.zeros(0, dtype=np.int64), counts
+
+    # The position of each byte within its varint.
+    is_first = np.concatenate([[True], is_last[:-1]])
+    starts = np.flatnonzero(is_first)
+    positions = np.arange(len(data)) - starts[np.cumsum(is_first) - 1]
+    if positions.max() >= 10:
+        raise ValueError("Varint is longer than 10 bytes.")
+    groups = (data & 0x7F).astype(np.uint64) << (positions * 7).astype(np.uint64)
+    values = np.bitwise_or.reduceat(groups, starts)
+    return values.view(np.int64), counts
+
+
+def _encode_varints(values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Encode int64 values as varints.
+
+    Returns:
+        The concatenated varints, and the number of bytes of each varint.
+    """
+    values = values.astype(np.int64).view(np.uint64)[:, np.newaxis]
+    shifts = np.arange(10, dtype=np.uint64) * np.uint64(7)
+    shifted = values >> shifts
+    sizes = np.maximum(np.count_nonzero(shifted, axis=1), 1)
+    positions = np.arange(10)
+    groups = (shifted & np.uint64(0x7F)).astype(np.uint8)
+    # Set the most significant bit of every byte except the last of each varint.
+    groups[positions < (sizes - 1)[:, np.newaxis]] |= 0x80
+    return groups[positions < sizes[:, np.newaxis]], sizes
+
+
+def _encode_varint(value: int) -> bytes:
+    """Encode a non-negative int as a varint."""
+    data = bytearray()
+    while value >= 0x80:
+        data.append((value & 0x7F) | 0x80)
+        value >>= 7
+    data.append(value)
+    return bytes(data)
+
+
+def _decode_varint(data: bytes, pos: int) -> Tuple[int, int]:
+    """Decode the varint at the given position.
+
+    Returns:
+        The value, and the position after the varint.
+    """
+    value = 0
+    shift = 0
+    while True:
+        if pos >= len(data):
+            raise ValueError("Truncated message.")
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+        if shift >= 70:
+            raise ValueError("Varint is longer than 10 bytes.")
+
+
+def _iter_fields(
+    data: bytes, start: int, end: int
+) -> Iterator[Tuple[int, int, int, int]]:
+    """Iterate over the fields of the protobuf message in `data[start:end]`.
+
+    Yields:
+        The field number, the wire type, and the start and end positions of the
+        value of each field. The value of a length-delimited field excludes its
+        length.
+    """
+    pos = start
+    while pos < end:
+        tag, pos = _decode_varint(data, pos)
+        field_number, wire_type = tag >> 3, tag & 0x7
+        if wire_type == 0:
+            _, value_end = _decode_varint(data, pos)
+        elif wire_type == 1:
+            value_end = pos + 8
+        elif wire_type == 2:
+            length, pos = _decode_varint(data, pos)
+            value_end = pos + length
+        elif wire_type == 5:
+            value_end = pos + 4
+        else:
+            raise ValueError(f"Unsupported wire type {wire_type}.")
+        if value_end > end:
+            raise ValueError("Truncated message.")
+        yield field_number, wire_type, pos, value_end
+        pos = value_end
+
+
+def _parse_example(data: bytes) -> Dict[str, _Feature]:
+    """Parse a serialized `tf.train.Example` into its features by name."""
+    features = {}
+    for field_number, wire_type, start, end in _iter_fields(data, 0, len(data)):
+        # Example.features
+        if field_number != 1 or wire_type != 2:
+            continue
+        for entry_field_number, entry_wire_type, entry_start, entry_end in _iter_fields(
+            data, start, end
+        ):
+            # Features.feature, a map from names to features.
+            if entry_field_number != 1 or entry_wire_type != 2:
+                continue
+            name = ""
+            feature = (None, None)
+            for key_field_number, key_wire_type, key_start, key_end in _iter_fields(
+                data, entry_start, entry_end
+            ):
+                if key_wire_type != 2:
+                    continue
+                if key_field_number == 1:
+                    name = data[key_start:key_end].decode()
+                elif key_field_number == 2:
+                    feature = _parse_feature(data, key_start, key_end)
+            features[name] = feature
+    return features
+
+
+def _parse_feature(data: bytes, start: int, end: int) -> _Feature:
+    feature_type = None
+    values = []
+    for field_number, wire_type, list_start, list_end in _iter_fields(data, start, end):
+        if field_number not in _FEATURE_TYPES or wire_type != 2:
+            continue
+        if _FEATURE_TYPES[field_number] != feature_type:
+            # The value lists are a oneof, so the last one set wins.
+            feature_type = _FEATURE_TYPES[field_number]
+            values = []
+        for value_field_number, _, value_start, value_end in _iter_fields(
+            data, list_start, list_end
+        ):
+            # The values of the list, which are packed for floats and ints.
+            if value_field_number == 1:
+                values.append(data[value_start:value_end])
+    if feature_type in ("float", "int"):
+        values = b"".join(values)
+    return feature_type, values
+
+
+def _convert_arrow_table_to_examples(
+    arrow_table: "pyarrow.Table",
+    tf_schema: Optional["schema_pb2.Schema"] = None,
+) -> Iterable[bytes]:
+    """Serialize each row of the table to a `tf.train.Example`."""
+    schema_dict = _get_schema_dict(tf_schema)
+    if arrow_table.num_rows == 0:
+        return
+
+    columns = []
+    for name in arrow_table.column_names:
+        if tf_schema is not None and name not in schema_dict:
+            raise ValueError(
+                f"Found extra unexpected feature {name} "
+                f"not in specified schema: {tf_schema}"
+            )
+        key = name.encode()
+        # The prefix of the `Features.feature` map entry, up to the feature.
+        prefix = b"\x0a" + _encode_varint(len(key)) + key + b"\x12"
+        features = _column_to_features(
+            arrow_table[name].combine_chunks(),
+            schema_dict.get(name),
+            tf_schema is not None,
+        )
+        columns.append((prefix, features))
+
+    for i in range(arrow_table.num_rows):
+        entries = []
+        for prefix, features in columns:
+            entry = prefix + _encode_varint(len(features[i])) + features[i]
+            entries.append(b"\x0a" + _encode_varint(len(entry)) + entry)
+        features_message = b"".join(entries)
+        yield b"\x0a" + _encode_varint(len(features_message)) + features_message
+
+
+def _column_to_features(
+    column: "pyarrow.Array",
+    schema_feature_type: Optional[str],
+    has_schema: bool,
+) -> List[bytes]:
+    """Serialize each value of the column to a `tf.train.Feature`."""
     import pyarrow as pa
-    import tensorflow as tf
 
-    if isinstance(value, pa.ListScalar):
-        # Use the underlying type of the ListScalar's value in
-        # determining the output feature's data type.
-        value_type = value.type.value_type
-        value = value.as_py()
+    if pa.types.is_list(column.type):
+        # Use the underlying type of the lists' values in determining the output
+        # feature's data type. Null lists are written as empty lists.
+        value_type = column.type.value_type
+        offsets = np.asarray(column.offsets)
+        counts = np.diff(offsets)
+        if column.null_count:
+            counts[~np.asarray(column.is_valid())] = 0
+        value_offsets = np.concatenate([[0], np.cumsum(counts)])
+        indices = (
+            np.arange(value_offsets[-1])
+            - np.repeat(value_offsets[:-1], counts)
+            + np.repeat(offsets[:-1], counts)
+        )
+        values = column.values.take(pa.array(indices, type=pa.int64()))
     else:
-        value_type = value.type
-        value = value.as_py()
-        if value is None:
-            value = []
-        else:
-            value = [value]
+        # Null values are written as empty lists.
+        value_type = column.type
+        counts = np.asarray(column.is_valid(), dtype=np.int64)
+        value_offsets = np.concatenate([[0], np.cumsum(counts)])
+        values = column.filter(column.is_valid())
 
     underlying_value_type = {
         "bytes": pa.types.is_binary(value_type),
@@ -237,21 +486,14 @@ def _value_to_feature(
     }
     assert sum(bool(value) for value in underlying_value_type.values()) <= 1
 
-    if schema_feature_type is not None:
-        try:
-            from tensorflow_metadata.proto.v0 import schema_pb2
-        except ModuleNotFoundError:
-            raise ModuleNotFoundError(
-                "To use TensorFlow schemas, please install "
-                "the tensorflow-metadata package."
-            )
+    if has_schema:
         specified_feature_type = {
-            "bytes": schema_feature_type == schema_pb2.FeatureType.BYTES
+            "bytes": schema_feature_type == "bytes"
             and not underlying_value_type["string"],
-            "string": schema_feature_type == schema_pb2.FeatureType.BYTES
+            "string": schema_feature_type == "bytes"
             and underlying_value_type["string"],
-            "float": schema_feature_type == schema_pb2.FeatureType.FLOAT,
-            "int": schema_feature_type == schema_pb2.FeatureType.INT,
+            "float": schema_feature_type == "float",
+            "int": schema_feature_type == "int",
         }
 
         und_type = _get_single_true_type(underlying_value_type)
@@ -264,26 +506,67 @@ def _value_to_feature(
         # Override the underlying value type with the type in the user-specified schema.
         underlying_value_type = specified_feature_type
 
-    if underlying_value_type["int"]:
-        return tf.train.Feature(int64_list=tf.train.Int64List(value=value))
-    if underlying_value_type["float"]:
-        return tf.train.Feature(float_list=tf.train.FloatList(value=value))
-    if underlying_value_type["bytes"]:
-        return tf.train.Feature(bytes_list=tf.train.BytesList(value=value))
-    if underlying_value_type["string"]:
-        value = [v.encode() for v in value]  # casting to bytes
-        return tf.train.Feature(bytes_list=tf.train.BytesList(value=value))
-    if pa.types.is_null(value_type):
+    feature_type = _get_single_true_type(underlying_value_type)
+    if feature_type is None:
+        if pa.types.is_null(value_type):
+            raise ValueError(
+                "Unable to infer type from partially missing column. "
+                "Try setting read parallelism = 1, or use an input data source which "
+                "explicitly specifies the schema."
+            )
         raise ValueError(
-            "Unable to infer type from partially missing column. "
-            "Try setting read parallelism = 1, or use an input data source which "
-            "explicitly specifies the schema."
+            f"Value is of type {value_type}, "
+            "which we cannot convert to a supported tf.train.Feature storage type "
+            "(bytes, float, or int)."
         )
-    raise ValueError(
-        f"Value is of type {value_type}, "
-        "which we cannot convert to a supported tf.train.Feature storage type "
-        "(bytes, float, or int)."
-    )
+    if values.null_count:
+        raise ValueError("Lists with null values can't be written to TFRecords.")
+
+    if feature_type in ("bytes", "string"):
+        # Each value is a length-delimited field of the `BytesList`.
+        value_list = values.to_pylist()
+        if feature_type == "string":
+            value_list = [value.encode() for value in value_list]  # casting to bytes
+        value_lists = [
+            b"".join(
+                b"\x0a" + _encode_varint(len(value)) + value
+                for value in value_list[value_offsets[i] : value_offsets[i + 1]]
+            )
+            for i in range(len(column))
+        ]
+        feature_type = "bytes"
+    else:
+        # The values are packed into a single length-delimited field of the
+        # `FloatList` or `Int64List`.
+        values = values.to_numpy(zero_copy_only=False)
+        if feature_type == "float":
+            data = values.astype("<f4").tobytes()
+            byte_offsets = value_offsets * 4
+        else:
+            data, sizes = _encode_varints(values)
+            data = data.tobytes()
+            byte_offsets = np.concatenate([[0], np.cumsum(sizes)])[value_offsets]
+        value_lists = []
+        for i in range(len(column)):
+            payload = data[byte_offsets[i] : byte_offsets[i + 1]]
+            value_lists.append(
+                b"\x0a" + _encode_varint(len(payload)) + payload if payload else b""
+            )
+
+    # Always set the value list, even if it's empty, like `tf.train.Feature` does.
+    tag = bytes([_FEATURE_FIELD_NUMBERS[feature_type] << 3 | 2])
+    return [
+        tag + _encode_varint(len(value_list)) + value_list for value_list in value_lists
+    ]
+
+
+def _get_single_true_type(dct) -> str:
+    """Utility function for getting the single key which has a `True` value in
+    a dict. Used to filter a dict of `{field_type: is_valid}` to get
+    the field type from a schema or data source."""
+    filtered_types = iter([_type for _type in dct if dct[_type]])
+    # In the case where there are no keys with a `True` value, return `None`
+    return next(filtered_types, None)
 
 
 # Adapted from https://github.com/vahidk/tfrecord/blob/74b2d24a838081356d993ec0e147eaf59ccd4c84/tfrecord/reader.py#L16-L96  # noqa: E501
@@ -323,13 +606,23 @@ def _read_records(
         byte   data[length]
         uint32 masked_crc32_of_data
 
+    The CRC-32C hashes are checked if the crc32c package is installed.
+
     See https://www.tensorflow.org/tutorials/load_data/tfrecord#tfrecords_format_details
     for more details.
     """
+    try:
+        import crc32c  # noqa: F401
+
+        check_crc = True
+    except ImportError:
+        check_crc = False
+
     length_bytes = bytearray(8)
     crc_bytes = bytearray(4)
     datum_bytes = bytearray(1024 * 1024)
     row_count = 0
+    data_length = None
     while True:
         try:
             # Read "length" field.
@@ -349,6 +642,8 @@ def _read_records(
                     "Failed to read the length of CRC-32C hashes. Expected 4 bytes "
                     "but got {num_length_crc_bytes_read} bytes."
                 )
+            if check_crc and _masked_crc(length_bytes) != crc_bytes:
+                raise ValueError("The CRC-32C hash of the record length is invalid.")
 
             # Read "data[length]" field.
             (data_length,) = struct.unpack("<Q", length_bytes)
@@ -363,13 +658,14 @@ def _read_records(
                 )
 
             # Read "masked_crc32_of_data" field.
-            # TODO(chengsu): ideally we should check CRC-32C against the actual data.
             num_crc_bytes_read = file.readinto(crc_bytes)
             if num_crc_bytes_read != 4:
                 raise ValueError(
                     "Failed to read the CRC-32C hashes. Expected 4 bytes but got "
                     f"{num_crc_bytes_read} bytes."
                 )
+            if check_crc and _masked_crc(datum_bytes_view) != crc_bytes:
+                raise ValueError("The CRC-32C hash of the record data is invalid.")
 
             # Return the data.
             yield datum_bytes_view
@@ -413,9 +709,8 @@ def _read_records(
 
 def _write_record(
     file: "pyarrow.NativeFile",
-    example: "tf.train.Example",
+    record: bytes,
 ) -> None:
-    record = example.SerializeToString()
     length = len(record)
     length_bytes = struct.pack("<Q", length)
     file.write(length_bytes)
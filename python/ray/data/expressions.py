@@ -0,0 +1,271 @@
+from typing import TYPE_CHECKING, Any, List, Union
+
+from ray.util.annotations import PublicAPI
+
+if TYPE_CHECKING:
+    import pyarrow
+    import pyarrow.dataset
+
+
+@PublicAPI(stability="alpha")
+class Expr:
+    """An expression over the columns of a :class:`~ray.data.Dataset`.
+
+    Expressions are built with :func:`~ray.data.col` and :func:`~ray.data.lit`, and
+    combined with Python operators. Unlike Python functions, expressions are
+    evaluated with vectorized ``pyarrow.compute`` kernels, and can be inspected by
+    the optimizer, e.g. to push filters down into reads.
+
+    Examples:
+        >>> from ray.data import col, lit
+        >>> (col("a") + col("b")) * 2
+        ((col('a') + col('b')) * lit(2))
+        >>> (col("x") > 5) & ~col("y").is_null()
+        ((col('x') > lit(5)) & ~col('y').is_null())
+
+    .. note::
+        Arithmetic follows Arrow semantics, e.g. dividing integers performs an
+        integer division, and operations with null values produce nulls.
+    """
+
+    def evaluate(self, table: "pyarrow.Table") -> "pyarrow.ChunkedArray":
+        """Evaluate this expression on the rows of an Arrow table.
+
+        Args:
+            table: The table to evaluate this expression on.
+
+        Returns:
+            A column with one value per row of ``table``.
+        """
+        import pyarrow as pa
+
+        result = self._evaluate(table)
+        if isinstance(result, pa.Scalar):
+            result = pa.chunked_array(
+                [pa.array([result.as_py()] * table.num_rows, type=result.type)]
+            )
+        elif isinstance(result, pa.Array):
+            result = pa.chunked_array([result])
+        return result
+
+    def to_pyarrow(self) -> "pyarrow.dataset.Expression":
+        """Convert this expression to a ``pyarrow.dataset.Expression``, e.g. to use
+        it as a filter when scanning Parquet files.
+        """
+        raise NotImplementedError
+
+    def columns(self) -> List[str]:
+        """Return the names of the columns referenced by this expression."""
+        raise NotImplementedError
+
+    def is_null(self) -> "Expr":
+        """Return an expression that is true where this expression is null."""
+        return _CallExpr("is_null", [self], "{0}.is_null()")
+
+    def _evaluate(
+        self, table: "pyarrow.Table"
+    ) -> Union["pyarrow.ChunkedArray", "pyarrow.Array", "pyarrow.Scalar"]:
+        raise NotImplementedError
+
+    def __bool__(self):
+        raise TypeError(
+            "The truth value of an expression is ambiguous. Use `&`, `|` and `~` "
+            "instead of `and`, `or` and `not`, and don't chain comparisons."
+        )
+
+    def __add__(self, other: Any) -> "Expr":
+        return _binary("add", self, other, "+")
+
+    def __radd__(self, other: Any) -> "Expr":
+        return _binary("add", other, self, "+")
+
+    def __sub__(self, other: Any) -> "Expr":
+        return _binary("subtract", self, other, "-")
+
+    def __rsub__(self, other: Any) -> "Expr":
+        return _binary("subtract", other, self, "-")
+
+    def __mul__(self, other: Any) -> "Expr":
+        return _binary("multiply", self, other, "*")
+
+    def __rmul__(self, other: Any) -> "Expr":
+        return _binary("multiply", other, self, "*")
+
+    def __truediv__(self, other: Any) -> "Expr":
+        return _binary("divide", self, other, "/")
+
+    def __rtruediv__(self, other: Any) -> "Expr":
+        return _binary("divide", other, self, "/")
+
+    def __eq__(self, other: Any) -> "Expr":
+        return _binary("equal", self, other, "==")
+
+    def __ne__(self, other: Any) -> "Expr":
+        return _binary("not_equal", self, other, "!=")
+
+    def __lt__(self, other: Any) -> "Expr":
+        return _binary("less", self, other, "<")
+
+    def __le__(self, other: Any) -> "Expr":
+        return _binary("less_equal", self, other, "<=")
+
+    def __gt__(self, other: Any) -> "Expr":
+        return _binary("greater", self, other, ">")
+
+    def __ge__(self, other: Any) -> "Expr":
+        return _binary("greater_equal", self, other, ">=")
+
+    def __and__(self, other: Any) -> "Expr":
+        return _binary("and_kleene", self, other, "&")
+
+    def __rand__(self, other: Any) -> "Expr":
+        return _binary("and_kleene", other, self, "&")
+
+    def __or__(self, other: Any) -> "Expr":
+        return _binary("or_kleene", self, other, "|")
+
+    def __ror__(self, other: Any) -> "Expr":
+        return _binary("or_kleene", other, self, "|")
+
+    def __invert__(self) -> "Expr":
+        return _CallExpr("invert", [self], "~{0}")
+
+    def __neg__(self) -> "Expr":
+        return _CallExpr("negate", [self], "-{0}")
+
+    # Expressions override `__eq__`, so they can't be hashed.
+    __hash__ = None
+
+
+class _ColumnExpr(Expr):
+    """An expression referencing a column."""
+
+    def __init__(self, name: str):
+        self._name = name
+
+    def to_pyarrow(self) -> "pyarrow.dataset.Expression":
+        import pyarrow.dataset as pds
+
+        return pds.field(self._name)
+
+    def columns(self) -> List[str]:
+        return [self._name]
+
+    def _evaluate(self, table: "pyarrow.Table") -> "pyarrow.ChunkedArray":
+        if self._name not in table.column_names:
+            raise KeyError(
+                f"The column '{self._name}' does not exist in the schema "
+                f"'{table.schema}'."
+            )
+        return table.column(self._name)
+
+    def __repr__(self) -> str:
+        return f"col({self._name!r})"
+
+
+class _LiteralExpr(Expr):
+    """An expression of a constant value."""
+
+    def __init__(self, value: Any):
+        self._value = value
+
+    def to_pyarrow(self) -> "pyarrow.dataset.Expression":
+        import pyarrow.dataset as pds
+
+        return pds.scalar(self._value)
+
+    def columns(self) -> List[str]:
+        return []
+
+    def _evaluate(self, table: "pyarrow.Table") -> "pyarrow.Scalar":
+        import pyarrow as pa
+
+        return pa.scalar(self._value)
+
+    def __repr__(self) -> str:
+        return f"lit({self._value!r})"
+
+
+class _CallExpr(Expr):
+    """An expression calling a ``pyarrow.compute`` function on other expressions."""
+
+    def __init__(self, function_name: str, args: List[Expr], repr_format: str):
+        self._function_name = function_name
+        self._args = args
+        self._repr_format = repr_format
+
+    def to_pyarrow(self) -> "pyarrow.dataset.Expression":
+        import pyarrow.dataset as pds
+
+        return pds.Expression._call(
+            self._function_name, [arg.to_pyarrow() for arg in self._args]
+        )
+
+    def columns(self) -> List[str]:
+        columns = []
+        for arg in self._args:
+            for column in arg.columns():
+                if column not in columns:
+                    columns.append(column)
+        return columns
+
+    def _evaluate(
+        self, table: "pyarrow.Table"
+    ) -> Union["pyarrow.ChunkedArray", "pyarrow.Array", "pyarrow.Scalar"]:
+        import pyarrow.compute as pc
+
+        return pc.call_function(
+            self._function_name, [arg._evaluate(table) for arg in self._args]
+        )
+
+    def __repr__(self) -> str:
+        return self._repr_format.format(*[repr(arg) for arg in self._args])
+
+
+def _binary(function_name: str, left: Any, right: Any, symbol: str) -> Expr:
+    return _CallExpr(
+        function_name, [_to_expr(left), _to_expr(right)], f"({{0}} {symbol} {{1}})"
+    )
+
+
+def _to_expr(value: Any) -> Expr:
+    if isinstance(value, Expr):
+        return value
+    return _LiteralExpr(value)
+
+
+@PublicAPI(stability="alpha")
+def col(name: str) -> Expr:
+    """Return an expression referencing the column with the given name.
+
+    Examples:
+        >>> import ray
+        >>> from ray.data import col
+        >>> ds = ray.data.range(10)
+        >>> ds.filter(expr=col("id") > 7).take_all()
+        [{'id': 8}, {'id': 9}]
+
+    Args:
+        name: The name of the column.
+    """
+    return _ColumnExpr(name)
+
+
+@PublicAPI(stability="alpha")
+def lit(value: Any) -> Expr:
+    """Return an expression of a constant value.
+
+    Python values combined with expressions are converted to literals implicitly,
+    so this is only needed for expressions that don't reference any column.
+
+    Examples:
+        >>> import ray
+        >>> from ray.data import lit
+        >>> ds = ray.data.range(2)
+        >>> ds.add_column("one", lit(1)).take_all()
+        [{'id': 0, 'one': 1}, {'id': 1, 'one': 1}]
+
+    Args:
+        value: The constant value.
+    """
+    return _LiteralExpr(value)
@@ -8,6 +8,10 @@ from ray.data._internal.execution.interfaces import TaskContext
 from ray.data._internal.logical.interfaces import LogicalPlan
 from ray.data._internal.logical.operators.all_to_all_operator import Aggregate
 from ray.data._internal.plan import AllToAllStage
+from ray.data._internal.planner.exchange.aggregate_task_spec import (
+    SortAggregateTaskSpec,
+    _merge_combined_blocks,
+)
 from ray.data._internal.push_based_shuffle import PushBasedShufflePlan
 from ray.data._internal.shuffle import ShuffleOp, SimpleShufflePlan
 from ray.data._internal.sort import SortKey
@@ -35,20 +39,31 @@ class _GroupbyOp(ShuffleOp):
         boundaries: List[KeyType],
         key: str,
         aggs: Tuple[AggregateFn],
+        heavy_hitters: Optional[List[KeyType]] = None,
     ) -> List[Union[BlockMetadata, Block]]:
-        """Partition the block and combine rows with the same key."""
+        """Partition the block and combine rows with the same key.
+
+        The rows of the heavy hitter keys are combined without sorting them, like in
+        `SortAggregateTaskSpec.map`.
+        """
         stats = BlockExecStats.builder()
 
         block = _GroupbyOp._prune_unused_columns(block, key, aggs)
 
+        heavy_parts = {}
         if key is None:
             partitions = [block]
         else:
-            partitions = BlockAccessor.for_block(block).sort_and_partition(
+            rest, heavy_parts = SortAggregateTaskSpec._combine_heavy_hitters(
+                block, boundaries, key, aggs, heavy_hitters or []
+            )
+            partitions = BlockAccessor.for_block(rest).sort_and_partition(
                 boundaries,
                 SortKey(key),
             )
         parts = [BlockAccessor.for_block(p).combine(key, aggs) for p in partitions]
+        for i, combined in heavy_parts.items():
+            parts[i] = _merge_combined_blocks([parts[i]] + combined, key)
         meta = BlockAccessor.for_block(block).get_metadata(
             input_files=None, exec_stats=stats.build()
         )
@@ -154,23 +169,35 @@ class GroupedData:
 
             num_mappers = blocks.initial_num_blocks()
             num_reducers = num_mappers
+            heavy_hitters = []
             if self._key is None:
                 num_reducers = 1
                 boundaries = []
             else:
-                boundaries = sort.sample_boundaries(
+                sorted_samples = sort.sample_keys(
                     blocks.get_blocks(),
                     SortKey(self._key),
                     num_reducers,
                     task_ctx,
                 )
+                if sorted_samples is None:
+                    boundaries = [None] * (num_reducers - 1)
+                else:
+                    boundaries = sort.compute_boundaries(sorted_samples, num_reducers)
+                    heavy_hitters = [
+                        heavy_key
+                        for (heavy_key,), _ in sort.find_heavy_hitters(
+                            sorted_samples, num_reducers
+                        )
+                    ]
             ctx = DataContext.get_current()
             if ctx.use_push_based_shuffle:
                 shuffle_op_cls = PushBasedGroupbyOp
             else:
                 shuffle_op_cls = SimpleShuffleGroupbyOp
             shuffle_op = shuffle_op_cls(
-                map_args=[boundaries, self._key, aggs], reduce_args=[self._key, aggs]
+                map_args=[boundaries, self._key, aggs, heavy_hitters],
+                reduce_args=[self._key, aggs],
             )
             return shuffle_op.execute(
                 blocks,
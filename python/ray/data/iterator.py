@@ -296,6 +296,8 @@ class DataIterator(abc.ABC):
         drop_last: bool = False,
         local_shuffle_buffer_size: Optional[int] = None,
         local_shuffle_seed: Optional[int] = None,
+        pin_memory: bool = False,
+        device_prefetch_batches: int = 0,
         # Deprecated.
         prefetch_blocks: int = 0,
     ) -> Iterable["TorchBatchType"]:
@@ -376,6 +378,14 @@ class DataIterator(abc.ABC):
                 therefore ``batch_size`` must also be specified when using local
                 shuffling.
             local_shuffle_seed: The seed to use for the local random shuffle.
+            pin_memory: Whether to copy the batches into reusable page-locked host
+                buffers before copying them to the device, which makes the copies to
+                GPUs asynchronous. You can't use this parameter with ``collate_fn``.
+            device_prefetch_batches: The number of batches to start copying to the
+                device ahead of the current batch. If greater than 0, the copies to
+                GPUs are made on a separate CUDA stream, overlapping with the use of
+                the current batch. Defaults to 0, which copies each batch when it's
+                fetched. You can't use this parameter with ``collate_fn``.
 
         Returns:
             An iterator over Torch Tensor batches.
@@ -386,11 +396,21 @@ class DataIterator(abc.ABC):
             get_device,
         )
 
-        if collate_fn is not None and (dtypes is not None or device != "auto"):
+        if collate_fn is not None and (
+            dtypes is not None
+            or device != "auto"
+            or pin_memory
+            or device_prefetch_batches > 0
+        ):
             raise ValueError(
-                "collate_fn cannot be used with dtypes and device."
-                "You should manually move the output Torch tensors to the"
-                "desired dtype and device outside of collate_fn."
+                "collate_fn cannot be used with dtypes, device, pin_memory and "
+                "device_prefetch_batches. You should manually move the output Torch "
+                "tensors to the desired dtype and device outside of collate_fn."
+            )
+        if device_prefetch_batches < 0:
+            raise ValueError(
+                "device_prefetch_batches must be non-negative, got "
+                f"{device_prefetch_batches}."
             )
 
         if device == "auto":
@@ -424,7 +444,28 @@ class DataIterator(abc.ABC):
         else:
             finalize_fn = None
 
-        return self.iter_batches(
+        batch_device = None
+        staging_buffer_pool = None
+        if (
+            finalize_fn is not None
+            and device is not None
+            and (pin_memory or device_prefetch_batches > 0)
+        ):
+            from ray.data._internal.block_batching.device_prefetch import (
+                StagingBufferPool,
+                get_batch_device,
+            )
+
+            # Stage the batches in the finalize_fn thread, and copy them to the
+            # device as they're consumed.
+            batch_device = get_batch_device(device)
+            if pin_memory:
+                staging_buffer_pool = StagingBufferPool(batch_device)
+                finalize_fn = staging_buffer_pool.stage
+            else:
+                finalize_fn = None
+
+        batch_iter = self.iter_batches(
             prefetch_batches=prefetch_batches,
             prefetch_blocks=prefetch_blocks,
             batch_size=batch_size,
@@ -434,6 +475,18 @@ class DataIterator(abc.ABC):
             _collate_fn=collate_fn,
             _finalize_fn=finalize_fn,
         )
+        if batch_device is not None:
+            from ray.data._internal.block_batching.device_prefetch import (
+                prefetch_to_device,
+            )
+
+            batch_iter = prefetch_to_device(
+                batch_iter,
+                batch_device,
+                num_batches=device_prefetch_batches,
+                staging_buffer_pool=staging_buffer_pool,
+            )
+        return batch_iter
 
     def iter_tf_batches(
         self,
@@ -12,6 +12,7 @@ from ray.util.annotations import Deprecated, DeveloperAPI, PublicAPI
 if TYPE_CHECKING:
     import numpy as np
     import pandas as pd
+    import pyarrow
 
     from ray.air.data_batch_type import DataBatchType
     from ray.data import Dataset, DatasetPipeline
@@ -45,6 +46,9 @@ class Preprocessor(abc.ABC):
     * ``_transform_pandas`` and/or ``_transform_numpy`` for best performance,
       implement both. Otherwise, the data will be converted to the match the
       implemented method.
+    * ``_transform_arrow`` if the transformation can be done with vectorized
+      ``pyarrow.compute`` kernels. If it's implemented, Datasets are transformed in
+      the Arrow format, without converting the blocks to pandas or NumPy.
     """
 
     class FitStatus(str, Enum):
@@ -216,12 +220,20 @@ class Preprocessor(abc.ABC):
     def _determine_transform_to_use(self) -> BatchFormat:
         """Determine which batch format to use based on Preprocessor implementation.
 
+        * If `_transform_arrow` is implemented, then use ``arrow`` batch format.
         * If only `_transform_pandas` is implemented, then use ``pandas`` batch format.
         * If only `_transform_numpy` is implemented, then use ``numpy`` batch format.
         * If both are implemented, then use the Preprocessor defined preferred batch
         format.
         """
+        if self._has_transform_arrow():
+            return BatchFormat.ARROW
+        return self._determine_pandas_or_numpy_transform_to_use()
 
+    def _has_transform_arrow(self) -> bool:
+        return self.__class__._transform_arrow != Preprocessor._transform_arrow
+
+    def _determine_pandas_or_numpy_transform_to_use(self) -> BatchFormat:
         has_transform_pandas = (
             self.__class__._transform_pandas != Preprocessor._transform_pandas
         )
@@ -260,10 +272,14 @@ class Preprocessor(abc.ABC):
             return ds.map_batches(
                 self._transform_numpy, batch_format=BatchFormat.NUMPY, **kwargs
             )
+        elif transform_type == BatchFormat.ARROW:
+            return ds.map_batches(
+                self._transform_arrow, batch_format="pyarrow", **kwargs
+            )
         else:
             raise ValueError(
                 "Invalid transform type returned from _determine_transform_to_use; "
-                f'"pandas" and "numpy" allowed, but got: {transform_type}'
+                f'"pandas", "numpy" and "arrow" allowed, but got: {transform_type}'
             )
 
     def _get_transform_config(self) -> Dict[str, Any]:
@@ -281,6 +297,7 @@ class Preprocessor(abc.ABC):
         from ray.air.util.data_batch_conversion import (
             _convert_batch_type_to_numpy,
             _convert_batch_type_to_pandas,
+            _convert_pandas_to_batch_type,
         )
 
         try:
@@ -299,10 +316,24 @@ class Preprocessor(abc.ABC):
 
         transform_type = self._determine_transform_to_use()
 
+        if transform_type == BatchFormat.ARROW and not isinstance(data, pyarrow.Table):
+            # Transform other batch types in the format they're closest to, if
+            # there's a transform for it, to avoid round trips through Arrow.
+            try:
+                transform_type = self._determine_pandas_or_numpy_transform_to_use()
+            except NotImplementedError:
+                pass
+
         if transform_type == BatchFormat.PANDAS:
             return self._transform_pandas(_convert_batch_type_to_pandas(data))
         elif transform_type == BatchFormat.NUMPY:
             return self._transform_numpy(_convert_batch_type_to_numpy(data))
+        elif transform_type == BatchFormat.ARROW:
+            if not isinstance(data, pyarrow.Table):
+                data = _convert_pandas_to_batch_type(
+                    _convert_batch_type_to_pandas(data), BatchFormat.ARROW
+                )
+            return self._transform_arrow(data)
 
     @DeveloperAPI
     def _transform_pandas(self, df: "pd.DataFrame") -> "pd.DataFrame":
@@ -316,6 +347,15 @@ class Preprocessor(abc.ABC):
         """Run the transformation on a data batch in a NumPy ndarray format."""
         raise NotImplementedError()
 
+    @DeveloperAPI
+    def _transform_arrow(self, table: "pyarrow.Table") -> "DataBatchType":
+        """Run the transformation on a data batch in a pyarrow Table format.
+
+        Implementations may fall back to ``_transform_pandas`` for columns that
+        can't be transformed with Arrow kernels, and return its pandas DataFrame.
+        """
+        raise NotImplementedError()
+
     @classmethod
     @DeveloperAPI
     def preferred_batch_format(cls) -> BatchFormat:
@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple, Union
 
 from ray.air.util.data_batch_conversion import BatchFormat
 from ray.data import Dataset, DatasetPipeline
@@ -14,6 +14,10 @@ class Chain(Preprocessor):
     When you call ``fit``, each preprocessor is fit on the dataset produced by the
     preceeding preprocessor's ``fit_transform``.
 
+    When you call ``transform``, the transforms of the preprocessors are fused into
+    as few ``map_batches`` calls as possible, so that each batch is transformed by
+    all of them in a single map stage.
+
     Example:
         >>> import pandas as pd
         >>> import ray
@@ -82,13 +86,29 @@ class Chain(Preprocessor):
     def _transform(
         self, ds: Union[Dataset, DatasetPipeline]
     ) -> Union[Dataset, DatasetPipeline]:
-        for preprocessor in self.preprocessors:
-            if isinstance(ds, Dataset):
-                ds = preprocessor.transform(ds)
+        for stage, kwargs in _get_fused_stages(self._flatten()):
+            if len(stage) > 1:
+                ds = ds.map_batches(
+                    _FusedTransform(stage),
+                    batch_format=_get_map_batch_format(stage[0]),
+                    **kwargs,
+                )
+            elif isinstance(ds, Dataset):
+                ds = stage[0].transform(ds)
             elif isinstance(ds, DatasetPipeline):
-                ds = preprocessor._transform_pipeline(ds)
+                ds = stage[0]._transform_pipeline(ds)
         return ds
 
+    def _flatten(self) -> List[Preprocessor]:
+        """Return the preprocessors of this chain, and of the chains in it."""
+        preprocessors = []
+        for preprocessor in self.preprocessors:
+            if isinstance(preprocessor, Chain):
+                preprocessors.extend(preprocessor._flatten())
+            else:
+                preprocessors.append(preprocessor)
+        return preprocessors
+
     def _transform_batch(self, df: "DataBatchType") -> "DataBatchType":
         for preprocessor in self.preprocessors:
             df = preprocessor.transform_batch(df)
@@ -104,3 +124,54 @@ class Chain(Preprocessor):
         # TODO (jiaodong): We should revisit if our Chain preprocessor is
         # still optimal with context of lazy execution.
         return self.preprocessors[0]._determine_transform_to_use()
+
+
+class _FusedTransform:
+    """Applies the transforms of a sequence of preprocessors to a batch."""
+
+    def __init__(self, preprocessors: List[Preprocessor]):
+        self.preprocessors = preprocessors
+
+    def __call__(self, batch: "DataBatchType") -> "DataBatchType":
+        for preprocessor in self.preprocessors:
+            batch = preprocessor._transform_batch(batch)
+        return batch
+
+
+def _get_fused_stages(
+    preprocessors: List[Preprocessor],
+) -> List[Tuple[List[Preprocessor], Dict[str, Any]]]:
+    """Group consecutive preprocessors into stages that can run in one map stage.
+
+    Preprocessors are fused unless they set different ``map_batches`` arguments,
+    e.g. batch sizes, or transform datasets with something other than
+    ``map_batches``.
+
+    Returns:
+        The stages, with the ``map_batches`` arguments of each stage.
+    """
+    stages = []
+    can_fuse_previous = False
+    for preprocessor in preprocessors:
+        kwargs = preprocessor._get_transform_config()
+        can_fuse = type(preprocessor)._transform == Preprocessor._transform
+        if (
+            can_fuse
+            and can_fuse_previous
+            and all(
+                stages[-1][1][k] == v for k, v in kwargs.items() if k in stages[-1][1]
+            )
+        ):
+            stages[-1][0].append(preprocessor)
+            stages[-1][1].update(kwargs)
+        else:
+            stages.append(([preprocessor], dict(kwargs)))
+        can_fuse_previous = can_fuse
+    return stages
+
+
+def _get_map_batch_format(preprocessor: Preprocessor) -> str:
+    transform_type = preprocessor._determine_transform_to_use()
+    if transform_type == BatchFormat.ARROW:
+        return "pyarrow"
+    return transform_type
@@ -1,13 +1,17 @@
 from collections import Counter, OrderedDict
 from functools import partial
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 
 import numpy as np
 import pandas as pd
 import pandas.api.types
+import pyarrow as pa
+import pyarrow.compute as pc
 
+from ray.air.util.data_batch_conversion import _convert_batch_type_to_pandas
 from ray.data import Dataset
 from ray.data.preprocessor import Preprocessor
+from ray.data.preprocessors.utils import _set_arrow_column
 from ray.util.annotations import PublicAPI
 
 
@@ -118,6 +122,22 @@ class OrdinalEncoder(Preprocessor):
         df[self.columns] = df[self.columns].apply(column_ordinal_encoder)
         return df
 
+    def _transform_arrow(self, table: pa.Table):
+        _validate_table(table, *self.columns)
+
+        encoded = {}
+        for column in self.columns:
+            encoded[column] = _index_in(
+                table[column], self.stats_[f"unique_values({column})"]
+            )
+            if encoded[column] is None:
+                # Lists, and values that Arrow can't compare with the categories.
+                return self._transform_pandas(_convert_batch_type_to_pandas(table))
+
+        for column, indices in encoded.items():
+            table = _set_arrow_column(table, column, indices)
+        return table
+
     def __repr__(self):
         return (
             f"{self.__class__.__name__}(columns={self.columns!r}, "
@@ -233,6 +253,31 @@ class OneHotEncoder(Preprocessor):
         df = df.drop(columns=list(columns_to_drop))
         return df
 
+    def _transform_arrow(self, table: pa.Table):
+        _validate_table(table, *self.columns)
+
+        encoded = {}
+        for column in self.columns:
+            encoded[column] = _index_in(
+                table[column], self.stats_[f"unique_values({column})"]
+            )
+            if encoded[column] is None:
+                # Lists, and values that Arrow can't compare with the categories.
+                return self._transform_pandas(_convert_batch_type_to_pandas(table))
+
+        # Compute new one-hot encoded columns
+        for column, indices in encoded.items():
+            column_values = self.stats_[f"unique_values({column})"]
+            for i, column_value in enumerate(column_values):
+                is_value = pc.equal(indices, i).fill_null(False)
+                table = _set_arrow_column(
+                    table, f"{column}_{column_value}", is_value.cast(pa.int64())
+                )
+        # Drop original unencoded columns.
+        return table.select(
+            [column for column in table.column_names if column not in encoded]
+        )
+
     def __repr__(self):
         return (
             f"{self.__class__.__name__}(columns={self.columns!r}, "
@@ -341,6 +386,21 @@ class MultiHotEncoder(Preprocessor):
 
         return df
 
+    def _transform_arrow(self, table: pa.Table):
+        _validate_table(table, *self.columns)
+
+        encoded = {}
+        for column in self.columns:
+            encoded[column] = _multi_hot_encode(
+                table[column], self.stats_[f"unique_values({column})"]
+            )
+            if encoded[column] is None:
+                return self._transform_pandas(_convert_batch_type_to_pandas(table))
+
+        for column, counts in encoded.items():
+            table = _set_arrow_column(table, column, counts)
+        return table
+
     def __repr__(self):
         return (
             f"{self.__class__.__name__}(columns={self.columns!r}, "
@@ -417,6 +477,17 @@ class LabelEncoder(Preprocessor):
         df[self.label_column] = df[self.label_column].transform(column_label_encoder)
         return df
 
+    def _transform_arrow(self, table: pa.Table):
+        _validate_table(table, self.label_column)
+
+        indices = _index_in(
+            table[self.label_column],
+            self.stats_[f"unique_values({self.label_column})"],
+        )
+        if indices is None:
+            return self._transform_pandas(_convert_batch_type_to_pandas(table))
+        return _set_arrow_column(table, self.label_column, indices)
+
     def __repr__(self):
         return f"{self.__class__.__name__}(label_column={self.label_column!r})"
 
@@ -499,6 +570,31 @@ class Categorizer(Preprocessor):
         df = df.astype(self.stats_)
         return df
 
+    def _transform_arrow(self, table: pa.Table):
+        # Dictionary encode the columns with the categories as dictionaries, which
+        # convert to ``pd.CategoricalDtype`` columns.
+        encoded = {}
+        for column, dtype in self.stats_.items():
+            categories = _to_arrow_array(dtype.categories)
+            if categories is not None:
+                indices = _index_in(table[column], categories)
+            if categories is None or indices is None:
+                return self._transform_pandas(_convert_batch_type_to_pandas(table))
+            indices = indices.cast(pa.int32())
+            encoded[column] = pa.chunked_array(
+                [
+                    pa.DictionaryArray.from_arrays(
+                        chunk, categories, ordered=dtype.ordered
+                    )
+                    for chunk in indices.chunks
+                ],
+                type=pa.dictionary(pa.int32(), categories.type, dtype.ordered),
+            )
+
+        for column, categorical in encoded.items():
+            table = _set_arrow_column(table, column, categorical)
+        return table
+
     def __repr__(self):
         return (
             f"{self.__class__.__name__}(columns={self.columns!r}, "
@@ -602,6 +698,86 @@ def _validate_df(df: pd.DataFrame, *columns: str) -> None:
         )
 
 
+def _validate_table(table: pa.Table, *columns: str) -> None:
+    def has_null_values(column: pa.ChunkedArray) -> bool:
+        if column.null_count > 0:
+            return True
+        return pa.types.is_floating(column.type) and pc.any(pc.is_nan(column)).as_py()
+
+    null_columns = [column for column in columns if has_null_values(table[column])]
+    if null_columns:
+        raise ValueError(
+            f"Unable to transform columns {null_columns} because they contain "
+            f"null values. Consider imputing missing values first."
+        )
+
+
+def _to_arrow_array(values) -> Optional[pa.Array]:
+    """Convert the fitted categories of a column to an Arrow array, or return
+    None if Arrow can't represent them, e.g. if they're of mixed types."""
+    try:
+        return pa.array(list(values))
+    except (pa.ArrowInvalid, pa.ArrowTypeError, TypeError):
+        return None
+
+
+def _is_arrow_list_type(type_: pa.DataType) -> bool:
+    return (
+        pa.types.is_list(type_)
+        or pa.types.is_large_list(type_)
+        or pa.types.is_fixed_size_list(type_)
+    )
+
+
+def _index_in(
+    column: pa.ChunkedArray, values: Union[Dict[Any, int], pa.Array]
+) -> Optional[pa.ChunkedArray]:
+    """Return the index of each element of a column in the categories, with nulls
+    for elements that aren't categories.
+
+    This is the vectorized equivalent of mapping the elements with a
+    ``{category: index}`` dict. None is returned if the column can't be encoded with
+    Arrow, e.g. if its elements are lists, or if they can't be compared with the
+    categories.
+    """
+    if _is_arrow_list_type(column.type):
+        return None
+    if not isinstance(values, pa.Array):
+        values = _to_arrow_array(values)
+        if values is None:
+            return None
+    try:
+        return pc.index_in(column, value_set=values).cast(pa.int64())
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+        return None
+
+
+def _multi_hot_encode(
+    column: pa.ChunkedArray, values: Dict[Any, int]
+) -> Optional[pa.ListArray]:
+    """Count the occurrences of each category in the lists of a column, or
+    return None if the column can't be encoded with Arrow."""
+    column = column.combine_chunks()
+    if _is_arrow_list_type(column.type):
+        parents = pc.list_parent_indices(column)
+        elements = pc.list_flatten(column)
+    else:
+        # Scalar elements are encoded like single element lists.
+        parents = pa.array(np.arange(len(column)))
+        elements = column
+    indices = _index_in(elements, values)
+    if indices is None:
+        return None
+
+    is_category = indices.is_valid()
+    rows = parents.filter(is_category).to_numpy()
+    categories = indices.filter(is_category).to_numpy()
+    counts = np.zeros((len(column), len(values)), dtype=np.int64)
+    np.add.at(counts, (rows, categories), 1)
+    offsets = np.arange(len(column) + 1, dtype=np.int32) * len(values)
+    return pa.ListArray.from_arrays(offsets, counts.ravel())
+
+
 def _is_series_composed_of_lists(series: pd.Series) -> bool:
     # we assume that all elements are a list here
     first_not_none_element = next(
@@ -3,11 +3,15 @@ from numbers import Number
 from typing import Dict, List, Optional, Union
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 from pandas.api.types import is_categorical_dtype
 
+from ray.air.util.data_batch_conversion import _convert_batch_type_to_pandas
 from ray.data import Dataset
 from ray.data.aggregate import Mean
 from ray.data.preprocessor import Preprocessor
+from ray.data.preprocessors.utils import _set_arrow_column
 from ray.util.annotations import PublicAPI
 
 
@@ -115,18 +119,20 @@ class SimpleImputer(Preprocessor):
 
         return self
 
-    def _transform_pandas(self, df: pd.DataFrame):
+    def _get_fill_values(self) -> Dict[str, Union[str, Number]]:
         if self.strategy == "mean":
-            new_values = {
-                column: self.stats_[f"mean({column})"] for column in self.columns
-            }
+            return {column: self.stats_[f"mean({column})"] for column in self.columns}
         elif self.strategy == "most_frequent":
-            new_values = {
+            return {
                 column: self.stats_[f"most_frequent({column})"]
                 for column in self.columns
             }
-        elif self.strategy == "constant":
-            new_values = {column: self.fill_value for column in self.columns}
+        else:
+            return {column: self.fill_value for column in self.columns}
+
+    def _transform_pandas(self, df: pd.DataFrame):
+        new_values = self._get_fill_values()
+        if self.strategy == "constant":
             for column, value in new_values.items():
                 if is_categorical_dtype(df.dtypes[column]):
                     df[column] = df[column].cat.add_categories(value)
@@ -134,6 +140,16 @@ class SimpleImputer(Preprocessor):
         df = df.fillna(new_values)
         return df
 
+    def _transform_arrow(self, table: pa.Table):
+        for column, value in self._get_fill_values().items():
+            filled = _fill_missing_values(table[column], value)
+            if filled is None:
+                # Categories have to be added for the fill values, and values of
+                # other types change the column type, which pandas handles.
+                return self._transform_pandas(_convert_batch_type_to_pandas(table))
+            table = _set_arrow_column(table, column, filled)
+        return table
+
     def __repr__(self):
         return (
             f"{self.__class__.__name__}(columns={self.columns!r}, "
@@ -141,6 +157,29 @@ class SimpleImputer(Preprocessor):
         )
 
 
+def _fill_missing_values(
+    column: pa.ChunkedArray, value: Union[str, Number]
+) -> Optional[pa.ChunkedArray]:
+    """Fill the nulls and NaNs of a column with a value, or return None if the
+    value can't be filled in without changing the column type."""
+    if pa.types.is_dictionary(column.type):
+        return None
+    if (
+        pa.types.is_integer(column.type)
+        and isinstance(value, float)
+        and column.null_count > 0
+    ):
+        # Like pandas, which represents the missing integers with NaNs.
+        column = column.cast(pa.float64())
+    try:
+        filled = column.fill_null(value)
+        if pa.types.is_floating(column.type):
+            filled = pc.if_else(pc.is_nan(filled), value, filled).cast(column.type)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+        return None
+    return filled
+
+
 def _get_most_frequent_values(
     dataset: Dataset, *columns: str
 ) -> Dict[str, Union[str, Number]]:
@@ -2,8 +2,11 @@ from typing import List
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 
 from ray.data.preprocessor import Preprocessor
+from ray.data.preprocessors.utils import _set_arrow_column, _to_float_column
 from ray.util.annotations import PublicAPI
 
 
@@ -81,6 +84,16 @@ class Normalizer(Preprocessor):
         "max": lambda cols: np.max(abs(cols), axis=1),
     }
 
+    _arrow_norm_fns = {
+        "l1": lambda cols: _sum_columns([pc.abs(col) for col in cols]),
+        "l2": lambda cols: pc.sqrt(
+            _sum_columns([pc.multiply(col, col) for col in cols])
+        ),
+        "max": lambda cols: pc.max_element_wise(
+            *[pc.abs(col) for col in cols], skip_nulls=True
+        ),
+    }
+
     _is_fittable = False
 
     def __init__(self, columns: List[str], norm="l2"):
@@ -100,7 +113,24 @@ class Normalizer(Preprocessor):
         df.loc[:, self.columns] = columns.div(column_norms, axis=0)
         return df
 
+    def _transform_arrow(self, table: pa.Table) -> pa.Table:
+        columns = [_to_float_column(table[column]) for column in self.columns]
+        column_norms = self._arrow_norm_fns[self.norm](columns)
+
+        for name, column in zip(self.columns, columns):
+            normalized = pc.divide(column, column_norms).cast(column.type)
+            table = _set_arrow_column(table, name, normalized)
+        return table
+
     def __repr__(self):
         return (
             f"{self.__class__.__name__}(columns={self.columns!r}, norm={self.norm!r})"
         )
+
+
+def _sum_columns(columns: List[pa.ChunkedArray]) -> pa.ChunkedArray:
+    # Like pandas, skip the missing values when summing.
+    total = columns[0].fill_null(0)
+    for column in columns[1:]:
+        total = pc.add(total, column.fill_null(0))
+    return total
@@ -2,10 +2,13 @@ from typing import List, Tuple
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 
 from ray.data import Dataset
 from ray.data.aggregate import AbsMax, Max, Mean, Min, Std
 from ray.data.preprocessor import Preprocessor
+from ray.data.preprocessors.utils import _set_arrow_column, _to_float_column
 from ray.util.annotations import PublicAPI
 
 
@@ -89,6 +92,18 @@ class StandardScaler(Preprocessor):
         )
         return df
 
+    def _transform_arrow(self, table: pa.Table) -> pa.Table:
+        for column in self.columns:
+            s_mean = self.stats_[f"mean({column})"]
+            s_std = self.stats_[f"std({column})"]
+            if s_std == 0:
+                s_std = 1
+
+            values = _to_float_column(table[column])
+            scaled = pc.divide(pc.subtract(values, s_mean), s_std)
+            table = _set_arrow_column(table, column, scaled.cast(values.type))
+        return table
+
     def __repr__(self):
         return f"{self.__class__.__name__}(columns={self.columns!r})"
 
@@ -173,6 +188,18 @@ class MinMaxScaler(Preprocessor):
         )
         return df
 
+    def _transform_arrow(self, table: pa.Table) -> pa.Table:
+        for column in self.columns:
+            s_min = self.stats_[f"min({column})"]
+            diff = self.stats_[f"max({column})"] - s_min
+            if diff == 0:
+                diff = 1
+
+            values = _to_float_column(table[column])
+            scaled = pc.divide(pc.subtract(values, s_min), diff)
+            table = _set_arrow_column(table, column, scaled.cast(values.type))
+        return table
+
     def __repr__(self):
         return f"{self.__class__.__name__}(columns={self.columns!r})"
 
@@ -251,6 +278,17 @@ class MaxAbsScaler(Preprocessor):
         )
         return df
 
+    def _transform_arrow(self, table: pa.Table) -> pa.Table:
+        for column in self.columns:
+            s_abs_max = self.stats_[f"abs_max({column})"]
+            if s_abs_max == 0:
+                s_abs_max = 1
+
+            values = _to_float_column(table[column])
+            scaled = pc.divide(values, s_abs_max)
+            table = _set_arrow_column(table, column, scaled.cast(values.type))
+        return table
+
     def __repr__(self):
         return f"{self.__class__.__name__}(columns={self.columns!r})"
 
@@ -368,6 +406,23 @@ class RobustScaler(Preprocessor):
         )
         return df
 
+    def _transform_arrow(self, table: pa.Table) -> pa.Table:
+        for column in self.columns:
+            s_low_q = self.stats_[f"low_quantile({column})"]
+            s_median = self.stats_[f"median({column})"]
+            diff = self.stats_[f"high_quantile({column})"] - s_low_q
+
+            if diff == 0:
+                values = table[column]
+                zeros = np.zeros(len(table), dtype=values.type.to_pandas_dtype())
+                scaled = pa.chunked_array([zeros], type=values.type)
+            else:
+                values = _to_float_column(table[column])
+                scaled = pc.divide(pc.subtract(values, s_median), diff)
+                scaled = scaled.cast(values.type)
+            table = _set_arrow_column(table, column, scaled)
+        return table
+
     def __repr__(self):
         return (
             f"{self.__class__.__name__}(columns={self.columns!r}, "
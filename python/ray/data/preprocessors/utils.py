@@ -1,6 +1,9 @@
 import hashlib
+import json
 from typing import List
 
+import pyarrow as pa
+
 from ray.util.annotations import DeveloperAPI
 
 
@@ -17,3 +20,31 @@ def simple_hash(value: object, num_features: int) -> int:
     hashed_value = hashlib.sha1(encoded_value)
     hashed_value_int = int(hashed_value.hexdigest(), 16)
     return hashed_value_int % num_features
+
+
+def _set_arrow_column(table: pa.Table, name: str, column: pa.ChunkedArray) -> pa.Table:
+    """Replace a column of a table, keeping its position, or append it if the
+    table doesn't have the column."""
+    index = table.schema.get_field_index(name)
+    if index < 0:
+        return table.append_column(name, column)
+    changes_type = table.schema.field(index).type != column.type
+    table = table.set_column(index, name, column)
+    metadata = table.schema.metadata
+    if changes_type and metadata and b"pandas" in metadata:
+        # Drop the pandas dtype of the column, which no longer applies to it.
+        pandas_metadata = json.loads(metadata[b"pandas"])
+        pandas_metadata["columns"] = [
+            c for c in pandas_metadata["columns"] if c["name"] != name
+        ]
+        table = table.replace_schema_metadata(
+            {**metadata, b"pandas": json.dumps(pandas_metadata)}
+        )
+    return table
+
+
+def _to_float_column(column: pa.ChunkedArray) -> pa.ChunkedArray:
+    """Cast a numeric column to floats, like pandas arithmetic does."""
+    if pa.types.is_floating(column.type):
+        return column
+    return column.cast(pa.float64())
@@ -57,13 +57,17 @@ class RandomAccessDataset:
         bounds = ray.get([get_bounds.remote(b, key) for b in blocks])
         self._non_empty_blocks = []
         self._lower_bound = None
+        self._lower_bounds = []
         self._upper_bounds = []
         for i, b in enumerate(bounds):
             if b:
                 self._non_empty_blocks.append(blocks[i])
                 if self._lower_bound is None:
                     self._lower_bound = b[0]
+                self._lower_bounds.append(b[0])
                 self._upper_bounds.append(b[1])
+        # Used to find the blocks of many keys at once.
+        self._upper_bounds_array = _to_search_array(self._upper_bounds)
 
         logger.info("[setup] Creating {} random access workers.".format(num_workers))
         ctx = DataContext.get_current()
@@ -145,30 +149,59 @@ class RandomAccessDataset:
     def multiget(self, keys: List[Any]) -> List[Optional[Any]]:
         """Synchronously find the records for a list of keys.
 
+        The keys are grouped by the worker serving their blocks, so that each worker
+        receives a single request.
+
         Args:
             keys: List of keys to find the records for.
 
         Returns:
             List of found records (in pydict form), or None for missing records.
         """
+        results = [None] * len(keys)
+        if not keys or not self._upper_bounds:
+            return results
+        block_indices = self._find_le_batch(keys)
+
+        # The positions of the keys to find, by the worker to find them with.
         batches = defaultdict(list)
-        for k in keys:
-            batches[self._find_le(k)].append(k)
-        futures = {}
-        for index, keybatch in batches.items():
-            if index is None:
-                continue
-            fut = self._worker_for(index).multiget.remote(
-                [index] * len(keybatch), keybatch
+        workers = {}
+        for block_index in np.unique(block_indices[block_indices >= 0]):
+            workers[block_index] = self._worker_for(block_index)
+        for i, block_index in enumerate(block_indices):
+            if block_index >= 0:
+                batches[workers[block_index]].append(i)
+
+        futures = {
+            worker: worker.multiget.remote(
+                [int(block_indices[i]) for i in positions],
+                [keys[i] for i in positions],
             )
-            futures[index] = fut
-        results = {}
-        for i, fut in futures.items():
-            keybatch = batches[i]
-            values = ray.get(fut)
-            for k, v in zip(keybatch, values):
-                results[k] = v
-        return [results.get(k) for k in keys]
+            for worker, positions in batches.items()
+        }
+        for worker, fut in futures.items():
+            for i, value in zip(batches[worker], ray.get(fut)):
+                results[i] = value
+        return results
+
+    def range(self, start: Any, end: Any) -> List[Any]:
+        """Synchronously find the records with keys in the range ``[start, end)``.
+
+        Args:
+            start: The smallest key of the records to find, inclusive.
+            end: The largest key of the records to find, exclusive.
+
+        Returns:
+            List of found records (in pydict form), sorted by key.
+        """
+        # The blocks that can contain keys in the range.
+        first = bisect.bisect_left(self._upper_bounds, start)
+        last = bisect.bisect_left(self._lower_bounds, end)
+        futures = [
+            self._worker_for(block_index).range.remote(block_index, start, end)
+            for block_index in range(first, last)
+        ]
+        return [record for records in ray.get(futures) for record in records]
 
     def stats(self) -> str:
         """Returns a string containing access timing information."""
@@ -199,17 +232,30 @@ class RandomAccessDataset:
             return None
         return i
 
+    def _find_le_batch(self, keys: List[Any]) -> np.ndarray:
+        """Return the index of the block for each key, or -1 if the key is out of
+        the bounds of the dataset."""
+        keys = _to_search_array(keys)
+        indices = np.searchsorted(self._upper_bounds_array, keys, side="left")
+        indices[(indices >= len(self._upper_bounds)) | (keys < self._lower_bound)] = -1
+        return indices
+
 
 @ray.remote(num_cpus=0)
 class _RandomAccessWorker:
     def __init__(self, key_field):
         self.blocks = None
+        # The sorted key column of each block, as a numpy array.
+        self.indexes = None
         self.key_field = key_field
         self.num_accesses = 0
         self.total_time = 0
 
     def assign_blocks(self, block_ref_dict):
         self.blocks = {k: ray.get(ref) for k, ref in block_ref_dict.items()}
+        self.indexes = {
+            k: _get_index(block, self.key_field) for k, block in self.blocks.items()
+        }
 
     def get(self, block_index, key):
         start = time.perf_counter()
@@ -220,20 +266,28 @@ class _RandomAccessWorker:
 
     def multiget(self, block_indices, keys):
         start = time.perf_counter()
-        block = self.blocks[block_indices[0]]
-        if len(set(block_indices)) == 1 and isinstance(
-            self.blocks[block_indices[0]], pa.Table
-        ):
-            # Fast path: use np.searchsorted for vectorized search on a single block.
-            # This is ~3x faster than the naive case.
-            block = self.blocks[block_indices[0]]
-            col = block[self.key_field]
-            indices = np.searchsorted(col, keys)
-            acc = BlockAccessor.for_block(block)
-            result = [acc._get_row(i) for i in indices]
-            # assert result == [self._get(i, k) for i, k in zip(block_indices, keys)]
-        else:
-            result = [self._get(i, k) for i, k in zip(block_indices, keys)]
+        result = [None] * len(keys)
+        block_indices = np.asarray(block_indices)
+        # Search the index of each block for all of its keys at once.
+        for block_index in np.unique(block_indices):
+            positions = np.flatnonzero(block_indices == block_index)
+            rows = _search_index(
+                self.indexes[block_index], [keys[i] for i in positions]
+            )
+            acc = BlockAccessor.for_block(self.blocks[block_index])
+            for i, row in zip(positions, rows):
+                if row >= 0:
+                    result[i] = acc._get_row(row)
+        self.total_time += time.perf_counter() - start
+        self.num_accesses += 1
+        return result
+
+    def range(self, block_index, start_key, end_key):
+        start = time.perf_counter()
+        index = self.indexes[block_index]
+        lo, hi = np.searchsorted(index, _to_search_array([start_key, end_key]))
+        acc = BlockAccessor.for_block(self.blocks[block_index])
+        result = [acc._get_row(i) for i in range(lo, hi)]
         self.total_time += time.perf_counter() - start
         self.num_accesses += 1
         return result
@@ -251,33 +305,41 @@ class _RandomAccessWorker:
     def _get(self, block_index, key):
         if block_index is None:
             return None
-        block = self.blocks[block_index]
-        column = block[self.key_field]
-        if isinstance(block, pa.Table):
-            column = _ArrowListWrapper(column)
-        i = _binary_search_find(column, key)
-        if i is None:
+        [i] = _search_index(self.indexes[block_index], [key])
+        if i < 0:
             return None
-        acc = BlockAccessor.for_block(block)
+        acc = BlockAccessor.for_block(self.blocks[block_index])
         return acc._get_row(i)
 
 
-def _binary_search_find(column, x):
-    i = bisect.bisect_left(column, x)
-    if i != len(column) and column[i] == x:
-        return i
-    return None
-
-
-class _ArrowListWrapper:
-    def __init__(self, arrow_col):
-        self.arrow_col = arrow_col
-
-    def __getitem__(self, i):
-        return self.arrow_col[i].as_py()
-
-    def __len__(self):
-        return len(self.arrow_col)
+def _get_index(block, key):
+    """Return the sorted key column of a block as a numpy array."""
+    column = block[key]
+    if isinstance(block, pa.Table):
+        return column.to_numpy()
+    return np.asarray(column)
+
+
+def _to_search_array(keys: List[Any]) -> np.ndarray:
+    array = np.asarray(keys)
+    if array.ndim == 1 and array.dtype.kind not in "USVO":
+        return array
+    # Compare strings and other Python objects as objects, like the keys in the
+    # indexes.
+    array = np.empty(len(keys), dtype=object)
+    for i, key in enumerate(keys):
+        array[i] = key
+    return array
+
+
+def _search_index(index: np.ndarray, keys: List[Any]) -> np.ndarray:
+    """Return the position of each key in the sorted index, or -1 if it's missing."""
+    keys = _to_search_array(keys)
+    positions = np.searchsorted(index, keys, side="left")
+    found = positions < len(index)
+    found[found] = index[positions[found]] == keys[found]
+    positions[~found] = -1
+    return positions
 
 
 def _get_bounds(block, key):
@@ -0,0 +1,102 @@
+import pytest
+import torch
+
+from ray.data._internal.block_batching.device_prefetch import (
+    BatchDevice,
+    HostBatchDevice,
+    StagingBufferPool,
+    get_batch_device,
+    prefetch_to_device,
+)
+
+
+class RecordingDevice(BatchDevice):
+    """A CPU device that records the order of the copies and waits."""
+
+    def __init__(self):
+        self.events = []
+        self.num_allocated = 0
+
+    def allocate_staging_buffer(self, shape, dtype):
+        self.num_allocated += 1
+        return torch.empty(shape, dtype=dtype)
+
+    def copy(self, tensor):
+        handle = int(tensor[0])
+        self.events.append(("copy", handle))
+        return tensor.clone(), handle
+
+    def wait(self, tensor, handle):
+        self.events.append(("wait", handle))
+
+    def synchronize(self, handle):
+        self.events.append(("synchronize", handle))
+
+
+@pytest.mark.parametrize("num_batches", [0, 1, 3])
+def test_prefetch_to_device(num_batches):
+    device = RecordingDevice()
+    batches = [{"x": torch.full((4,), i)} for i in range(5)]
+
+    outputs = []
+    for batch in prefetch_to_device(iter(batches), device, num_batches=num_batches):
+        # The copies of the next `num_batches` batches have been started.
+        num_copies = sum(event[0] == "copy" for event in device.events)
+        assert num_copies == min(len(outputs) + 1 + num_batches, len(batches))
+        assert device.events[-1] == ("wait", len(outputs))
+        outputs.append(batch)
+
+    for i, batch in enumerate(outputs):
+        assert torch.equal(batch["x"], torch.full((4,), i))
+
+
+def test_staging_buffer_pool():
+    device = RecordingDevice()
+    pool = StagingBufferPool(device, max_free_buffers=2)
+
+    batches = [torch.full((4,), i) for i in range(6)] + [torch.full((2,), 6)]
+    staged = [pool.stage(batch) for batch in batches[:2]]
+    assert device.num_allocated == 2
+    for batch in prefetch_to_device(
+        iter(staged), device, num_batches=1, staging_buffer_pool=pool
+    ):
+        pass
+
+    # Released buffers are reused for batches of the same shape, once the copies
+    # from them have finished.
+    staged = pool.stage(batches[2])
+    assert device.num_allocated == 2
+    assert device.events[-1] == ("synchronize", 0)
+    assert torch.equal(staged, batches[2])
+
+    # Batches of other shapes get new buffers.
+    staged = pool.stage(batches[6])
+    assert device.num_allocated == 3
+    assert torch.equal(staged, batches[6])
+
+
+def test_pin_memory_iteration_on_cpu():
+    device = get_batch_device("cpu")
+    assert isinstance(device, HostBatchDevice)
+    pool = StagingBufferPool(device)
+
+    def staged_batches():
+        for i in range(10):
+            yield pool.stage({"x": torch.full((8,), i), "y": torch.arange(8) + i})
+
+    outputs = list(
+        prefetch_to_device(
+            staged_batches(), device, num_batches=2, staging_buffer_pool=pool
+        )
+    )
+    # The outputs don't share memory with the reused staging buffers.
+    assert pool.num_allocated <= 8
+    for i, batch in enumerate(outputs):
+        assert torch.equal(batch["x"], torch.full((8,), i))
+        assert torch.equal(batch["y"], torch.arange(8) + i)
+
+
+if __name__ == "__main__":
+    import sys
+
+    sys.exit(pytest.main(["-v", __file__]))
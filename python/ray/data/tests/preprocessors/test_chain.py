@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 import pandas as pd
 import pytest
 
@@ -221,6 +223,45 @@ def test_nested_chain():
     assert pred_out_df.equals(pred_expected_df)
 
 
+def test_chain_fuses_transforms():
+    """Tests that the transforms of a Chain run in as few map stages as possible."""
+    col_a = [-1, -1, 1, 1]
+    col_b = [1, 1, 1, None]
+    col_c = ["sunday", "monday", "tuesday", "tuesday"]
+    in_df = pd.DataFrame.from_dict({"A": col_a, "B": col_b, "C": col_c})
+    ds = ray.data.from_pandas(in_df)
+
+    def udf(df):
+        df["A"] *= 2
+        return df
+
+    def create_chain(batch_size):
+        batch_mapper = BatchMapper(fn=udf, batch_format="pandas", batch_size=2)
+        imputer = SimpleImputer(["B"])
+        scaler = StandardScaler(["A", "B"])
+        encoder = LabelEncoder("C")
+        identity = BatchMapper(
+            fn=lambda df: df, batch_format="pandas", batch_size=batch_size
+        )
+        return Chain(Chain(scaler, imputer), batch_mapper, encoder, identity)
+
+    expected_df = pd.DataFrame.from_dict(
+        {"A": [-2.0, -2.0, 2.0, 2.0], "B": [0.0, 0.0, 0.0, 0.0], "C": [1, 0, 2, 2]}
+    )
+    for batch_size, num_stages in [(2, 1), (4, 2)]:
+        chain = create_chain(batch_size)
+        chain.fit(ds)
+        with patch.object(
+            ray.data.Dataset,
+            "map_batches",
+            autospec=True,
+            side_effect=ray.data.Dataset.map_batches,
+        ) as mock_map_batches:
+            out_df = chain.transform(ds).to_pandas()
+        assert mock_map_batches.call_count == num_stages
+        assert out_df.equals(expected_df)
+
+
 class PreprocessorWithoutTransform(Preprocessor):
     pass
 
@@ -239,7 +280,7 @@ def test_determine_transform_to_use():
     preprocessor = SimpleImputer(["A"])
     chain1 = Chain(preprocessor)
     format1 = chain1._determine_transform_to_use()
-    assert format1 == BatchFormat.PANDAS
+    assert format1 == BatchFormat.ARROW
 
     chain2 = Chain(chain1)
     format2 = chain2._determine_transform_to_use()
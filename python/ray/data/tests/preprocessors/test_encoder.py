@@ -1,5 +1,6 @@
 import numpy as np
 import pandas as pd
+import pyarrow as pa
 import pytest
 
 import ray
@@ -577,6 +578,47 @@ def test_categorizer(predefined_dtypes):
     assert pred_out_df.dtypes["C"] == expected_dtypes["C"]
 
 
+@pytest.mark.parametrize(
+    "encoder",
+    [
+        OrdinalEncoder(["B", "C"]),
+        OneHotEncoder(["B", "C"]),
+        MultiHotEncoder(["B", "D"]),
+        LabelEncoder("B"),
+        Categorizer(["B", "C"]),
+    ],
+)
+def test_encoder_arrow_transform(encoder):
+    """Tests that encoders transform Arrow batches like pandas batches."""
+    col_a = [0, 1, 2, 3]
+    col_b = ["red", "green", "blue", "red"]
+    col_c = [1, 10, 5, 10]
+    col_d = [["warm"], [], ["hot", "warm", "cold"], ["cold", "cold"]]
+    in_df = pd.DataFrame.from_dict({"A": col_a, "B": col_b, "C": col_c, "D": col_d})
+    ds = ray.data.from_pandas(in_df)
+    encoder.fit(ds)
+
+    pred_in_df = pd.DataFrame.from_dict(
+        {
+            "A": [4, 5],
+            "B": ["blue", "yellow"],
+            "C": [10, 7],
+            "D": [["warm", "cold"], ["tepid", "warm"]],
+        }
+    )
+    pred_out_table = encoder.transform_batch(pa.Table.from_pandas(pred_in_df))
+    assert isinstance(pred_out_table, pa.Table)
+
+    pred_out_df = pred_out_table.to_pandas()
+    pred_expected_df = encoder.transform_batch(pred_in_df.copy())
+    # Arrow lists convert to arrays.
+    pred_out_df["D"] = pred_out_df["D"].map(list)
+    pred_expected_df["D"] = pred_expected_df["D"].map(list)
+    pd.testing.assert_frame_equal(
+        pred_out_df, pred_expected_df, check_dtype=False, check_categorical=False
+    )
+
+
 if __name__ == "__main__":
     import sys
 
@@ -383,6 +383,40 @@ def test_numpy_pandas_support_transform_batch_arrow(create_dummy_preprocessors):
     )
 
 
+def test_arrow_support_transform():
+    class DummyPreprocessorWithArrow(Preprocessor):
+        _is_fittable = False
+
+        def _transform_arrow(self, table: pyarrow.Table) -> pyarrow.Table:
+            return table
+
+    class DummyPreprocessorWithArrowAndPandas(DummyPreprocessorWithArrow):
+        def _transform_pandas(self, df: "pd.DataFrame") -> "pd.DataFrame":
+            return df
+
+    with_arrow = DummyPreprocessorWithArrow()
+    with_arrow_and_pandas = DummyPreprocessorWithArrowAndPandas()
+
+    df = pd.DataFrame([[1, 2, 3], [4, 5, 6]], columns=["A", "B", "C"])
+    ds = ray.data.from_pandas(df)
+
+    # Arrow is used for datasets whenever it's implemented.
+    for preprocessor in [with_arrow, with_arrow_and_pandas]:
+        with patch.object(ray.data.dataset.Dataset, "map_batches") as mock_map_batches:
+            preprocessor.transform(ds)
+        mock_map_batches.assert_called_once_with(
+            preprocessor._transform_arrow, batch_format="pyarrow"
+        )
+        assert preprocessor.transform(ds).to_pandas().equals(df)
+
+    table = pyarrow.Table.from_pandas(df)
+    assert isinstance(with_arrow.transform_batch(table), pyarrow.Table)
+    assert isinstance(with_arrow.transform_batch(df), pyarrow.Table)
+    assert isinstance(with_arrow_and_pandas.transform_batch(table), pyarrow.Table)
+    # Other batches are transformed without converting them to Arrow.
+    assert isinstance(with_arrow_and_pandas.transform_batch(df), pd.DataFrame)
+
+
 def test_numpy_pandas_support_transform_batch_tensor(create_dummy_preprocessors):
     # Case 4: tensor dataset created by from numpy data directly
     (
@@ -1,4 +1,5 @@
 import pandas as pd
+import pyarrow as pa
 import pytest
 
 import ray
@@ -240,6 +241,32 @@ def test_standard_scaler():
     assert pred_out_df.equals(pred_expected_df)
 
 
+@pytest.mark.parametrize(
+    "scaler",
+    [
+        StandardScaler(["B", "C"]),
+        MinMaxScaler(["B", "C"]),
+        MaxAbsScaler(["B", "C"]),
+        RobustScaler(["B", "C"]),
+    ],
+)
+def test_scaler_arrow_transform(scaler):
+    """Tests that scalers transform Arrow batches like pandas batches."""
+    col_a = [-1, 0, 1, 2]
+    col_b = [1, 1, 5, 5]
+    col_c = [1.0, 1.0, 1.0, 1.0]
+    in_df = pd.DataFrame.from_dict({"A": col_a, "B": col_b, "C": col_c})
+    ds = ray.data.from_pandas(in_df)
+    scaler.fit(ds)
+
+    pred_in_df = pd.DataFrame.from_dict({"A": [1, 2], "B": [3, None], "C": [2.0, 1.0]})
+    pred_out_table = scaler.transform_batch(pa.Table.from_pandas(pred_in_df))
+    assert isinstance(pred_out_table, pa.Table)
+
+    pred_expected_df = scaler.transform_batch(pred_in_df.copy())
+    pd.testing.assert_frame_equal(pred_out_table.to_pandas(), pred_expected_df)
+
+
 if __name__ == "__main__":
     import sys
 
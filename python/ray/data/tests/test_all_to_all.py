@@ -9,10 +9,27 @@ import pyarrow as pa
 import pytest
 
 import ray
-from ray.data.aggregate import AggregateFn, Count, Max, Mean, Min, Quantile, Std, Sum
+from ray.data._internal.planner.exchange.aggregate_task_spec import (
+    SortAggregateTaskSpec,
+)
+from ray.data.aggregate import (
+    AggregateFn,
+    ApproxCountDistinct,
+    ApproxQuantile,
+    ApproxTopK,
+    Count,
+    Max,
+    Mean,
+    Min,
+    Quantile,
+    Std,
+    Sum,
+)
+from ray.data.block import BlockAccessor
 from ray.data.context import DataContext
+from ray.data.grouped_data import _GroupbyOp
 from ray.data.tests.conftest import *  # noqa
-from ray.data.tests.util import column_udf, named_values
+from ray.data.tests.util import column_udf, extract_values, named_values
 from ray.tests.conftest import *  # noqa
 
 
@@ -135,6 +152,93 @@ def test_zip_preserve_order(ray_start_regular_shared):
     ), result
 
 
+@pytest.mark.parametrize(
+    "how,strategy",
+    [
+        ("inner", "hash"),
+        ("left", "hash"),
+        ("right", "hash"),
+        ("outer", "hash"),
+        ("inner", "broadcast"),
+        ("left", "broadcast"),
+    ],
+)
+def test_join(ray_start_regular_shared, how, strategy):
+    left = pd.DataFrame({"id": list(range(10)), "a": [i * 10 for i in range(10)]})
+    right = pd.DataFrame({"id": list(range(5, 15)), "b": [str(i) for i in range(10)]})
+    ds1 = ray.data.from_pandas(left).repartition(3)
+    ds2 = ray.data.from_pandas(right).repartition(4)
+
+    ds = ds1.join(ds2, on="id", how=how, strategy=strategy)
+    assert set(ds.schema().names) == {"id", "a", "b"}
+    expected = left.merge(right, on="id", how=how)
+    expected = expected.sort_values("id").reset_index(drop=True)
+    result = ds.to_pandas()[expected.columns]
+    result = result.sort_values("id").reset_index(drop=True)
+    pd.testing.assert_frame_equal(result, expected, check_dtype=False)
+
+
+def test_join_multi_key_and_duplicate_columns(ray_start_regular_shared):
+    ds1 = ray.data.from_items(
+        [{"k1": i % 3, "k2": i % 2, "v": i} for i in range(12)], parallelism=4
+    )
+    ds2 = ray.data.from_items(
+        [{"x1": i % 3, "x2": i % 2, "v": -i} for i in range(6)], parallelism=2
+    )
+    ds = ds1.join(
+        ds2, on=["k1", "k2"], right_on=["x1", "x2"], num_outputs=3, strategy="hash"
+    )
+    assert ds.num_blocks() == 3
+    assert set(ds.schema().names) == {"k1", "k2", "v", "v_1"}
+    result = sorted((r["v"], r["v_1"]) for r in ds.take_all())
+    assert result == sorted((i, -(i % 6)) for i in range(12))
+
+
+def test_join_nulls_on_one_side(ray_start_regular_shared):
+    # The left keys have nulls, so they'd be floats in pandas, but must still be
+    # assigned to the same partitions as the int keys on the right.
+    left = pa.table(
+        {"id": pa.array([i if i % 3 else None for i in range(30)]), "a": range(30)}
+    )
+    right = pa.table({"id": pa.array(range(30)), "b": range(30)})
+    ds1 = ray.data.from_arrow(left).repartition(3)
+    ds2 = ray.data.from_arrow(right).repartition(4)
+
+    ds = ds1.join(ds2, on="id", num_outputs=8, strategy="hash")
+    result = sorted((row["id"], row["a"], row["b"]) for row in ds.take_all())
+    assert result == [(i, i, i) for i in range(30) if i % 3]
+
+
+def test_join_errors(ray_start_regular_shared):
+    ds = ray.data.range(10)
+    with pytest.raises(ValueError, match="Invalid join type"):
+        ds.join(ds, on="id", how="cross")
+    with pytest.raises(ValueError, match="same length"):
+        ds.join(ds, on="id", right_on=["id", "id"])
+    with pytest.raises(ValueError, match="Invalid join strategy"):
+        ds.join(ds, on="id", strategy="sort_merge")
+    with pytest.raises(ValueError, match="only supports"):
+        ds.join(ds, on="id", how="outer", strategy="broadcast")
+    with pytest.raises(ValueError, match="does not exist"):
+        ds.join(ds, on="missing").materialize()
+
+
+def test_join_auto_broadcast(ray_start_regular_shared, restore_data_context):
+    ds1 = ray.data.range(100, parallelism=10)
+    ds2 = ray.data.from_items([{"id": i, "v": i * 2} for i in range(0, 100, 10)])
+
+    # The right hand side is below the threshold, so it's broadcast without a
+    # shuffle, and the block order of the left hand side is preserved.
+    ds = ds1.join(ds2, on="id").materialize()
+    assert "JoinMap" not in ds.stats()
+    assert extract_values("id", ds.take_all()) == list(range(0, 100, 10))
+
+    DataContext.get_current().broadcast_join_threshold_bytes = 0
+    ds = ds1.join(ds2, on="id").materialize()
+    assert "JoinMap" in ds.stats()
+    assert sorted(extract_values("id", ds.take_all())) == list(range(0, 100, 10))
+
+
 def test_empty_shuffle(ray_start_regular_shared):
     ds = ray.data.range(100, parallelism=100)
     ds = ds.filter(lambda x: x)
@@ -859,6 +963,83 @@ def test_groupby_arrow_multi_agg(ray_start_regular_shared, num_parts):
             assert result == expected
 
 
+@pytest.mark.parametrize("ds_format", ["arrow", "pandas"])
+def test_groupby_map_side_combine(ds_format):
+    xs = list(range(1000))
+    random.shuffle(xs)
+    block = pd.DataFrame({"A": [x % 10 for x in xs], "B": xs})
+    if ds_format == "arrow":
+        block = pa.Table.from_pandas(block)
+
+    # Each map task outputs one partially combined row per distinct key.
+    aggs = [Count(), Sum("B")]
+    *parts, meta = SortAggregateTaskSpec.map(0, block, 2, [(5,)], "A", aggs, [])
+    assert meta.num_rows == 1000
+    assert [BlockAccessor.for_block(part).num_rows() for part in parts] == [5, 5]
+
+    result, _ = SortAggregateTaskSpec.reduce("A", aggs, *parts)
+    assert list(BlockAccessor.for_block(result).iter_rows(True)) == [
+        {"A": k, "count()": 100, "sum(B)": sum(x for x in xs if x % 10 == k)}
+        for k in range(10)
+    ]
+
+
+@pytest.mark.parametrize("ds_format", ["arrow", "pandas"])
+def test_groupby_skewed_key(
+    ray_start_regular_shared, ds_format, use_push_based_shuffle
+):
+    # Key 0 makes up most of the rows, so it's combined as a heavy hitter.
+    xs = [0] * 900 + list(range(1, 101))
+    random.shuffle(xs)
+    df = pd.DataFrame({"A": xs, "B": range(len(xs))})
+    ds = ray.data.from_pandas(df).repartition(10)
+    if ds_format == "pandas":
+        ds = ds.map_batches(lambda x: x, batch_size=None, batch_format="pandas")
+
+    agg_ds = ds.groupby("A").aggregate(Count(), Sum("B"), Mean("B"), Std("B"))
+    agg_ds = agg_ds.materialize()
+    agg_df = agg_ds.to_pandas()
+    assert agg_df["A"].tolist() == list(range(101))
+    expected_grouped = df.groupby("A")["B"]
+    np.testing.assert_array_equal(
+        agg_df["count()"].to_numpy(), expected_grouped.count().to_numpy()
+    )
+    for agg in ["sum", "mean", "std"]:
+        np.testing.assert_array_almost_equal(
+            agg_df[f"{agg}(B)"].to_numpy(), getattr(expected_grouped, agg)().to_numpy()
+        )
+    assert "'num_heavy_hitter_keys': 1" in agg_ds.stats()
+
+
+def test_groupby_skewed_key_legacy(
+    ray_start_regular_shared, restore_data_context, use_push_based_shuffle
+):
+    # Without the optimizer, the aggregation runs as a legacy AllToAllStage, which
+    # also combines the heavy hitter keys.
+    DataContext.get_current().optimizer_enabled = False
+    xs = [0] * 900 + list(range(1, 101))
+    random.shuffle(xs)
+    df = pd.DataFrame({"A": xs, "B": range(len(xs))})
+    ds = ray.data.from_pandas(df).repartition(10)
+
+    agg_df = ds.groupby("A").aggregate(Count(), Sum("B")).to_pandas()
+    assert agg_df["A"].tolist() == list(range(101))
+    expected_grouped = df.groupby("A")["B"]
+    np.testing.assert_array_equal(
+        agg_df["count()"].to_numpy(), expected_grouped.count().to_numpy()
+    )
+    np.testing.assert_array_equal(
+        agg_df["sum(B)"].to_numpy(), expected_grouped.sum().to_numpy()
+    )
+
+    # The map combines the rows of the heavy hitter key into a single row of the
+    # partition that the key belongs to.
+    block = pa.table({"A": [0, 2, 0, 1, 0], "B": [1, 2, 3, 4, 5]})
+    *parts, _ = _GroupbyOp.map(0, block, 2, [(1,)], "A", [Sum("B")], [0])
+    assert BlockAccessor.for_block(parts[0]).to_pandas().values.tolist() == [[0, 9]]
+    assert BlockAccessor.for_block(parts[1]).to_pandas()["A"].tolist() == [1, 2]
+
+
 @pytest.mark.parametrize("num_parts", [1, 30])
 def test_groupby_arrow_multi_agg_alias(ray_start_regular_shared, num_parts):
     seed = int(time.time())
@@ -918,6 +1099,90 @@ def test_groupby_arrow_multi_agg_alias(ray_start_regular_shared, num_parts):
             assert result == expected
 
 
+@pytest.mark.parametrize("num_parts", [1, 2, 30])
+def test_approx_aggregates(ray_start_regular_shared, num_parts):
+    rng = np.random.default_rng(0)
+    xs = rng.normal(size=10000)
+    labels = rng.choice(["a", "b", "c"], size=10000, p=[0.6, 0.3, 0.1])
+    df = pd.DataFrame({"A": xs, "B": labels, "C": np.arange(10000) % 1000})
+    ds = ray.data.from_pandas(df).repartition(num_parts)
+
+    result = ds.aggregate(
+        ApproxCountDistinct("C"),
+        ApproxQuantile("A", q=[0.1, 0.5, 0.9]),
+        ApproxTopK("B", k=2, alias_name="top"),
+    )
+    assert abs(result["approx_count_distinct(C)"] - 1000) <= 30
+    for q, value in zip([0.1, 0.5, 0.9], result["approx_quantile(A)"]):
+        assert abs(np.mean(xs <= value) - q) <= 0.02
+    assert [item["value"] for item in result["top"]] == ["a", "b"]
+
+    # Test the approximate aggregations per group.
+    result = (
+        ds.groupby("B")
+        .aggregate(ApproxCountDistinct("C"), ApproxQuantile("A"))
+        .sort("B")
+        .take_all()
+    )
+    assert [row["B"] for row in result] == ["a", "b", "c"]
+    for row in result:
+        group = df[df["B"] == row["B"]]
+        expected = group["C"].nunique()
+        assert abs(row["approx_count_distinct(C)"] - expected) <= 0.03 * expected
+        assert abs(np.mean(group["A"] <= row["approx_quantile(A)"]) - 0.5) <= 0.02
+
+    with pytest.raises(ValueError):
+        ApproxQuantile("A", q=1.5)
+
+
+def test_approx_aggregates_nulls(ray_start_regular_shared):
+    ds = ray.data.from_items(
+        [{"A": x, "B": None if x % 2 else str(x % 4)} for x in range(100)]
+        + [{"A": None, "B": None}]
+    )
+    result = ds.aggregate(
+        ApproxCountDistinct("A"),
+        ApproxCountDistinct("B"),
+        ApproxQuantile("A", q=[0.0, 1.0]),
+        ApproxTopK("B"),
+    )
+    assert result["approx_count_distinct(A)"] == 100
+    assert result["approx_count_distinct(B)"] == 2
+    assert result["approx_quantile(A)"] == [0, 99]
+    assert result["approx_top_k(B)"] == [
+        {"value": "0", "count": 25},
+        {"value": "2", "count": 25},
+    ]
+
+    # Empty groups have no quantiles.
+    ds = ray.data.from_items([{"A": None}, {"A": None}])
+    assert ds.aggregate(ApproxQuantile("A"))["approx_quantile(A)"] is None
+
+
+def test_dataset_summary(ray_start_regular_shared):
+    ds = ray.data.from_items(
+        [{"A": i, "B": str(i % 3), "C": [i]} for i in range(99)]
+        + [{"A": None, "B": None, "C": None}],
+        parallelism=4,
+    )
+    summary = ds.summary()
+    assert list(summary.index) == ["A", "B", "C"]
+    assert summary.loc["A", "count"] == 99
+    assert summary.loc["A", "null_count"] == 1
+    assert summary.loc["A", "approx_count_distinct"] == 99
+    assert summary.loc["A", "min"] == 0
+    assert summary.loc["A", "max"] == 98
+    assert summary.loc["A", "mean"] == 49
+    assert abs(summary.loc["A", "approx_50%"] - 49) <= 1
+    assert summary.loc["B", "count"] == 99
+    assert summary.loc["B", "approx_count_distinct"] == 3
+    assert [item["count"] for item in summary.loc["B", "approx_top_k"]] == [33] * 3
+    assert pd.isnull(summary.loc["B", "mean"])
+    # Statistics of list columns other than the counts aren't computed.
+    assert summary.loc["C", "null_count"] == 1
+    assert pd.isnull(summary.loc["C", "approx_count_distinct"])
+
+
 @pytest.mark.parametrize("num_parts", [1, 2, 30])
 def test_groupby_map_groups_for_none_groupkey(ray_start_regular_shared, num_parts):
     ds = ray.data.from_items(list(range(100)))
@@ -5,10 +5,7 @@ import pytest
 
 import ray
 from ray.data._internal.batcher import Batcher, ShufflingBatcher
-
-
-def gen_block(num_rows):
-    return pa.table({"foo": [1] * num_rows})
+from ray.data.block import BlockAccessor
 
 
 def test_shuffling_batcher():
@@ -27,51 +24,36 @@ def test_shuffling_batcher():
         batch_size=batch_size,
         shuffle_buffer_min_size=buffer_size,
     )
+    yielded = []
+    next_row = 0
 
-    def add_and_check(
-        num_rows,
-        materialized_buffer_size,
-        pending_buffer_size,
-        expect_has_batch=False,
-        no_nexting_yet=True,
-    ):
-        block = gen_block(num_rows)
+    def add_and_check(num_rows, expected_buffer_size, expect_has_batch=False):
+        nonlocal next_row
+        block = pa.table({"foo": list(range(next_row, next_row + num_rows))})
+        next_row += num_rows
         batcher.add(block)
         if expect_has_batch:
             assert batcher.has_batch()
         else:
             assert not batcher.has_batch()
-
-        if no_nexting_yet:
-            # Check that no shuffle buffer has been materialized yet.
-            assert batcher._shuffle_buffer is None
-            assert batcher._batch_head == 0
-
-        assert batcher._builder.num_rows() == pending_buffer_size
-        assert batcher._materialized_buffer_size() == materialized_buffer_size
+        assert batcher._num_rows == expected_buffer_size
 
     def next_and_check(
-        current_cursor,
-        materialized_buffer_size,
-        pending_buffer_size,
+        expected_buffer_size,
         should_batch_be_full=True,
         should_have_batch_after=True,
-        new_data_added=False,
     ):
         if should_batch_be_full:
             assert batcher.has_batch()
         else:
-            batcher.has_any()
-        if new_data_added:
-            # If new data was added, the builder should be non-empty.
-            assert batcher._builder.num_rows() > 0
+            assert batcher.has_any()
         batch = batcher.next_batch()
 
         if should_batch_be_full:
             assert len(batch) == batch_size
+        yielded.extend(batch["foo"].to_pylist())
 
-        assert batcher._builder.num_rows() == pending_buffer_size
-        assert batcher._materialized_buffer_size() == materialized_buffer_size
+        assert batcher._num_rows == expected_buffer_size
 
         if should_have_batch_after:
             assert batcher.has_batch()
@@ -80,92 +62,117 @@ def test_shuffling_batcher():
 
     # Add less than a batch.
     # Buffer not full and no batch slack.
-    add_and_check(3, materialized_buffer_size=0, pending_buffer_size=3)
+    add_and_check(3, expected_buffer_size=3)
 
     # Add to more than a batch (total=10).
     # Buffer not full and no batch slack.
-    add_and_check(7, materialized_buffer_size=0, pending_buffer_size=10)
+    add_and_check(7, expected_buffer_size=10)
 
     # Fill up to buffer (total=20).
     # Buffer is full but no batch slack.
-    add_and_check(10, materialized_buffer_size=0, pending_buffer_size=20)
+    add_and_check(10, expected_buffer_size=20)
 
-    # Fill past buffer and over 1.5 * min buffer size. A batch is now available, but
-    # compaction still doesn't happen until a next().
-    add_and_check(
-        15, materialized_buffer_size=0, pending_buffer_size=35, expect_has_batch=True
-    )
+    # Fill past the min buffer size by more than a batch. A batch is now available.
+    add_and_check(8, expected_buffer_size=28, expect_has_batch=True)
 
     # Consume only available batch.
-    next_and_check(
-        0,
-        materialized_buffer_size=30,
-        pending_buffer_size=0,
-        should_have_batch_after=True,
-        new_data_added=True,
-    )
+    next_and_check(expected_buffer_size=23, should_have_batch_after=False)
 
-    # Add 4 batches-worth to the already-full buffer.
-    add_and_check(
-        20,
-        materialized_buffer_size=30,
-        pending_buffer_size=20,
-        expect_has_batch=True,
-        no_nexting_yet=False,
-    )
+    # Add 4 batches-worth to the buffer.
+    add_and_check(20, expected_buffer_size=43, expect_has_batch=True)
 
-    # Consume 4 batches from the buffer.
-    next_and_check(
-        0, materialized_buffer_size=25, pending_buffer_size=20, new_data_added=True
-    )
-    next_and_check(batch_size, materialized_buffer_size=20, pending_buffer_size=20)
-    # Triggers materialization of pending batches to avoid falling below min buf size.
-    next_and_check(2 * batch_size, materialized_buffer_size=35, pending_buffer_size=0)
-    next_and_check(
-        3 * batch_size,
-        materialized_buffer_size=30,
-        pending_buffer_size=0,
-        should_have_batch_after=True,
-    )
-
-    # Add a full batch + a partial batch to the buffer.
-    add_and_check(
-        8,
-        materialized_buffer_size=30,
-        pending_buffer_size=8,
-        expect_has_batch=True,
-        no_nexting_yet=False,
-    )
-    next_and_check(
-        0,
-        materialized_buffer_size=25,
-        pending_buffer_size=8,
-        should_have_batch_after=True,
-        new_data_added=True,
-    )
+    # Consume 4 batches from the buffer, stopping at the min buffer size.
+    next_and_check(expected_buffer_size=38)
+    next_and_check(expected_buffer_size=33)
+    next_and_check(expected_buffer_size=28)
+    next_and_check(expected_buffer_size=23, should_have_batch_after=False)
 
     # Indicate to the batcher that we're done adding blocks.
     batcher.done_adding()
 
-    # Consume 6 full batches and one partial batch, fully draining the buffer.
-    next_and_check(batch_size, materialized_buffer_size=28, pending_buffer_size=0)
-    next_and_check(2 * batch_size, materialized_buffer_size=23, pending_buffer_size=0)
-    next_and_check(3 * batch_size, materialized_buffer_size=18, pending_buffer_size=0)
-    next_and_check(4 * batch_size, materialized_buffer_size=13, pending_buffer_size=0)
-    next_and_check(5 * batch_size, materialized_buffer_size=8, pending_buffer_size=0)
-    next_and_check(
-        6 * batch_size,
-        materialized_buffer_size=3,
-        pending_buffer_size=0,
-        should_have_batch_after=False,
-    )
+    # Consume 4 full batches and one partial batch, fully draining the buffer.
+    next_and_check(expected_buffer_size=18)
+    next_and_check(expected_buffer_size=13)
+    next_and_check(expected_buffer_size=8)
+    next_and_check(expected_buffer_size=3, should_have_batch_after=False)
     next_and_check(
-        7 * batch_size,
-        materialized_buffer_size=0,
-        pending_buffer_size=0,
+        expected_buffer_size=0,
         should_batch_be_full=False,
         should_have_batch_after=False,
     )
+    assert not batcher.has_any()
+
+    # Every row is yielded once, and all blocks are released.
+    assert sorted(yielded) == list(range(next_row))
+    assert yielded != list(range(next_row))
+    assert not batcher._blocks
+
+
+def test_shuffling_batcher_seed():
+    def shuffle(seed):
+        batcher = ShufflingBatcher(
+            batch_size=10, shuffle_buffer_min_size=50, shuffle_seed=seed
+        )
+        for i in range(10):
+            batcher.add(pa.table({"foo": list(range(i * 20, (i + 1) * 20))}))
+        batcher.done_adding()
+        rows = []
+        while batcher.has_any():
+            rows.extend(batcher.next_batch()["foo"].to_pylist())
+        return rows
+
+    assert shuffle(42) == shuffle(42)
+    assert sorted(shuffle(42)) == list(range(200))
+
+
+def test_shuffling_batcher_interleaves_blocks():
+    batcher = ShufflingBatcher(batch_size=100, shuffle_buffer_min_size=100)
+    batcher.add(pa.table({"foo": list(range(50))}))
+    batcher.add(pa.table({"foo": list(range(50, 100))}))
+    batcher.done_adding()
+    batch = batcher.next_batch()["foo"].to_pylist()
+    assert sorted(batch) == list(range(100))
+    # The rows of a batch aren't grouped by the block they're gathered from.
+    from_second_block = [row >= 50 for row in batch]
+    assert from_second_block not in [
+        sorted(from_second_block),
+        [True] * 50 + [False] * 50,
+    ]
+
+
+def test_shuffling_batcher_bounds_buffered_rows():
+    batch_size = 100
+    buffer_min_size = 10000
+    block_size = 1000
+    batcher = ShufflingBatcher(
+        batch_size=batch_size, shuffle_buffer_min_size=buffer_min_size
+    )
+
+    def num_resident_rows():
+        return sum(
+            BlockAccessor.for_block(block).num_rows()
+            for block in batcher._blocks.values()
+        )
+
+    yielded = []
+    max_resident_rows = 0
+    for i in range(100):
+        batcher.add(
+            pa.table({"foo": list(range(i * block_size, (i + 1) * block_size))})
+        )
+        while batcher.has_batch():
+            yielded.extend(batcher.next_batch()["foo"].to_pylist())
+            max_resident_rows = max(max_resident_rows, num_resident_rows())
+    batcher.done_adding()
+    while batcher.has_any():
+        yielded.extend(batcher.next_batch()["foo"].to_pylist())
+        max_resident_rows = max(max_resident_rows, num_resident_rows())
+
+    assert sorted(yielded) == list(range(100 * block_size))
+    # Partially yielded blocks are compacted, so at most twice the buffered rows are
+    # kept in memory, instead of every block with an unyielded row.
+    assert max_resident_rows <= 2 * (buffer_min_size + batch_size + block_size)
+    assert not batcher._blocks
 
 
 def test_batching_pyarrow_table_with_many_chunks():
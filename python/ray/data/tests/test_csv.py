@@ -712,6 +712,28 @@ def test_csv_write(ray_start_regular_shared, fs, data_path, endpoint_url):
     assert df.equals(ds_df)
 
 
+def test_csv_write_max_rows_per_file(ray_start_regular_shared, tmp_path):
+    df1 = pd.DataFrame({"one": [1, 2, 3], "two": ["a", "b", "c"]})
+    df2 = pd.DataFrame({"one": [4, 5, 6], "two": ["e", "f", "g"]})
+    ds = ray.data.from_pandas([df1, df2]).repartition(1)
+    ds._set_uuid("data")
+
+    # The blocks are streamed into files of up to 4 rows, each with a header.
+    ds.write_csv(str(tmp_path), max_rows_per_file=4)
+    assert sorted(os.listdir(tmp_path)) == [
+        "data_000000_000000.csv",
+        "data_000000_000001.csv",
+    ]
+    ds_df = pd.concat(
+        [
+            pd.read_csv(os.path.join(tmp_path, "data_000000_000000.csv")),
+            pd.read_csv(os.path.join(tmp_path, "data_000000_000001.csv")),
+        ],
+        ignore_index=True,
+    )
+    assert pd.concat([df1, df2], ignore_index=True).equals(ds_df)
+
+
 @pytest.mark.parametrize(
     "fs,data_path",
     [
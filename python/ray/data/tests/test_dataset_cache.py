@@ -0,0 +1,136 @@
+import os
+import threading
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+from pyarrow.fs import S3FileSystem
+
+import ray
+from ray.data._internal.logical.fingerprint import fingerprint_plan, fingerprint_value
+from ray.data.dataset import MaterializedDataset
+from ray.data.tests.conftest import *  # noqa
+from ray.tests.conftest import *  # noqa
+
+_GLOBAL_LOCK = threading.Lock()
+
+
+def _cache_entries(location):
+    return sorted(os.listdir(location)) if os.path.exists(location) else []
+
+
+def test_cache_reuses_results(ray_start_regular_shared, tmp_path):
+    location = str(tmp_path / "cache")
+
+    def double(row):
+        return {"id": row["id"] * 2}
+
+    ds = ray.data.range(100, parallelism=4).map(double).cache(location)
+    assert isinstance(ds, MaterializedDataset)
+    assert "_ArrowIPC" not in ds.stats()
+    assert [row["id"] for row in ds.take_all()] == list(range(0, 200, 2))
+    assert len(_cache_entries(location)) == 1
+
+    # A new dataset with the same plan reads the cache, instead of executing.
+    ds = ray.data.range(100, parallelism=4).map(double).cache(location)
+    assert isinstance(ds, MaterializedDataset)
+    assert "_ArrowIPC" in ds.stats()
+    assert [row["id"] for row in ds.take_all()] == list(range(0, 200, 2))
+    assert ds.num_blocks() == 4
+    assert len(_cache_entries(location)) == 1
+
+    # A different UDF or argument changes the fingerprint.
+    ds = ray.data.range(100, parallelism=4).map(lambda row: row).cache(location)
+    assert ds.count() == 100
+    ds = ray.data.range(10, parallelism=4).map(double).cache(location)
+    assert ds.count() == 10
+    assert len(_cache_entries(location)) == 3
+
+
+def test_cache_invalidated_by_modified_files(ray_start_regular_shared, tmp_path):
+    location = str(tmp_path / "cache")
+    path = str(tmp_path / "data.parquet")
+    pq.write_table(pa.table({"a": [1, 2, 3]}), path)
+
+    ds = ray.data.read_parquet(path).cache(location)
+    assert ds.to_pandas().equals(pd.DataFrame({"a": [1, 2, 3]}))
+    ds = ray.data.read_parquet(path).cache(location)
+    assert ds.to_pandas().equals(pd.DataFrame({"a": [1, 2, 3]}))
+    assert len(_cache_entries(location)) == 1
+
+    pq.write_table(pa.table({"a": [4, 5, 6, 7]}), path)
+    os.utime(path, ns=(0, 0))
+    ds = ray.data.read_parquet(path).cache(location)
+    assert ds.to_pandas().equals(pd.DataFrame({"a": [4, 5, 6, 7]}))
+    assert len(_cache_entries(location)) == 2
+
+
+def test_fingerprint_plan(ray_start_regular_shared):
+    def fn(row):
+        return row
+
+    ds = ray.data.range(10).map(fn).filter(lambda row: row["id"] > 3)
+    assert fingerprint_plan(ds._logical_plan) == fingerprint_plan(
+        ray.data.range(10).map(fn).filter(lambda row: row["id"] > 3)._logical_plan
+    )
+    assert fingerprint_plan(ds._logical_plan) != fingerprint_plan(
+        ray.data.range(10).map(fn).filter(lambda row: row["id"] > 4)._logical_plan
+    )
+
+    # UDFs holding objects that can't be fingerprinted can't be cached.
+    lock = threading.Lock()
+
+    def locked(row):
+        with lock:
+            return row
+
+    ds = ray.data.range(10).map(locked)
+    assert fingerprint_plan(ds._logical_plan) is None
+    with pytest.raises(ValueError, match="can't be cached"):
+        ds.cache("/tmp/unused")
+
+    # So can UDFs referencing global values that can't be fingerprinted.
+    def locked_global(row):
+        with _GLOBAL_LOCK:
+            return row
+
+    ds = ray.data.range(10).map(locked_global)
+    assert fingerprint_plan(ds._logical_plan) is None
+
+
+def test_fingerprint_value():
+    # Data is fingerprinted by all of its values, not by its repr.
+    values = list(range(1000))
+    table = pa.table({"a": values})
+    assert fingerprint_value(table) == fingerprint_value(pa.table({"a": values}))
+    values[500] = -1
+    assert fingerprint_value(table) != fingerprint_value(pa.table({"a": values}))
+    assert fingerprint_value(table["a"]) != fingerprint_value(
+        pa.chunked_array([values])
+    )
+
+    # Filesystems are fingerprinted by all of their options.
+    assert fingerprint_value(S3FileSystem(region="us-east-1")) != (
+        fingerprint_value(S3FileSystem(region="us-west-2"))
+    )
+
+    # Objects that keep state outside of their `__dict__` can't be fingerprinted.
+    class Slotted:
+        __slots__ = ["value"]
+
+        def __init__(self, value):
+            self.value = value
+
+    class Plain:
+        def __init__(self, value):
+            self.value = value
+
+    assert fingerprint_value(Slotted(1)) is None
+    assert fingerprint_value(Plain(1)) != fingerprint_value(Plain(2))
+
+
+if __name__ == "__main__":
+    import sys
+
+    sys.exit(pytest.main(["-v", __file__]))
@@ -14,6 +14,7 @@ from ray.data._internal.execution.operators.base_physical_operator import (
     AllToAllOperator,
 )
 from ray.data._internal.execution.operators.input_data_buffer import InputDataBuffer
+from ray.data._internal.execution.operators.join_operator import JoinOperator
 from ray.data._internal.execution.operators.map_operator import MapOperator
 from ray.data._internal.execution.operators.map_transformer import (
     BatchMapTransformFn,
@@ -42,7 +43,7 @@ from ray.data._internal.logical.operators.map_operator import (
     MapBatches,
     MapRows,
 )
-from ray.data._internal.logical.operators.n_ary_operator import Union, Zip
+from ray.data._internal.logical.operators.n_ary_operator import Join, Union, Zip
 from ray.data._internal.logical.operators.write_operator import Write
 from ray.data._internal.logical.optimizers import PhysicalOptimizer
 from ray.data._internal.logical.util import (
@@ -245,6 +246,18 @@ def test_filter_e2e(ray_start_regular_shared, enable_optimizer):
     _check_usage_record(["ReadRange", "Filter"])
 
 
+def test_filter_by_expression_e2e(ray_start_regular_shared, enable_optimizer):
+    import pyarrow.dataset as pds
+
+    ds = ray.data.range(5)
+    ds = ds.filter(expr=(pds.field("id") > 0) & (pds.field("id") < 3))
+    assert extract_values("id", ds.take_all()) == [1, 2], ds
+    _check_usage_record(["ReadRange", "MapBatches"])
+
+    with pytest.raises(ValueError, match="Exactly one of"):
+        ray.data.range(5).filter()
+
+
 def test_flat_map(ray_start_regular_shared, enable_optimizer):
     planner = Planner()
     read_op = get_parquet_read_logical_op()
@@ -1082,6 +1095,36 @@ def test_zip_e2e(ray_start_regular_shared, enable_optimizer, num_blocks1, num_bl
     _check_usage_record(["ReadRange", "Zip"])
 
 
+def test_join_operator(ray_start_regular_shared, enable_optimizer):
+    planner = Planner()
+    read_op1 = get_parquet_read_logical_op()
+    read_op2 = get_parquet_read_logical_op()
+    op = Join(read_op1, read_op2, ["id"], ["id"], "inner", ("", "_1"))
+    plan = LogicalPlan(op)
+    physical_op = planner.plan(plan).dag
+
+    assert op.name == "Join"
+    assert isinstance(physical_op, JoinOperator)
+    assert len(physical_op.input_dependencies) == 2
+    assert isinstance(physical_op.input_dependencies[0], MapOperator)
+    assert isinstance(physical_op.input_dependencies[1], MapOperator)
+    assert physical_op in physical_op.input_dependencies[1].output_dependencies
+
+
+@pytest.mark.parametrize("num_blocks1,num_blocks2", [(1, 1), (3, 5), (8, 2)])
+def test_join_e2e(ray_start_regular_shared, enable_optimizer, num_blocks1, num_blocks2):
+    n = 20
+    ds1 = ray.data.range(n, parallelism=num_blocks1)
+    ds2 = ray.data.range(n, parallelism=num_blocks2).map(
+        lambda r: {"id": r["id"] * 2, "value": r["id"]}
+    )
+    ds = ds1.join(ds2, on="id")
+    assert sorted(ds.take_all(), key=lambda r: r["id"]) == named_values(
+        ["id", "value"], [(i * 2, i) for i in range(n // 2)]
+    )
+    _check_usage_record(["ReadRange", "Join"])
+
+
 def test_from_dask_e2e(ray_start_regular_shared, enable_optimizer):
     import dask.dataframe as dd
 
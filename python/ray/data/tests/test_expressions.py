@@ -0,0 +1,94 @@
+import pyarrow as pa
+import pyarrow.dataset as pds
+import pytest
+
+import ray
+from ray.data import col, lit
+from ray.data._internal.logical.operators.read_operator import Read
+from ray.data._internal.logical.optimizers import LogicalOptimizer
+from ray.data.tests.conftest import *  # noqa
+from ray.tests.conftest import *  # noqa
+
+
+def test_expression_evaluate():
+    table = pa.table({"a": [1, 2, 3], "b": [10, None, 30]})
+
+    assert (col("a") + col("b")).evaluate(table).to_pylist() == [11, None, 33]
+    assert (2 * col("a") - 1).evaluate(table).to_pylist() == [1, 3, 5]
+    assert (col("a") >= 2).evaluate(table).to_pylist() == [False, True, True]
+    assert ((col("a") > 1) & ~col("b").is_null()).evaluate(table).to_pylist() == [
+        False,
+        False,
+        True,
+    ]
+    assert ((col("a") == 1) | (col("a") == 3)).evaluate(table).to_pylist() == [
+        True,
+        False,
+        True,
+    ]
+    # Literals are broadcast to the number of rows.
+    assert lit(5).evaluate(table).to_pylist() == [5, 5, 5]
+
+    with pytest.raises(KeyError, match="'c' does not exist"):
+        col("c").evaluate(table)
+    with pytest.raises(TypeError, match="ambiguous"):
+        bool(col("a") > 1)
+
+
+def test_expression_to_pyarrow():
+    table = pa.table({"a": [1, 2, 3], "b": [10, None, 30]})
+    expr = (col("a") * 10 > col("b")) | col("b").is_null()
+
+    assert isinstance(expr.to_pyarrow(), pds.Expression)
+    assert (
+        pds.dataset(table).to_table(filter=expr.to_pyarrow()).to_pydict()
+        == table.filter(expr.evaluate(table)).to_pydict()
+        == {"a": [2], "b": [None]}
+    )
+    assert expr.columns() == ["a", "b"]
+    assert repr(expr) == "(((col('a') * lit(10)) > col('b')) | col('b').is_null())"
+
+
+def test_filter_with_expression(ray_start_regular_shared):
+    ds = ray.data.range(10, parallelism=3)
+    ds = ds.filter(expr=col("id") > 6)
+    assert [row["id"] for row in ds.take_all()] == [7, 8, 9]
+
+    ds = ray.data.from_items([{"a": 1, "b": "x"}, {"a": 2, "b": "y"}])
+    ds = ds.filter(expr=col("b") != "x")
+    assert ds.take_all() == [{"a": 2, "b": "y"}]
+
+
+def test_add_column_with_expression(ray_start_regular_shared):
+    ds = ray.data.from_items([{"a": 1, "b": 2.0}, {"a": 3, "b": 4.0}])
+
+    assert ds.add_column("c", col("a") + col("b")).take_all() == [
+        {"a": 1, "b": 2.0, "c": 3.0},
+        {"a": 3, "b": 4.0, "c": 7.0},
+    ]
+    # Existing columns are overwritten.
+    assert ds.add_column("a", col("a") * 10).take_all() == [
+        {"a": 10, "b": 2.0},
+        {"a": 30, "b": 4.0},
+    ]
+    assert ds.add_column("c", lit("x")).take_all() == [
+        {"a": 1, "b": 2.0, "c": "x"},
+        {"a": 3, "b": 4.0, "c": "x"},
+    ]
+
+
+def test_expression_filter_pushdown(ray_start_regular_shared, tmp_path):
+    ray.data.range(100, parallelism=4).write_parquet(str(tmp_path))
+
+    ds = ray.data.read_parquet(str(tmp_path)).filter(
+        expr=(col("id") >= 10) & (col("id") < 13)
+    )
+    dag = LogicalOptimizer().optimize(ds._logical_plan).dag
+    assert isinstance(dag, Read)
+    assert sorted(row["id"] for row in ds.take_all()) == [10, 11, 12]
+
+
+if __name__ == "__main__":
+    import sys
+
+    sys.exit(pytest.main(["-v", __file__]))
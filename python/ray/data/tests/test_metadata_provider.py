@@ -1,6 +1,7 @@
 import logging
 import os
 import posixpath
+import time
 import urllib.parse
 from functools import partial
 from unittest.mock import patch
@@ -12,6 +13,8 @@ import pytest
 from pyarrow.fs import LocalFileSystem
 from pytest_lazyfixture import lazy_fixture
 
+from ray.data._internal.file_metadata_cache import FileMetadataCache, _list_directory
+from ray.data.context import DataContext
 from ray.data.datasource import (
     BaseFileMetadataProvider,
     DefaultFileMetadataProvider,
@@ -481,6 +484,131 @@ def test_fast_file_metadata_provider(
     assert meta.schema is None
 
 
+def test_file_metadata_cache_list_directory(tmp_path):
+    data_path = tmp_path / "data"
+    (data_path / "sub").mkdir(parents=True)
+    (data_path / "a.csv").write_text("a")
+    (data_path / "sub" / "b.csv").write_text("bb")
+    path, fs = str(data_path), LocalFileSystem()
+    cache = FileMetadataCache(str(tmp_path / "cache"))
+
+    def list_directory():
+        with patch(
+            "ray.data._internal.file_metadata_cache._list_directory",
+            wraps=_list_directory,
+        ) as mock_list:
+            files = cache.list_directory(path, fs)
+        return [(file_path, size) for file_path, size, _ in files], mock_list.called
+
+    expected = [(f"{path}/a.csv", 1), (f"{path}/sub/b.csv", 2)]
+    assert list_directory() == (expected, True)
+    # The cached listing is reused while the directories are unchanged.
+    assert list_directory() == (expected, False)
+
+    # Adding a file to a subdirectory changes its modification time. It's also
+    # set explicitly, since filesystems with coarse timestamps may not change it.
+    (data_path / "sub" / "c.csv").write_text("ccc")
+    os.utime(data_path / "sub", ns=(0, 0))
+    expected.append((f"{path}/sub/c.csv", 3))
+    assert list_directory() == (expected, True)
+    assert list_directory() == (expected, False)
+
+    # So does removing a file.
+    (data_path / "a.csv").unlink()
+    os.utime(data_path, ns=(0, 0))
+    assert list_directory() == (expected[1:], True)
+
+    # A directory whose modification time changed is listed again, even if its
+    # contents are the same.
+    os.utime(data_path, ns=(10**9, 10**9))
+    assert list_directory() == (expected[1:], True)
+    assert list_directory() == (expected[1:], False)
+
+
+def test_file_metadata_cache_listing_ttl(tmp_path):
+    data_path = tmp_path / "data"
+    data_path.mkdir()
+    (data_path / "a.csv").write_text("a")
+    path, fs = str(data_path), LocalFileSystem()
+
+    def list_directory(cache):
+        # Simulate a filesystem that doesn't report directory modification times.
+        def list_without_mtimes(*args):
+            files, mtimes = _list_directory(*args)
+            return files, dict.fromkeys(mtimes)
+
+        with patch(
+            "ray.data._internal.file_metadata_cache._list_directory",
+            side_effect=list_without_mtimes,
+        ) as mock_list:
+            cache.list_directory(path, fs)
+        return mock_list.called
+
+    cache_dir = str(tmp_path / "cache")
+    # Without a TTL, these directories are always listed again.
+    cache = FileMetadataCache(cache_dir)
+    assert list_directory(cache)
+    assert list_directory(cache)
+    # With a TTL, their listings are reused until it expires.
+    cache = FileMetadataCache(cache_dir, listing_ttl_s=60)
+    assert list_directory(cache)
+    assert not list_directory(cache)
+    with patch("time.time", return_value=time.time() + 61):
+        assert list_directory(cache)
+
+
+def test_file_metadata_cache_prune(tmp_path):
+    data_path = tmp_path / "data"
+    data_path.mkdir()
+    (data_path / "a.csv").write_text("a")
+    (data_path / "b").mkdir()
+    fs = LocalFileSystem()
+    cache_path = tmp_path / "cache"
+    cache = FileMetadataCache(str(cache_path))
+
+    cache.list_directory(str(data_path), fs)
+    [old_listing] = os.listdir(cache_path / "listings")
+    (cache_path / "listings" / "x.tmp").write_text("")
+    cache.list_directory(str(data_path / "b"), fs)
+    assert len(os.listdir(cache_path / "listings")) == 3
+
+    # Old cache files, including leftover temporary files, are deleted when a
+    # listing is written.
+    old = time.time_ns() - 8 * 24 * 60 * 60 * 10**9
+    os.utime(cache_path / "listings" / old_listing, ns=(old, old))
+    os.utime(cache_path / "listings" / "x.tmp", ns=(old, old))
+    os.utime(data_path / "b", ns=(0, 0))
+    cache.list_directory(str(data_path / "b"), fs)
+    assert old_listing not in os.listdir(cache_path / "listings")
+    assert len(os.listdir(cache_path / "listings")) == 1
+
+    # Old footers are dropped when their shard is written.
+    shard = {"old": (1, 1, "", old / 1e9), "new": (1, 1, "", time.time())}
+    cache._write_parquet_shard("00", shard)
+    assert cache._read_entry(str(cache_path / "parquet" / "00")).keys() == {"new"}
+
+
+def test_default_file_metadata_provider_file_metadata_cache(
+    restore_data_context, tmp_path
+):
+    data_path = tmp_path / "data"
+    data_path.mkdir()
+    (data_path / "a.csv").write_text("a")
+    DataContext.get_current().file_metadata_cache_dir = str(tmp_path / "cache")
+    paths, fs = _resolve_paths_and_filesystem(str(data_path))
+
+    meta_provider = DefaultFileMetadataProvider()
+    assert list(meta_provider.expand_paths(paths, fs)) == [(f"{paths[0]}/a.csv", 1)]
+    assert len(os.listdir(tmp_path / "cache" / "listings")) == 1
+
+    (data_path / "b.csv").write_text("bb")
+    os.utime(data_path, ns=(0, 0))
+    assert list(meta_provider.expand_paths(paths, fs)) == [
+        (f"{paths[0]}/a.csv", 1),
+        (f"{paths[0]}/b.csv", 2),
+    ]
+
+
 def test_fast_file_metadata_provider_ignore_missing():
     meta_provider = FastFileMetadataProvider()
     with pytest.raises(ValueError):
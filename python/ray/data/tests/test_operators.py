@@ -304,6 +304,52 @@ def test_split_operator_random(ray_start_regular_shared, equal, random_seed):
         assert sum(len(output_splits[i]) for i in range(3)) == num_inputs, output_splits
 
 
+@pytest.mark.parametrize("equal", [False, True])
+def test_split_operator_max_outstanding_bundles(ray_start_regular_shared, equal):
+    input_op = InputDataBuffer(make_ref_bundles([[i] for i in range(20)]))
+    op = OutputSplitter(input_op, 3, equal=equal, max_outstanding_bundles=2)
+
+    # Only the consumer of split 0 consumes its outputs.
+    output_splits = collections.defaultdict(list)
+
+    def consume():
+        while op.has_next():
+            ref = op.get_next()
+            for block, _ in ref.blocks:
+                output_splits[ref.output_split_idx].extend(list(ray.get(block)["id"]))
+            if ref.output_split_idx == 0:
+                op.on_output_consumed(0)
+
+    op.start(ExecutionOptions())
+    while input_op.has_next() and op.should_add_input():
+        op.add_input(input_op.get_next(), 0)
+        consume()
+
+    # The lagging splits are only assigned up to 2 bundles.
+    assert len(output_splits[1]) == 2
+    assert len(output_splits[2]) == 2
+    metrics = op.get_metrics()
+    assert metrics["num_outstanding_1"] == 2
+    assert metrics["max_outstanding_2"] == 2
+    if equal:
+        # The buffer is bounded while waiting for the lagging consumers.
+        assert input_op.has_next()
+        assert op.internal_queue_size() == 6
+        assert len(output_splits[0]) == 3
+        op.on_output_consumed(1)
+        op.on_output_consumed(2)
+        assert op.should_add_input()
+        consume()
+        assert [len(output_splits[i]) for i in range(3)] == [4, 3, 3]
+    else:
+        # The other bundles are rebalanced to split 0.
+        assert not input_op.has_next()
+        assert len(output_splits[0]) == 16
+        assert metrics["num_rebalanced"] > 0
+        op.all_inputs_done()
+        assert op.completed()
+
+
 def test_split_operator_locality_hints(ray_start_regular_shared):
     input_op = InputDataBuffer(make_ref_bundles([[i] for i in range(10)]))
     op = OutputSplitter(input_op, 2, equal=False, locality_hints=["node1", "node2"])
@@ -10,6 +10,7 @@ import pytest
 from pytest_lazyfixture import lazy_fixture
 
 import ray
+from ray.data._internal.execution.interfaces import TaskContext
 from ray.data.block import BlockAccessor
 from ray.data.datasource import (
     DefaultFileMetadataProvider,
@@ -243,6 +244,51 @@ def test_parquet_read_meta_provider(ray_start_regular_shared, fs, data_path):
     ]
 
 
+@pytest.mark.parametrize("parallel", [False, True])
+def test_parquet_read_file_metadata_cache(
+    ray_start_regular_shared, restore_data_context, tmp_path, monkeypatch, parallel
+):
+    if parallel:
+        # Decode the cached footers in the metadata fetch tasks.
+        monkeypatch.setattr(
+            "ray.data.datasource.parquet_datasource.PARALLELIZE_META_FETCH_THRESHOLD",
+            0,
+        )
+    data_path = tmp_path / "data"
+    data_path.mkdir()
+    for i in range(3):
+        pq.write_table(pa.table({"one": [i] * (i + 1)}), data_path / f"{i}.parquet")
+    ctx = ray.data.DataContext.get_current()
+    ctx.file_metadata_cache_dir = str(tmp_path / "cache")
+
+    num_fetched = []
+
+    class CountingMetadataProvider(DefaultParquetMetadataProvider):
+        def _fetch_file_metadata(self, pieces, footers=None, **ray_remote_args):
+            num_fetched.append(footers.count(None))
+            return super()._fetch_file_metadata(pieces, footers, **ray_remote_args)
+
+    def read():
+        return ray.data.read_parquet(
+            str(data_path), meta_provider=CountingMetadataProvider()
+        )
+
+    assert read()._meta_count() == 6
+    assert num_fetched == [3]
+    # The footers of unchanged files are reused.
+    assert read()._meta_count() == 6
+    assert num_fetched == [3, 0]
+
+    # Only the footers of new and modified files are fetched.
+    pq.write_table(pa.table({"one": [1] * 10}), data_path / "1.parquet")
+    os.utime(data_path / "1.parquet", ns=(0, 0))
+    pq.write_table(pa.table({"one": [3]}), data_path / "3.parquet")
+    ds = read()
+    assert num_fetched == [3, 0, 2]
+    assert ds._meta_count() == 15
+    assert ds.count() == 15
+
+
 @pytest.mark.parametrize(
     "fs,data_path",
     [
@@ -517,6 +563,64 @@ def test_parquet_read_partitioned_with_filter(ray_start_regular_shared, tmp_path
     assert ds.count() == 2
 
 
+def test_parquet_read_pushdown(ray_start_regular_shared, tmp_path):
+    from ray.data._internal.logical.operators.read_operator import Read
+    from ray.data._internal.logical.optimizers import LogicalOptimizer
+
+    df = pd.DataFrame(
+        {
+            "one": [1, 1, 1, 3, 3, 3],
+            "two": ["a", "a", "b", "b", "c", "c"],
+            "three": [0.1, 0.2, 0.3, 0.4, 0.5, 0.6],
+        }
+    )
+    table = pa.Table.from_pandas(df)
+    pq.write_to_dataset(
+        table, root_path=str(tmp_path), partition_cols=["one"], use_legacy_dataset=False
+    )
+
+    ds = ray.data.read_parquet(str(tmp_path))
+    # The filter references a column that isn't selected.
+    ds = ds.filter(expr=pa.dataset.field("two") == "b").select_columns(["three"])
+
+    dag = LogicalOptimizer().optimize(ds._logical_plan).dag
+    assert isinstance(dag, Read)
+    assert dag._reader._columns == ["three"]
+    assert dag._reader._reader_args["filter"] is not None
+    assert sorted(row["three"] for row in ds.take_all()) == [0.3, 0.4]
+
+    # Select the partition column.
+    ds = ray.data.read_parquet(str(tmp_path)).select_columns(["one", "two"])
+    assert sorted((row["one"], row["two"]) for row in ds.take_all()) == sorted(
+        zip(df["one"], df["two"])
+    )
+
+    # Filters are combined with the filter passed to the read.
+    ds = ray.data.read_parquet(
+        str(tmp_path), filter=(pa.dataset.field("two") == "b")
+    ).filter(expr=pa.dataset.field("one") == 1)
+    assert [(row["one"], row["two"]) for row in ds.take_all()] == [(1, "b")]
+
+    # Filters on columns dropped by an earlier projection aren't pushed down, and
+    # fail like they do without the pushdown.
+    ds = (
+        ray.data.read_parquet(str(tmp_path))
+        .select_columns(["three"])
+        .filter(expr=pa.dataset.field("two") == "b")
+    )
+    dag = LogicalOptimizer().optimize(ds._logical_plan).dag
+    assert not isinstance(dag, Read)
+    assert "filter" not in dag.input_dependency._reader._reader_args
+    with pytest.raises(Exception, match="two"):
+        ds.take_all()
+
+    # Projections that can't be pushed down are still applied.
+    ds = ray.data.read_parquet(str(tmp_path)).select_columns(["two", "two"])
+    dag = LogicalOptimizer().optimize(ds._logical_plan).dag
+    assert not isinstance(dag, Read)
+    assert ds.schema().names == ["two", "two"]
+
+
 def test_parquet_read_partitioned_explicit(ray_start_regular_shared, tmp_path):
     df = pd.DataFrame(
         {"one": [1, 1, 1, 3, 3, 3], "two": ["a", "b", "c", "e", "f", "g"]}
@@ -922,6 +1026,140 @@ def test_parquet_write_with_udf(ray_start_regular_shared, tmp_path):
     assert expected_df.equals(dfds)
 
 
+def test_parquet_write_max_rows_per_file(ray_start_regular_shared, tmp_path):
+    data_path = str(tmp_path)
+    df1 = pd.DataFrame({"one": list(range(50)), "two": ["a"] * 50})
+    df2 = pd.DataFrame({"one": list(range(50, 100)), "two": ["b"] * 50})
+    ds = ray.data.from_pandas([df1, df2])
+
+    # 2 write tasks, that each roll over to a new file every 20 rows.
+    ds._set_uuid("data")
+    ds.write_parquet(data_path, max_rows_per_file=20)
+    num_rows = {
+        file_name: pq.read_metadata(os.path.join(data_path, file_name)).num_rows
+        for file_name in os.listdir(data_path)
+    }
+    assert num_rows == {
+        "data_000000_000000.parquet": 20,
+        "data_000000_000001.parquet": 20,
+        "data_000000_000002.parquet": 10,
+        "data_000001_000000.parquet": 20,
+        "data_000001_000001.parquet": 20,
+        "data_000001_000002.parquet": 10,
+    }
+    dfds = pd.read_parquet(data_path).sort_values("one", ignore_index=True)
+    assert pd.concat([df1, df2], ignore_index=True).equals(dfds)
+
+
+def test_parquet_write_target_file_size(ray_start_regular_shared, tmp_path):
+    data_path = str(tmp_path)
+    ds = ray.data.from_pandas(
+        [pd.DataFrame({"one": np.random.random(10000)}) for _ in range(2)]
+    ).repartition(1)
+
+    ds.write_parquet(data_path, target_file_size_bytes=20000)
+    file_sizes = [
+        os.path.getsize(os.path.join(data_path, file_name))
+        for file_name in os.listdir(data_path)
+    ]
+    # The random floats don't compress, so the files are ~8 bytes per row.
+    assert 5 < len(file_sizes) < 12
+    assert pd.read_parquet(data_path)["one"].count() == 20000
+
+
+def test_parquet_write_partition_cols(ray_start_regular_shared, tmp_path):
+    data_path = str(tmp_path)
+    df1 = pd.DataFrame({"year": ["2020", "2021", "2020"], "one": [1, 2, 3]})
+    df2 = pd.DataFrame({"year": ["2021", "2022", None], "one": [4, 5, 6]})
+    ds = ray.data.from_pandas([df1, df2])
+
+    ds._set_uuid("data")
+    ds.write_parquet(data_path, partition_cols=["year"])
+    assert sorted(os.listdir(data_path)) == [
+        "year=2020",
+        "year=2021",
+        "year=2022",
+        "year=__HIVE_DEFAULT_PARTITION__",
+    ]
+    # Each write task writes its rows of each partition to a separate file.
+    assert sorted(os.listdir(os.path.join(data_path, "year=2021"))) == [
+        "data_000000_000000.parquet",
+        "data_000001_000000.parquet",
+    ]
+    values = {
+        dir_name: sorted(pd.read_parquet(os.path.join(data_path, dir_name))["one"])
+        for dir_name in os.listdir(data_path)
+    }
+    assert values == {
+        "year=2020": [1, 3],
+        "year=2021": [2, 4],
+        "year=2022": [5],
+        "year=__HIVE_DEFAULT_PARTITION__": [6],
+    }
+
+    with pytest.raises(ValueError, match="not found"):
+        ds.write_parquet(data_path, partition_cols=["month"])
+
+
+@pytest.mark.parametrize("with_nulls", [False, True])
+def test_parquet_write_partition_cols_int(
+    ray_start_regular_shared, tmp_path, with_nulls
+):
+    data_path = str(tmp_path)
+    # The block with nulls must not write its rows of 2023 to "year=2023.0".
+    table1 = pa.table({"year": [2023, 2024, 2023], "one": [1, 2, 3]})
+    table2 = pa.table(
+        {
+            "year": pa.array([2023, None if with_nulls else 2025], pa.int64()),
+            "one": [4, 5],
+        }
+    )
+    ds = ray.data.from_arrow([table1, table2])
+
+    ds.write_parquet(data_path, partition_cols=["year"])
+    other_dir_name = "year=__HIVE_DEFAULT_PARTITION__" if with_nulls else "year=2025"
+    values = {
+        dir_name: sorted(pd.read_parquet(os.path.join(data_path, dir_name))["one"])
+        for dir_name in os.listdir(data_path)
+    }
+    assert values == {"year=2023": [1, 3, 4], "year=2024": [2], other_dir_name: [5]}
+
+
+def test_parquet_write_partition_cols_bool(ray_start_regular_shared, tmp_path):
+    data_path = str(tmp_path)
+    ds = ray.data.from_arrow(pa.table({"flag": [True, False, True], "one": [1, 2, 3]}))
+
+    ds.write_parquet(data_path, partition_cols=["flag"])
+    assert sorted(os.listdir(data_path)) == ["flag=false", "flag=true"]
+
+
+def test_parquet_write_incompatible_schemas(ray_start_regular_shared, tmp_path):
+    # The column of the first block is all nulls, so it has the null type, which the
+    # values of the later blocks can't be cast to.
+    blocks = [
+        pa.table({"one": pa.nulls(2)}),
+        pa.table({"one": [1, 2, 3]}),
+        pa.table({"one": [4]}),
+    ]
+
+    ParquetDatasource().write(
+        blocks, TaskContext(task_idx=0), str(tmp_path), "data", max_rows_per_file=10
+    )
+    # The later blocks are written to a new file.
+    tables = [
+        pq.read_table(os.path.join(tmp_path, file_name))
+        for file_name in sorted(os.listdir(tmp_path))
+    ]
+    assert [table.schema.field("one").type for table in tables] == [
+        pa.null(),
+        pa.int64(),
+    ]
+    assert [table["one"].to_pylist() for table in tables] == [
+        [None, None],
+        [1, 2, 3, 4],
+    ]
+
+
 @pytest.mark.parametrize(
     "fs,data_path,endpoint_url",
     [
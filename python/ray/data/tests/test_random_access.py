@@ -30,6 +30,37 @@ def test_basic(ray_start_regular_shared, pandas):
     assert results == [None] + [expected(i) for i in range(10)] + [None]
 
 
+@pytest.mark.parametrize("num_workers", [1, 3])
+def test_multiget_and_range(ray_start_regular_shared, num_workers):
+    # Only even keys are present.
+    ds = ray.data.range(100, parallelism=10).map(lambda row: {"id": row["id"] * 2})
+    rad = ds.to_random_access_dataset("id", num_workers=num_workers)
+
+    keys = [5, 4, -2, 198, 200, 0, 101, 4]
+    assert rad.multiget(keys) == [
+        None if k % 2 or not 0 <= k < 200 else {"id": k} for k in keys
+    ]
+    assert rad.multiget([]) == []
+
+    assert rad.range(10, 50) == [{"id": k} for k in range(10, 50, 2)]
+    assert rad.range(11, 13) == [{"id": 12}]
+    assert rad.range(-10, 3) == [{"id": 0}, {"id": 2}]
+    assert rad.range(190, 1000) == [{"id": k} for k in range(190, 200, 2)]
+    assert rad.range(3, 3) == []
+    assert rad.range(500, 600) == []
+
+
+def test_string_keys(ray_start_regular_shared):
+    ds = ray.data.from_items([{"key": f"k{i:03d}", "value": i} for i in range(50)])
+    rad = ds.to_random_access_dataset("key", num_workers=2)
+    assert rad.multiget(["k010", "missing", "k049"]) == [
+        {"key": "k010", "value": 10},
+        None,
+        {"key": "k049", "value": 49},
+    ]
+    assert [row["value"] for row in rad.range("k020", "k025")] == list(range(20, 25))
+
+
 def test_empty_blocks(ray_start_regular_shared):
     ds = ray.data.range(10).repartition(20)
     assert ds.num_blocks() == 20
@@ -1,10 +1,14 @@
 import os
 import uuid
+from unittest.mock import patch
 
+import numpy as np
+import pyarrow as pa
 import pytest
 
 import ray
 from ray.data._internal.arrow_block import ArrowBlockBuilder
+from ray.data._internal.size_estimator import SizeEstimator
 from ray.tests.conftest import *  # noqa
 
 SMALL_VALUE = "a" * 100
@@ -77,6 +81,33 @@ def test_arrow_size_add_block(ray_start_regular_shared):
     assert b2.build().num_rows == 10000
 
 
+def test_size_estimator_values():
+    estimator = SizeEstimator()
+    estimator.add({"int": 1, "float": 1.0, "bool": True, "none": None})
+    assert estimator.size_bytes() == 8 + 8 + 1 + 1
+    estimator = SizeEstimator()
+    estimator.add({"str": "a" * 100, "bytes": b"a" * 100, "unicode": "\u00e9" * 10})
+    assert estimator.size_bytes() == 104 + 104 + 24
+    estimator = SizeEstimator()
+    estimator.add({"array": np.zeros((10, 10)), "arrow": pa.array(np.zeros(100))})
+    assert estimator.size_bytes() == 800 + 800
+    estimator = SizeEstimator()
+    estimator.add({"list": list(range(1000)), "nested": [[1, 2], [3]]})
+    assert estimator.size_bytes() == (4 + 8000) + (4 + (4 + 16) + (4 + 8))
+
+
+def test_size_estimator_samples():
+    estimator = SizeEstimator()
+    with patch.object(
+        estimator, "_estimate_item_size", wraps=estimator._estimate_item_size
+    ) as mock_estimate:
+        for _ in range(1000):
+            estimator.add({"int": 1, "str": "a" * 100})
+    # Only the first 10, every 10th up to 100, and every 100th item are sized.
+    assert mock_estimate.call_count == 10 + 9 + 9
+    assert estimator.size_bytes() == 1000 * (8 + 104)
+
+
 def test_split_read_csv(ray_start_regular_shared, tmp_path):
     ctx = ray.data.context.DataContext.get_current()
 
@@ -0,0 +1,93 @@
+import numpy as np
+import pytest
+
+from ray.data._internal.sketches import FrequentItems, HyperLogLog, KLLSketch
+
+
+def test_hyperloglog():
+    sketch = HyperLogLog()
+    assert sketch.count() == 0
+
+    values = np.arange(200000)
+    # Add the values twice, so that duplicates are counted once.
+    for chunk in np.array_split(np.concatenate([values, values]), 10):
+        sketch.add(chunk)
+    assert abs(sketch.count() - 200000) <= 0.03 * 200000
+
+    # Small counts are nearly exact.
+    sketch = HyperLogLog()
+    sketch.add(np.array(["a", "b", "c", "a"], dtype=object))
+    assert sketch.count() == 3
+
+    # Integral floats hash the same as ints.
+    sketch.add(np.array([1, 2]))
+    sketch.add(np.array([1.0, 2.0, 2.5]))
+    assert sketch.count() == 6
+
+    with pytest.raises(ValueError):
+        HyperLogLog(precision=2)
+
+
+def test_hyperloglog_merge():
+    sketches = [HyperLogLog() for _ in range(4)]
+    for i, sketch in enumerate(sketches):
+        sketch.add(np.arange(i * 10000, (i + 2) * 10000))
+    merged = sketches[0]
+    for sketch in sketches[1:]:
+        merged.merge(sketch)
+    assert abs(merged.count() - 50000) <= 0.03 * 50000
+
+    with pytest.raises(ValueError):
+        merged.merge(HyperLogLog(precision=10))
+
+
+def test_kll_sketch():
+    rng = np.random.default_rng(0)
+    values = rng.normal(size=500000)
+    sketches = [KLLSketch() for _ in range(8)]
+    for i, chunk in enumerate(np.array_split(values, 100)):
+        sketches[i % 8].add(chunk)
+    merged = sketches[0]
+    for sketch in sketches[1:]:
+        merged.merge(sketch)
+
+    assert merged.num_values == len(values)
+    assert sum(len(items) for items in merged.levels) < 10 * merged.k
+    qs = [0.0, 0.01, 0.25, 0.5, 0.75, 0.99, 1.0]
+    quantiles = merged.quantiles(qs)
+    assert quantiles[0] == values.min()
+    assert quantiles[-1] == values.max()
+    for q, value in zip(qs, quantiles):
+        assert abs(np.mean(values <= value) - q) <= 0.02
+
+    assert KLLSketch().quantiles([0.5]) == [None]
+    with pytest.raises(ValueError):
+        KLLSketch(k=4)
+
+
+def test_frequent_items():
+    rng = np.random.default_rng(0)
+    values = rng.zipf(1.5, size=100000)
+    sketch = FrequentItems(capacity=50)
+    other = FrequentItems(capacity=50)
+    for i, chunk in enumerate(np.array_split(values, 20)):
+        (sketch if i % 2 else other).add(chunk)
+    sketch.merge(other)
+
+    assert len(sketch.counts) <= 50
+    unique, counts = np.unique(values, return_counts=True)
+    expected = unique[np.argsort(-counts, kind="stable")][:5]
+    top = sketch.top(5)
+    assert [item["value"] for item in top] == expected.tolist()
+    for item in top:
+        true_count = counts[unique == item["value"]][0]
+        assert true_count - len(values) / 51 <= item["count"] <= true_count
+
+    with pytest.raises(ValueError):
+        FrequentItems(capacity=0)
+
+
+if __name__ == "__main__":
+    import sys
+
+    sys.exit(pytest.main(["-v", __file__]))
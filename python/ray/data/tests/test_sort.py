@@ -7,11 +7,12 @@ import pyarrow as pa
 import pytest
 
 import ray
+from ray.data._internal.arrow_ops import transform_pyarrow
 from ray.data._internal.planner.exchange.push_based_shuffle_task_scheduler import (
     PushBasedShuffleTaskScheduler,
 )
 from ray.data._internal.push_based_shuffle import PushBasedShufflePlan
-from ray.data._internal.sort import SortKey
+from ray.data._internal.sort import SortKey, compute_boundaries, find_heavy_hitters
 from ray.data.block import BlockAccessor
 from ray.data.tests.conftest import *  # noqa
 from ray.data.tests.util import extract_values
@@ -60,6 +61,75 @@ def test_sort_partition_same_key_to_same_block(
     assert total == num_items
 
 
+def test_compute_boundaries_with_skewed_key():
+    samples = np.sort(np.concatenate([np.full(500, 7), np.arange(500)]))
+    boundaries = compute_boundaries([samples], 10)
+
+    assert len(boundaries) == 9
+    # The skewed key gets a range of its own.
+    assert (7,) in boundaries and (8,) in boundaries
+    # The other ranges don't overlap and aren't empty.
+    assert len(set(boundaries)) == len(boundaries)
+
+    # With fewer distinct keys than reducers, the last ranges are empty.
+    assert compute_boundaries([np.array([1, 1, 2])], 4) == [(2,), (2,), (2,)]
+
+
+def test_find_heavy_hitters():
+    samples = np.sort(np.concatenate([np.full(500, 7), np.arange(500)]))
+    assert find_heavy_hitters([samples], 10) == [((7,), 0.501)]
+    assert find_heavy_hitters([samples], 1) == []
+
+    # Null keys can't be ordered with the other keys, so nothing is reported.
+    samples = np.sort(np.concatenate([np.full(500, 7.0), np.full(10, np.nan)]))
+    assert find_heavy_hitters([samples], 10) == []
+
+
+def test_sort_skewed_key(ray_start_regular, use_push_based_shuffle):
+    xs = [0] * 500 + list(range(500))
+    random.shuffle(xs)
+    ds = ray.data.from_items(xs, parallelism=10).sort("item")
+
+    assert extract_values("item", ds.take_all()) == sorted(xs)
+    # All rows of the skewed key are in one block, and the other rows are spread over
+    # the other blocks.
+    num_rows = ds._block_num_rows()
+    assert max(num_rows) < 600
+    assert len([n for n in num_rows if n > 0]) > 5
+
+
+@pytest.mark.parametrize("descending", [False, True])
+def test_merge_sorted(descending):
+    sort_key = SortKey(["a", "b"], descending=descending)
+    blocks = [
+        transform_pyarrow.sort(
+            pa.table({"a": np.random.randint(0, 10, n), "b": np.random.rand(n)}),
+            sort_key,
+        )
+        for n in [0, 1, 100, 1000]
+    ]
+    expected = transform_pyarrow.sort(transform_pyarrow.concat(blocks), sort_key)
+
+    for window_size_bytes in [1, 1024, 1024 * 1024]:
+        for spill_threshold_bytes in [None, 0]:
+            result = transform_pyarrow.merge_sorted(
+                blocks, sort_key, window_size_bytes, spill_threshold_bytes
+            )
+            assert result.to_pydict() == expected.to_pydict()
+
+
+def test_sort_spill_to_disk(ray_start_regular, restore_data_context):
+    ray.data.DataContext.get_current().sort_spill_threshold_bytes = 0
+    xs = list(range(1000))
+    random.shuffle(xs)
+    ds = ray.data.from_items(xs, parallelism=10)
+
+    assert extract_values("item", ds.sort("item").take_all()) == list(range(1000))
+    assert extract_values("item", ds.sort("item", descending=True).take_all()) == list(
+        reversed(range(1000))
+    )
+
+
 @pytest.mark.parametrize("num_items,parallelism", [(100, 1), (1000, 4)])
 @pytest.mark.parametrize("use_polars", [False, True])
 def test_sort_arrow(
@@ -25,6 +25,7 @@ from ray.data._internal.execution.streaming_executor_state import (
     AutoscalingState,
     DownstreamMemoryInfo,
     OpState,
+    RollingRate,
     TopologyResourceUsage,
     _execution_allowed,
     build_streaming_topology,
@@ -233,6 +234,69 @@ def test_select_operator_to_run():
     )
 
 
+def test_rolling_rate():
+    rate = RollingRate(window_s=10)
+    assert rate.rate(now=100) is None
+    rate.record(now=100)
+    rate.record(now=101)
+    # Not enough measurements yet.
+    assert rate.rate(now=102) is None
+    assert rate.rate(now=105) == 2 / 5
+    # Events older than the window are evicted.
+    rate.record(now=111)
+    assert rate.rate(now=111) == 2 / 10
+
+
+def test_select_operator_to_run_throughput_backpressure():
+    opt = ExecutionOptions()
+    inputs = make_ref_bundles([[x] for x in range(20)])
+    o1 = InputDataBuffer(inputs)
+    o2 = MapOperator.create(
+        make_map_transformer(lambda block: [b * -1 for b in block]), o1
+    )
+    o3 = MapOperator.create(
+        make_map_transformer(lambda block: [b * 2 for b in block]), o2
+    )
+    topo, _ = build_streaming_topology(o3, opt)
+    for i in range(20):
+        topo[o1].outqueue.append(f"dummy{i}")
+    for i in range(8):
+        topo[o2].outqueue.append(f"dummy{i}")
+    o3.num_active_tasks = MagicMock(return_value=20)
+    o3.internal_queue_size = MagicMock(return_value=0)
+
+    # Without throughput measurements, o3 has the most bundles in processing.
+    assert (
+        select_operator_to_run(
+            topo, NO_USAGE, ExecutionResources(), True, "dummy", AutoscalingState()
+        )
+        == o2
+    )
+
+    # o3 consumes 0.1 bundles/s, so the 8 bundles queued for it already keep it
+    # busy for longer than the backpressure horizon.
+    now = time.time()
+    topo[o3].input_rate.record(now=now - 20)
+    topo[o3].input_rate.record(now=now - 10)
+    assert (
+        select_operator_to_run(
+            topo, NO_USAGE, ExecutionResources(), True, "dummy", AutoscalingState()
+        )
+        == o3
+    )
+
+    # o3 consumes 10 bundles/s, so more bundles should be queued for it.
+    topo[o3].input_rate = RollingRate()
+    for i in range(200):
+        topo[o3].input_rate.record(now=now - 20 + i * 0.1)
+    assert (
+        select_operator_to_run(
+            topo, NO_USAGE, ExecutionResources(), True, "dummy", AutoscalingState()
+        )
+        == o2
+    )
+
+
 def test_dispatch_next_task():
     inputs = make_ref_bundles([[x] for x in range(20)])
     o1 = InputDataBuffer(inputs)
@@ -652,6 +652,23 @@ def test_read_invalid_tfrecords(ray_start_regular_shared, tmp_path):
         ray.data.read_tfrecords(file_path).schema()
 
 
+def test_read_corrupted_tfrecords(ray_start_regular_shared, tmp_path):
+    ray.data.from_items([{"item": i} for i in range(10)]).write_tfrecords(tmp_path)
+    [filename] = os.listdir(tmp_path)
+    path = os.path.join(tmp_path, filename)
+    assert ray.data.read_tfrecords(path).take_all() == [{"item": i} for i in range(10)]
+
+    # Flip a bit of the last record's data, so that its CRC-32C hash is invalid.
+    with open(path, "rb") as file:
+        data = bytearray(file.read())
+    data[-5] ^= 1
+    with open(path, "wb") as file:
+        file.write(data)
+
+    with pytest.raises(RuntimeError, match="Already read 9 rows"):
+        ray.data.read_tfrecords(path).materialize()
+
+
 def test_read_with_invalid_schema(
     ray_start_regular_shared,
     tmp_path,
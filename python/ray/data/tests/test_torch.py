@@ -303,6 +303,29 @@ def test_iter_torch_batches_tensor_ds(ray_start_10_cpus_shared):
         np.testing.assert_array_equal(arr, combined_iterations)
 
 
+@pytest.mark.parametrize("pin_memory", [False, True])
+@pytest.mark.parametrize("device_prefetch_batches", [0, 2])
+def test_iter_torch_batches_device_prefetch(
+    ray_start_10_cpus_shared, pin_memory, device_prefetch_batches
+):
+    ds = ray.data.range(100, parallelism=5)
+
+    num_epochs = 2
+    for _ in range(num_epochs):
+        iterations = []
+        for batch in ds.iter_torch_batches(
+            batch_size=8,
+            device="cpu",
+            pin_memory=pin_memory,
+            device_prefetch_batches=device_prefetch_batches,
+        ):
+            iterations.append(batch["id"].numpy())
+        np.testing.assert_array_equal(np.concatenate(iterations), np.arange(100))
+
+    with pytest.raises(ValueError):
+        ds.iter_torch_batches(collate_fn=lambda batch: batch, pin_memory=True)
+
+
 # This test catches an error in stream_split_iterator dealing with empty blocks,
 # which is difficult to reproduce outside of TorchTrainer.
 def test_torch_trainer_crash(ray_start_10_cpus_shared):
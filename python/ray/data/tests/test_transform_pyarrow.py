@@ -368,6 +368,36 @@ def test_arrow_block_slice_copy_empty():
     assert table2.num_rows == 0
 
 
+def test_arrow_block_to_numpy_tensor_zero_copy():
+    # Test that tensor columns are only copied if their chunks aren't contiguous.
+    data = np.arange(60, dtype=np.float32).reshape((10, 3, 2))
+    arr = ArrowTensorArray.from_numpy(data)
+
+    # Single chunk.
+    acc = BlockAccessor.for_block(pa.table({"a": arr.slice(2, 5)}))
+    out = acc.to_numpy("a")
+    np.testing.assert_array_equal(out, data[2:7])
+    assert np.shares_memory(out, data)
+    assert acc.num_bytes_copied == 0
+
+    # Adjacent slices of the same array.
+    col = pa.chunked_array([arr.slice(1, 3), arr.slice(4, 0), arr.slice(4, 4)])
+    acc = BlockAccessor.for_block(pa.table({"a": col}))
+    out = acc.to_numpy("a")
+    np.testing.assert_array_equal(out, data[1:8])
+    assert np.shares_memory(out, data)
+    assert acc.num_bytes_copied == 0
+
+    # Chunks of different arrays are copied once.
+    other = ArrowTensorArray.from_numpy(data.copy())
+    col = pa.chunked_array([arr.slice(0, 3), other.slice(5, 4)])
+    acc = BlockAccessor.for_block(pa.table({"a": col}))
+    out = acc.to_numpy("a")
+    np.testing.assert_array_equal(out, np.concatenate([data[:3], data[5:9]]))
+    assert not np.shares_memory(out, data)
+    assert acc.num_bytes_copied == out.nbytes
+
+
 def test_convert_to_pyarrow(ray_start_regular_shared, tmp_path):
     ds = ray.data.range(100)
     assert ds.to_dask().sum().compute()[0] == 4950
@@ -23,6 +23,7 @@ try:
     )
     from ray.serve.air_integrations import PredictorDeployment
     from ray.serve.batching import batch
+    from ray.serve.caching import cache
     from ray.serve.config import HTTPOptions
 except ModuleNotFoundError as e:
     e.msg += (
@@ -39,6 +40,7 @@ ray._private.worker.blocking_get_inside_async_warned = True
 __all__ = [
     "batch",
     "build",
+    "cache",
     "start",
     "HTTPOptions",
     "get_replica_context",
@@ -0,0 +1,121 @@
+import math
+import time
+from typing import Callable, Dict, Iterable, Optional
+
+# The number of seconds that clients are asked to wait before retrying requests
+# that were rejected because the queue of an application was full.
+QUEUE_FULL_RETRY_AFTER_S = 1.0
+
+
+class TokenBucket:
+    """A token bucket that admits requests at a sustained rate.
+
+    The bucket holds up to `capacity` tokens and is refilled at `rate` tokens per
+    second. Each admitted request takes a token, so bursts of up to `capacity`
+    requests are admitted at once.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.rate = rate
+        self.capacity = capacity
+        self._clock = clock
+        self._tokens = capacity
+        self._last_refill_time = clock()
+
+    def _refill(self):
+        now = self._clock()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._last_refill_time) * self.rate
+        )
+        self._last_refill_time = now
+
+    def try_acquire(self) -> Optional[float]:
+        """Take a token from the bucket.
+
+        Returns None if a token was taken, or else the number of seconds until a
+        token will be available.
+        """
+        self._refill()
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return None
+        return (1 - self._tokens) / self.rate
+
+
+class AdmissionController:
+    """Decides whether the proxy admits requests to each application.
+
+    Requests to an application are rejected if either:
+      - `max_queued_requests` is set, and at least that many requests to the
+        application are waiting in the proxy to be assigned to a replica.
+      - `max_requests_per_s` is set, and the application's token bucket is empty.
+
+    Each application has its own limits, so that a spike of traffic to one
+    application doesn't cause requests to the others to be rejected.
+    """
+
+    def __init__(
+        self,
+        max_queued_requests: Optional[int] = None,
+        max_requests_per_s: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_queued_requests = max_queued_requests
+        self.max_requests_per_s = max_requests_per_s
+        self._clock = clock
+        self._token_buckets: Dict[str, TokenBucket] = dict()
+
+    @property
+    def enabled(self) -> bool:
+        return (
+            self.max_queued_requests is not None or self.max_requests_per_s is not None
+        )
+
+    def _get_token_bucket(self, app_name: str) -> TokenBucket:
+        if app_name not in self._token_buckets:
+            self._token_buckets[app_name] = TokenBucket(
+                rate=self.max_requests_per_s,
+                capacity=max(self.max_requests_per_s, 1),
+                clock=self._clock,
+            )
+        return self._token_buckets[app_name]
+
+    def check(
+        self, app_name: str, get_num_queued_requests: Callable[[], int]
+    ) -> Optional[float]:
+        """Check whether a request to the application is admitted.
+
+        `get_num_queued_requests` returns the number of requests to the application
+        that are waiting to be assigned to a replica. It's only called if the queue
+        length is limited.
+
+        Returns None if the request is admitted, or else the number of seconds that
+        the client should wait before retrying it.
+        """
+        if (
+            self.max_queued_requests is not None
+            and get_num_queued_requests() >= self.max_queued_requests
+        ):
+            return QUEUE_FULL_RETRY_AFTER_S
+
+        if self.max_requests_per_s is not None:
+            return self._get_token_bucket(app_name).try_acquire()
+
+        return None
+
+    def update_applications(self, app_names: Iterable[str]):
+        """Drop the state of the applications that aren't running anymore."""
+        app_names = set(app_names)
+        for app_name in list(self._token_buckets):
+            if app_name not in app_names:
+                del self._token_buckets[app_name]
+
+
+def format_retry_after(retry_after_s: float) -> str:
+    """Format the Retry-After header value, in whole seconds."""
+    return str(max(1, math.ceil(retry_after_s)))
@@ -49,7 +49,11 @@ class InMemoryMetricsStore:
         return datapoints[idx:]
 
     def window_average(
-        self, key: str, window_start_timestamp_s: float, do_compact: bool = True
+        self,
+        key: str,
+        window_start_timestamp_s: float,
+        do_compact: bool = True,
+        window_end_timestamp_s: Optional[float] = None,
     ) -> Optional[float]:
         """Perform a window average operation for metric `key`
 
@@ -61,6 +65,9 @@ class InMemoryMetricsStore:
             do_compact: whether or not to delete the datapoints that's
               before `window_start_timestamp_s` to save memory. Default is
               true.
+            window_end_timestamp_s: the unix epoch timestamp for the end of
+              the window. If set, only the datapoints before this timestamp
+              are averaged.
         Returns:
             The average of all the datapoints for the key on and after time
             window_start_timestamp_s, or None if there are no such points.
@@ -70,6 +77,13 @@ class InMemoryMetricsStore:
         if do_compact:
             self.data[key] = points_after_idx
 
+        if window_end_timestamp_s is not None:
+            end_idx = bisect.bisect_left(
+                a=points_after_idx,
+                x=TimeStampedValue(timestamp=window_end_timestamp_s, value=0),
+            )
+            points_after_idx = points_after_idx[:end_idx]
+
         if len(points_after_idx) == 0:
             return
         return sum(point.value for point in points_after_idx) / len(points_after_idx)
@@ -1,8 +1,11 @@
 from abc import ABCMeta, abstractmethod
 import math
-from typing import List
+import time
+from typing import Any, Callable, Dict, List, Optional
 
+from ray._private.utils import import_attr
 from ray.serve.config import AutoscalingConfig
+from ray.serve._private.autoscaling_metrics import InMemoryMetricsStore
 from ray.serve._private.constants import CONTROL_LOOP_PERIOD_S, SERVE_LOGGER_NAME
 import logging
 
@@ -203,3 +206,164 @@ class BasicAutoscalingPolicy(AutoscalingPolicy):
             self.decision_counter = 0
 
         return decision_num_replicas
+
+
+class PredictiveAutoscalingPolicy(BasicAutoscalingPolicy):
+    """An autoscaling policy that scales replicas ahead of the forecast load.
+
+    The load of the deployment is the number of ongoing requests of its replicas
+    plus the number of queries queued in its handles. Every `metrics_interval_s`,
+    the load is recorded in an `InMemoryMetricsStore`, and its level and trend
+    are smoothed over `look_back_period_s` with Holt's linear exponential
+    smoothing. The load `forecast_horizon_s` from now is forecast by following
+    the trend, and if `seasonal_period_s` is set, also by repeating the load of
+    one period ago, shifted by how much the level changed since then. The larger
+    of the forecasts is used.
+
+    The policy scales up to the number of replicas that the forecast load needs
+    right away, so that they've started by the time the load arrives. Otherwise,
+    it makes the same decisions as `BasicAutoscalingPolicy`, but doesn't scale
+    below the number of replicas that the forecast load needs.
+
+    The load history is kept in memory, and is lost when the controller
+    recovers from a failure or the deployment is updated.
+    """
+
+    LOAD_KEY = "load"
+
+    def __init__(
+        self, config: AutoscalingConfig, clock: Callable[[], float] = time.time
+    ):
+        super().__init__(config)
+        self._clock = clock
+        self._reset_forecast()
+
+    def _reset_forecast(self):
+        self.metrics_store = InMemoryMetricsStore()
+        self._level: Optional[float] = None
+        # The trend of the load, in requests per second.
+        self._trend = 0.0
+        self._last_record_timestamp_s: Optional[float] = None
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Don't checkpoint the load history along with the deployment info.
+        state = self.__dict__.copy()
+        for key in ["metrics_store", "_level", "_trend", "_last_record_timestamp_s"]:
+            del state[key]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]):
+        self.__dict__.update(state)
+        self._reset_forecast()
+
+    def record_load(self, load: float, timestamp_s: float):
+        """Record the load, at most once per `metrics_interval_s`."""
+        if self._last_record_timestamp_s is not None:
+            elapsed_s = timestamp_s - self._last_record_timestamp_s
+            if elapsed_s < self.config.metrics_interval_s:
+                return
+
+        self.metrics_store.add_metrics_point({self.LOAD_KEY: load}, timestamp_s)
+        if self._level is None:
+            self._level = load
+        else:
+            # The smoothing factor depends on the time since the last data point,
+            # so that the smoothing window doesn't depend on the recording rate.
+            alpha = 1 - math.exp(-elapsed_s / self.config.look_back_period_s)
+            prev_level = self._level
+            self._level = alpha * load + (1 - alpha) * (
+                prev_level + self._trend * elapsed_s
+            )
+            self._trend = (
+                alpha * (self._level - prev_level) / elapsed_s
+                + (1 - alpha) * self._trend
+            )
+        self._last_record_timestamp_s = timestamp_s
+
+        # Drop the data points that are too old for the seasonal forecast.
+        history_s = self.config.look_back_period_s + (
+            self.config.seasonal_period_s or 0
+        )
+        self.metrics_store.window_average(self.LOAD_KEY, timestamp_s - history_s)
+
+    def _seasonal_load(self, timestamp_s: float) -> Optional[float]:
+        """The average recorded load around the timestamp."""
+        half_window_s = self.config.look_back_period_s / 2
+        return self.metrics_store.window_average(
+            self.LOAD_KEY,
+            timestamp_s - half_window_s,
+            do_compact=False,
+            window_end_timestamp_s=timestamp_s + half_window_s,
+        )
+
+    def forecast_load(self, timestamp_s: float) -> Optional[float]:
+        """Forecast the load `forecast_horizon_s` after the timestamp.
+
+        Returns None if no load has been recorded yet.
+        """
+        if self._level is None:
+            return None
+
+        horizon_s = self.config.forecast_horizon_s
+        forecast = self._level + self._trend * horizon_s
+
+        period_s = self.config.seasonal_period_s
+        if period_s is not None:
+            past_load = self._seasonal_load(timestamp_s - period_s)
+            past_future_load = self._seasonal_load(timestamp_s - period_s + horizon_s)
+            if past_load is not None and past_future_load is not None:
+                forecast = max(forecast, past_future_load + self._level - past_load)
+
+        return max(forecast, 0.0)
+
+    def get_decision_num_replicas(
+        self,
+        curr_target_num_replicas: int,
+        current_num_ongoing_requests: List[float],
+        current_handle_queued_queries: float,
+    ) -> int:
+        timestamp_s = self._clock()
+        self.record_load(
+            sum(current_num_ongoing_requests) + current_handle_queued_queries,
+            timestamp_s,
+        )
+
+        decision_num_replicas = super().get_decision_num_replicas(
+            curr_target_num_replicas=curr_target_num_replicas,
+            current_num_ongoing_requests=current_num_ongoing_requests,
+            current_handle_queued_queries=current_handle_queued_queries,
+        )
+
+        forecast = self.forecast_load(timestamp_s)
+        if forecast is None:
+            return decision_num_replicas
+
+        # Round away floating point error, so that a steady load that needs
+        # exactly N replicas doesn't get N + 1.
+        forecast_num_replicas = math.ceil(
+            round(forecast / self.config.target_num_ongoing_requests_per_replica, 6)
+        )
+        forecast_num_replicas = min(self.config.max_replicas, forecast_num_replicas)
+        forecast_num_replicas = max(self.config.min_replicas, forecast_num_replicas)
+        return max(decision_num_replicas, forecast_num_replicas)
+
+
+def create_autoscaling_policy(config: AutoscalingConfig) -> AutoscalingPolicy:
+    """Create the autoscaling policy that's set in the config.
+
+    `config.policy` is None for `BasicAutoscalingPolicy`, "predictive" for
+    `PredictiveAutoscalingPolicy`, or else the import path of a subclass of
+    `AutoscalingPolicy`, which is constructed with the config.
+    """
+    if config.policy is None:
+        return BasicAutoscalingPolicy(config)
+    if config.policy == "predictive":
+        return PredictiveAutoscalingPolicy(config)
+
+    policy_cls = import_attr(config.policy)
+    if not (isinstance(policy_cls, type) and issubclass(policy_cls, AutoscalingPolicy)):
+        raise TypeError(
+            f"The autoscaling policy '{config.policy}' must be a subclass of "
+            f"AutoscalingPolicy, got {policy_cls}."
+        )
+    return policy_cls(config)
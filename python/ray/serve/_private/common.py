@@ -15,7 +15,7 @@ from ray.serve.generated.serve_pb2 import (
     ApplicationStatusInfo as ApplicationStatusInfoProto,
     StatusOverview as StatusOverviewProto,
 )
-from ray.serve._private.autoscaling_policy import BasicAutoscalingPolicy
+from ray.serve._private.autoscaling_policy import create_autoscaling_policy
 
 
 class DeploymentID(NamedTuple):
@@ -235,7 +235,7 @@ class DeploymentInfo:
         self.docs_path = docs_path
         self.ingress = ingress
         if deployment_config.autoscaling_config is not None:
-            self.autoscaling_policy = BasicAutoscalingPolicy(
+            self.autoscaling_policy = create_autoscaling_policy(
                 deployment_config.autoscaling_config
             )
         else:
@@ -201,6 +201,8 @@ class DeploymentConfig(BaseModel):
                 data["autoscaling_config"]["upscale_smoothing_factor"] = None
             if not data["autoscaling_config"].get("downscale_smoothing_factor"):
                 data["autoscaling_config"]["downscale_smoothing_factor"] = None
+            if not data["autoscaling_config"].get("policy"):
+                data["autoscaling_config"]["policy"] = None
             data["autoscaling_config"] = AutoscalingConfig(**data["autoscaling_config"])
         if "version" in data:
             if data["version"] == "":
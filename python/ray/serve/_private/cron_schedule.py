@@ -0,0 +1,96 @@
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional, Set
+
+# The (min, max) values of the minute, hour, day of month, month, and day of week
+# fields of cron expressions.
+_FIELD_RANGES = [(0, 59), (0, 23), (1, 31), (1, 12), (0, 7)]
+_FIELD_NAMES = ["minute", "hour", "day of month", "month", "day of week"]
+
+
+def _parse_field(field: str, name: str, min_value: int, max_value: int) -> Set[int]:
+    values = set()
+    for part in field.split(","):
+        range_part, _, step_part = part.partition("/")
+        try:
+            step = int(step_part) if step_part else 1
+            if range_part == "*":
+                start, end = min_value, max_value
+            elif "-" in range_part:
+                start, end = (int(value) for value in range_part.split("-", 1))
+            else:
+                start = int(range_part)
+                end = max_value if step_part else start
+        except ValueError:
+            raise ValueError(f"Invalid {name} field '{field}'.") from None
+        if step < 1 or not min_value <= start <= end <= max_value:
+            raise ValueError(
+                f"Invalid {name} field '{field}', values must be between "
+                f"{min_value} and {max_value}."
+            )
+        values.update(range(start, end + 1, step))
+    return values
+
+
+class CronSchedule:
+    """A schedule defined by a cron expression, evaluated in UTC.
+
+    The expression has the standard five fields: minute, hour, day of month,
+    month, and day of week (0-7, where both 0 and 7 are Sunday). Each field is
+    `*`, a value, a range `a-b`, or a comma-separated list of them, optionally
+    with a step, e.g. `*/15` or `9-17/2`. Like cron, if both the day of month and
+    the day of week are restricted, a day matches if either of them matches.
+    """
+
+    def __init__(self, expression: str):
+        fields = expression.split()
+        if len(fields) != 5:
+            raise ValueError(
+                f"Invalid cron expression '{expression}', expected 5 fields: "
+                "minute, hour, day of month, month, and day of week."
+            )
+
+        self.expression = expression
+        parsed: List[Set[int]] = [
+            _parse_field(field, name, *value_range)
+            for field, name, value_range in zip(fields, _FIELD_NAMES, _FIELD_RANGES)
+        ]
+        self._minutes, self._hours, self._days, self._months, weekdays = parsed
+        if 7 in weekdays:
+            weekdays.add(0)
+        self._weekdays = weekdays
+        self._days_restricted = fields[2] != "*"
+        self._weekdays_restricted = fields[4] != "*"
+
+    def _day_matches(self, time: datetime) -> bool:
+        if time.month not in self._months:
+            return False
+        day_matches = time.day in self._days
+        # `datetime.weekday()` starts the week on Monday, cron starts it on Sunday.
+        weekday_matches = (time.weekday() + 1) % 7 in self._weekdays
+        if self._days_restricted and self._weekdays_restricted:
+            return day_matches or weekday_matches
+        return day_matches and weekday_matches
+
+    def last_match(self, timestamp_s: float, max_lookback_s: float) -> Optional[float]:
+        """Return the last time at or before `timestamp_s` that matches.
+
+        Only the `max_lookback_s` seconds before `timestamp_s` are searched, and
+        None is returned if no time in them matches.
+        """
+        time = datetime.fromtimestamp(timestamp_s, tz=timezone.utc).replace(
+            second=0, microsecond=0
+        )
+        earliest = datetime.fromtimestamp(timestamp_s - max_lookback_s, tz=timezone.utc)
+        one_minute = timedelta(minutes=1)
+        # Skip whole days and hours that don't match, so that long lookbacks are
+        # cheap to search.
+        while time >= earliest:
+            if not self._day_matches(time):
+                time = time.replace(hour=0, minute=0) - one_minute
+            elif time.hour not in self._hours:
+                time = time.replace(minute=0) - one_minute
+            elif time.minute not in self._minutes:
+                time -= one_minute
+            else:
+                return time.timestamp()
+        return None
@@ -1486,6 +1486,11 @@ class DeploymentState:
             current_num_ongoing_requests=current_num_ongoing_requests,
             current_handle_queued_queries=current_handle_queued_queries,
         )
+        # Keep the scheduled minimum number of replicas regardless of the policy.
+        decision_num_replicas = max(
+            decision_num_replicas,
+            autoscaling_policy.config.get_min_replicas(time.time()),
+        )
         if decision_num_replicas == self._target_state.num_replicas:
             return
 
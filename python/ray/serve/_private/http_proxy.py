@@ -30,6 +30,10 @@ from ray.serve.handle import (
     DeploymentHandle,
     _DeploymentResponseBase,
 )
+from ray.serve._private.admission_control import (
+    AdmissionController,
+    format_retry_after,
+)
 from ray.serve._private.grpc_util import (
     create_serve_grpc_server,
     DummyServicer,
@@ -128,6 +132,7 @@ INITIAL_BACKOFF_PERIOD_SEC = 0.05
 MAX_BACKOFF_PERIOD_SEC = 5
 BACKOFF_FACTOR = 2
 DRAINED_MESSAGE = "This node is being drained."
+OVERLOADED_MESSAGE = "The application is overloaded, retry the request later."
 HEALTH_CHECK_SUCCESS_MESSAGE = "success"
 
 
@@ -145,6 +150,7 @@ class GenericProxy(ABC):
       - `not_found()`
       - `draining_response()`
       - `timeout_response()`
+      - `overloaded_response()`
       - `routes_response()`
       - `health_response()`
       - `send_request_to_replica_unary()`
@@ -161,11 +167,18 @@ class GenericProxy(ABC):
         request_timeout_s: Optional[float] = None,
         controller_actor: Optional[ActorHandle] = None,
         proxy_actor: Optional[ActorHandle] = None,
+        max_queued_requests: Optional[int] = None,
+        max_requests_per_s: Optional[float] = None,
     ):
         self.request_timeout_s = request_timeout_s
         if self.request_timeout_s is not None and self.request_timeout_s < 0:
             self.request_timeout_s = None
 
+        self.admission_controller = AdmissionController(
+            max_queued_requests=max_queued_requests,
+            max_requests_per_s=max_requests_per_s,
+        )
+
         self._node_id = node_id
 
         # Set the controller name so that serve connects to the
@@ -243,6 +256,15 @@ class GenericProxy(ABC):
             ),
         )
 
+        self.rejected_request_counter = metrics.Counter(
+            f"serve_num_{self.protocol.lower()}_rejected_requests",
+            description=(
+                f"The number of {self.protocol} requests rejected by the proxy "
+                "because their application was overloaded."
+            ),
+            tag_keys=("route", "method", "application"),
+        )
+
         self.processing_latency_tracker = metrics.Histogram(
             f"serve_{self.protocol.lower()}_request_latency_ms",
             description=(
@@ -310,6 +332,9 @@ class GenericProxy(ABC):
             self.route_info[route] = endpoint
 
         self.proxy_router.update_routes(endpoints)
+        self.admission_controller.update_applications(
+            endpoint.app for endpoint in endpoints
+        )
 
     def is_drained(self):
         """Check whether the proxy actor is drained or not.
@@ -359,6 +384,12 @@ class GenericProxy(ABC):
     ) -> ProxyResponse:
         raise NotImplementedError
 
+    @abstractmethod
+    async def overloaded_response(
+        self, proxy_request: ProxyRequest, retry_after_s: float
+    ) -> ProxyResponse:
+        raise NotImplementedError
+
     @abstractmethod
     async def routes_response(self, proxy_request: ProxyRequest) -> ProxyResponse:
         raise NotImplementedError
@@ -459,6 +490,42 @@ class GenericProxy(ABC):
 
             route_prefix, handle, app_is_cross_language = matched_route
 
+            if self.admission_controller.enabled:
+                # Reject the request right away if its application is overloaded,
+                # rather than queueing it until it times out.
+                app_name = handle.deployment_id.app
+                retry_after_s = self.admission_controller.check(
+                    app_name,
+                    lambda: handle._get_or_create_router().num_queued_queries,
+                )
+                if retry_after_s is not None:
+                    proxy_response = await self.overloaded_response(
+                        proxy_request=proxy_request, retry_after_s=retry_after_s
+                    )
+                    self.rejected_request_counter.inc(
+                        tags={
+                            "route": route_path,
+                            "method": method,
+                            "application": app_name,
+                        }
+                    )
+                    self.request_error_counter.inc(
+                        tags={
+                            "route": route_path,
+                            "error_code": proxy_response.status_code,
+                            "method": method,
+                        }
+                    )
+                    self.request_counter.inc(
+                        tags={
+                            "route": route_path,
+                            "method": method,
+                            "application": app_name,
+                            "status_code": proxy_response.status_code,
+                        }
+                    )
+                    return proxy_response
+
             # Modify the path and root path so that reverse lookups and redirection
             # work as expected. We do this here instead of in replicas so it can be
             # changed without restarting the replicas.
@@ -677,6 +744,15 @@ class gRPCProxy(GenericProxy):
         proxy_request.send_details(message=timeout_message)
         return ProxyResponse(status_code=str(status_code))
 
+    async def overloaded_response(
+        self, proxy_request: ProxyRequest, retry_after_s: float
+    ) -> ProxyResponse:
+        status_code = grpc.StatusCode.RESOURCE_EXHAUSTED
+        proxy_request.send_status_code(status_code=status_code)
+        proxy_request.send_details(message=OVERLOADED_MESSAGE)
+        proxy_request.send_retry_after(format_retry_after(retry_after_s))
+        return ProxyResponse(status_code=str(status_code))
+
     async def routes_response(self, proxy_request: ProxyRequest) -> ProxyResponse:
         status_code = grpc.StatusCode.OK
         proxy_request.send_status_code(status_code=status_code)
@@ -969,6 +1045,19 @@ class HTTPProxy(GenericProxy):
         )
         return ProxyResponse(status_code=str(status_code))
 
+    async def overloaded_response(
+        self, proxy_request: ProxyRequest, retry_after_s: float
+    ) -> ProxyResponse:
+        status_code = 503
+        response = Response(OVERLOADED_MESSAGE, status_code=status_code)
+        response.raw_headers.append(
+            [b"retry-after", format_retry_after(retry_after_s).encode()]
+        )
+        await response.send(
+            proxy_request.scope, proxy_request.receive, proxy_request.send
+        )
+        return ProxyResponse(status_code=str(status_code))
+
     async def routes_response(self, proxy_request: ProxyRequest) -> ProxyResponse:
         resp = dict()
         for route, endpoint in self.route_info.items():
@@ -1413,6 +1502,8 @@ class HTTPProxyActor:
         http_middlewares: Optional[List["starlette.middleware.Middleware"]] = None,
         keep_alive_timeout_s: int = DEFAULT_UVICORN_KEEP_ALIVE_TIMEOUT_S,
         grpc_options: Optional[gRPCOptions] = None,
+        max_queued_requests: Optional[int] = None,
+        max_requests_per_s: Optional[float] = None,
     ):  # noqa: F821
         self.grpc_options = grpc_options or gRPCOptions()
         configure_component_logger(
@@ -1468,6 +1559,8 @@ class HTTPProxyActor:
             request_timeout_s=(
                 request_timeout_s or RAY_SERVE_REQUEST_PROCESSING_TIMEOUT_S
             ),
+            max_queued_requests=max_queued_requests,
+            max_requests_per_s=max_requests_per_s,
         )
         self.grpc_proxy = (
             gRPCProxy(
@@ -1478,6 +1571,8 @@ class HTTPProxyActor:
                 request_timeout_s=(
                     request_timeout_s or RAY_SERVE_REQUEST_PROCESSING_TIMEOUT_S
                 ),
+                max_queued_requests=max_queued_requests,
+                max_requests_per_s=max_requests_per_s,
             )
             if self.should_start_grpc_service()
             else None
@@ -499,6 +499,8 @@ class HTTPProxyStateManager:
             http_middlewares=self._config.middlewares,
             request_timeout_s=self._config.request_timeout_s,
             keep_alive_timeout_s=self._config.keep_alive_timeout_s,
+            max_queued_requests=self._config.max_queued_requests,
+            max_requests_per_s=self._config.max_requests_per_s,
             grpc_options=grpc_options,
         )
         return proxy
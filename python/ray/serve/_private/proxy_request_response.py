@@ -160,6 +160,9 @@ class gRPCProxyRequest(ProxyRequest):
     def send_request_id(self, request_id: str):
         self.context.set_trailing_metadata([("request_id", request_id)])
 
+    def send_retry_after(self, retry_after: str):
+        self.context.set_trailing_metadata([("retry-after", retry_after)])
+
     def send_status_code(self, status_code: grpc.StatusCode):
         self.context.set_code(status_code)
 
@@ -717,6 +717,8 @@ class RayServeReplica:
                 request_metadata.request_id,
                 self.deployment_id.app,
                 request_metadata.multiplexed_model_id,
+                priority=request_metadata.priority,
+                deadline=request_metadata.deadline,
             )
         )
 
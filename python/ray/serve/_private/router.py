@@ -51,6 +51,7 @@ from ray.serve._private.utils import (
     JavaActorHandleProxy,
     MetricsPusher,
 )
+from ray.serve.exceptions import RequestDeadlineExceededError
 from ray.serve.generated.serve_pb2 import (
     DeploymentRoute,
     RequestMetadata as RequestMetadataProto,
@@ -80,6 +81,12 @@ class RequestMetadata:
     # If this request expects a streaming response.
     is_streaming: bool = False
 
+    # Requests with higher priorities are assigned to replicas first.
+    priority: int = 0
+
+    # Unix timestamp after which the request is no longer assigned to a replica.
+    deadline: Optional[float] = None
+
     # The protocol to serve this request
     _request_protocol: RequestProtocol = RequestProtocol.UNDEFINED
 
@@ -91,6 +98,18 @@ class RequestMetadata:
     def is_grpc_request(self) -> bool:
         return self._request_protocol == RequestProtocol.GRPC
 
+    def is_past_deadline(self) -> bool:
+        return self.deadline is not None and time.time() >= self.deadline
+
+
+def _deadline_exceeded_error(
+    request_metadata: RequestMetadata,
+) -> RequestDeadlineExceededError:
+    return RequestDeadlineExceededError(
+        f"Request {request_metadata.request_id} wasn't assigned to a replica before "
+        "its deadline."
+    )
+
 
 @dataclass
 class Query:
@@ -322,7 +341,9 @@ class LocalityScope(str, enum.Enum):
 class PowerOfTwoChoicesReplicaScheduler(ReplicaScheduler):
     """Chooses a replica for each request using the "power of two choices" procedure.
 
-    Requests are scheduled in FIFO order.
+    Requests are scheduled in order of priority, and in FIFO order among requests
+    with the same priority. Requests whose deadline passes before they're scheduled
+    fail with a `RequestDeadlineExceededError` instead of being sent to a replica.
 
     When a request comes in, two candidate replicas are chosen randomly. Each replica
     is sent a control message to fetch its queue length.
@@ -390,9 +411,10 @@ class PowerOfTwoChoicesReplicaScheduler(ReplicaScheduler):
         # added, but it will not exceed self.max_num_scheduling_tasks.
         self._scheduling_tasks: Set[asyncio.Task] = set()
 
-        # We keep two separate queues of pending requests:
+        # We keep two separate queues of pending requests, which are both sorted by
+        # priority and then by arrival order:
         # - self._pending_requests_to_fulfill is a queue that will be used to fulfill
-        # requests in FIFO order by scheduling tasks once they've acquired a replica.
+        # requests in order by scheduling tasks once they've acquired a replica.
         # To avoid long tail latencies due to backoff, the scheduling task started by
         # a given request may not be the one to fulfill it.
         # - self._pending_requests_to_schedule is a queue that is used for tasks to
@@ -701,6 +723,41 @@ class PowerOfTwoChoicesReplicaScheduler(ReplicaScheduler):
         # In that case, return `None` so a new one is selected.
         return self._replicas.get(chosen_replica_id, None)
 
+    @staticmethod
+    def _insert_pending_request(
+        pending_requests: Deque[PendingRequest], pending_request: PendingRequest
+    ):
+        """Insert a pending request after the requests with the same or a higher
+        priority.
+
+        Requests usually have the same priority, in which case this appends them.
+        """
+        index = len(pending_requests)
+        while (
+            index > 0
+            and pending_requests[index - 1].metadata.priority
+            < pending_request.metadata.priority
+        ):
+            index -= 1
+        pending_requests.insert(index, pending_request)
+
+    @staticmethod
+    def _is_pending(pending_request: PendingRequest) -> bool:
+        """Check if a request is still waiting to be assigned a replica.
+
+        If the request's deadline has passed, it fails instead.
+        """
+        if pending_request.future.done():
+            return False
+
+        if pending_request.metadata.is_past_deadline():
+            pending_request.future.set_exception(
+                _deadline_exceeded_error(pending_request.metadata)
+            )
+            return False
+
+        return True
+
     def _get_pending_request_matching_metadata(
         self,
         replica: ReplicaWrapper,
@@ -711,7 +768,7 @@ class PowerOfTwoChoicesReplicaScheduler(ReplicaScheduler):
 
         for pr in self._pending_requests_to_fulfill:
             if (
-                not pr.future.done()
+                self._is_pending(pr)
                 and pr.metadata.multiplexed_model_id
                 == request_metadata.multiplexed_model_id
             ):
@@ -724,10 +781,10 @@ class PowerOfTwoChoicesReplicaScheduler(ReplicaScheduler):
         replica: ReplicaWrapper,
         request_metadata: Optional[RequestMetadata] = None,
     ):
-        """Assign the replica to the next pending request in FIFO order.
+        """Assign the replica to the next pending request in priority order.
 
-        If a pending request has been cancelled, it will be popped from the queue
-        and not assigned.
+        If a pending request has been cancelled or its deadline has passed, it will
+        be popped from the queue and not assigned.
         """
         # First try to match a pending request based on the request metadata (currently
         # this only looks at the multiplexed model ID).
@@ -740,10 +797,10 @@ class PowerOfTwoChoicesReplicaScheduler(ReplicaScheduler):
             return
 
         # If no pending request matches the request metadata, fulfill the next in the
-        # queue in FIFO order, passing over futures that have been cancelled.
+        # queue, passing over futures that have been cancelled or timed out.
         while len(self._pending_requests_to_fulfill) > 0:
             pr = self._pending_requests_to_fulfill.popleft()
-            if not pr.future.done():
+            if self._is_pending(pr):
                 pr.future.set_result(replica)
                 break
 
@@ -752,7 +809,7 @@ class PowerOfTwoChoicesReplicaScheduler(ReplicaScheduler):
     ) -> Optional[RequestMetadata]:
         while len(self._pending_requests_to_schedule) > 0:
             pr = self._pending_requests_to_schedule.popleft()
-            if not pr.future.done():
+            if self._is_pending(pr):
                 return pr.metadata
 
         return None
@@ -803,19 +860,33 @@ class PowerOfTwoChoicesReplicaScheduler(ReplicaScheduler):
     async def choose_replica_for_query(self, query: Query) -> ReplicaWrapper:
         """Chooses a replica to send the provided request to.
 
-        Requests are scheduled in FIFO order, so this puts a future on the internal
-        queue that will be resolved when a replica is available and it's the front of
-        the queue.
+        Requests are scheduled in priority order, so this puts a future on the
+        internal queue that will be resolved when a replica is available and it's the
+        front of the queue.
 
-        Upon cancellation (by the caller), the future is cancelled and will be passed
-        over when a replica becomes available.
+        Upon cancellation (by the caller) or when the request's deadline passes, the
+        future is cancelled and will be passed over when a replica becomes available.
         """
+        if query.metadata.is_past_deadline():
+            raise _deadline_exceeded_error(query.metadata)
+
         pending_request = PendingRequest(asyncio.Future(), query.metadata)
         try:
-            self._pending_requests_to_fulfill.append(pending_request)
-            self._pending_requests_to_schedule.append(pending_request)
+            self._insert_pending_request(
+                self._pending_requests_to_fulfill, pending_request
+            )
+            self._insert_pending_request(
+                self._pending_requests_to_schedule, pending_request
+            )
             self.maybe_start_scheduling_tasks()
-            replica = await pending_request.future
+            if query.metadata.deadline is None:
+                replica = await pending_request.future
+            else:
+                replica = await asyncio.wait_for(
+                    pending_request.future, query.metadata.deadline - time.time()
+                )
+        except asyncio.TimeoutError:
+            raise _deadline_exceeded_error(query.metadata) from None
         except asyncio.CancelledError as e:
             pending_request.future.cancel()
 
@@ -1131,6 +1202,18 @@ class Router:
             {"deployment": deployment_id.name, "application": deployment_id.app}
         )
 
+        self.num_deadline_exceeded_requests = metrics.Counter(
+            "serve_num_deadline_exceeded_requests",
+            description=(
+                "The number of requests dropped by the router because they weren't "
+                "assigned to a replica before their deadline."
+            ),
+            tag_keys=("deployment", "route", "application"),
+        )
+        self.num_deadline_exceeded_requests.set_default_tags(
+            {"deployment": deployment_id.name, "application": deployment_id.app}
+        )
+
         self.num_queued_queries = 0
         self.num_queued_queries_gauge = metrics.Gauge(
             "serve_deployment_queued_queries",
@@ -1190,6 +1273,11 @@ class Router:
         """Assign a query to a replica and return the resulting object_ref."""
 
         self.num_router_requests.inc(tags={"route": request_meta.route})
+        if request_meta.is_past_deadline():
+            # Shed requests that have already timed out before queueing them.
+            self.num_deadline_exceeded_requests.inc(tags={"route": request_meta.route})
+            raise _deadline_exceeded_error(request_meta)
+
         self.num_queued_queries += 1
         self.num_queued_queries_gauge.set(self.num_queued_queries)
 
@@ -1211,6 +1299,9 @@ class Router:
             )
             await query.replace_known_types_in_args()
             return await self._replica_scheduler.assign_replica(query)
+        except RequestDeadlineExceededError:
+            self.num_deadline_exceeded_requests.inc(tags={"route": request_meta.route})
+            raise
         finally:
             # If the query is disconnected before assignment, this coroutine
             # gets cancelled by the caller and an asyncio.CancelledError is
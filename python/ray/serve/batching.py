@@ -18,6 +18,7 @@ from typing import (
 )
 
 from ray.util.annotations import PublicAPI
+from ray.serve import metrics
 from ray.serve.exceptions import RayServeException
 from ray._private.utils import get_or_create_event_loop
 from ray.serve._private.utils import extract_self_if_method_call
@@ -62,12 +63,140 @@ def _batch_args_kwargs(
     return recover_args(batched_flattened_args)
 
 
+class _AdaptiveBatchController:
+    """Chooses the batch size and wait timeout of a batch queue online.
+
+    The execution time of batches is modeled as a linear function of the batch
+    size, ``intercept + slope * batch_size``, fit by least squares with
+    exponentially decaying weights, and the arrival rate is tracked with an
+    exponentially weighted moving average of the time between requests.
+
+    Until batches of different sizes have run, the execution time is assumed to
+    be all fixed cost, so that larger batches are tried whenever a single batch
+    size doesn't keep up.
+
+    A request can wait for the running batch to finish, then for its batch to
+    fill, then for its batch to run, so batch sizes whose execution time is more
+    than half of the latency SLO are never chosen. Among the rest, the smallest
+    batch size that keeps up with the arrival rate is chosen, to minimize the
+    latency. If none does, the largest batch size is chosen, to maximize the
+    throughput. If more requests are queued than that, the batch size is raised
+    to drain them, within half of the SLO unless no batch size that runs within
+    it keeps up. The wait timeout is the expected time for the batch to fill, up
+    to the latency that's left in the SLO.
+    """
+
+    # The weight of the previous estimates when a new measurement is recorded.
+    DECAY = 0.9
+    # The margin of the throughput over the arrival rate.
+    THROUGHPUT_HEADROOM = 1.2
+
+    def __init__(self, latency_slo_s: float):
+        self.latency_slo_s = latency_slo_s
+        # The exponentially weighted sums of the least squares fit.
+        self._sum_weights = 0.0
+        self._sum_sizes = 0.0
+        self._sum_durations = 0.0
+        self._sum_sizes_squared = 0.0
+        self._sum_sizes_durations = 0.0
+        self._last_arrival_time: Optional[float] = None
+        self._interarrival_time_s: Optional[float] = None
+
+    def record_arrival(self, arrival_time: float) -> None:
+        if self._last_arrival_time is not None:
+            interarrival_time_s = max(arrival_time - self._last_arrival_time, 0)
+            if self._interarrival_time_s is None:
+                self._interarrival_time_s = interarrival_time_s
+            else:
+                self._interarrival_time_s = (
+                    self.DECAY * self._interarrival_time_s
+                    + (1 - self.DECAY) * interarrival_time_s
+                )
+        self._last_arrival_time = arrival_time
+
+    def record_batch(self, batch_size: int, duration_s: float) -> None:
+        self._sum_weights = self.DECAY * self._sum_weights + 1
+        self._sum_sizes = self.DECAY * self._sum_sizes + batch_size
+        self._sum_durations = self.DECAY * self._sum_durations + duration_s
+        self._sum_sizes_squared = self.DECAY * self._sum_sizes_squared + batch_size**2
+        self._sum_sizes_durations = (
+            self.DECAY * self._sum_sizes_durations + batch_size * duration_s
+        )
+
+    def estimate_duration_s(self, batch_size: int) -> Optional[float]:
+        """Estimate the execution time of a batch, or None if no batches ran."""
+        if self._sum_weights == 0:
+            return None
+        mean_size = self._sum_sizes / self._sum_weights
+        mean_duration = self._sum_durations / self._sum_weights
+        size_variance = self._sum_sizes_squared / self._sum_weights - mean_size**2
+        if size_variance <= 1e-9 * max(mean_size**2, 1):
+            # Only one batch size ran, so assume that the execution time doesn't
+            # depend on the batch size. This underestimates the execution time of
+            # larger batches, but running one measures the actual slope. Assuming
+            # that it's proportional instead would never try a larger batch size
+            # if the first one doesn't keep up.
+            return mean_duration
+        covariance = (
+            self._sum_sizes_durations / self._sum_weights - mean_size * mean_duration
+        )
+        slope = max(covariance / size_variance, 0)
+        intercept = max(mean_duration - slope * mean_size, 0)
+        return intercept + slope * batch_size
+
+    def choose(self, max_batch_size: int, num_queued: int = 1) -> Tuple[int, float]:
+        """Return the batch size, up to max_batch_size, and wait timeout to use,
+        given the number of requests that are queued, including the first request
+        of the batch."""
+        if self._sum_weights == 0:
+            # Run the requests that are queued until the first batch is measured.
+            return max_batch_size, 0.0
+
+        arrival_rate = 0.0
+        if self._interarrival_time_s is not None:
+            arrival_rate = 1 / max(self._interarrival_time_s, 1e-9)
+
+        # The smallest batch size that keeps up with the arrival rate, and the
+        # largest one that runs within half of the SLO.
+        keep_up_batch_size = None
+        max_slo_batch_size = 1
+        for candidate_batch_size in range(1, max_batch_size + 1):
+            duration_s = self.estimate_duration_s(candidate_batch_size)
+            if 2 * duration_s > self.latency_slo_s:
+                break
+            max_slo_batch_size = candidate_batch_size
+            throughput = candidate_batch_size / max(duration_s, 1e-9)
+            if (
+                keep_up_batch_size is None
+                and throughput >= self.THROUGHPUT_HEADROOM * arrival_rate
+            ):
+                keep_up_batch_size = candidate_batch_size
+            if keep_up_batch_size is not None and candidate_batch_size >= num_queued:
+                break
+        batch_size = keep_up_batch_size or max_slo_batch_size
+        # Drain the backlog of queued requests. If no batch size that runs within
+        # the SLO keeps up, the SLO can't be met, so drain it at the max throughput.
+        max_drain_batch_size = (
+            max_slo_batch_size if keep_up_batch_size is not None else max_batch_size
+        )
+        batch_size = max(batch_size, min(num_queued, max_drain_batch_size))
+
+        if num_queued >= batch_size or arrival_rate == 0:
+            return batch_size, 0.0
+        fill_time_s = (batch_size - num_queued) / arrival_rate
+        remaining_latency_s = self.latency_slo_s - 2 * self.estimate_duration_s(
+            batch_size
+        )
+        return batch_size, max(min(fill_time_s, remaining_latency_s), 0.0)
+
+
 class _BatchQueue:
     def __init__(
         self,
         max_batch_size: int,
         batch_wait_timeout_s: float,
         handle_batch_func: Optional[Callable] = None,
+        latency_slo_s: Optional[float] = None,
     ) -> None:
         """Async queue that accepts individual items and returns batches.
 
@@ -75,6 +204,11 @@ class _BatchQueue:
         max_batch_size elements are available or the timeout has passed since
         the previous get.
 
+        If latency_slo_s is passed in, the batch size (up to max_batch_size)
+        and timeout are instead chosen before each batch by an
+        _AdaptiveBatchController, from the measured execution times of the
+        batches and arrival rate of the requests.
+
         If handle_batch_func is passed in, a background coroutine will run to
         poll from the queue and call handle_batch_func on the results.
 
@@ -86,12 +220,31 @@ class _BatchQueue:
                 batch.
             handle_batch_func(Optional[Callable]): callback to run in the
                 background to handle batches if provided.
+            latency_slo_s(Optional[float]): the target latency of requests, to
+                choose the batch size and timeout adaptively if provided.
         """
         self.queue: asyncio.Queue[_SingleRequest] = asyncio.Queue()
         self.max_batch_size = max_batch_size
         self.batch_wait_timeout_s = batch_wait_timeout_s
         self.queue_put_event = asyncio.Event()
 
+        self._adaptive_controller = None
+        if latency_slo_s is not None:
+            self._adaptive_controller = _AdaptiveBatchController(latency_slo_s)
+            function_name = getattr(handle_batch_func, "__qualname__", "")
+            self._batch_size_gauge = metrics.Gauge(
+                "serve_batch_adaptive_batch_size",
+                description="The batch size chosen by adaptive batching.",
+                tag_keys=("function",),
+            )
+            self._batch_size_gauge.set_default_tags({"function": function_name})
+            self._batch_wait_timeout_gauge = metrics.Gauge(
+                "serve_batch_adaptive_wait_timeout_s",
+                description="The batch wait timeout chosen by adaptive batching.",
+                tag_keys=("function",),
+            )
+            self._batch_wait_timeout_gauge.set_default_tags({"function": function_name})
+
         self._handle_batch_task = None
         if handle_batch_func is not None:
             self._handle_batch_task = get_or_create_event_loop().create_task(
@@ -99,6 +252,8 @@ class _BatchQueue:
             )
 
     def put(self, request: Tuple[_SingleRequest, asyncio.Future]) -> None:
+        if self._adaptive_controller is not None:
+            self._adaptive_controller.record_arrival(time.time())
         self.queue.put_nowait(request)
         self.queue_put_event.set()
 
@@ -119,6 +274,12 @@ class _BatchQueue:
         # Cache current max_batch_size and batch_wait_timeout_s for this batch.
         max_batch_size = self.max_batch_size
         batch_wait_timeout_s = self.batch_wait_timeout_s
+        if self._adaptive_controller is not None:
+            max_batch_size, batch_wait_timeout_s = self._adaptive_controller.choose(
+                max_batch_size, num_queued=1 + self.queue.qsize()
+            )
+            self._batch_size_gauge.set(max_batch_size)
+            self._batch_wait_timeout_gauge.set(batch_wait_timeout_s)
 
         # Wait self.timeout_s seconds for new queue arrivals.
         batch_start_time = time.time()
@@ -222,7 +383,12 @@ class _BatchQueue:
             else:
                 try:
                     func_future = func_future_or_generator
+                    batch_start_time = time.time()
                     results = await func_future
+                    if self._adaptive_controller is not None:
+                        self._adaptive_controller.record_batch(
+                            len(batch), time.time() - batch_start_time
+                        )
                     self._validate_results(results, len(batch))
                     for result, future in zip(results, futures):
                         future.set_result(result)
@@ -257,12 +423,14 @@ class _LazyBatchQueueWrapper:
         batch_wait_timeout_s: float = 0.0,
         handle_batch_func: Optional[Callable] = None,
         batch_queue_cls: Type[_BatchQueue] = _BatchQueue,
+        latency_slo_s: Optional[float] = None,
     ):
         self._queue: Type[_BatchQueue] = None
         self.max_batch_size = max_batch_size
         self.batch_wait_timeout_s = batch_wait_timeout_s
         self.handle_batch_func = handle_batch_func
         self.batch_queue_cls = batch_queue_cls
+        self.latency_slo_s = latency_slo_s
 
     @property
     def queue(self) -> Type[_BatchQueue]:
@@ -271,10 +439,16 @@ class _LazyBatchQueueWrapper:
         Initializes queue when called for the first time.
         """
         if self._queue is None:
+            # Only pass latency_slo_s when it's set, to support custom queue
+            # classes that don't take it.
+            kwargs = {}
+            if self.latency_slo_s is not None:
+                kwargs["latency_slo_s"] = self.latency_slo_s
             self._queue = self.batch_queue_cls(
                 self.max_batch_size,
                 self.batch_wait_timeout_s,
                 self.handle_batch_func,
+                **kwargs,
             )
         return self._queue
 
@@ -314,6 +488,17 @@ def _validate_max_batch_size(max_batch_size):
         )
 
 
+def _validate_latency_slo_s(latency_slo_s):
+    if latency_slo_s is None:
+        return
+
+    if not isinstance(latency_slo_s, (float, int)):
+        raise TypeError(f"latency_slo_s must be a float > 0, got {latency_slo_s}")
+
+    if latency_slo_s <= 0:
+        raise ValueError(f"latency_slo_s must be a float > 0, got {latency_slo_s}")
+
+
 def _validate_batch_wait_timeout_s(batch_wait_timeout_s):
     if not isinstance(batch_wait_timeout_s, (float, int)):
         raise TypeError(
@@ -343,6 +528,7 @@ def batch(func: F) -> G:
 def batch(
     max_batch_size: int = 10,
     batch_wait_timeout_s: float = 0.0,
+    latency_slo_s: Optional[float] = None,
 ) -> Callable[[F], G]:
     pass
 
@@ -352,6 +538,7 @@ def batch(
     _func: Optional[Callable] = None,
     max_batch_size: int = 10,
     batch_wait_timeout_s: float = 0.0,
+    latency_slo_s: Optional[float] = None,
     *,
     batch_queue_cls: Type[_BatchQueue] = _BatchQueue,
 ):
@@ -369,6 +556,16 @@ def batch(
     methods from the batch_handler (`set_max_batch_size` and
     `set_batch_wait_timeout_s`).
 
+    If `latency_slo_s` is set, the batch size and wait timeout are instead
+    chosen adaptively before each batch, from the measured execution times of
+    the batches and the arrival rate of the requests. The smallest batch size
+    that keeps up with the arrival rate is chosen, up to `max_batch_size` and
+    the largest batch size that can run within the latency SLO, and the wait
+    timeout is the expected time for the batch to fill within the SLO. The
+    chosen values are exported as the `serve_batch_adaptive_batch_size` and
+    `serve_batch_adaptive_wait_timeout_s` metrics. Adaptive batching isn't
+    supported for generator functions.
+
     Example:
 
     .. code-block:: python
@@ -401,6 +598,9 @@ def batch(
             one call to the underlying function.
         batch_wait_timeout_s: the maximum duration to wait for
             `max_batch_size` elements before running the current batch.
+        latency_slo_s: the target latency of requests, in seconds, to choose
+            the batch size and wait timeout adaptively. `batch_wait_timeout_s`
+            is ignored if this is set.
         batch_queue_cls: the class to use for the underlying batch queue.
     """
     # `_func` will be None in the case when the decorator is parametrized.
@@ -416,13 +616,21 @@ def batch(
 
     _validate_max_batch_size(max_batch_size)
     _validate_batch_wait_timeout_s(batch_wait_timeout_s)
+    _validate_latency_slo_s(latency_slo_s)
 
     def _batch_decorator(_func):
+        if latency_slo_s is not None and isasyncgenfunction(_func):
+            raise TypeError(
+                "latency_slo_s isn't supported for generator functions decorated "
+                "with @serve.batch."
+            )
+
         lazy_batch_queue_wrapper = _LazyBatchQueueWrapper(
             max_batch_size,
             batch_wait_timeout_s,
             _func,
             batch_queue_cls,
+            latency_slo_s,
         )
 
         async def batch_handler_generator(
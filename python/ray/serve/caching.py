@@ -0,0 +1,308 @@
+import asyncio
+import hashlib
+import pickle
+import time
+from collections import OrderedDict
+from functools import wraps
+from inspect import isasyncgenfunction, iscoroutinefunction
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Sequence, Tuple
+
+from ray.serve import metrics
+from ray.serve._private.utils import extract_self_if_method_call
+from ray.util.annotations import PublicAPI
+
+
+class _ResponseCache:
+    """A bounded cache of responses with LRU and TTL eviction.
+
+    Concurrent requests with the same key are coalesced: while a response is
+    being computed for a key, the other requests for the key wait for it instead
+    of computing it again.
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        ttl_s: Optional[float],
+        name: str,
+        record_metrics: bool = True,
+    ):
+        self.max_size = max_size
+        self.ttl_s = ttl_s
+        # Key -> (expiration time, response), in LRU order.
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        # Key -> future of the response that is being computed.
+        self._in_flight: Dict[Hashable, asyncio.Future] = {}
+
+        self.num_hits = 0
+        self.num_misses = 0
+        self.num_coalesced = 0
+        self.num_evictions = 0
+
+        self._metrics = None
+        if record_metrics:
+            self._metrics = {
+                "hits": metrics.Counter(
+                    "serve_response_cache_hits",
+                    description="The number of requests served from the cache.",
+                    tag_keys=("function",),
+                ),
+                "misses": metrics.Counter(
+                    "serve_response_cache_misses",
+                    description=(
+                        "The number of requests whose responses were computed and "
+                        "cached."
+                    ),
+                    tag_keys=("function",),
+                ),
+                "coalesced": metrics.Counter(
+                    "serve_response_cache_coalesced_requests",
+                    description=(
+                        "The number of requests that waited for an identical "
+                        "in-flight request instead of being computed."
+                    ),
+                    tag_keys=("function",),
+                ),
+                "evictions": metrics.Counter(
+                    "serve_response_cache_evictions",
+                    description="The number of responses evicted from the cache.",
+                    tag_keys=("function",),
+                ),
+            }
+            for counter in self._metrics.values():
+                counter.set_default_tags({"function": name})
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _record(self, event: str, value: int = 1):
+        setattr(self, f"num_{event}", getattr(self, f"num_{event}") + value)
+        if self._metrics is not None and value > 0:
+            self._metrics[event].inc(value)
+
+    def _get(self, key: Hashable) -> Tuple[bool, Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+        expiration_time, response = entry
+        if time.monotonic() >= expiration_time:
+            del self._entries[key]
+            self._record("evictions")
+            return False, None
+        self._entries.move_to_end(key)
+        return True, response
+
+    def _put(self, key: Hashable, response: Any):
+        expiration_time = (
+            float("inf") if self.ttl_s is None else time.monotonic() + self.ttl_s
+        )
+        self._entries[key] = (expiration_time, response)
+        self._entries.move_to_end(key)
+        num_evicted = 0
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            num_evicted += 1
+        self._record("evictions", num_evicted)
+
+    def clear(self):
+        self._entries.clear()
+
+    async def get_or_compute(
+        self, key: Hashable, compute: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        while True:
+            hit, response = self._get(key)
+            if hit:
+                self._record("hits")
+                return response
+
+            in_flight = self._in_flight.get(key)
+            if in_flight is None:
+                break
+
+            self._record("coalesced")
+            try:
+                return await asyncio.shield(in_flight)
+            except asyncio.CancelledError:
+                # Compute the response if the request that was computing it was
+                # cancelled, rather than failing this request too.
+                if not in_flight.cancelled():
+                    raise
+
+        self._record("misses")
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        try:
+            response = await compute()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Don't warn about the exception if no requests were waiting for it.
+            future.exception()
+            raise
+        finally:
+            del self._in_flight[key]
+
+        self._put(key, response)
+        future.set_result(response)
+        return response
+
+
+# The headers of HTTP requests that are part of the default cache key. Responses
+# often depend on the user that the credentials in these headers identify.
+DEFAULT_KEY_HEADERS = ("Authorization", "Cookie")
+
+
+async def _default_cache_key(
+    args: Tuple, kwargs: Dict[str, Any], key_headers: Sequence[str]
+) -> str:
+    """Hash the arguments of a request.
+
+    HTTP requests are hashed by their method, URL, body, and the values of the
+    `key_headers`.
+    """
+    from starlette.requests import Request
+
+    async def to_key(arg: Any) -> Any:
+        if isinstance(arg, Request):
+            headers = [arg.headers.getlist(name) for name in key_headers]
+            return (arg.method, str(arg.url), await arg.body(), headers)
+        return arg
+
+    key_args = [await to_key(arg) for arg in args]
+    key_kwargs = [(name, await to_key(kwargs[name])) for name in sorted(kwargs)]
+
+    try:
+        serialized = pickle.dumps(
+            (key_args, key_kwargs), protocol=pickle.HIGHEST_PROTOCOL
+        )
+    except Exception as e:
+        raise TypeError(
+            "The arguments of functions decorated with @serve.cache must be "
+            "picklable to be hashed, or a `key_fn` must be provided."
+        ) from e
+    return hashlib.sha256(serialized).hexdigest()
+
+
+@PublicAPI(stability="alpha")
+def cache(
+    _func: Optional[Callable] = None,
+    max_size: int = 1024,
+    ttl_s: Optional[float] = None,
+    key_fn: Optional[Callable[..., Hashable]] = None,
+    key_headers: Sequence[str] = DEFAULT_KEY_HEADERS,
+) -> Callable:
+    """Cache the responses of a function or method in each replica.
+
+    The responses are cached by the hash of the arguments of the call, so that
+    repeated identical requests are answered without calling the function. While
+    a response is being computed, identical requests wait for it rather than
+    calling the function concurrently. Exceptions aren't cached.
+
+    HTTP requests are cached by their method, URL, body, and the values of the
+    ``key_headers``, which are the ``Authorization`` and ``Cookie`` headers by
+    default, so that responses for one user aren't returned to another. If the
+    response depends on other headers, e.g. ``Accept-Language``, add them to
+    ``key_headers``.
+
+    Each replica has its own cache, which only saves the call of the function:
+    a request that hits the cache is still routed from the proxy or handle to a
+    replica, and requests routed to different replicas don't share responses.
+
+    The cache holds up to ``max_size`` responses, and evicts the least recently
+    used response to make room for new ones. If ``ttl_s`` is set, responses also
+    expire ``ttl_s`` seconds after they're cached. The hits, misses, coalesced
+    requests, and evictions of the cache are exported as the
+    ``serve_response_cache_*`` metrics.
+
+    The same response object is returned for all of the hits, so it shouldn't be
+    mutated.
+
+    The function must be defined with ``async def``.
+
+    Example:
+
+    .. code-block:: python
+
+            from ray import serve
+            from starlette.requests import Request
+
+            @serve.deployment
+            class Model:
+                @serve.cache(max_size=10000, ttl_s=60)
+                async def __call__(self, request: Request) -> str:
+                    prompt = (await request.json())["prompt"]
+                    return self.generate(prompt)
+
+            app = Model.bind()
+
+    Arguments:
+        max_size: the maximum number of responses to cache.
+        ttl_s: the number of seconds that responses are cached for. By default,
+            responses don't expire.
+        key_fn: a function that's called with the arguments of the call, excluding
+            ``self``, and returns the hashable cache key. By default, the
+            arguments are pickled and hashed, and HTTP requests are hashed by
+            their method, URL, body, and ``key_headers``.
+        key_headers: the names of the headers of HTTP requests that are part
+            of the default cache key. Defaults to ``("Authorization",
+            "Cookie")``. Ignored if ``key_fn`` is set.
+    """
+    if _func is not None and not callable(_func):
+        raise TypeError(
+            "@serve.cache can only be used to decorate functions or methods."
+        )
+
+    if type(max_size) is not int or max_size < 1:
+        raise ValueError(f"max_size must be a positive integer, got {max_size}.")
+
+    if ttl_s is not None and ttl_s <= 0:
+        raise ValueError(f"ttl_s must be positive, got {ttl_s}.")
+
+    if isinstance(key_headers, str) or not all(
+        isinstance(name, str) for name in key_headers
+    ):
+        raise TypeError(
+            f"key_headers must be a sequence of header names, got {key_headers!r}."
+        )
+    key_headers = tuple(key_headers)
+
+    def _cache_decorator(_func):
+        if isasyncgenfunction(_func) or not iscoroutinefunction(_func):
+            raise TypeError("Functions decorated with @serve.cache must be 'async def'")
+
+        response_cache = None
+
+        def get_response_cache() -> _ResponseCache:
+            # The cache is created on the first call, since the metrics need the
+            # replica context.
+            nonlocal response_cache
+            if response_cache is None:
+                response_cache = _ResponseCache(max_size, ttl_s, _func.__qualname__)
+            return response_cache
+
+        @wraps(_func)
+        async def cache_wrapper(*args, **kwargs):
+            self = extract_self_if_method_call(args, _func)
+            key_args = args if self is None else args[1:]
+            if key_fn is None:
+                key = await _default_cache_key(key_args, kwargs, key_headers)
+            else:
+                key = key_fn(*key_args, **kwargs)
+
+            return await get_response_cache().get_or_compute(
+                key, lambda: _func(*args, **kwargs)
+            )
+
+        def cache_clear():
+            if response_cache is not None:
+                response_cache.clear()
+
+        cache_wrapper.cache_clear = cache_clear
+        return cache_wrapper
+
+    # Like `serve.batch`, this handles both non-parametrized (@serve.cache) and
+    # parametrized (@serve.cache(**kwargs)) usage.
+    return _cache_decorator(_func) if callable(_func) else _cache_decorator
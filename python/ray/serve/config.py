@@ -20,12 +20,45 @@ from ray.serve._private.constants import (
     DEFAULT_UVICORN_KEEP_ALIVE_TIMEOUT_S,
     SERVE_LOGGER_NAME,
 )
+from ray.serve._private.cron_schedule import CronSchedule
 from ray._private.utils import import_attr
 from ray.util.annotations import Deprecated, PublicAPI
 
 logger = logging.getLogger(SERVE_LOGGER_NAME)
 
 
+@PublicAPI(stability="alpha")
+class ScheduledReplicas(BaseModel):
+    """A minimum number of replicas that's kept during scheduled time windows.
+
+    The windows start at the times matched by the `schedule` cron expression,
+    evaluated in UTC, and last `duration_s` seconds. Schedule them to start before
+    the traffic they're meant for, so that the replicas are warm before it arrives.
+    """
+
+    # Please keep these options in sync with those in
+    # `src/ray/protobuf/serve.proto`.
+
+    # Cron expression of the start times of the windows, e.g. "30 7 * * 1-5".
+    schedule: str
+    # How long each window lasts.
+    duration_s: PositiveFloat
+    # Minimum number of replicas during the windows.
+    min_replicas: NonNegativeInt
+
+    @validator("schedule")
+    def schedule_valid(cls, v):
+        CronSchedule(v)
+        return v
+
+    def is_active(self, timestamp_s: float) -> bool:
+        """Whether a window of the schedule contains the timestamp."""
+        last_start_s = CronSchedule(self.schedule).last_match(
+            timestamp_s, self.duration_s
+        )
+        return last_start_s is not None
+
+
 @PublicAPI(stability="stable")
 class AutoscalingConfig(BaseModel):
     # Please keep these options in sync with those in
@@ -60,6 +93,19 @@ class AutoscalingConfig(BaseModel):
     # How long to wait before scaling up replicas
     upscale_delay_s: NonNegativeFloat = 30.0
 
+    # Import path of the AutoscalingPolicy subclass that makes the scaling
+    # decisions, or "predictive" for the built-in `PredictiveAutoscalingPolicy`.
+    # Defaults to `BasicAutoscalingPolicy`.
+    policy: Optional[str] = None
+    # How far ahead the predictive policy forecasts the load. This should cover
+    # the time it takes to start replicas.
+    forecast_horizon_s: NonNegativeFloat = 120.0
+    # Period of the seasonality of the load that the predictive policy learns,
+    # e.g. 86400 for daily traffic patterns. Defaults to only following trends.
+    seasonal_period_s: Optional[PositiveFloat] = None
+    # Minimum numbers of replicas to keep during scheduled time windows.
+    scheduled_min_replicas: List[ScheduledReplicas] = []
+
     @validator("max_replicas", always=True)
     def replicas_settings_valid(cls, max_replicas, values):
         min_replicas = values.get("min_replicas")
@@ -90,6 +136,20 @@ class AutoscalingConfig(BaseModel):
     def get_downscale_smoothing_factor(self) -> PositiveFloat:
         return self.downscale_smoothing_factor or self.smoothing_factor
 
+    def get_min_replicas(self, timestamp_s: float) -> int:
+        """The minimum number of replicas at the timestamp.
+
+        This is `min_replicas`, raised by the scheduled minimums whose windows
+        contain the timestamp, and capped by `max_replicas`.
+        """
+        min_replicas = self.min_replicas
+        for scheduled in self.scheduled_min_replicas:
+            if scheduled.min_replicas > min_replicas and scheduled.is_active(
+                timestamp_s
+            ):
+                min_replicas = scheduled.min_replicas
+        return min(min_replicas, self.max_replicas)
+
     # TODO(architkulkarni): implement below
     # The num_ongoing_requests_per_replica error ratio (desired / current)
     # threshold for overriding `upscale_delay_s`
@@ -152,6 +212,13 @@ class HTTPOptions(pydantic.BaseModel):
     - request_timeout_s: End-to-end timeout for HTTP requests.
     - keep_alive_timeout_s: Duration to keep idle connections alive when no
       requests are ongoing.
+    - max_queued_requests: Maximum number of requests to an application that
+      each proxy queues while waiting for a replica. Further requests are
+      rejected with 503 (HTTP) or RESOURCE_EXHAUSTED (gRPC) until the queue
+      drains. Defaults to no limit.
+    - max_requests_per_s: Maximum rate of requests to an application that each
+      proxy admits, enforced with a token bucket. Further requests are rejected
+      like above. Defaults to no limit.
 
     - location: [DEPRECATED: use `proxy_location` field instead] The deployment
       location of HTTP servers:
@@ -177,6 +244,8 @@ class HTTPOptions(pydantic.BaseModel):
     fixed_number_selection_seed: int = 0
     request_timeout_s: Optional[float] = None
     keep_alive_timeout_s: int = DEFAULT_UVICORN_KEEP_ALIVE_TIMEOUT_S
+    max_queued_requests: Optional[int] = None
+    max_requests_per_s: Optional[float] = None
 
     @validator("location", always=True)
     def location_backfill_no_server(cls, v, values):
@@ -220,6 +289,12 @@ class HTTPOptions(pydantic.BaseModel):
             )
         return v
 
+    @validator("max_queued_requests", "max_requests_per_s")
+    def admission_limits_positive(cls, v, field):
+        if v is not None and v <= 0:
+            raise ValueError(f"`{field.name}` must be positive, got {v}.")
+        return v
+
     class Config:
         validate_assignment = True
         arbitrary_types_allowed = True
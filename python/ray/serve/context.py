@@ -156,6 +156,10 @@ def _connect(raise_if_no_controller_running: bool = True) -> ServeControllerClie
 #     the route is empty.
 # request_id: the request id is generated from http proxy, the value
 #     shouldn't be changed when the variable is set.
+# priority: the scheduling priority of the request, which is propagated to the
+#     requests it makes through handles.
+# deadline: the Unix timestamp after which the request is no longer scheduled,
+#     which is also propagated to the requests it makes through handles.
 # note:
 #   The request context is readonly to avoid potential
 #       async task conflicts when using it concurrently.
@@ -167,6 +171,8 @@ class _RequestContext:
     request_id: str = ""
     app_name: str = ""
     multiplexed_model_id: str = ""
+    priority: int = 0
+    deadline: Optional[float] = None
 
 
 _serve_request_context = contextvars.ContextVar(
@@ -191,5 +197,7 @@ def _set_request_context(
             app_name=app_name or current_request_context.app_name,
             multiplexed_model_id=multiplexed_model_id
             or current_request_context.multiplexed_model_id,
+            priority=current_request_context.priority,
+            deadline=current_request_context.deadline,
         )
     )
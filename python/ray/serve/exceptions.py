@@ -4,3 +4,10 @@ from ray.util.annotations import PublicAPI
 @PublicAPI(stability="stable")
 class RayServeException(Exception):
     pass
+
+
+@PublicAPI(stability="alpha")
+class RequestDeadlineExceededError(RayServeException):
+    """Raised when a request isn't assigned to a replica before its deadline."""
+
+    pass
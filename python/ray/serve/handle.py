@@ -2,6 +2,7 @@ import asyncio
 import concurrent.futures
 from dataclasses import dataclass
 import threading
+import time
 from typing import Any, AsyncIterator, Coroutine, Dict, Iterator, Optional, Tuple, Union
 
 import ray
@@ -48,6 +49,9 @@ class _HandleOptions:
     method_name: str = "__call__"
     multiplexed_model_id: str = ""
     stream: bool = False
+    # If None, the priority of the request that's being handled is used.
+    priority: Optional[int] = None
+    timeout_s: Optional[float] = None
     _prefer_local_routing: bool = False
     _router_cls: str = ""
     _request_protocol: str = RequestProtocol.UNDEFINED
@@ -57,6 +61,8 @@ class _HandleOptions:
         method_name: Union[str, DEFAULT] = DEFAULT.VALUE,
         multiplexed_model_id: Union[str, DEFAULT] = DEFAULT.VALUE,
         stream: Union[bool, DEFAULT] = DEFAULT.VALUE,
+        priority: Union[int, None, DEFAULT] = DEFAULT.VALUE,
+        timeout_s: Union[float, None, DEFAULT] = DEFAULT.VALUE,
         _prefer_local_routing: Union[bool, DEFAULT] = DEFAULT.VALUE,
         _router_cls: Union[str, DEFAULT] = DEFAULT.VALUE,
         _request_protocol: Union[str, DEFAULT] = DEFAULT.VALUE,
@@ -71,6 +77,8 @@ class _HandleOptions:
                 else multiplexed_model_id
             ),
             stream=self.stream if stream == DEFAULT.VALUE else stream,
+            priority=self.priority if priority == DEFAULT.VALUE else priority,
+            timeout_s=self.timeout_s if timeout_s == DEFAULT.VALUE else timeout_s,
             _prefer_local_routing=self._prefer_local_routing
             if _prefer_local_routing == DEFAULT.VALUE
             else _prefer_local_routing,
@@ -200,14 +208,23 @@ class _DeploymentHandleBase:
         method_name: Union[str, DEFAULT] = DEFAULT.VALUE,
         multiplexed_model_id: Union[str, DEFAULT] = DEFAULT.VALUE,
         stream: Union[bool, DEFAULT] = DEFAULT.VALUE,
+        priority: Union[int, None, DEFAULT] = DEFAULT.VALUE,
+        timeout_s: Union[float, None, DEFAULT] = DEFAULT.VALUE,
         use_new_handle_api: Union[bool, DEFAULT] = DEFAULT.VALUE,
         _prefer_local_routing: Union[bool, DEFAULT] = DEFAULT.VALUE,
         _router_cls: Union[str, DEFAULT] = DEFAULT.VALUE,
     ):
+        if priority not in (DEFAULT.VALUE, None) and not isinstance(priority, int):
+            raise TypeError(f"priority must be an integer, got {priority}.")
+        if timeout_s not in (DEFAULT.VALUE, None) and timeout_s <= 0:
+            raise ValueError(f"timeout_s must be positive, got {timeout_s}.")
+
         new_handle_options = self.handle_options.copy_and_update(
             method_name=method_name,
             multiplexed_model_id=multiplexed_model_id,
             stream=stream,
+            priority=priority,
+            timeout_s=timeout_s,
             _prefer_local_routing=_prefer_local_routing,
             _router_cls=_router_cls,
         )
@@ -237,6 +254,19 @@ class _DeploymentHandleBase:
     def _remote(self, args: Tuple[Any], kwargs: Dict[str, Any]) -> Coroutine:
         self._record_telemetry_if_needed()
         _request_context = ray.serve.context._serve_request_context.get()
+        # The priority and deadline of the request that's being handled are
+        # propagated, unless they're overridden by the options of the handle.
+        priority = self.handle_options.priority
+        if priority is None:
+            priority = _request_context.priority
+        deadline = _request_context.deadline
+        if self.handle_options.timeout_s is not None:
+            timeout_deadline = time.time() + self.handle_options.timeout_s
+            deadline = (
+                timeout_deadline
+                if deadline is None
+                else min(deadline, timeout_deadline)
+            )
         request_metadata = RequestMetadata(
             _request_context.request_id,
             self.deployment_name,
@@ -245,6 +275,8 @@ class _DeploymentHandleBase:
             app_name=self.app_name,
             multiplexed_model_id=self.handle_options.multiplexed_model_id,
             is_streaming=self.handle_options.stream,
+            priority=priority,
+            deadline=deadline,
             _request_protocol=self.handle_options._request_protocol,
         )
         self.request_counter.inc(
@@ -329,6 +361,8 @@ class RayServeHandle(_DeploymentHandleBase):
         method_name: Union[str, DEFAULT] = DEFAULT.VALUE,
         multiplexed_model_id: Union[str, DEFAULT] = DEFAULT.VALUE,
         stream: Union[bool, DEFAULT] = DEFAULT.VALUE,
+        priority: Union[int, None, DEFAULT] = DEFAULT.VALUE,
+        timeout_s: Union[float, None, DEFAULT] = DEFAULT.VALUE,
         use_new_handle_api: Union[bool, DEFAULT] = DEFAULT.VALUE,
         _prefer_local_routing: Union[bool, DEFAULT] = DEFAULT.VALUE,
         _router_cls: Union[str, DEFAULT] = DEFAULT.VALUE,
@@ -349,6 +383,8 @@ class RayServeHandle(_DeploymentHandleBase):
             method_name=method_name,
             multiplexed_model_id=multiplexed_model_id,
             stream=stream,
+            priority=priority,
+            timeout_s=timeout_s,
             _prefer_local_routing=_prefer_local_routing,
             use_new_handle_api=use_new_handle_api,
             _router_cls=_router_cls,
@@ -407,6 +443,8 @@ class RayServeSyncHandle(_DeploymentHandleBase):
         method_name: Union[str, DEFAULT] = DEFAULT.VALUE,
         multiplexed_model_id: Union[str, DEFAULT] = DEFAULT.VALUE,
         stream: Union[bool, DEFAULT] = DEFAULT.VALUE,
+        priority: Union[int, None, DEFAULT] = DEFAULT.VALUE,
+        timeout_s: Union[float, None, DEFAULT] = DEFAULT.VALUE,
         use_new_handle_api: Union[bool, DEFAULT] = DEFAULT.VALUE,
         _prefer_local_routing: Union[bool, DEFAULT] = DEFAULT.VALUE,
         _router_cls: Union[str, DEFAULT] = DEFAULT.VALUE,
@@ -427,6 +465,8 @@ class RayServeSyncHandle(_DeploymentHandleBase):
             method_name=method_name,
             multiplexed_model_id=multiplexed_model_id,
             stream=stream,
+            priority=priority,
+            timeout_s=timeout_s,
             use_new_handle_api=use_new_handle_api,
             _prefer_local_routing=_prefer_local_routing,
             _router_cls=_router_cls,
@@ -818,6 +858,8 @@ class DeploymentHandle(_DeploymentHandleBase):
         method_name: Union[str, DEFAULT] = DEFAULT.VALUE,
         multiplexed_model_id: Union[str, DEFAULT] = DEFAULT.VALUE,
         stream: Union[bool, DEFAULT] = DEFAULT.VALUE,
+        priority: Union[int, None, DEFAULT] = DEFAULT.VALUE,
+        timeout_s: Union[float, None, DEFAULT] = DEFAULT.VALUE,
         use_new_handle_api: Union[bool, DEFAULT] = DEFAULT.VALUE,
         _prefer_local_routing: Union[bool, DEFAULT] = DEFAULT.VALUE,
         _router_cls: Union[str, DEFAULT] = DEFAULT.VALUE,
@@ -832,11 +874,24 @@ class DeploymentHandle(_DeploymentHandleBase):
                 method_name="other_method",
                 multiplexed_model_id="model:v1",
             ).remote()
+
+        Requests with a higher `priority` are assigned to replicas before requests
+        with a lower priority when the deployment is overloaded. By default, the
+        priority of the request that's being handled is used, or 0 outside of a
+        request. If `timeout_s` is set, requests that aren't assigned to a replica
+        within `timeout_s` seconds fail with a `RequestDeadlineExceededError`. The
+        deadline of the request that's being handled is also propagated:
+
+        .. code-block:: python
+
+            response = handle.options(priority=1, timeout_s=0.5).remote()
         """
         return self._options(
             method_name=method_name,
             multiplexed_model_id=multiplexed_model_id,
             stream=stream,
+            priority=priority,
+            timeout_s=timeout_s,
             use_new_handle_api=use_new_handle_api,
             _prefer_local_routing=_prefer_local_routing,
             _router_cls=_router_cls,
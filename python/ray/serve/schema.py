@@ -580,6 +580,25 @@ class HTTPOptionsSchema(BaseModel):
         "before closing them when no requests are ongoing. Defaults to "
         f"{DEFAULT_UVICORN_KEEP_ALIVE_TIMEOUT_S} seconds.",
     )
+    max_queued_requests: Optional[int] = Field(
+        default=None,
+        description=(
+            "The maximum number of requests to an application that each proxy "
+            "queues while waiting for a replica. Further requests are rejected with "
+            "a 503 (HTTP) or RESOURCE_EXHAUSTED (gRPC) response with a Retry-After "
+            "hint. Defaults to no limit."
+        ),
+        gt=0,
+    )
+    max_requests_per_s: Optional[float] = Field(
+        default=None,
+        description=(
+            "The maximum rate of requests to an application that each proxy admits. "
+            "Requests beyond the rate are rejected like requests beyond "
+            "`max_queued_requests`. Defaults to no limit."
+        ),
+        gt=0,
+    )
 
 
 @PublicAPI(stability="stable")
@@ -0,0 +1,92 @@
+import pytest
+
+from ray.serve._private.admission_control import (
+    QUEUE_FULL_RETRY_AFTER_S,
+    AdmissionController,
+    TokenBucket,
+    format_retry_after,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.time = 0.0
+
+    def __call__(self) -> float:
+        return self.time
+
+
+def test_token_bucket():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2, capacity=2, clock=clock)
+
+    # The bucket starts full, so a burst of `capacity` requests is admitted.
+    assert bucket.try_acquire() is None
+    assert bucket.try_acquire() is None
+    assert bucket.try_acquire() == pytest.approx(0.5)
+
+    clock.time = 0.25
+    assert bucket.try_acquire() == pytest.approx(0.25)
+    clock.time = 0.5
+    assert bucket.try_acquire() is None
+    assert bucket.try_acquire() == pytest.approx(0.5)
+
+    # The bucket doesn't hold more than `capacity` tokens.
+    clock.time = 100
+    assert bucket.try_acquire() is None
+    assert bucket.try_acquire() is None
+    assert bucket.try_acquire() is not None
+
+
+def test_admission_controller_disabled():
+    controller = AdmissionController()
+    assert not controller.enabled
+    assert controller.check("app", lambda: 10**6) is None
+
+
+def test_admission_controller_max_queued_requests():
+    controller = AdmissionController(max_queued_requests=2)
+    assert controller.enabled
+    assert controller.check("app", lambda: 0) is None
+    assert controller.check("app", lambda: 1) is None
+    assert controller.check("app", lambda: 2) == QUEUE_FULL_RETRY_AFTER_S
+    assert controller.check("app", lambda: 3) == QUEUE_FULL_RETRY_AFTER_S
+
+
+def test_admission_controller_max_requests_per_s():
+    clock = FakeClock()
+    controller = AdmissionController(max_requests_per_s=0.5, clock=clock)
+
+    def num_queued_requests():
+        raise AssertionError("The queue length shouldn't be checked.")
+
+    # Each application has its own token bucket, which holds at least one token.
+    assert controller.check("app1", num_queued_requests) is None
+    assert controller.check("app1", num_queued_requests) == pytest.approx(2)
+    assert controller.check("app2", num_queued_requests) is None
+
+    clock.time = 2
+    assert controller.check("app1", num_queued_requests) is None
+
+    # The state of deleted applications is dropped.
+    controller.update_applications(["app1"])
+    assert controller.check("app1", num_queued_requests) is not None
+    assert controller.check("app2", num_queued_requests) is None
+
+
+def test_admission_controller_queue_full_does_not_take_tokens():
+    controller = AdmissionController(max_queued_requests=1, max_requests_per_s=1)
+    assert controller.check("app", lambda: 1) == QUEUE_FULL_RETRY_AFTER_S
+    assert controller.check("app", lambda: 0) is None
+
+
+def test_format_retry_after():
+    assert format_retry_after(0.01) == "1"
+    assert format_retry_after(1) == "1"
+    assert format_retry_after(1.5) == "2"
+
+
+if __name__ == "__main__":
+    import sys
+
+    sys.exit(pytest.main(["-v", "-s", __file__]))
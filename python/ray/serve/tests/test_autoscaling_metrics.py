@@ -37,6 +37,28 @@ class TestInMemoryMetricsStore:
             is None
         )
 
+    def test_window_end_timestamp(self):
+        s = InMemoryMetricsStore()
+        for timestamp in range(1, 5):
+            s.add_metrics_point({"m1": timestamp}, timestamp=timestamp)
+
+        assert (
+            s.window_average(
+                "m1", window_start_timestamp_s=1.5, window_end_timestamp_s=3
+            )
+            == 2
+        )
+        assert (
+            s.window_average(
+                "m1", window_start_timestamp_s=0, window_end_timestamp_s=10
+            )
+            == 2.5
+        )
+        assert (
+            s.window_average("m1", window_start_timestamp_s=0, window_end_timestamp_s=1)
+            is None
+        )
+
     def test_compaction_window(self):
         s = InMemoryMetricsStore()
 
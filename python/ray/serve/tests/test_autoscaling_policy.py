@@ -1,5 +1,6 @@
 import logging
 import os
+import pickle
 import sys
 import tempfile
 import time
@@ -7,13 +8,17 @@ from unittest import mock
 from typing import List, Iterable
 import zipfile
 
+from pydantic import ValidationError
 import pytest
 import requests
 
 from ray._private.test_utils import SignalActor, wait_for_condition
 from ray.serve._private.autoscaling_policy import (
+    AutoscalingPolicy,
     BasicAutoscalingPolicy,
+    PredictiveAutoscalingPolicy,
     calculate_desired_num_replicas,
+    create_autoscaling_policy,
 )
 from ray.serve._private.common import (
     DeploymentID,
@@ -24,7 +29,8 @@ from ray.serve._private.common import (
 from ray.serve.generated.serve_pb2 import (
     DeploymentStatusInfo as DeploymentStatusInfoProto,
 )
-from ray.serve.config import AutoscalingConfig
+from ray.serve.config import AutoscalingConfig, ScheduledReplicas
+from ray.serve._private.cron_schedule import CronSchedule
 from ray.serve._private.constants import CONTROL_LOOP_PERIOD_S, SERVE_DEFAULT_APP_NAME
 from ray.serve.controller import ServeController
 from ray.serve.schema import ServeDeploySchema
@@ -760,6 +766,161 @@ def test_single_replica_receives_all_requests(ongoing_requests):
     assert new_num_replicas == sum(ongoing_requests) / target_requests
 
 
+class FakeClock:
+    def __init__(self):
+        self.time = 0.0
+
+    def __call__(self) -> float:
+        return self.time
+
+
+def test_predictive_policy_follows_trend():
+    """The predictive policy scales up ahead of a steadily rising load."""
+    config = AutoscalingConfig(
+        min_replicas=1,
+        max_replicas=50,
+        target_num_ongoing_requests_per_replica=1,
+        metrics_interval_s=10,
+        look_back_period_s=30,
+        forecast_horizon_s=120,
+    )
+    clock = FakeClock()
+    basic_policy = BasicAutoscalingPolicy(config)
+    predictive_policy = PredictiveAutoscalingPolicy(config, clock=clock)
+
+    # The load rises by 1 request every 10 seconds.
+    for i in range(30):
+        clock.time = i * 10
+        ongoing_requests = [i / 4] * 4
+        basic_num_replicas = basic_policy.get_decision_num_replicas(
+            curr_target_num_replicas=4,
+            current_num_ongoing_requests=ongoing_requests,
+            current_handle_queued_queries=0,
+        )
+        predictive_num_replicas = predictive_policy.get_decision_num_replicas(
+            curr_target_num_replicas=4,
+            current_num_ongoing_requests=ongoing_requests,
+            current_handle_queued_queries=0,
+        )
+        assert predictive_num_replicas >= basic_num_replicas
+
+    # The forecast is close to the load 120 seconds from now.
+    assert predictive_policy.forecast_load(clock.time) == pytest.approx(41, rel=0.1)
+    assert predictive_num_replicas > 29
+
+
+def test_predictive_policy_learns_seasonality():
+    """The predictive policy scales up ahead of load seen one period ago."""
+    config = AutoscalingConfig(
+        min_replicas=1,
+        max_replicas=20,
+        target_num_ongoing_requests_per_replica=1,
+        metrics_interval_s=10,
+        look_back_period_s=20,
+        forecast_horizon_s=100,
+        seasonal_period_s=1000,
+    )
+    clock = FakeClock()
+    policy = PredictiveAutoscalingPolicy(config, clock=clock)
+
+    # In the first period, the load is 10 during its second half.
+    for timestamp_s in range(0, 1300, 10):
+        policy.record_load(10 if 500 <= timestamp_s < 1000 else 0, timestamp_s)
+
+    def decide():
+        return policy.get_decision_num_replicas(
+            curr_target_num_replicas=1,
+            current_num_ongoing_requests=[0],
+            current_handle_queued_queries=0,
+        )
+
+    clock.time = 1300
+    assert decide() == 1
+    # 100 seconds before the load is expected, scale up for it.
+    clock.time = 1420
+    assert decide() >= 10
+
+    # The load history isn't checkpointed.
+    restored = pickle.loads(pickle.dumps(policy))
+    assert restored.forecast_load(clock.time) is None
+
+
+def test_create_autoscaling_policy():
+    assert isinstance(
+        create_autoscaling_policy(AutoscalingConfig()), BasicAutoscalingPolicy
+    )
+    assert isinstance(
+        create_autoscaling_policy(AutoscalingConfig(policy="predictive")),
+        PredictiveAutoscalingPolicy,
+    )
+
+    config = AutoscalingConfig(policy=f"{__name__}.FixedAutoscalingPolicy")
+    policy = create_autoscaling_policy(config)
+    assert isinstance(policy, FixedAutoscalingPolicy)
+    assert policy.get_decision_num_replicas(1, [1], 0) == 3
+
+    with pytest.raises(TypeError):
+        create_autoscaling_policy(AutoscalingConfig(policy=f"{__name__}.FakeClock"))
+
+
+class FixedAutoscalingPolicy(AutoscalingPolicy):
+    def get_decision_num_replicas(
+        self,
+        curr_target_num_replicas: int,
+        current_num_ongoing_requests: List[float],
+        current_handle_queued_queries: float,
+    ) -> int:
+        return 3
+
+
+def test_cron_schedule():
+    # Monday, 2024-01-01 08:30 UTC.
+    monday_8_30 = 1704097800
+    schedule = CronSchedule("0 8 * * 1-5")
+    assert schedule.last_match(monday_8_30, 3600) == monday_8_30 - 1800
+    assert schedule.last_match(monday_8_30, 600) is None
+    # The last match before Monday morning was on Friday.
+    assert schedule.last_match(monday_8_30 - 3600, 4 * 86400) == (
+        monday_8_30 - 3 * 86400 - 1800
+    )
+
+    schedule = CronSchedule("*/15 * * * *")
+    assert schedule.last_match(monday_8_30 + 59, 59) == monday_8_30
+    assert schedule.last_match(monday_8_30 + 60, 59) is None
+    assert schedule.last_match(monday_8_30 + 60, 300) == monday_8_30
+
+    # If both days of month and days of week are restricted, either matches.
+    schedule = CronSchedule("0 0 15 * 0")
+    assert schedule.last_match(monday_8_30, 2 * 86400) == (monday_8_30 - 86400 - 30600)
+
+    for expression in ["* * * *", "60 * * * *", "a * * * *", "*/0 * * * *"]:
+        with pytest.raises(ValueError):
+            CronSchedule(expression)
+
+
+def test_scheduled_min_replicas():
+    # Monday, 2024-01-01 08:30 UTC.
+    monday_8_30 = 1704097800
+    config = AutoscalingConfig(
+        min_replicas=1,
+        max_replicas=8,
+        scheduled_min_replicas=[
+            ScheduledReplicas(schedule="0 8 * * 1-5", duration_s=3600, min_replicas=4),
+            ScheduledReplicas(schedule="0 8 * * *", duration_s=1200, min_replicas=6),
+            ScheduledReplicas(schedule="0 9 * * *", duration_s=3600, min_replicas=10),
+        ],
+    )
+    assert config.get_min_replicas(monday_8_30 - 3600) == 1
+    assert config.get_min_replicas(monday_8_30 - 1500) == 6
+    assert config.get_min_replicas(monday_8_30) == 4
+    assert config.get_min_replicas(monday_8_30 + 1800) == 8
+    # Saturday.
+    assert config.get_min_replicas(monday_8_30 - 2 * 86400) == 1
+
+    with pytest.raises(ValidationError):
+        ScheduledReplicas(schedule="0 8 * *", duration_s=60, min_replicas=1)
+
+
 @pytest.mark.skipif(sys.platform == "win32", reason="Failing on Windows.")
 def test_e2e_bursty(serve_instance):
     """
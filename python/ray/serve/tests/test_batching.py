@@ -9,6 +9,7 @@ from concurrent.futures.thread import ThreadPoolExecutor
 
 import ray
 from ray import serve
+from ray.serve.batching import _AdaptiveBatchController
 from ray.serve.exceptions import RayServeException
 from ray._private.utils import get_or_create_event_loop
 
@@ -656,6 +657,88 @@ async def test_batch_generator_streaming_response_integration_test(serve_instanc
         assert response.text == "".join([prompt_prefix + str(idx)] * NUM_YIELDS)
 
 
+def test_adaptive_batch_controller():
+    controller = _AdaptiveBatchController(latency_slo_s=0.11)
+    # Run the queued requests until a batch is measured.
+    assert controller.choose(max_batch_size=100) == (100, 0.0)
+
+    # Batches take 10ms plus 2ms per request.
+    for batch_size in [1, 4, 8, 16]:
+        controller.record_batch(batch_size, 0.01 + 0.002 * batch_size)
+    assert controller.estimate_duration_s(10) == pytest.approx(0.03)
+
+    # At 100 requests per second, batches of 2 requests keep up with the
+    # arrivals, and wait 10ms for the second request.
+    for i in range(100):
+        controller.record_arrival(i * 0.01)
+    batch_size, batch_wait_timeout_s = controller.choose(max_batch_size=100)
+    assert batch_size == 2
+    assert batch_wait_timeout_s == pytest.approx(0.01)
+
+    # At 1000 requests per second, no batch size keeps up with the arrivals, so
+    # the largest batch size that runs within half of the SLO is chosen.
+    for i in range(200):
+        controller.record_arrival(1 + i * 0.001)
+    batch_size, batch_wait_timeout_s = controller.choose(max_batch_size=100)
+    assert batch_size == 22
+    assert batch_wait_timeout_s == pytest.approx(0.002)
+    assert controller.choose(max_batch_size=10)[0] == 10
+
+
+def test_adaptive_batch_controller_cold_start():
+    # Batches take 30ms plus 1ms per request, and requests arrive at 100 per second.
+    controller = _AdaptiveBatchController(latency_slo_s=0.105)
+    for i in range(100):
+        controller.record_arrival(i * 0.01)
+    # Only a batch of 1 request ran, which doesn't keep up with the arrivals. Its
+    # execution time is assumed to be fixed cost, so a larger batch is tried.
+    controller.record_batch(1, 0.031)
+    assert controller.choose(max_batch_size=100) == (4, pytest.approx(0.03))
+
+    # Batches of 5 requests keep up with the arrivals, but the queued requests are
+    # run in larger batches, up to the 22 that run within half of the SLO.
+    controller.record_batch(4, 0.034)
+    assert controller.choose(max_batch_size=100)[0] == 5
+    assert controller.choose(max_batch_size=100, num_queued=10) == (10, 0.0)
+    assert controller.choose(max_batch_size=100, num_queued=50) == (22, 0.0)
+
+    # At 1000 requests per second, no batch size that runs within half of the SLO
+    # keeps up, so the queued requests are run at the max throughput.
+    for i in range(200):
+        controller.record_arrival(1 + i * 0.001)
+    assert controller.choose(max_batch_size=100, num_queued=50) == (50, 0.0)
+
+
+@pytest.mark.asyncio
+async def test_batch_latency_slo():
+    batch_sizes = []
+
+    @serve.batch(max_batch_size=20, latency_slo_s=0.5)
+    async def adaptive(requests):
+        batch_sizes.append(len(requests))
+        await asyncio.sleep(0.01 + 0.001 * len(requests))
+        return requests
+
+    # Requests that arrive faster than they can be handled one at a time are
+    # batched.
+    tasks = []
+    for i in range(100):
+        tasks.append(get_or_create_event_loop().create_task(adaptive(i)))
+        await asyncio.sleep(0.002)
+    assert await asyncio.gather(*tasks) == list(range(100))
+    assert max(batch_sizes) > 1
+    assert max(batch_sizes) <= 20
+
+    with pytest.raises(ValueError):
+        serve.batch(latency_slo_s=0)
+
+    with pytest.raises(TypeError, match="generator"):
+
+        @serve.batch(latency_slo_s=1)
+        async def generator(requests):
+            yield requests
+
+
 if __name__ == "__main__":
     import sys
 
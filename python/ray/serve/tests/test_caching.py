@@ -0,0 +1,191 @@
+import asyncio
+import time
+
+import pytest
+import requests
+
+import ray
+from ray import serve
+from ray.serve.caching import DEFAULT_KEY_HEADERS, _default_cache_key, _ResponseCache
+
+
+@pytest.mark.asyncio
+async def test_response_cache_lru():
+    cache = _ResponseCache(max_size=2, ttl_s=None, name="f", record_metrics=False)
+    num_calls = 0
+
+    def compute(value):
+        async def _compute():
+            nonlocal num_calls
+            num_calls += 1
+            return value
+
+        return _compute
+
+    assert await cache.get_or_compute("a", compute(1)) == 1
+    assert await cache.get_or_compute("b", compute(2)) == 2
+    # Hit "a", so that "b" is the least recently used response.
+    assert await cache.get_or_compute("a", compute(None)) == 1
+    assert await cache.get_or_compute("c", compute(3)) == 3
+    assert len(cache) == 2
+    assert await cache.get_or_compute("b", compute(4)) == 4
+
+    assert num_calls == 4
+    assert cache.num_hits == 1
+    assert cache.num_misses == 4
+    assert cache.num_evictions == 2
+
+
+@pytest.mark.asyncio
+async def test_response_cache_ttl():
+    cache = _ResponseCache(max_size=10, ttl_s=0.1, name="f", record_metrics=False)
+
+    async def compute():
+        return time.monotonic()
+
+    first = await cache.get_or_compute("a", compute)
+    assert await cache.get_or_compute("a", compute) == first
+    await asyncio.sleep(0.2)
+    assert await cache.get_or_compute("a", compute) != first
+    assert cache.num_evictions == 1
+
+
+@pytest.mark.asyncio
+async def test_response_cache_coalesces_requests():
+    cache = _ResponseCache(max_size=10, ttl_s=None, name="f", record_metrics=False)
+    num_calls = 0
+    event = asyncio.Event()
+
+    async def compute():
+        nonlocal num_calls
+        num_calls += 1
+        await event.wait()
+        return num_calls
+
+    tasks = [asyncio.create_task(cache.get_or_compute("a", compute)) for _ in range(5)]
+    await asyncio.sleep(0.01)
+    event.set()
+    assert await asyncio.gather(*tasks) == [1] * 5
+    assert num_calls == 1
+    assert cache.num_coalesced == 4
+
+    # Exceptions are propagated to the waiting requests, but aren't cached.
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise ValueError("oops")
+
+    tasks = [asyncio.create_task(cache.get_or_compute("b", fail)) for _ in range(2)]
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    assert all(isinstance(result, ValueError) for result in results)
+    assert len(cache) == 1
+
+    # The waiting requests compute the response if the request computing it is
+    # cancelled.
+    event.clear()
+    first = asyncio.create_task(cache.get_or_compute("c", compute))
+    await asyncio.sleep(0.01)
+    second = asyncio.create_task(cache.get_or_compute("c", compute))
+    await asyncio.sleep(0.01)
+    first.cancel()
+    await asyncio.sleep(0.01)
+    event.set()
+    assert await second == num_calls
+    with pytest.raises(asyncio.CancelledError):
+        await first
+
+
+@pytest.mark.asyncio
+async def test_default_cache_key_headers():
+    from starlette.requests import Request
+
+    async def key(headers, key_headers=DEFAULT_KEY_HEADERS):
+        async def receive():
+            return {"type": "http.request", "body": b"a", "more_body": False}
+
+        scope = {
+            "type": "http",
+            "method": "POST",
+            "scheme": "http",
+            "server": ("localhost", 8000),
+            "path": "/",
+            "query_string": b"",
+            "headers": [
+                (name.lower().encode(), value.encode()) for name, value in headers
+            ],
+        }
+        return await _default_cache_key((Request(scope, receive),), {}, key_headers)
+
+    # Requests with different credentials aren't served each other's responses.
+    assert await key([]) != await key([("Authorization", "Bearer a")])
+    assert await key([("Authorization", "Bearer a")]) != await key(
+        [("Authorization", "Bearer b")]
+    )
+    assert await key([("Cookie", "session=a")]) != await key([("Cookie", "session=b")])
+    # Other headers aren't part of the key, unless they're added.
+    assert await key([("User-Agent", "a")]) == await key([("User-Agent", "b")])
+    assert await key([("Accept-Language", "en")], ["Accept-Language"]) != await key(
+        [("Accept-Language", "fr")], ["Accept-Language"]
+    )
+    assert await key([("Authorization", "Bearer a")], []) == await key([], [])
+
+
+def test_cache_validation():
+    with pytest.raises(TypeError):
+
+        @serve.cache
+        def not_async(request):
+            pass
+
+    with pytest.raises(ValueError):
+        serve.cache(max_size=0)
+
+    with pytest.raises(ValueError):
+        serve.cache(ttl_s=-1)
+
+    with pytest.raises(TypeError):
+        serve.cache(key_headers="Authorization")
+
+
+def test_cache_deployment(serve_instance):
+    @serve.deployment
+    class Counter:
+        def __init__(self):
+            self.num_calls = 0
+
+        @serve.cache(max_size=2)
+        async def __call__(self, request):
+            self.num_calls += 1
+            return {"body": (await request.body()).decode(), "calls": self.num_calls}
+
+        @serve.cache(key_fn=lambda x, y: x)
+        async def add(self, x, y):
+            self.num_calls += 1
+            return x + y
+
+    handle = serve.run(Counter.bind())
+
+    url = "http://localhost:8000/"
+    assert requests.post(url, data="a").json() == {"body": "a", "calls": 1}
+    assert requests.post(url, data="a").json() == {"body": "a", "calls": 1}
+    assert requests.post(url, data="b").json() == {"body": "b", "calls": 2}
+    assert requests.post(url + "?q=1", data="a").json() == {"body": "a", "calls": 3}
+    # Requests with credentials are cached separately.
+    headers = {"Authorization": "Bearer x"}
+    assert requests.post(url, data="a", headers=headers).json() == {
+        "body": "a",
+        "calls": 4,
+    }
+    assert requests.post(url, data="a", headers=headers).json() == {
+        "body": "a",
+        "calls": 4,
+    }
+
+    assert ray.get(handle.add.remote(1, 2)) == 3
+    assert ray.get(handle.add.remote(1, 5)) == 3
+    assert ray.get(handle.add.remote(2, 5)) == 7
+
+
+if __name__ == "__main__":
+    import sys
+
+    sys.exit(pytest.main(["-v", "-s", __file__]))
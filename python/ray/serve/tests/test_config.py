@@ -10,7 +10,7 @@ from ray.serve.config import (
     ProxyLocation,
     gRPCOptions,
 )
-from ray.serve.config import AutoscalingConfig
+from ray.serve.config import AutoscalingConfig, ScheduledReplicas
 from ray.serve._private.utils import DEFAULT
 from ray.serve.generated.serve_pb2_grpc import add_UserDefinedServiceServicer_to_server
 from ray.serve._private.constants import DEFAULT_GRPC_PORT
@@ -436,6 +436,14 @@ def test_http_options():
     assert HTTPOptions(location=None).location == "NoServer"
     assert HTTPOptions(location=DeploymentMode.EveryNode).location == "EveryNode"
 
+    options = HTTPOptions(max_queued_requests=10, max_requests_per_s=0.5)
+    assert options.max_queued_requests == 10
+    assert options.max_requests_per_s == 0.5
+    with pytest.raises(ValidationError):
+        HTTPOptions(max_queued_requests=0)
+    with pytest.raises(ValidationError):
+        HTTPOptions(max_requests_per_s=-1)
+
 
 def test_with_proto():
     # Test roundtrip
@@ -446,6 +454,20 @@ def test_with_proto():
     config = DeploymentConfig(user_config={"python": ("native", ["objects"])})
     assert config == DeploymentConfig.from_proto_bytes(config.to_proto_bytes())
 
+    # Test autoscaling policy options
+    config = DeploymentConfig(
+        autoscaling_config=AutoscalingConfig(
+            policy="predictive",
+            seasonal_period_s=86400,
+            scheduled_min_replicas=[
+                ScheduledReplicas(
+                    schedule="0 8 * * 1-5", duration_s=3600, min_replicas=1
+                )
+            ],
+        )
+    )
+    assert config == DeploymentConfig.from_proto_bytes(config.to_proto_bytes())
+
 
 def test_zero_default_proto():
     # Test that options set to zero (protobuf default value) still retain their
@@ -168,6 +168,22 @@ class TestgRPCProxy:
         proxy_request.send_status_code.assert_called_with(status_code=timeout_status)
         proxy_request.send_details.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_overloaded_response(self):
+        """Test gRPCProxy set up the correct overloaded response."""
+        grpc_proxy = self.create_grpc_proxy()
+        proxy_request = AsyncMock()
+        overloaded_status = grpc.StatusCode.RESOURCE_EXHAUSTED
+        response = await grpc_proxy.overloaded_response(
+            proxy_request=proxy_request, retry_after_s=0.2
+        )
+
+        assert isinstance(response, ProxyResponse)
+        assert response.status_code == str(overloaded_status)
+        proxy_request.send_status_code.assert_called_with(status_code=overloaded_status)
+        proxy_request.send_details.assert_called_once()
+        proxy_request.send_retry_after.assert_called_with("1")
+
     @pytest.mark.asyncio
     async def test_routes_response(self):
         """Test gRPCProxy set up the correct routes response."""
@@ -333,7 +349,7 @@ class TestgRPCProxy:
 class TestHTTPProxy:
     """Test methods implemented on HTTPProxy"""
 
-    def create_http_proxy(self):
+    def create_http_proxy(self, **kwargs):
         controller_name = "fake-controller_name"
         node_id = "fake-node_id"
         node_ip_address = "fake-node_ip_address"
@@ -344,6 +360,7 @@ class TestHTTPProxy:
             proxy_router_class=MagicMock(),
             controller_actor=FakeActorHandler("fake_controller_actor"),
             proxy_actor=FakeActorHandler("fake_proxy_actor"),
+            **kwargs,
         )
 
     def test_subclass_from_generic_proxy(self):
@@ -427,6 +444,50 @@ class TestHTTPProxy:
         mocked_util.assert_called_with(ANY, status_code=timeout_status)
         mocked_response.send.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_overloaded_response(self):
+        """Test HTTPProxy set up the correct overloaded response."""
+        http_proxy = self.create_http_proxy()
+        send = AsyncMock()
+        proxy_request = ASGIProxyRequest(
+            scope={"type": "http"},
+            receive=AsyncMock(),
+            send=send,
+        )
+        response = await http_proxy.overloaded_response(
+            proxy_request=proxy_request, retry_after_s=2.5
+        )
+        assert isinstance(response, ProxyResponse)
+        assert response.status_code == "503"
+        start_message = send.call_args_list[0].args[0]
+        assert start_message["status"] == 503
+        assert [b"retry-after", b"3"] in start_message["headers"]
+
+    @pytest.mark.asyncio
+    async def test_proxy_request_rejected_when_overloaded(self):
+        """Test HTTPProxy rejects requests when the queue of the app is full."""
+        http_proxy = self.create_http_proxy(max_queued_requests=2)
+        handle = MagicMock()
+        handle.deployment_id.app = "app"
+        handle._get_or_create_router.return_value.num_queued_queries = 2
+        http_proxy.proxy_router.match_route.return_value = ("/", handle, False)
+        http_proxy.overloaded_response = AsyncMock(
+            return_value=ProxyResponse(status_code="503")
+        )
+        proxy_request = ASGIProxyRequest(
+            scope={"type": "http", "path": "/", "method": "GET"},
+            receive=AsyncMock(),
+            send=AsyncMock(),
+        )
+
+        response = await http_proxy.proxy_request(proxy_request)
+        assert response.status_code == "503"
+        http_proxy.overloaded_response.assert_called_once_with(
+            proxy_request=proxy_request, retry_after_s=ANY
+        )
+        handle.options.assert_not_called()
+        assert http_proxy._ongoing_requests == 0
+
     @pytest.mark.asyncio
     @patch("ray.serve._private.http_proxy.starlette.responses.JSONResponse")
     async def test_routes_response(self, mock_json_response):
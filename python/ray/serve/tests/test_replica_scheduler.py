@@ -16,6 +16,7 @@ from ray.serve._private.router import (
     ReplicaWrapper,
     RequestMetadata,
 )
+from ray.serve.exceptions import RequestDeadlineExceededError
 
 SCHEDULER_NODE_ID = "scheduler_node_id"
 SCHEDULER_AZ = "scheduler_az"
@@ -436,6 +437,89 @@ async def test_tasks_scheduled_fifo(pow_2_scheduler, fake_query):
         tasks = tasks[1:]
 
 
+def query_with_priority(priority: int, deadline: Optional[float] = None):
+    meta = RequestMetadata(
+        request_id="req_id",
+        endpoint="endpoint",
+        priority=priority,
+        deadline=deadline,
+    )
+    return Query([], {}, meta)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "pow_2_scheduler",
+    [
+        {"prefer_local_node": False, "prefer_local_az": False},
+    ],
+    indirect=True,
+)
+async def test_tasks_scheduled_by_priority(pow_2_scheduler):
+    """
+    Verify that requests with higher priorities are scheduled first, and requests
+    with the same priority are scheduled in FIFO order.
+    """
+    s = pow_2_scheduler
+    loop = get_or_create_event_loop()
+
+    priorities = [0, 1, 0, 2, 1, 0]
+    tasks = []
+    for priority in priorities:
+        tasks.append(
+            loop.create_task(s.choose_replica_for_query(query_with_priority(priority)))
+        )
+
+    done, _ = await asyncio.wait(tasks, timeout=0.1)
+    assert len(done) == 0
+
+    r1 = FakeReplicaWrapper("r1", reset_after_response=True)
+    s.update_replicas([r1])
+
+    expected_order = [3, 1, 4, 0, 2, 5]
+    for i in expected_order:
+        r1.set_queue_state_response(0)
+        done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        assert done == {tasks[i]}
+        tasks[i] = loop.create_future()
+    for task in tasks:
+        task.cancel()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "pow_2_scheduler",
+    [
+        {"prefer_local_node": False, "prefer_local_az": False},
+    ],
+    indirect=True,
+)
+async def test_requests_past_deadline_not_scheduled(pow_2_scheduler, fake_query):
+    """
+    Verify that requests fail when their deadline passes before they're scheduled,
+    and are passed over when a replica becomes available.
+    """
+    s = pow_2_scheduler
+    loop = get_or_create_event_loop()
+
+    with pytest.raises(RequestDeadlineExceededError):
+        await s.choose_replica_for_query(
+            query_with_priority(0, deadline=time.time() - 1)
+        )
+
+    expiring_task = loop.create_task(
+        s.choose_replica_for_query(query_with_priority(1, deadline=time.time() + 0.1))
+    )
+    task = loop.create_task(s.choose_replica_for_query(fake_query))
+    with pytest.raises(RequestDeadlineExceededError):
+        await expiring_task
+
+    r1 = FakeReplicaWrapper("r1")
+    r1.set_queue_state_response(0)
+    s.update_replicas([r1])
+    assert (await task) == r1
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
     "pow_2_scheduler",